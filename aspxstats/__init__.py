@@ -1,7 +1,13 @@
+import importlib
+from typing import Any, List, TYPE_CHECKING
+
 from .exceptions import Error, ClientError, TimeoutError, InvalidResponseError, NotFoundError, InvalidParameterError, \
     ValidationError
 from .types import ResponseValidationMode
 
+if TYPE_CHECKING:
+    from .scheduler import RequestPriority, request_priority
+
 """
 aspxstats.
 Python library for retrieving stats of Battlefield 2 and Battlefield 2142 players.
@@ -10,9 +16,35 @@ Python library for retrieving stats of Battlefield 2 and Battlefield 2142 player
 __version__ = '0.7.1'
 __author__ = 'cetteup'
 __credits__ = 'wilson212'
+
+# Attributes only imported on first access (PEP 562), since the scheduler imports asyncio, which sync-only users
+# should not pay for on every cold start (see aspxstats.bf2)
+_LAZY_ATTRIBUTES = {
+    'RequestPriority': '.scheduler',
+    'request_priority': '.scheduler',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the module, so any further access does not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
 __all__ = [
     'bf2',
     'ResponseValidationMode',
+    'RequestPriority',
+    'request_priority',
     'Error',
     'ClientError',
     'TimeoutError',
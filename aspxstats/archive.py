@@ -0,0 +1,247 @@
+import lzma
+import mmap
+import os
+import struct
+import zlib
+from dataclasses import dataclass
+from enum import Enum, IntEnum
+from typing import Dict, Optional, Union, Iterator, Tuple, TextIO, BinaryIO
+
+from .exceptions import Error
+
+
+class Compression(IntEnum):
+    NONE = 0
+    ZLIB = 1
+    LZMA = 2
+
+
+@dataclass(frozen=True)
+class ArchiveKey:
+    provider: str
+    endpoint: str
+    pid: int
+    asof: int
+
+
+@dataclass(frozen=True)
+class ArchiveRecord:
+    segment: int
+    offset: int
+    length: int
+    compression: Compression
+
+
+class ResponseArchive:
+    """
+    Append-only archive of raw aspx responses
+    Responses are compressed and appended to segment files ("segment-00000.dat", ...). The location of each record is
+    written to a sidecar index ("index.tsv"), which is loaded into memory when opening the archive. Records are read
+    via memory maps of the segment files, so each lookup is a dict access plus a single decompression.
+    """
+    directory: str
+    compression: Compression
+    max_segment_size: int
+
+    index: Dict[ArchiveKey, ArchiveRecord]
+    index_file: TextIO
+    segment: int
+    segment_file: BinaryIO
+    maps: Dict[int, mmap.mmap]
+
+    # Each record is prefixed with its compression type and (compressed) length, allowing segments to be read without
+    # the index (e.g. for recovery)
+    record_header = struct.Struct('<BI')
+
+    def __init__(
+            self,
+            directory: str,
+            compression: Compression = Compression.ZLIB,
+            max_segment_size: int = 256 * 1024 * 1024
+    ):
+        self.directory = directory
+        self.compression = compression
+        self.max_segment_size = max_segment_size
+        self.maps = dict()
+
+        os.makedirs(directory, exist_ok=True)
+        self.index = self.load_index()
+        self.segment = max((record.segment for record in self.index.values()), default=0)
+        self.segment_file = open(self.get_segment_path(self.segment), 'ab')
+        self.index_file = open(os.path.join(self.directory, 'index.tsv'), 'a', encoding='utf-8', newline='\n')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, key: ArchiveKey) -> bool:
+        return key in self.index
+
+    def __iter__(self) -> Iterator[ArchiveKey]:
+        return iter(self.index)
+
+    def close(self) -> None:
+        for segment_map in self.maps.values():
+            segment_map.close()
+        self.maps.clear()
+        self.segment_file.close()
+        self.index_file.close()
+
+    def append(
+            self,
+            provider: Union[str, Enum],
+            endpoint: str,
+            pid: int,
+            asof: int,
+            raw_data: str
+    ) -> ArchiveKey:
+        """
+        Append a raw response to the archive (replacing any previously archived response with the same key)
+        :param provider: provider the response was fetched from
+        :param endpoint: (relative) URL of the endpoint the response was fetched from, e.g. "getplayerinfo.aspx"
+        :param pid: id of the player the response belongs to
+        :param asof: "asof" timestamp of the response
+        :param raw_data: raw aspx data as a string
+        :return: key to read the response from the archive
+        """
+        key = ArchiveKey(self.stringify_provider(provider), endpoint, pid, asof)
+        # Tabs separate the index's columns, line breaks its rows
+        if any(c in element for element in (key.provider, key.endpoint) for c in '\t\n\r'):
+            raise Error('Archive key elements must not contain tabs or line breaks')
+
+        payload = self.compress(raw_data.encode('utf-8'), self.compression)
+        if self.segment_file.tell() > 0 and self.segment_file.tell() + len(payload) > self.max_segment_size:
+            self.segment_file.close()
+            self.segment += 1
+            self.segment_file = open(self.get_segment_path(self.segment), 'ab')
+
+        offset = self.segment_file.tell() + self.record_header.size
+        self.segment_file.write(self.record_header.pack(self.compression, len(payload)))
+        self.segment_file.write(payload)
+        # Only add the record to the index once it is completely written
+        self.segment_file.flush()
+
+        record = ArchiveRecord(self.segment, offset, len(payload), self.compression)
+        self.index_file.write('\t'.join([
+            key.provider, key.endpoint, str(key.pid), str(key.asof),
+            str(record.segment), str(record.offset), str(record.length), str(int(record.compression))
+        ]) + '\n')
+        self.index_file.flush()
+        self.index[key] = record
+
+        return key
+
+    def get(self, provider: Union[str, Enum], endpoint: str, pid: int, asof: int) -> Optional[str]:
+        key = ArchiveKey(self.stringify_provider(provider), endpoint, pid, asof)
+        if key not in self.index:
+            return None
+
+        return self.read(key)
+
+    def read(self, key: ArchiveKey) -> str:
+        """
+        Read a raw response from the archive
+        :param key: key of the response
+        :return: raw aspx data as a string
+        """
+        record = self.index[key]
+        segment_map = self.get_segment_map(record.segment, record.offset + record.length)
+        payload = segment_map[record.offset:record.offset + record.length]
+        return self.decompress(payload, record.compression).decode('utf-8')
+
+    def items(self) -> Iterator[Tuple[ArchiveKey, str]]:
+        """
+        Iterate over all archived responses in the order they were written (reading each segment sequentially)
+        """
+        for key, _ in sorted(self.index.items(), key=lambda item: (item[1].segment, item[1].offset)):
+            yield key, self.read(key)
+
+    def get_segment_map(self, segment: int, min_size: int) -> mmap.mmap:
+        segment_map = self.maps.get(segment)
+        # The current segment grows as records are appended, re-map it if the record is beyond the mapped region
+        if segment_map is None or len(segment_map) < min_size:
+            if segment_map is not None:
+                segment_map.close()
+            with open(self.get_segment_path(segment), 'rb') as f:
+                segment_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self.maps[segment] = segment_map
+
+        return segment_map
+
+    def get_segment_path(self, segment: int) -> str:
+        return os.path.join(self.directory, f'segment-{segment:05d}.dat')
+
+    def load_index(self) -> Dict[ArchiveKey, ArchiveRecord]:
+        index: Dict[ArchiveKey, ArchiveRecord] = dict()
+        path = os.path.join(self.directory, 'index.tsv')
+        if not os.path.isfile(path):
+            return index
+
+        # Records are appended to the index, so they must not end up on the same line as a partially written one
+        ResponseArchive.truncate_partial_line(path)
+
+        segment_sizes: Dict[int, int] = dict()
+        with open(path, 'r', encoding='utf-8', newline='\n') as f:
+            for line in f:
+                elements = line.rstrip('\n').split('\t')
+                # Skip any partially written lines
+                if len(elements) != 8:
+                    continue
+
+                provider, endpoint, pid, asof, segment, offset, length, compression = elements
+                record = ArchiveRecord(int(segment), int(offset), int(length), Compression(int(compression)))
+
+                # Skip any records which were not (completely) written to their segment
+                if record.segment not in segment_sizes:
+                    segment_path = self.get_segment_path(record.segment)
+                    segment_sizes[record.segment] = os.path.getsize(segment_path) if os.path.isfile(segment_path) else 0
+                if record.offset + record.length > segment_sizes[record.segment]:
+                    continue
+
+                # Later records replace any earlier ones with the same key
+                index[ArchiveKey(provider, endpoint, int(pid), int(asof))] = record
+
+        return index
+
+    @staticmethod
+    def truncate_partial_line(path: str, block_size: int = 4096) -> None:
+        with open(path, 'rb+') as f:
+            end = f.seek(0, os.SEEK_END)
+            # Search backwards for the end of the last complete line
+            position = end
+            while position > 0:
+                start = max(position - block_size, 0)
+                f.seek(start)
+                newline = f.read(position - start).rfind(b'\n')
+                if newline != -1:
+                    position = start + newline + 1
+                    break
+                position = start
+
+            if position < end:
+                f.truncate(position)
+
+    @staticmethod
+    def compress(data: bytes, compression: Compression) -> bytes:
+        if compression is Compression.ZLIB:
+            return zlib.compress(data)
+        if compression is Compression.LZMA:
+            return lzma.compress(data)
+        return data
+
+    @staticmethod
+    def decompress(data: bytes, compression: Compression) -> bytes:
+        if compression is Compression.ZLIB:
+            return zlib.decompress(data)
+        if compression is Compression.LZMA:
+            return lzma.decompress(data)
+        return data
+
+    @staticmethod
+    def stringify_provider(provider: Union[str, Enum]) -> str:
+        return str(provider.value) if isinstance(provider, Enum) else provider
@@ -1,27 +1,60 @@
 import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
 from enum import Enum
-from typing import Dict, Optional, Union
+from functools import partial
+from typing import Dict, Optional, Union, Callable, TypeVar, Tuple
 from urllib.parse import urljoin
 
 import aiohttp as aiohttp
 
+from .cassette import Cassette, CassetteMode
 from .client import AspxClient
-from .exceptions import ClientError, TimeoutError
-from .types import ResponseValidationMode
+from .exceptions import Error, ClientError, TimeoutError
+from .scheduler import RequestScheduler, RequestPriority
+from .types import ResponseValidationMode, ValidationMetrics
+
+T = TypeVar('T')
 
 
 class AsyncAspxClient(AspxClient):
     session: aiohttp.ClientSession
+    parse_executor: Optional[Executor]
+    parse_executor_threshold: int
+    # Maximum number of simultaneous connections (0 for no limit)
+    connection_limit: int
+    # Queues requests exceeding the connection limit by priority, see aspxstats.scheduler.request_priority
+    scheduler: RequestScheduler
 
     def __init__(
             self,
             base_uri: str,
             default_headers: Dict[str, str],
             timeout: float,
-            response_validation_mode: ResponseValidationMode
+            response_validation_mode: ResponseValidationMode,
+            parse_executor: Optional[Executor] = None,
+            parse_executor_threshold: int = 1024,
+            cassette: Optional[Cassette] = None,
+            connection_limit: int = 100,
+            validation_sample_rate: int = 100,
+            request_quotas: Optional[Dict[RequestPriority, int]] = None
     ):
-        super().__init__(base_uri, default_headers, timeout, response_validation_mode)
-        self.session = aiohttp.ClientSession(headers=default_headers)
+        super().__init__(
+            base_uri=base_uri,
+            default_headers=default_headers,
+            timeout=timeout,
+            response_validation_mode=response_validation_mode,
+            cassette=cassette,
+            validation_sample_rate=validation_sample_rate
+        )
+        self.connection_limit = connection_limit
+        self.scheduler = RequestScheduler(connection_limit, request_quotas)
+        self.session = aiohttp.ClientSession(
+            headers=default_headers,
+            connector=aiohttp.TCPConnector(limit=connection_limit)
+        )
+        self.parse_executor = parse_executor
+        self.parse_executor_threshold = parse_executor_threshold
 
     async def __aenter__(self):
         return self
@@ -29,6 +62,26 @@ class AsyncAspxClient(AspxClient):
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         await self.close()
 
+    def __getstate__(self) -> dict:
+        # Neither the session, the executor nor the cassette can be pickled, only retain the configuration
+        # (required to send bound parse methods to a process pool executor, which also do not need any response cache)
+        state = self.__dict__.copy()
+        state.pop('session', None)
+        state.pop('parse_executor', None)
+        state.pop('cassette', None)
+        state.pop('response_cache', None)
+        state.pop('scheduler', None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        # A session can only be created within a running event loop,
+        # so unpickled clients can validate and parse responses but not fetch any data
+        self.__dict__.update(state)
+        self.parse_executor = None
+        self.cassette = None
+        self.response_cache = None
+        self.scheduler = RequestScheduler(self.connection_limit)
+
     async def close(self) -> None:
         await self.session.close()
 
@@ -40,14 +93,81 @@ class AsyncAspxClient(AspxClient):
         :return: raw aspx data as a string
         """
         url = urljoin(self.base_uri, endpoint)
+        params = self.stringify_params(params)
+        # Requests only wait for the scheduler once the connection limit is reached, and are then sent in order of
+        # priority (rather than in the order they were made, as they would be when waiting for a pooled connection)
+        async with self.scheduler.slot():
+            return await self.fetch_aspx_data(url, params)
+
+    async def fetch_aspx_data(self, url: str, params: Optional[Dict[str, str]]) -> str:
+        if self.cassette is not None and self.cassette.mode is CassetteMode.REPLAY:
+            exchange = self.cassette.replay(url, params)
+            if self.cassette.replay_latency:
+                await asyncio.sleep(exchange.latency)
+
+            if exchange.ok:
+                return exchange.body
+            else:
+                raise ClientError(f'Failed to fetch ASPX data (HTTP/{exchange.status})')
+
         try:
-            response = await self.session.get(url, params=self.stringify_params(params), timeout=self.timeout)
+            started = time.perf_counter()
+            response = await self.session.get(url, params=params, timeout=self.timeout)
+
+            text = await response.text(errors='replace')
+            if self.cassette is not None:
+                self.cassette.record(url, params, response.status, text, time.perf_counter() - started)
 
             if response.ok:
-                return await response.text(errors='replace')
+                return text
             else:
                 raise ClientError(f'Failed to fetch ASPX data (HTTP/{response.status})')
         except asyncio.TimeoutError:
             raise TimeoutError('Timed out trying to fetch ASPX data')
         except aiohttp.ClientError as e:
             raise ClientError(f'Failed to fetch ASPX data: {e}') from None
+
+    async def run_parse(self, parse: Callable[[str], T], raw_data: str) -> T:
+        """
+        Run a (CPU-bound) parse function on raw aspx data without blocking the event loop for large responses
+        Responses shorter than the threshold are parsed inline, since handing them off costs more than parsing them.
+        A process pool executor parses on a copy of the client, so the validation mode needs to be selected (and passed
+        to the parse function) beforehand, see select_validation_mode. Validation metrics recorded by the copy are
+        merged back into the client's metrics.
+        :param parse: function to validate and parse the raw data (must be picklable if using a process pool executor)
+        :param raw_data: raw aspx data as a string
+        :return: result of the parse function
+        """
+        if self.parse_executor is None or len(raw_data) < self.parse_executor_threshold:
+            return parse(raw_data)
+
+        loop = asyncio.get_running_loop()
+        if not isinstance(self.parse_executor, ProcessPoolExecutor):
+            return await loop.run_in_executor(self.parse_executor, parse, raw_data)
+
+        result, error, metrics = await loop.run_in_executor(
+            self.parse_executor,
+            partial(self.parse_in_process, parse),
+            raw_data
+        )
+        self.validation_metrics.responses += metrics.responses
+        self.validation_metrics.validated += metrics.validated
+        self.validation_metrics.failed += metrics.failed
+        if metrics.last_failure is not None:
+            self.validation_metrics.last_failure = metrics.last_failure
+        if error is not None:
+            raise error
+        return result
+
+    def parse_in_process(
+            self,
+            parse: Callable[[str], T],
+            raw_data: str
+    ) -> Tuple[Optional[T], Optional[Error], ValidationMetrics]:
+        # Called on the (unpickled) copy of the client in a worker process, which parse is bound to as well
+        # (pickling retains identity), so only metrics recorded while parsing this response are returned
+        self.validation_metrics = ValidationMetrics()
+        try:
+            return parse(raw_data), None, self.validation_metrics
+        except Error as e:
+            return None, e, self.validation_metrics
@@ -1,16 +1,84 @@
-from .async_client import AsyncAspxClient
-from .async_fetch import async_searchforplayers, async_searchforplayers_dict, async_getbackendinfo_dict, \
-    async_getunlocksinfo_dict, async_getawardsinfo_dict, async_getrankinfo_dict, async_getrankinfo, \
-    async_getplayerinfo_dict, async_getplayerinfo, async_getleaderboard_dict, async_getleaderboard
+import importlib
+from typing import Any, List, TYPE_CHECKING
+
 from .client import AspxClient
 from .fetch import searchforplayers, searchforplayers_dict, getleaderboard, getleaderboard_dict, getplayerinfo_dict, \
     getrankinfo_dict, getawardsinfo_dict, getunlocksinfo_dict, getbackendinfo_dict, getplayerinfo, getrankinfo
+from .store import PlayerStore
+from .table import PlayerStatsTable
 from .types import StatsProvider, SearchMatchType, SearchSortOrder, LeaderboardType, ScoreLeaderboardId, \
     WeaponType, VehicleType, KitType, PlayerinfoKeySet
 
+if TYPE_CHECKING:
+    from .async_client import AsyncAspxClient
+    from .async_fetch import async_searchforplayers, async_searchforplayers_dict, async_getbackendinfo_dict, \
+        async_getunlocksinfo_dict, async_getawardsinfo_dict, async_getrankinfo_dict, async_getrankinfo, \
+        async_getplayerinfo_dict, async_getplayerinfo, async_getleaderboard_dict, async_getleaderboard
+    from .batch import parse_responses, BatchResult
+    from .watchlist import WatchlistPoller, WatchlistEvent, WatchlistEventType
+    from .pipeline import CrawlPipeline, PipelineResult, leaderboard_pids, file_pids, relation_pids, JsonLinesSink, \
+        SqliteSink
+
+# Attributes only imported on first access (PEP 562), so sync-only users do not pay for importing aiohttp
+# (or multiprocessing) on every cold start
+_LAZY_ATTRIBUTES = {
+    'AsyncAspxClient': '.async_client',
+    'parse_responses': '.batch',
+    'BatchResult': '.batch',
+    'WatchlistPoller': '.watchlist',
+    'WatchlistEvent': '.watchlist',
+    'WatchlistEventType': '.watchlist',
+    'CrawlPipeline': '.pipeline',
+    'PipelineResult': '.pipeline',
+    'leaderboard_pids': '.pipeline',
+    'file_pids': '.pipeline',
+    'relation_pids': '.pipeline',
+    'JsonLinesSink': '.pipeline',
+    'SqliteSink': '.pipeline',
+    'async_searchforplayers': '.async_fetch',
+    'async_searchforplayers_dict': '.async_fetch',
+    'async_getleaderboard': '.async_fetch',
+    'async_getleaderboard_dict': '.async_fetch',
+    'async_getplayerinfo': '.async_fetch',
+    'async_getplayerinfo_dict': '.async_fetch',
+    'async_getrankinfo': '.async_fetch',
+    'async_getrankinfo_dict': '.async_fetch',
+    'async_getawardsinfo_dict': '.async_fetch',
+    'async_getunlocksinfo_dict': '.async_fetch',
+    'async_getbackendinfo_dict': '.async_fetch',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the module, so any further access does not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
 __all__ = [
     'AspxClient',
     'AsyncAspxClient',
+    'parse_responses',
+    'BatchResult',
+    'WatchlistPoller',
+    'WatchlistEvent',
+    'WatchlistEventType',
+    'CrawlPipeline',
+    'PipelineResult',
+    'leaderboard_pids',
+    'file_pids',
+    'relation_pids',
+    'JsonLinesSink',
+    'SqliteSink',
     'searchforplayers',
     'searchforplayers_dict',
     'getleaderboard',
@@ -41,5 +109,7 @@ __all__ = [
     'WeaponType',
     'VehicleType',
     'KitType',
-    'PlayerinfoKeySet'
+    'PlayerinfoKeySet',
+    'PlayerStatsTable',
+    'PlayerStore'
 ]
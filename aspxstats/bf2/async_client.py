@@ -1,11 +1,15 @@
-from typing import Optional, Union
+from concurrent.futures import Executor
+from functools import partial
+from typing import Optional, Union, Sequence, Dict
 
 from .client import AspxClient
 from .types import StatsProvider, SearchMatchType, SearchSortOrder, PlayerSearchResponse, LeaderboardType, \
     ScoreLeaderboardId, WeaponType, VehicleType, \
     KitType, LeaderboardResponse, PlayerinfoKeySet, PlayerinfoResponse, \
-    PlayerinfoGeneralStats, PlayerinfoMapStats, RankinfoResponse
+    PlayerinfoProjection, RankinfoResponse
 from ..async_client import AsyncAspxClient as AsyncBaseAspxClient
+from ..cassette import Cassette
+from ..scheduler import RequestPriority
 from ..types import ResponseValidationMode
 
 
@@ -18,8 +22,31 @@ class AsyncAspxClient(AspxClient, AsyncBaseAspxClient):
             timeout: float = 2.0,
             response_validation_mode: ResponseValidationMode = ResponseValidationMode.LAX,
             clean_nicks: bool = False,
+            parse_executor: Optional[Executor] = None,
+            parse_executor_threshold: int = 1024,
+            cassette: Optional[Cassette] = None,
+            connection_limit: int = 100,
+            validation_sample_rate: int = 100,
+            lazy_values: bool = False,
+            response_cache_size: int = 0,
+            request_quotas: Optional[Dict[RequestPriority, int]] = None
     ):
-        super().__init__(provider, timeout, response_validation_mode, clean_nicks)
+        # Initialize via the async base client directly, since the session is created based on the async-only options
+        provider_config = AspxClient.get_provider_config(provider)
+        AsyncBaseAspxClient.__init__(
+            self,
+            base_uri=provider_config.base_uri,
+            default_headers=provider_config.default_headers,
+            timeout=timeout,
+            response_validation_mode=response_validation_mode,
+            parse_executor=parse_executor,
+            parse_executor_threshold=parse_executor_threshold,
+            cassette=cassette,
+            connection_limit=connection_limit,
+            validation_sample_rate=validation_sample_rate,
+            request_quotas=request_quotas
+        )
+        self.init_provider_options(provider, clean_nicks, lazy_values, response_cache_size)
 
     async def searchforplayers(
             self,
@@ -41,7 +68,10 @@ class AsyncAspxClient(AspxClient, AsyncBaseAspxClient):
             'where': where,
             'sort': sort
         })
-        return self.validate_and_parse_searchforplayers_response(raw_data)
+        return await self.run_parse(
+            partial(self.validate_and_parse_searchforplayers_response, validation_mode=self.select_validation_mode()),
+            raw_data
+        )
 
     async def getleaderboard(
             self,
@@ -83,35 +113,81 @@ class AsyncAspxClient(AspxClient, AsyncBaseAspxClient):
             'after': str(after),
             'pid': str(pid) if pid is not None else None
         })
-        return self.validate_and_parse_getleaderboard_response(raw_data)
+        return await self.run_parse(
+            partial(self.validate_and_parse_getleaderboard_response, validation_mode=self.select_validation_mode()),
+            raw_data
+        )
 
     async def getplayerinfo(
             self,
             pid: int,
-            key_set: PlayerinfoKeySet = PlayerinfoKeySet.GENERAL_STATS
+            key_set: PlayerinfoKeySet = PlayerinfoKeySet.GENERAL_STATS,
+            fields: Optional[Sequence[str]] = None
     ) -> PlayerinfoResponse:
-        parsed = await self.getplayerinfo_dict(pid, key_set)
+        if fields is None:
+            raw_data = await self.get_aspx_data('getplayerinfo.aspx', {
+                'pid': str(pid),
+                'info': key_set
+            })
+            cached = self.get_cached_getplayerinfo_response(pid, key_set, raw_data, typed=True)
+            if cached is not None:
+                return cached
 
-        if key_set is PlayerinfoKeySet.GENERAL_STATS:
-            data = PlayerinfoGeneralStats.from_aspx_response(parsed)
-        else:
-            data = PlayerinfoMapStats.from_aspx_response(parsed)
+            # Check/update the cache here, parsing may happen in another process (see parse_executor)
+            response = await self.run_parse(
+                partial(
+                    self.validate_and_decode_getplayerinfo_response,
+                    key_set,
+                    validation_mode=self.select_validation_mode()
+                ),
+                raw_data
+            )
+            self.cache_getplayerinfo_response(pid, key_set, raw_data, response)
+            return response
 
+        parsed = await self.getplayerinfo_dict(pid, key_set, fields)
         return PlayerinfoResponse(
             asof=parsed['asof'],
-            data=data
+            data=PlayerinfoProjection.from_aspx_response(parsed)
         )
 
     async def getplayerinfo_dict(
             self,
             pid: int,
-            key_set: PlayerinfoKeySet = PlayerinfoKeySet.GENERAL_STATS
+            key_set: PlayerinfoKeySet = PlayerinfoKeySet.GENERAL_STATS,
+            fields: Optional[Sequence[str]] = None
     ) -> dict:
+        info: Union[PlayerinfoKeySet, str] = key_set
+        if fields is not None:
+            # Only request what is needed for the fields (fails early for any unknown fields)
+            schema = self.get_getplayerinfo_projection_schema(key_set, tuple(fields))
+            info = self.build_getplayerinfo_info(key_set, schema['data'].keys())
+
         raw_data = await self.get_aspx_data('getplayerinfo.aspx', {
             'pid': str(pid),
-            'info': key_set
+            'info': info
         })
-        return self.validate_and_parse_getplayerinfo_response(key_set, raw_data)
+        if fields is not None:
+            return await self.run_parse(
+                partial(
+                    self.validate_and_parse_getplayerinfo_response,
+                    key_set,
+                    fields=fields,
+                    validation_mode=self.select_validation_mode()
+                ),
+                raw_data
+            )
+
+        cached = self.get_cached_getplayerinfo_response(pid, key_set, raw_data, typed=False)
+        if cached is not None:
+            return cached
+
+        parsed = await self.run_parse(
+            partial(self.validate_and_parse_getplayerinfo_response, key_set, validation_mode=self.select_validation_mode()),
+            raw_data
+        )
+        self.cache_getplayerinfo_response(pid, key_set, raw_data, parsed)
+        return parsed
 
     async def getrankinfo(
             self,
@@ -127,7 +203,10 @@ class AsyncAspxClient(AspxClient, AsyncBaseAspxClient):
         raw_data = await self.get_aspx_data('getrankinfo.aspx', {
             'pid': str(pid)
         })
-        return self.validate_and_parse_getrankinfo_response(raw_data)
+        return await self.run_parse(
+            partial(self.validate_and_parse_getrankinfo_response, validation_mode=self.select_validation_mode()),
+            raw_data
+        )
 
     async def getawardsinfo_dict(
             self,
@@ -136,7 +215,10 @@ class AsyncAspxClient(AspxClient, AsyncBaseAspxClient):
         raw_data = await self.get_aspx_data('getawardsinfo.aspx', {
             'pid': str(pid)
         })
-        return self.validate_and_parse_getawardsinfo_response(raw_data, pid)
+        return await self.run_parse(
+            partial(self.validate_and_parse_getawardsinfo_response, pid=pid, validation_mode=self.select_validation_mode()),
+            raw_data
+        )
 
     async def getunlocksinfo_dict(
             self,
@@ -145,13 +227,19 @@ class AsyncAspxClient(AspxClient, AsyncBaseAspxClient):
         raw_data = await self.get_aspx_data('getunlocksinfo.aspx', {
             'pid': str(pid)
         })
-        return self.validate_and_parse_getunlocksinfo_response(raw_data)
+        return await self.run_parse(
+            partial(self.validate_and_parse_getunlocksinfo_response, validation_mode=self.select_validation_mode()),
+            raw_data
+        )
 
     async def getbackendinfo_dict(
             self,
     ) -> dict:
         raw_data = await self.get_aspx_data('getbackendinfo.aspx')
-        return self.validate_and_parse_getbackendinfo_response(raw_data)
+        return await self.run_parse(
+            partial(self.validate_and_parse_getbackendinfo_response, validation_mode=self.select_validation_mode()),
+            raw_data
+        )
 
     async def verifyplayer_dict(
             self,
@@ -165,4 +253,7 @@ class AsyncAspxClient(AspxClient, AsyncBaseAspxClient):
             'SoldierNick': nick,
             'pid': str(pid),
         })
-        return self.validate_and_parse_verifyplayer_response(raw_data)
+        return await self.run_parse(
+            partial(self.validate_and_parse_verifyplayer_response, validation_mode=self.select_validation_mode()),
+            raw_data
+        )
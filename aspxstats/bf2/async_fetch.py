@@ -1,4 +1,4 @@
-from typing import Union, Optional
+from typing import Union, Optional, Sequence
 
 from .async_client import AsyncAspxClient
 from .types import SearchMatchType, SearchSortOrder, PlayerSearchResponse, StatsProvider, LeaderboardType, \
@@ -81,10 +81,11 @@ async def async_getplayerinfo(
         provider: StatsProvider = StatsProvider.BF2HUB,
         timeout: float = 2.0,
         response_validation_mode: ResponseValidationMode = ResponseValidationMode.LAX,
-        clean_nicks: bool = False
+        clean_nicks: bool = False,
+        fields: Optional[Sequence[str]] = None
 ) -> PlayerinfoResponse:
     async with AsyncAspxClient(provider, timeout, response_validation_mode, clean_nicks) as client:
-        return await client.getplayerinfo(pid, key_set)
+        return await client.getplayerinfo(pid, key_set, fields)
 
 
 async def async_getplayerinfo_dict(
@@ -93,10 +94,11 @@ async def async_getplayerinfo_dict(
         provider: StatsProvider = StatsProvider.BF2HUB,
         timeout: float = 2.0,
         response_validation_mode: ResponseValidationMode = ResponseValidationMode.LAX,
-        clean_nicks: bool = False
+        clean_nicks: bool = False,
+        fields: Optional[Sequence[str]] = None
 ) -> dict:
     async with AsyncAspxClient(provider, timeout, response_validation_mode, clean_nicks) as client:
-        return await client.getplayerinfo_dict(pid, key_set)
+        return await client.getplayerinfo_dict(pid, key_set, fields)
 
 
 async def async_getrankinfo(
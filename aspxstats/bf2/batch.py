@@ -0,0 +1,156 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from enum import Enum
+from itertools import islice
+from typing import Iterable, Iterator, Tuple, Dict, Optional, Union, List, Deque, Set
+
+from .client import AspxClient
+from .types import StatsProvider
+from ..exceptions import Error, InvalidResponseError, InvalidParameterError
+from ..types import ResponseValidationMode
+
+BatchItem = Union[
+    Tuple[str, str],
+    Tuple[str, str, Optional[Dict[str, Optional[Union[str, Enum]]]]]
+]
+
+# Client used to parse responses within each worker process (set up by the pool's initializer)
+_worker_client: Optional[AspxClient] = None
+
+
+@dataclass
+class BatchResult:
+    index: int
+    endpoint: str
+    parsed: Optional[dict] = None
+    error: Optional[Error] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def parse_responses(
+        responses: Iterable[BatchItem],
+        provider: StatsProvider = StatsProvider.BF2HUB,
+        response_validation_mode: ResponseValidationMode = ResponseValidationMode.LAX,
+        clean_nicks: bool = False,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 256,
+        ordered: bool = True
+) -> Iterator[BatchResult]:
+    """
+    Validate and parse raw (e.g. archived) responses using a pool of worker processes
+    Responses are sent to the workers in chunks to reduce the per-item (pickling) overhead. Only a limited number of
+    chunks is in flight at any time, so (lazy) iterables of any size can be processed with constant memory usage.
+    :param responses: (endpoint, raw_data) or (endpoint, raw_data, params) tuples, see
+                      :meth:`AspxClient.validate_and_parse_response`
+    :param provider: provider the responses were fetched from
+    :param response_validation_mode: validation mode to parse responses with
+    :param clean_nicks: whether to clean nicks when parsing responses
+    :param max_workers: number of worker processes (defaults to the number of CPUs)
+    :param chunk_size: number of responses to send to a worker at once
+    :param ordered: yield results in input order (else yield results as soon as their chunk has been parsed)
+    :return: iterator of results (one per response, failures are reported via :attr:`BatchResult.error`)
+    """
+    # Validate parameters before returning the (generator) iterator, rather than only once it is first advanced
+    if chunk_size < 1:
+        raise InvalidParameterError('Chunk size must be a positive integer')
+
+    return iter_results(responses, provider, response_validation_mode, clean_nicks, max_workers, chunk_size, ordered)
+
+
+def iter_results(
+        responses: Iterable[BatchItem],
+        provider: StatsProvider,
+        response_validation_mode: ResponseValidationMode,
+        clean_nicks: bool,
+        max_workers: Optional[int],
+        chunk_size: int,
+        ordered: bool
+) -> Iterator[BatchResult]:
+    max_workers = max_workers or os.cpu_count() or 1
+    # Keep each worker busy while the next chunks are being pickled/results are being consumed
+    max_pending = max_workers * 2
+    chunks = iter_chunks(enumerate(responses), chunk_size)
+    with ProcessPoolExecutor(
+            max_workers,
+            initializer=init_worker,
+            initargs=(provider, response_validation_mode, clean_nicks)
+    ) as executor:
+        if ordered:
+            yield from iter_ordered_results(executor, chunks, max_pending)
+        else:
+            yield from iter_unordered_results(executor, chunks, max_pending)
+
+
+def iter_ordered_results(
+        executor: ProcessPoolExecutor,
+        chunks: Iterator[List[Tuple[int, BatchItem]]],
+        max_pending: int
+) -> Iterator[BatchResult]:
+    queue: Deque[Future] = deque()
+    for chunk in chunks:
+        if len(queue) >= max_pending:
+            yield from queue.popleft().result()
+        queue.append(executor.submit(parse_chunk, chunk))
+
+    while len(queue) > 0:
+        yield from queue.popleft().result()
+
+
+def iter_unordered_results(
+        executor: ProcessPoolExecutor,
+        chunks: Iterator[List[Tuple[int, BatchItem]]],
+        max_pending: int
+) -> Iterator[BatchResult]:
+    pending: Set[Future] = set()
+    for chunk in chunks:
+        if len(pending) >= max_pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+        pending.add(executor.submit(parse_chunk, chunk))
+
+    while len(pending) > 0:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield from future.result()
+
+
+def iter_chunks(items: Iterable[Tuple[int, BatchItem]], chunk_size: int) -> Iterator[List[Tuple[int, BatchItem]]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+def init_worker(
+        provider: StatsProvider,
+        response_validation_mode: ResponseValidationMode,
+        clean_nicks: bool
+) -> None:
+    global _worker_client
+    _worker_client = AspxClient(provider, response_validation_mode=response_validation_mode, clean_nicks=clean_nicks)
+
+
+def parse_chunk(chunk: List[Tuple[int, BatchItem]]) -> List[BatchResult]:
+    results: List[BatchResult] = []
+    for index, item in chunk:
+        endpoint, raw_data, params = item if len(item) == 3 else (*item, None)
+        try:
+            parsed = _worker_client.validate_and_parse_response(endpoint, raw_data, params)
+            results.append(BatchResult(index, endpoint, parsed=parsed))
+        except Error as e:
+            results.append(BatchResult(index, endpoint, error=e))
+        except Exception as e:
+            # Malformed responses can fail parsing with any exception (e.g. an IndexError for missing lines),
+            # which must not fail the entire chunk
+            error = InvalidResponseError(f'Failed to parse {endpoint} response: {e!r}')
+            results.append(BatchResult(index, endpoint, error=error))
+
+    return results
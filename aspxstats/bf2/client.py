@@ -1,18 +1,23 @@
 from datetime import datetime
-from typing import Dict, Optional, Union, Callable
+from enum import Enum
+from functools import partial, lru_cache
+from typing import Dict, Optional, Union, Callable, Sequence, Tuple, Iterable, Mapping, Any
 
-from .schemas import GETLEADERBOARD_RESPONSE_SCHEMA, SEARCHFORPLAYERS_RESPONSE_SCHEMA, \
-    GETPLAYERINFO_GENERAL_STATS_RESPONSE_SCHEMA, GETPLAYERINFO_MAP_STATS_RESPONSE_SCHEMA, GETRANKINFO_RESPONSE_SCHEMA, \
-    GETAWARDSINFO_RESPONSE_SCHEMA, GETUNLOCKSINFO_RESPONSE_SCHEMA, GETBACKENDINFO_RESPONSE_SCHEMA, \
-    VERIFYPLAYER_RESPONSE_SCHEMA
+from . import schemas
+from .decoding import decode_getplayerinfo_response
 from .types import StatsProvider, SearchMatchType, SearchSortOrder, PlayerSearchResponse, LeaderboardType, \
     ScoreLeaderboardId, WeaponType, VehicleType, \
     KitType, LeaderboardResponse, PlayerinfoKeySet, PlayerinfoResponse, \
-    PlayerinfoGeneralStats, PlayerinfoMapStats, RankinfoResponse
-from .utils import clean_nick, build_aspx_response
+    PlayerinfoGeneralStats, PlayerinfoMapStats, PlayerinfoProjection, RankinfoResponse
+from .utils import clean_nick, build_aspx_response, find_info_key, GETPLAYERINFO_FIXED_KEYS, \
+    GETPLAYERINFO_FIXED_PREFIXES, GETPLAYERINFO_FAVORITE_KEYS
+from ..cache import UnchangedResponseCache
+from ..cassette import Cassette
 from ..client import AspxClient as BaseAspxClient
 from ..exceptions import InvalidParameterError, InvalidResponseError, NotFoundError
 from ..parsing import parse_dict_values
+from ..schema import AttributeSchema, DictSchema
+from ..serialization import copy_instance
 from ..types import ProviderConfig, ParseTarget, ResponseValidationMode, CleanerType
 from ..validation import is_numeric, validate_dict
 
@@ -20,6 +25,10 @@ from ..validation import is_numeric, validate_dict
 class AspxClient(BaseAspxClient):
     provider: StatsProvider
     cleaners: Optional[Dict[CleanerType, Callable[[str], str]]]
+    # Return *_dict results as LazyParsedDict, which only parses values once they are accessed
+    lazy_values: bool
+    # Previously parsed getplayerinfo responses, returned again (with the new asof) if a response did not change
+    response_cache: Optional[UnchangedResponseCache]
 
     def __init__(
             self,
@@ -27,11 +36,36 @@ class AspxClient(BaseAspxClient):
             timeout: float = 2.0,
             response_validation_mode: ResponseValidationMode = ResponseValidationMode.LAX,
             clean_nicks: bool = False,
+            cassette: Optional[Cassette] = None,
+            validation_sample_rate: int = 100,
+            lazy_values: bool = False,
+            response_cache_size: int = 0
     ):
         provider_config = AspxClient.get_provider_config(provider)
-        super().__init__(provider_config.base_uri, provider_config.default_headers, timeout, response_validation_mode)
+        # Pass options by name, since super() is the async base client (with different positional params) in the MRO
+        # of the async client
+        super().__init__(
+            base_uri=provider_config.base_uri,
+            default_headers=provider_config.default_headers,
+            timeout=timeout,
+            response_validation_mode=response_validation_mode,
+            cassette=cassette,
+            validation_sample_rate=validation_sample_rate
+        )
+        self.init_provider_options(provider, clean_nicks, lazy_values, response_cache_size)
+
+    def init_provider_options(
+            self,
+            provider: StatsProvider,
+            clean_nicks: bool,
+            lazy_values: bool,
+            response_cache_size: int
+    ) -> None:
+        # Shared with the async client, which initializes the base client(s) on its own
         self.provider = provider
         self.cleaners = AspxClient.get_cleaners(clean_nicks)
+        self.lazy_values = lazy_values
+        self.response_cache = AspxClient.get_response_cache(response_cache_size)
 
     def searchforplayers(
             self,
@@ -55,8 +89,14 @@ class AspxClient(BaseAspxClient):
         })
         return self.validate_and_parse_searchforplayers_response(raw_data)
 
-    def validate_and_parse_searchforplayers_response(self, raw_data: str) -> dict:
-        valid_response, _ = self.is_valid_aspx_response(raw_data, self.response_validation_mode)
+    def validate_and_parse_searchforplayers_response(
+            self,
+            raw_data: str,
+            validation_mode: Optional[ResponseValidationMode] = None
+    ) -> dict:
+        if validation_mode is None:
+            validation_mode = self.select_validation_mode()
+        valid_response, _ = self.is_valid_aspx_response(raw_data, validation_mode)
         if not valid_response:
             raise InvalidResponseError(f'{self.provider} returned an invalid searchforplayers response')
 
@@ -65,20 +105,23 @@ class AspxClient(BaseAspxClient):
             ParseTarget('results', as_list=True)
         ])
 
-        self.validate_searchforplayers_response_data(parsed)
+        self.validate_response_data(validation_mode, self.validate_searchforplayers_response_data, parsed)
 
-        return self.parse_searchforplayers_response_values(parsed, self.cleaners)
+        return self.convert_response_values(
+            self.parse_searchforplayers_response_values, parsed, self.cleaners, self.lazy_values
+        )
 
     @staticmethod
     def validate_searchforplayers_response_data(parsed: dict) -> None:
-        validate_dict(parsed, SEARCHFORPLAYERS_RESPONSE_SCHEMA)
+        validate_dict(parsed, schemas.SEARCHFORPLAYERS_RESPONSE_SCHEMA)
 
     @staticmethod
     def parse_searchforplayers_response_values(
             parsed: dict,
-            cleaners: Optional[Dict[CleanerType, Callable[[str], str]]] = None
+            cleaners: Optional[Dict[CleanerType, Callable[[str], str]]] = None,
+            lazy: bool = False
     ) -> dict:
-        return parse_dict_values(parsed, SEARCHFORPLAYERS_RESPONSE_SCHEMA, cleaners)
+        return parse_dict_values(parsed, schemas.SEARCHFORPLAYERS_RESPONSE_SCHEMA, cleaners, lazy)
 
     def getleaderboard(
             self,
@@ -122,8 +165,14 @@ class AspxClient(BaseAspxClient):
         })
         return self.validate_and_parse_getleaderboard_response(raw_data)
 
-    def validate_and_parse_getleaderboard_response(self, raw_data: str) -> dict:
-        valid_response, _ = self.is_valid_aspx_response(raw_data, self.response_validation_mode)
+    def validate_and_parse_getleaderboard_response(
+            self,
+            raw_data: str,
+            validation_mode: Optional[ResponseValidationMode] = None
+    ) -> dict:
+        if validation_mode is None:
+            validation_mode = self.select_validation_mode()
+        valid_response, _ = self.is_valid_aspx_response(raw_data, validation_mode)
         if not valid_response:
             raise InvalidResponseError(f'{self.provider} returned an invalid getleaderboard response')
 
@@ -132,28 +181,77 @@ class AspxClient(BaseAspxClient):
             ParseTarget('entries', as_list=True)
         ])
 
-        self.validate_getleaderboard_response_data(parsed)
+        self.validate_response_data(validation_mode, self.validate_getleaderboard_response_data, parsed)
 
-        return self.parse_getleaderboard_response_values(parsed, self.cleaners)
+        return self.convert_response_values(
+            self.parse_getleaderboard_response_values, parsed, self.cleaners, self.lazy_values
+        )
 
     @staticmethod
     def validate_getleaderboard_response_data(parsed: dict) -> None:
         # TODO: Add per-leaderboard validation with respective attributes
-        validate_dict(parsed, GETLEADERBOARD_RESPONSE_SCHEMA)
+        validate_dict(parsed, schemas.GETLEADERBOARD_RESPONSE_SCHEMA)
 
     @staticmethod
     def parse_getleaderboard_response_values(
             parsed: dict,
-            cleaners: Optional[Dict[CleanerType, Callable[[str], str]]] = None
+            cleaners: Optional[Dict[CleanerType, Callable[[str], str]]] = None,
+            lazy: bool = False
     ) -> dict:
-        return parse_dict_values(parsed, GETLEADERBOARD_RESPONSE_SCHEMA, cleaners)
+        return parse_dict_values(parsed, schemas.GETLEADERBOARD_RESPONSE_SCHEMA, cleaners, lazy)
 
     def getplayerinfo(
             self,
             pid: int,
-            key_set: PlayerinfoKeySet = PlayerinfoKeySet.GENERAL_STATS
+            key_set: PlayerinfoKeySet = PlayerinfoKeySet.GENERAL_STATS,
+            fields: Optional[Sequence[str]] = None
     ) -> PlayerinfoResponse:
-        parsed = self.getplayerinfo_dict(pid, key_set)
+        if fields is None:
+            raw_data = self.get_aspx_data('getplayerinfo.aspx', {
+                'pid': str(pid),
+                'info': key_set
+            })
+            cached = self.get_cached_getplayerinfo_response(pid, key_set, raw_data, typed=True)
+            if cached is not None:
+                return cached
+
+            response = self.validate_and_decode_getplayerinfo_response(key_set, raw_data)
+            self.cache_getplayerinfo_response(pid, key_set, raw_data, response)
+            return response
+
+        parsed = self.getplayerinfo_dict(pid, key_set, fields)
+        return PlayerinfoResponse(
+            asof=parsed['asof'],
+            data=PlayerinfoProjection.from_aspx_response(parsed)
+        )
+
+    def validate_and_decode_getplayerinfo_response(
+            self,
+            key_set: PlayerinfoKeySet,
+            raw_data: str,
+            validation_mode: Optional[ResponseValidationMode] = None
+    ) -> PlayerinfoResponse:
+        """
+        Validate and decode a getplayerinfo response straight into a typed response, skipping the intermediate dicts
+        (responses which cannot be decoded directly are parsed via dict instead, with the same validation and errors)
+        :param key_set: key set the response was requested with
+        :param raw_data: raw aspx data as a string
+        :param validation_mode: validation mode to use (selected based on the client's mode by default)
+        :return: typed response
+        """
+        if validation_mode is None:
+            validation_mode = self.select_validation_mode()
+        valid_response, _ = self.is_valid_aspx_response(raw_data, validation_mode)
+        if valid_response:
+            nick_cleaner = self.cleaners.get(CleanerType.NICK) if self.cleaners is not None else None
+            decoded = decode_getplayerinfo_response(key_set, raw_data, nick_cleaner)
+            if decoded is not None:
+                # Decoding validates all values while converting them
+                if validation_mode is not ResponseValidationMode.TRUSTED:
+                    self.validation_metrics.validated += 1
+                return decoded
+
+        parsed = self.validate_and_parse_getplayerinfo_response(key_set, raw_data, validation_mode=validation_mode)
 
         if key_set is PlayerinfoKeySet.GENERAL_STATS:
             data = PlayerinfoGeneralStats.from_aspx_response(parsed)
@@ -168,16 +266,40 @@ class AspxClient(BaseAspxClient):
     def getplayerinfo_dict(
             self,
             pid: int,
-            key_set: PlayerinfoKeySet = PlayerinfoKeySet.GENERAL_STATS
+            key_set: PlayerinfoKeySet = PlayerinfoKeySet.GENERAL_STATS,
+            fields: Optional[Sequence[str]] = None
     ) -> dict:
+        info: Union[PlayerinfoKeySet, str] = key_set
+        if fields is not None:
+            # Only request what is needed for the fields (fails early for any unknown fields)
+            schema = self.get_getplayerinfo_projection_schema(key_set, tuple(fields))
+            info = self.build_getplayerinfo_info(key_set, schema['data'].keys())
+
         raw_data = self.get_aspx_data('getplayerinfo.aspx', {
             'pid': str(pid),
-            'info': key_set
+            'info': info
         })
-        return self.validate_and_parse_getplayerinfo_response(key_set, raw_data)
+        if fields is not None:
+            return self.validate_and_parse_getplayerinfo_response(key_set, raw_data, fields)
+
+        cached = self.get_cached_getplayerinfo_response(pid, key_set, raw_data, typed=False)
+        if cached is not None:
+            return cached
 
-    def validate_and_parse_getplayerinfo_response(self, key_set: PlayerinfoKeySet, raw_data: str) -> dict:
-        valid_response, not_found = self.is_valid_aspx_response(raw_data, self.response_validation_mode)
+        parsed = self.validate_and_parse_getplayerinfo_response(key_set, raw_data)
+        self.cache_getplayerinfo_response(pid, key_set, raw_data, parsed)
+        return parsed
+
+    def validate_and_parse_getplayerinfo_response(
+            self,
+            key_set: PlayerinfoKeySet,
+            raw_data: str,
+            fields: Optional[Sequence[str]] = None,
+            validation_mode: Optional[ResponseValidationMode] = None
+    ) -> dict:
+        if validation_mode is None:
+            validation_mode = self.select_validation_mode()
+        valid_response, not_found = self.is_valid_aspx_response(raw_data, validation_mode)
         if not valid_response and not_found:
             raise NotFoundError(f'No such player on {self.provider}')
         elif not valid_response:
@@ -188,50 +310,167 @@ class AspxClient(BaseAspxClient):
             ParseTarget('data')
         ])
 
+        if fields is not None:
+            # Drop any attributes which were not requested before fixing, validating and converting the rest
+            schema = self.get_getplayerinfo_projection_schema(key_set, tuple(fields))
+            parsed = self.project_getplayerinfo_response_data(schema, parsed)
+            parsed = self.fix_getplayerinfo_values(parsed)
+
+            self.validate_response_data(validation_mode, partial(validate_dict, schema=schema), parsed)
+
+            return self.convert_response_values(
+                parse_dict_values, parsed, schema, self.cleaners, self.lazy_values
+            )
+
         parsed = self.fix_getplayerinfo_values(parsed)
         parsed = self.upgrade_getplayerinfo_response_data(key_set, parsed)
 
-        self.validate_getplayerinfo_response_data(key_set, parsed)
+        self.validate_response_data(validation_mode, partial(self.validate_getplayerinfo_response_data, key_set), parsed)
+
+        return self.convert_response_values(
+            self.parse_getplayerinfo_response_values, key_set, parsed, self.cleaners, self.lazy_values
+        )
+
+    def get_cached_getplayerinfo_response(
+            self,
+            pid: int,
+            key_set: PlayerinfoKeySet,
+            raw_data: str,
+            typed: bool
+    ) -> Optional[Union[PlayerinfoResponse, dict]]:
+        """
+        Get the previously parsed response for a getplayerinfo response, skipping validation and parsing entirely
+        :param pid: pid the response was requested for
+        :param key_set: key set the response was requested with
+        :param raw_data: raw aspx data as a string
+        :param typed: get a typed response (else a parsed dict)
+        :return: previously parsed response with the asof of the raw response, None if the response changed
+        """
+        if self.response_cache is None:
+            return None
+
+        cached = self.response_cache.get(('getplayerinfo.aspx', pid, key_set, typed), raw_data)
+        if cached is None:
+            return None
+
+        asof, data = cached
+        # Hand out a copy, so callers modifying a response cannot change the cached one
+        if typed:
+            return PlayerinfoResponse(asof=asof, data=AspxClient.copy_getplayerinfo_data(data))
+        return {'asof': asof, 'data': AspxClient.copy_getplayerinfo_data(data)}
 
-        return self.parse_getplayerinfo_response_values(key_set, parsed, self.cleaners)
+    def cache_getplayerinfo_response(
+            self,
+            pid: int,
+            key_set: PlayerinfoKeySet,
+            raw_data: str,
+            response: Union[PlayerinfoResponse, dict]
+    ) -> None:
+        if self.response_cache is not None:
+            typed = isinstance(response, PlayerinfoResponse)
+            # Cache a copy of the data, since the response itself is returned to the caller
+            data = response.data if typed else response['data']
+            self.response_cache.put(
+                ('getplayerinfo.aspx', pid, key_set, typed), raw_data, AspxClient.copy_getplayerinfo_data(data)
+            )
 
     @staticmethod
-    def fix_getplayerinfo_values(parsed: dict) -> dict:
-        # Can't fix any player attributes if the key is missing/of wrong type
-        if not isinstance(parsed.get('data'), dict):
-            return parsed
+    def copy_getplayerinfo_data(data: Union[PlayerinfoGeneralStats, PlayerinfoMapStats, Mapping]) -> Any:
+        # LazyParsedDicts are read-only and parsed dicts are flat, so a shallow copy suffices for dicts. Typed stats
+        # are copied including their nested instances and lists (sharing only the immutable values), so modifying
+        # e.g. data.score.total does not change the cached stats either.
+        if isinstance(data, dict):
+            return dict(data)
+        if isinstance(data, Mapping):
+            return data
+        return copy_instance(data)
 
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def get_getplayerinfo_projection_schema(key_set: PlayerinfoKeySet, fields: Tuple[str, ...]) -> DictSchema:
         """
-        If a player has no kills/deaths, the PlayBF2 backend returns
-        a whitespace instead of a zero integer value for:
-        tvcr (top victim pid)
-        topr (top opponent pid)
-        mvrs (top victim rank)
-        vmrs (top opponent rank)
-        BF2Hub handles it better in most cases, but also has players with an empty string mvrs/vmrs or even more
-        interesting values such as "NOT VAILABLE" for tvcr (pid 10226681 asof 1617839795)
-        They also frequently return "NOT VAILABLE" for map stats values (pid 7568965 asof 1175020033)
-        => replace any invalid values with 0 (but don't add it if the key is missing)
+        Derive the schema for a getplayerinfo response containing only the given fields
+        :param key_set: key set the fields are part of
+        :param fields: keys of the attributes to include (pid and nick are always included)
+        :return: schema with the key set's "data" schema reduced to the given fields
         """
-        keys = {'tvcr', 'topr', 'mvrs', 'vmrs'}
-        prefixes = {
-            'vtm-', 'vkl-', 'vdt-', 'vkr-',  # vehicle stats prefixes
-            'atm-', 'awn-', 'alo-', 'abr-',  # army stats prefixes
-            'ktm-', 'kkl-', 'kdt-',  # kit stats prefixes
-            'mtm-', 'mwn-', 'mls-'  # map stats prefixes
-        }
+        if key_set is PlayerinfoKeySet.GENERAL_STATS:
+            schema = schemas.GETPLAYERINFO_GENERAL_STATS_RESPONSE_SCHEMA
+        else:
+            schema = schemas.GETPLAYERINFO_MAP_STATS_RESPONSE_SCHEMA
+
+        data: Dict[str, AttributeSchema] = dict()
+        for field in ('pid', 'nick', *fields):
+            attribute_schema = schema['data'].get(field)
+            if attribute_schema is None:
+                raise InvalidParameterError(f'Unknown getplayerinfo field "{field}" for key set {key_set.name}')
+            data[field] = attribute_schema
+
+        return {**schema, 'data': data}
+
+    @staticmethod
+    def build_getplayerinfo_info(key_set: PlayerinfoKeySet, fields: Iterable[str]) -> str:
+        """
+        Build an "info" param value requesting (a superset of) the given fields instead of the entire key set
+        :param key_set: key set the fields are part of
+        :param fields: keys of the attributes to request
+        :return: comma-separated info keys, in the same order as in the key set
+        """
+        info_keys = key_set.value.split(',')
+        group_keys = [info_key for info_key in info_keys if info_key.endswith('*')]
+        requested = set()
+        for field in fields:
+            # pid and nick are always part of the response
+            if field in ('pid', 'nick'):
+                continue
+
+            info_key = find_info_key(info_keys, field)
+            if info_key is not None:
+                requested.add(info_key)
+            else:
+                # Which attributes a group key such as "per*" covers is not documented, so request all of them
+                requested.update(group_keys)
+
+        if len(requested) == 0:
+            # Requests need to contain some info key
+            requested.update(group_keys or info_keys[:1])
+
+        return ','.join(info_key for info_key in info_keys if info_key in requested)
+
+    @staticmethod
+    def project_getplayerinfo_response_data(schema: DictSchema, parsed: dict) -> dict:
+        # Can't project anything if the key is missing/of wrong type
+        if not isinstance(parsed.get('data'), dict):
+            return parsed
+
         """
-        PlayBF2 often returns favorite kit/map/vehicle/weapon values with a "time" prefix
-        e.g. fveh as "time1" (pid 92163112 asof 1725108062)
+        Providers may ignore a custom "info" param and return the entire key set, so only retain requested attributes
+        Like upgrade_getplayerinfo_response_data, add Special Forces gadget keys if all requested ones are missing
         """
-        favorites = {'fkit', 'fmap', 'fveh', 'fwea'}
+        keys = ['de-6', 'de-7', 'de-8']
+        requested = [key for key in keys if key in schema['data']]
+        if len(requested) > 0 and all(key not in parsed['data'] for key in requested):
+            for key in requested:
+                parsed['data'][key] = '0'
+
+        parsed['data'] = {key: parsed['data'][key] for key in schema['data'] if key in parsed['data']}
+
+        return parsed
+
+    @staticmethod
+    def fix_getplayerinfo_values(parsed: dict) -> dict:
+        # Can't fix any player attributes if the key is missing/of wrong type
+        if not isinstance(parsed.get('data'), dict):
+            return parsed
+
+        # See GETPLAYERINFO_FIXED_KEYS and GETPLAYERINFO_FIXED_PREFIXES for why (and which) values need fixing
         for key, value in parsed['data'].items():
-            matches_key = key in keys
-            matches_prefix = key[:4] in prefixes
+            matches_key = key in GETPLAYERINFO_FIXED_KEYS
+            matches_prefix = key[:4] in GETPLAYERINFO_FIXED_PREFIXES
             if (matches_key or matches_prefix) and not is_numeric(value):
                 parsed['data'][key] = '0'
 
-            matches_favorite = key in favorites
+            matches_favorite = key in GETPLAYERINFO_FAVORITE_KEYS
             if matches_favorite and isinstance(value, str) and value.startswith('time'):
                 parsed['data'][key] = value[4:]
 
@@ -264,20 +503,21 @@ class AspxClient(BaseAspxClient):
             key_set: PlayerinfoKeySet, parsed: dict
     ) -> None:
         if key_set is PlayerinfoKeySet.GENERAL_STATS:
-            validate_dict(parsed, GETPLAYERINFO_GENERAL_STATS_RESPONSE_SCHEMA)
+            validate_dict(parsed, schemas.GETPLAYERINFO_GENERAL_STATS_RESPONSE_SCHEMA)
         else:
-            validate_dict(parsed, GETPLAYERINFO_MAP_STATS_RESPONSE_SCHEMA)
+            validate_dict(parsed, schemas.GETPLAYERINFO_MAP_STATS_RESPONSE_SCHEMA)
 
     @staticmethod
     def parse_getplayerinfo_response_values(
             key_set: PlayerinfoKeySet,
             parsed: dict,
-            cleaners: Optional[Dict[CleanerType, Callable[[str], str]]] = None
+            cleaners: Optional[Dict[CleanerType, Callable[[str], str]]] = None,
+            lazy: bool = False
     ) -> dict:
         if key_set is PlayerinfoKeySet.GENERAL_STATS:
-            return parse_dict_values(parsed, GETPLAYERINFO_GENERAL_STATS_RESPONSE_SCHEMA, cleaners)
+            return parse_dict_values(parsed, schemas.GETPLAYERINFO_GENERAL_STATS_RESPONSE_SCHEMA, cleaners, lazy)
         else:
-            return parse_dict_values(parsed, GETPLAYERINFO_MAP_STATS_RESPONSE_SCHEMA, cleaners)
+            return parse_dict_values(parsed, schemas.GETPLAYERINFO_MAP_STATS_RESPONSE_SCHEMA, cleaners, lazy)
 
     def getrankinfo(
             self,
@@ -295,8 +535,14 @@ class AspxClient(BaseAspxClient):
         })
         return self.validate_and_parse_getrankinfo_response(raw_data)
 
-    def validate_and_parse_getrankinfo_response(self, raw_data: str) -> dict:
-        valid_response, not_found = self.is_valid_aspx_response(raw_data, self.response_validation_mode)
+    def validate_and_parse_getrankinfo_response(
+            self,
+            raw_data: str,
+            validation_mode: Optional[ResponseValidationMode] = None
+    ) -> dict:
+        if validation_mode is None:
+            validation_mode = self.select_validation_mode()
+        valid_response, not_found = self.is_valid_aspx_response(raw_data, validation_mode)
         if not valid_response and not_found:
             raise NotFoundError(f'No such player on {self.provider}')
         elif not valid_response:
@@ -306,20 +552,23 @@ class AspxClient(BaseAspxClient):
             ParseTarget('data')
         ])
 
-        self.validate_getrankinfo_response_data(parsed)
+        self.validate_response_data(validation_mode, self.validate_getrankinfo_response_data, parsed)
 
-        return self.parse_getrankinfo_response_values(parsed, self.cleaners)
+        return self.convert_response_values(
+            self.parse_getrankinfo_response_values, parsed, self.cleaners, self.lazy_values
+        )
 
     @staticmethod
     def validate_getrankinfo_response_data(parsed: dict) -> None:
-        validate_dict(parsed, GETRANKINFO_RESPONSE_SCHEMA)
+        validate_dict(parsed, schemas.GETRANKINFO_RESPONSE_SCHEMA)
 
     @staticmethod
     def parse_getrankinfo_response_values(
             parsed: dict,
-            cleaners: Optional[Dict[CleanerType, Callable[[str], str]]] = None
+            cleaners: Optional[Dict[CleanerType, Callable[[str], str]]] = None,
+            lazy: bool = False
     ) -> dict:
-        return parse_dict_values(parsed, GETRANKINFO_RESPONSE_SCHEMA, cleaners)
+        return parse_dict_values(parsed, schemas.GETRANKINFO_RESPONSE_SCHEMA, cleaners, lazy)
 
     def getawardsinfo_dict(
             self,
@@ -330,8 +579,15 @@ class AspxClient(BaseAspxClient):
         })
         return self.validate_and_parse_getawardsinfo_response(raw_data, pid)
 
-    def validate_and_parse_getawardsinfo_response(self, raw_data: str, pid: int) -> dict:
-        valid_response, not_found = self.is_valid_aspx_response(raw_data, self.response_validation_mode)
+    def validate_and_parse_getawardsinfo_response(
+            self,
+            raw_data: str,
+            pid: int,
+            validation_mode: Optional[ResponseValidationMode] = None
+    ) -> dict:
+        if validation_mode is None:
+            validation_mode = self.select_validation_mode()
+        valid_response, not_found = self.is_valid_aspx_response(raw_data, validation_mode)
         if not valid_response and not_found:
             raise NotFoundError(f'No such player on {self.provider}')
         elif not valid_response:
@@ -354,21 +610,24 @@ class AspxClient(BaseAspxClient):
             ParseTarget('data', as_list=True)
         ])
 
-        self.validate_getawardsinfo_response_data(parsed)
+        self.validate_response_data(validation_mode, self.validate_getawardsinfo_response_data, parsed)
 
-        return self.parse_getawardsinfo_response_values(parsed, self.cleaners)
+        return self.convert_response_values(
+            self.parse_getawardsinfo_response_values, parsed, self.cleaners, self.lazy_values
+        )
 
     # TODO add tests
     @staticmethod
     def validate_getawardsinfo_response_data(parsed: dict) -> None:
-        validate_dict(parsed, GETAWARDSINFO_RESPONSE_SCHEMA)
+        validate_dict(parsed, schemas.GETAWARDSINFO_RESPONSE_SCHEMA)
 
     @staticmethod
     def parse_getawardsinfo_response_values(
             parsed: dict,
-            cleaners: Optional[Dict[CleanerType, Callable[[str], str]]] = None
+            cleaners: Optional[Dict[CleanerType, Callable[[str], str]]] = None,
+            lazy: bool = False
     ) -> dict:
-        return parse_dict_values(parsed, GETAWARDSINFO_RESPONSE_SCHEMA, cleaners)
+        return parse_dict_values(parsed, schemas.GETAWARDSINFO_RESPONSE_SCHEMA, cleaners, lazy)
 
     def getunlocksinfo_dict(
             self,
@@ -379,8 +638,14 @@ class AspxClient(BaseAspxClient):
         })
         return self.validate_and_parse_getunlocksinfo_response(raw_data)
 
-    def validate_and_parse_getunlocksinfo_response(self, raw_data: str) -> dict:
-        valid_response, not_found = self.is_valid_aspx_response(raw_data, self.response_validation_mode)
+    def validate_and_parse_getunlocksinfo_response(
+            self,
+            raw_data: str,
+            validation_mode: Optional[ResponseValidationMode] = None
+    ) -> dict:
+        if validation_mode is None:
+            validation_mode = self.select_validation_mode()
+        valid_response, not_found = self.is_valid_aspx_response(raw_data, validation_mode)
         if not valid_response and not_found:
             raise NotFoundError(f'No such player on {self.provider}')
         elif not valid_response:
@@ -392,21 +657,24 @@ class AspxClient(BaseAspxClient):
             ParseTarget('data', as_list=True)
         ])
 
-        self.validate_getunlocksinfo_response_data(parsed)
+        self.validate_response_data(validation_mode, self.validate_getunlocksinfo_response_data, parsed)
 
-        return self.parse_getunlocksinfo_response_values(parsed, self.cleaners)
+        return self.convert_response_values(
+            self.parse_getunlocksinfo_response_values, parsed, self.cleaners, self.lazy_values
+        )
 
     # TODO Add tests
     @staticmethod
     def validate_getunlocksinfo_response_data(parsed: dict) -> None:
-        validate_dict(parsed, GETUNLOCKSINFO_RESPONSE_SCHEMA)
+        validate_dict(parsed, schemas.GETUNLOCKSINFO_RESPONSE_SCHEMA)
 
     @staticmethod
     def parse_getunlocksinfo_response_values(
             parsed: dict,
-            cleaners: Optional[Dict[CleanerType, Callable[[str], str]]] = None
+            cleaners: Optional[Dict[CleanerType, Callable[[str], str]]] = None,
+            lazy: bool = False
     ) -> dict:
-        return parse_dict_values(parsed, GETUNLOCKSINFO_RESPONSE_SCHEMA, cleaners)
+        return parse_dict_values(parsed, schemas.GETUNLOCKSINFO_RESPONSE_SCHEMA, cleaners, lazy)
 
     def getbackendinfo_dict(
             self,
@@ -414,8 +682,14 @@ class AspxClient(BaseAspxClient):
         raw_data = self.get_aspx_data('getbackendinfo.aspx')
         return self.validate_and_parse_getbackendinfo_response(raw_data)
 
-    def validate_and_parse_getbackendinfo_response(self, raw_data: str) -> dict:
-        valid_response, _ = self.is_valid_aspx_response(raw_data, self.response_validation_mode)
+    def validate_and_parse_getbackendinfo_response(
+            self,
+            raw_data: str,
+            validation_mode: Optional[ResponseValidationMode] = None
+    ) -> dict:
+        if validation_mode is None:
+            validation_mode = self.select_validation_mode()
+        valid_response, _ = self.is_valid_aspx_response(raw_data, validation_mode)
         if not valid_response:
             raise InvalidResponseError(f'{self.provider} returned an invalid getbackendinfo response')
 
@@ -424,21 +698,24 @@ class AspxClient(BaseAspxClient):
             ParseTarget('unlocks', as_list=True)
         ])
 
-        self.validate_getbackendinfo_response_data(parsed)
+        self.validate_response_data(validation_mode, self.validate_getbackendinfo_response_data, parsed)
 
-        return self.parse_getbackendinfo_response_values(parsed, self.cleaners)
+        return self.convert_response_values(
+            self.parse_getbackendinfo_response_values, parsed, self.cleaners, self.lazy_values
+        )
 
     # TODO Add tests
     @staticmethod
     def validate_getbackendinfo_response_data(parsed: dict) -> None:
-        validate_dict(parsed, GETBACKENDINFO_RESPONSE_SCHEMA)
+        validate_dict(parsed, schemas.GETBACKENDINFO_RESPONSE_SCHEMA)
 
     @staticmethod
     def parse_getbackendinfo_response_values(
             parsed: dict,
-            cleaners: Optional[Dict[CleanerType, Callable[[str], str]]] = None
+            cleaners: Optional[Dict[CleanerType, Callable[[str], str]]] = None,
+            lazy: bool = False
     ) -> dict:
-        return parse_dict_values(parsed, GETBACKENDINFO_RESPONSE_SCHEMA, cleaners)
+        return parse_dict_values(parsed, schemas.GETBACKENDINFO_RESPONSE_SCHEMA, cleaners, lazy)
 
     def verifyplayer_dict(
             self,
@@ -454,8 +731,14 @@ class AspxClient(BaseAspxClient):
         })
         return self.validate_and_parse_verifyplayer_response(raw_data)
 
-    def validate_and_parse_verifyplayer_response(self, raw_data: str) -> dict:
-        valid_response, _ = self.is_valid_aspx_response(raw_data, self.response_validation_mode)
+    def validate_and_parse_verifyplayer_response(
+            self,
+            raw_data: str,
+            validation_mode: Optional[ResponseValidationMode] = None
+    ) -> dict:
+        if validation_mode is None:
+            validation_mode = self.select_validation_mode()
+        valid_response, _ = self.is_valid_aspx_response(raw_data, validation_mode)
         if not valid_response:
             raise InvalidResponseError(f'{self.provider} returned an invalid VerifyPlayer response')
 
@@ -464,21 +747,76 @@ class AspxClient(BaseAspxClient):
             ParseTarget(to_root=True)
         ])
 
-        self.validate_verifyplayer_response_data(parsed)
+        self.validate_response_data(validation_mode, self.validate_verifyplayer_response_data, parsed)
 
-        return self.parse_verifyplayer_response_values(parsed, self.cleaners)
+        return self.convert_response_values(
+            self.parse_verifyplayer_response_values, parsed, self.cleaners, self.lazy_values
+        )
 
     # TODO Add tests
     @staticmethod
     def validate_verifyplayer_response_data(parsed: dict) -> None:
-        validate_dict(parsed, VERIFYPLAYER_RESPONSE_SCHEMA)
+        validate_dict(parsed, schemas.VERIFYPLAYER_RESPONSE_SCHEMA)
 
     @staticmethod
     def parse_verifyplayer_response_values(
             parsed: dict,
-            cleaners: Optional[Dict[CleanerType, Callable[[str], str]]] = None
+            cleaners: Optional[Dict[CleanerType, Callable[[str], str]]] = None,
+            lazy: bool = False
+    ) -> dict:
+        return parse_dict_values(parsed, schemas.VERIFYPLAYER_RESPONSE_SCHEMA, cleaners, lazy)
+
+    def validate_and_parse_response(
+            self,
+            endpoint: str,
+            raw_data: str,
+            params: Optional[Dict[str, Optional[Union[str, Enum]]]] = None,
+            validation_mode: Optional[ResponseValidationMode] = None
     ) -> dict:
-        return parse_dict_values(parsed, VERIFYPLAYER_RESPONSE_SCHEMA, cleaners)
+        """
+        Validate and parse a raw response from any supported endpoint (e.g. when re-parsing archived responses)
+        :param endpoint: (relative) URL of the endpoint the response was fetched from, e.g. "getplayerinfo.aspx"
+        :param raw_data: raw aspx data as a string
+        :param params: query params the response was fetched with (getplayerinfo uses "info", getawardsinfo "pid")
+        :param validation_mode: validation mode to use (selected based on the client's mode by default)
+        :return: parsed response data as a dictionary
+        """
+        params = params or dict()
+        if endpoint == 'getplayerinfo.aspx':
+            key_set = AspxClient.get_getplayerinfo_key_set_param(params)
+            return self.validate_and_parse_getplayerinfo_response(key_set, raw_data, validation_mode=validation_mode)
+        elif endpoint == 'getawardsinfo.aspx':
+            pid = AspxClient.get_getawardsinfo_pid_param(params)
+            return self.validate_and_parse_getawardsinfo_response(raw_data, pid, validation_mode=validation_mode)
+
+        # Parsers of all other endpoints only take the raw data
+        parsers: Dict[str, Callable[..., dict]] = {
+            'searchforplayers.aspx': self.validate_and_parse_searchforplayers_response,
+            'getleaderboard.aspx': self.validate_and_parse_getleaderboard_response,
+            'getrankinfo.aspx': self.validate_and_parse_getrankinfo_response,
+            'getunlocksinfo.aspx': self.validate_and_parse_getunlocksinfo_response,
+            'getbackendinfo.aspx': self.validate_and_parse_getbackendinfo_response,
+            'VerifyPlayer.aspx': self.validate_and_parse_verifyplayer_response
+        }
+        parse = parsers.get(endpoint)
+        if parse is None:
+            raise InvalidParameterError(f'No parser for endpoint "{endpoint}"')
+
+        return parse(raw_data, validation_mode=validation_mode)
+
+    @staticmethod
+    def get_getplayerinfo_key_set_param(params: Dict[str, Optional[Union[str, Enum]]]) -> PlayerinfoKeySet:
+        try:
+            return PlayerinfoKeySet(params.get('info') or PlayerinfoKeySet.GENERAL_STATS)
+        except ValueError:
+            raise InvalidParameterError(f'Unsupported getplayerinfo key set "{params.get("info")}"') from None
+
+    @staticmethod
+    def get_getawardsinfo_pid_param(params: Dict[str, Optional[Union[str, Enum]]]) -> int:
+        pid = params.get('pid')
+        if not isinstance(pid, str) or not is_numeric(pid):
+            raise InvalidParameterError('Parsing getawardsinfo responses requires a numeric "pid" param')
+        return int(pid)
 
     @staticmethod
     def get_provider_config(provider: StatsProvider = StatsProvider.BF2HUB) -> ProviderConfig:
@@ -507,6 +845,13 @@ class AspxClient(BaseAspxClient):
 
         return config
 
+    @staticmethod
+    def get_response_cache(response_cache_size: int = 0) -> Optional[UnchangedResponseCache]:
+        if response_cache_size < 1:
+            return None
+
+        return UnchangedResponseCache(response_cache_size)
+
     @staticmethod
     def get_cleaners(clean_nicks: bool = False) -> Optional[Dict[CleanerType, Callable[[str], str]]]:
         cleaners: Dict[CleanerType, Callable[[str], str]] = dict()
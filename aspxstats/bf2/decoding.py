@@ -0,0 +1,223 @@
+"""
+Decoders turning tokenized aspx data lines straight into typed responses, without building any intermediate dicts.
+
+Decoders are generated once per response type, header (keys) layout and nick cleaner. Instead of describing the
+structure of each type again, the type's ``from_aspx_response`` is called with placeholders in place of values.
+The returned (placeholder) instance is then compiled into a single expression constructing the same instance
+from the data line's values, converting each value as :func:`aspxstats.parsing.parse_dict_value` would.
+
+Decoders only handle valid responses (conversions validate the same way as :func:`aspxstats.validation.validate_dict`),
+callers need to fall back to parsing via dict for any responses a decoder rejects. Values of keys the type does not
+read are converted (and discarded) as well, so decoders reject exactly the responses validation would reject.
+"""
+from dataclasses import is_dataclass, fields
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Set
+
+from . import schemas
+from .types import PlayerinfoKeySet, PlayerinfoResponse, PlayerinfoGeneralStats, PlayerinfoMapStats
+from .utils import is_fixed_getplayerinfo_key, fix_getplayerinfo_value
+from ..client import AspxClient as BaseAspxClient
+from ..parsing import parse_ratio
+from ..schema import AttributeSchema, DictSchema
+
+# Decodes the asof value and the values of a data line into a typed response
+Decoder = Callable[[str, List[str]], Any]
+
+
+class Placeholder:
+    """
+    Stand-in for the value of a key while generating a decoder
+    """
+    __slots__ = ('key',)
+
+    key: str
+
+    def __init__(self, key: str):
+        self.key = key
+
+
+def parse_checked_booly(value: str) -> bool:
+    # Unlike parse_dict_value, reject any values is_booly would consider invalid
+    parsed = int(value)
+    if not 0 <= parsed <= 1:
+        raise ValueError(f'invalid booly value: {value!r}')
+    return parsed == 1
+
+
+def build_value_expression(
+        source: str,
+        schema: AttributeSchema,
+        nick_cleaner: Optional[Callable[[str], str]]
+) -> str:
+    # Follows the same order of checks as parse_dict_value
+    if schema.is_numeric:
+        return f'int({source})'
+    if schema.is_booly:
+        return f'parse_checked_booly({source})'
+    if schema.is_floaty:
+        return f'float({source})'
+    if schema.is_ratio:
+        return f'parse_ratio({source})'
+    if schema.is_nick and nick_cleaner is not None:
+        return f'nick_cleaner({source})'
+    if schema.type == str:
+        return source
+
+    raise TypeError(f'No value expression for attribute schema {schema}')
+
+
+def build_expression(
+        value: Any,
+        schema: Dict[str, AttributeSchema],
+        indexes: Dict[str, int],
+        namespace: Dict[str, Any],
+        nick_cleaner: Optional[Callable[[str], str]],
+        convert: bool = True
+) -> str:
+    if isinstance(value, Placeholder) and not convert:
+        # Values are already of the attribute's type
+        return 'asof' if value.key == 'asof' else f'values[{indexes[value.key]}]'
+    if isinstance(value, Placeholder):
+        if value.key == 'asof':
+            return build_value_expression('asof', schema['asof'], nick_cleaner)
+
+        source = f'values[{indexes[value.key]}]'
+        if is_fixed_getplayerinfo_key(value.key):
+            source = f'fix_getplayerinfo_value({value.key!r}, {source})'
+        return build_value_expression(source, schema['data'][value.key], nick_cleaner)
+    if is_dataclass(value) and not isinstance(value, type):
+        cls = type(value)
+        namespace[cls.__name__] = cls
+        arguments = ', '.join(
+            f'{field.name}={build_expression(getattr(value, field.name), schema, indexes, namespace, nick_cleaner, convert)}'
+            for field in fields(value)
+        )
+        return f'{cls.__name__}({arguments})'
+    if isinstance(value, list):
+        return '[' + ', '.join(build_expression(v, schema, indexes, namespace, nick_cleaner, convert) for v in value) + ']'
+    if value is None or isinstance(value, (bool, int, float, str)):
+        # Constants such as item ids, derived from the keys by from_aspx_response
+        return repr(value)
+
+    raise TypeError(f'Cannot decode value of type {type(value).__name__}')
+
+
+def collect_placeholder_keys(value: Any, keys: Set[str]) -> Set[str]:
+    if isinstance(value, Placeholder):
+        keys.add(value.key)
+    elif is_dataclass(value) and not isinstance(value, type):
+        for field in fields(value):
+            collect_placeholder_keys(getattr(value, field.name), keys)
+    elif isinstance(value, list):
+        for v in value:
+            collect_placeholder_keys(v, keys)
+
+    return keys
+
+
+def generate_decoder(
+        schema: DictSchema,
+        from_aspx_response: Callable[[dict], Any],
+        keys: List[str],
+        nick_cleaner: Optional[Callable[[str], str]] = None,
+        convert: bool = True
+) -> Optional[Decoder]:
+    """
+    Generate a decoder for data lines with the given header (keys) layout
+    :param schema: schema of the response ("asof" plus a "data" dict)
+    :param from_aspx_response: function creating the typed instance from a parsed response
+    :param keys: keys of the data line, in the order they appear in the response
+    :param nick_cleaner: function used to clean nick values
+    :param convert: whether to convert values, pass False to decode already parsed values (e.g. from a store)
+    :return: decoder, None if the layout does not contain all keys referenced in the schema
+    """
+    # Use the last index for duplicate keys, just like build_dict_from_datasets does (later values overwrite earlier ones)
+    indexes = {key: index for (index, key) in enumerate(keys)}
+    if any(key not in indexes for key in schema['data']):
+        return None
+
+    instance = from_aspx_response({
+        'asof': Placeholder('asof'),
+        'data': {key: Placeholder(key) for key in schema['data']}
+    })
+
+    namespace: Dict[str, Any] = {
+        'PlayerinfoResponse': PlayerinfoResponse,
+        'parse_checked_booly': parse_checked_booly,
+        'parse_ratio': parse_ratio,
+        'fix_getplayerinfo_value': fix_getplayerinfo_value,
+        'nick_cleaner': nick_cleaner
+    }
+    expression = build_expression(instance, schema, indexes, namespace, nick_cleaner, convert)
+    asof_expression = build_expression(Placeholder('asof'), schema, indexes, namespace, nick_cleaner, convert)
+    source = 'def decode(asof, values):\n'
+    if convert:
+        # Convert values of keys the type does not read only to validate them
+        read = collect_placeholder_keys(instance, set())
+        for key, attribute_schema in schema['data'].items():
+            validated = attribute_schema.is_numeric or attribute_schema.is_booly or \
+                attribute_schema.is_floaty or attribute_schema.is_ratio
+            if key not in read and validated:
+                source += f'    {build_expression(Placeholder(key), schema, indexes, namespace, nick_cleaner)}\n'
+    source += f'    return PlayerinfoResponse(asof={asof_expression}, data={expression})\n'
+
+    exec(compile(source, f'<decoder {from_aspx_response.__qualname__}>', 'exec'), namespace)
+    return namespace['decode']
+
+
+# Generated decoders (None if a layout is not supported) by response type, header layout and nick cleaner
+_decoders: Dict[Tuple[Type, str, Optional[Callable[[str], str]]], Optional[Decoder]] = dict()
+
+
+def get_getplayerinfo_decoder(
+        key_set: PlayerinfoKeySet,
+        header: str,
+        nick_cleaner: Optional[Callable[[str], str]] = None
+) -> Optional[Decoder]:
+    if key_set is PlayerinfoKeySet.GENERAL_STATS:
+        cls, schema = PlayerinfoGeneralStats, schemas.GETPLAYERINFO_GENERAL_STATS_RESPONSE_SCHEMA
+    else:
+        cls, schema = PlayerinfoMapStats, schemas.GETPLAYERINFO_MAP_STATS_RESPONSE_SCHEMA
+
+    cache_key = (cls, header, nick_cleaner)
+    if cache_key in _decoders:
+        return _decoders[cache_key]
+
+    decoder = generate_decoder(schema, cls.from_aspx_response, header.split('\t'), nick_cleaner)
+
+    # Header layouts vary by provider (and player), but keep the cache from growing unbounded
+    if len(_decoders) >= 256:
+        _decoders.clear()
+    _decoders[cache_key] = decoder
+
+    return decoder
+
+
+def decode_getplayerinfo_response(
+        key_set: PlayerinfoKeySet,
+        raw_data: str,
+        nick_cleaner: Optional[Callable[[str], str]] = None
+) -> Optional[PlayerinfoResponse]:
+    """
+    Decode a (validated) getplayerinfo response straight into a typed response
+    :param key_set: key set the response was requested with
+    :param raw_data: raw aspx data as a string
+    :param nick_cleaner: function used to clean nick values
+    :return: typed response, None if the response cannot be decoded directly (needs to be parsed via dict instead)
+    """
+    datasets = BaseAspxClient.extract_datasets_from_response(raw_data)
+    if len(datasets) != 2 or datasets[0].keys != 'asof' or len(datasets[0].data) != 1 or len(datasets[1].data) != 1:
+        return None
+
+    decoder = get_getplayerinfo_decoder(key_set, datasets[1].keys, nick_cleaner)
+    if decoder is None:
+        return None
+
+    values = datasets[1].data[0].split('\t')
+    if len(values) != datasets[1].keys.count('\t') + 1:
+        return None
+
+    try:
+        return decoder(datasets[0].data[0], values)
+    except (ValueError, TypeError, AttributeError, IndexError):
+        return None
@@ -0,0 +1,211 @@
+import heapq
+from array import array
+from dataclasses import dataclass, field, fields, is_dataclass
+from enum import Enum
+from typing import Dict, Tuple, List, Iterable, Mapping, Sequence, Union, Any, get_type_hints, get_origin
+
+from .snapshot import get_leaderboard_columns
+from .types import LeaderboardResponse, PlayerinfoResponse, PlayerinfoGeneralStats, PlayerinfoFavorites
+from ..exceptions import InvalidParameterError
+from ..snapshot import Snapshot
+
+# Leaderboard columns by name (at least "pid", "n" and "nick"), e.g. as returned by get_leaderboard_columns
+LeaderboardColumns = Mapping[str, Sequence]
+LeaderboardSource = Union[Iterable[LeaderboardResponse], Snapshot, LeaderboardColumns]
+
+LEADERBOARD_DIFF_COLUMNS = ['pid', 'n', 'nick']
+
+# Attributes identifying an instance, items are matched by id and relations by pid
+IDENTITY_ATTRIBUTES = {'id', 'pid'}
+# Types whose (int) attributes are ids rather than counts, so a delta would be meaningless
+ID_TYPES = {PlayerinfoFavorites}
+
+
+@dataclass
+class LeaderboardDiff:
+    """
+    Differences between two leaderboards, stored column-wise: the n-th moved player's pid is ``moved_pids[n]``, their
+    previous and current position (``n`` of their entry) ``moved_from[n]`` and ``moved_to[n]``
+    """
+    entered: array = field(default_factory=lambda: array('q'))
+    dropped: array = field(default_factory=lambda: array('q'))
+    moved_pids: array = field(default_factory=lambda: array('q'))
+    moved_from: array = field(default_factory=lambda: array('q'))
+    moved_to: array = field(default_factory=lambda: array('q'))
+    # Previous and current nick by pid
+    nick_changes: Dict[int, Tuple[str, str]] = field(default_factory=dict)
+
+    def climbers(self, limit: int = 10) -> List[Tuple[int, int]]:
+        """
+        Get the players who climbed the most positions
+        :param limit: maximum number of players to return
+        :return: (pid, positions climbed) tuples, in descending order of positions climbed
+        """
+        rows = heapq.nlargest(limit, range(len(self.moved_pids)), key=lambda i: self.moved_from[i] - self.moved_to[i])
+        return [
+            (self.moved_pids[i], self.moved_from[i] - self.moved_to[i]) for i in rows if self.moved_from[i] > self.moved_to[i]
+        ]
+
+    def fallers(self, limit: int = 10) -> List[Tuple[int, int]]:
+        """
+        Get the players who dropped the most positions
+        :param limit: maximum number of players to return
+        :return: (pid, positions dropped) tuples, in descending order of positions dropped
+        """
+        rows = heapq.nlargest(limit, range(len(self.moved_pids)), key=lambda i: self.moved_to[i] - self.moved_from[i])
+        return [
+            (self.moved_pids[i], self.moved_to[i] - self.moved_from[i]) for i in rows if self.moved_to[i] > self.moved_from[i]
+        ]
+
+
+def diff_leaderboards(old: LeaderboardSource, new: LeaderboardSource) -> LeaderboardDiff:
+    """
+    Compare two leaderboards (e.g. two full crawls of a leaderboard a day apart), joining entries on pid
+    Runs in linear time. Columnar input (snapshots or columns) is compared without creating any entry objects.
+    If a player appears in a leaderboard more than once (e.g. having moved between pages during a crawl), their last
+    entry is used.
+    :param old: previous leaderboard, as leaderboard responses (pages), snapshot or columns
+    :param new: current leaderboard, as leaderboard responses (pages), snapshot or columns
+    :return: players who entered, dropped off or moved on the leaderboard, as well as any nick changes
+    """
+    old_columns, new_columns = get_diff_columns(old), get_diff_columns(new)
+    old_index = dict(zip(old_columns['pid'], range(len(old_columns['pid']))))
+    new_index = dict(zip(new_columns['pid'], range(len(new_columns['pid']))))
+
+    result = LeaderboardDiff()
+    old_n, old_nick = old_columns['n'], old_columns['nick']
+    new_n, new_nick = new_columns['n'], new_columns['nick']
+    for pid, new_row in new_index.items():
+        old_row = old_index.get(pid)
+        if old_row is None:
+            result.entered.append(pid)
+            continue
+
+        if old_n[old_row] != new_n[new_row]:
+            result.moved_pids.append(pid)
+            result.moved_from.append(old_n[old_row])
+            result.moved_to.append(new_n[new_row])
+        if old_nick[old_row] != new_nick[new_row]:
+            result.nick_changes[pid] = (old_nick[old_row], new_nick[new_row])
+
+    result.dropped.extend(pid for pid in old_index if pid not in new_index)
+
+    return result
+
+
+def get_diff_columns(source: LeaderboardSource) -> LeaderboardColumns:
+    if isinstance(source, Snapshot):
+        # Copy columns (which is a single memcpy for numeric columns), views would keep the snapshot from being closed
+        missing = [name for name in LEADERBOARD_DIFF_COLUMNS if name not in source]
+        if len(missing) > 0:
+            raise InvalidParameterError(f'Snapshot {source.path} is missing leaderboard columns: {", ".join(missing)}')
+        return {name: source.read_column(name) for name in LEADERBOARD_DIFF_COLUMNS}
+    if isinstance(source, Mapping):
+        missing = [name for name in LEADERBOARD_DIFF_COLUMNS if name not in source]
+        if len(missing) > 0:
+            raise InvalidParameterError(f'Leaderboard columns are missing: {", ".join(missing)}')
+        return source
+
+    return get_leaderboard_columns(source)
+
+
+class AttributeKind(int, Enum):
+    # Number, changes are reported as the delta
+    NUMBER = 0
+    # Any other value (or id), changes are reported as (old, new) tuples
+    VALUE = 1
+    # Nested instance, changes are reported as a dict of the changed attributes
+    INSTANCE = 2
+    # List of instances with ids, changes are reported as a dict of each changed item's changed attributes by id
+    ITEMS = 3
+
+
+# Attributes of each type as (name, kind) tuples
+_plans: Dict[type, List[Tuple[str, AttributeKind]]] = dict()
+
+
+def diff_general_stats(
+        old: Union[PlayerinfoResponse, PlayerinfoGeneralStats],
+        new: Union[PlayerinfoResponse, PlayerinfoGeneralStats]
+) -> Dict[str, Any]:
+    """
+    Compute the changes between two snapshots of a player's general stats, e.g. the stats earned in the last round
+    Numbers are reported as deltas (new - old), other values (nick, favorites etc.) as (old, new) tuples. Weapons,
+    vehicles, armies and kits are matched by id (items only present in either snapshot are ignored), relations by pid
+    (a different top rival/victim is reported as an (old, new) tuple).
+    Stats only change after a battle, so if the snapshots have the same "asof" timestamp or last battle timestamp,
+    nothing but the top-level attributes (nick, rank, ...) are compared.
+    :param old: previous stats (or response containing them)
+    :param new: current stats (or response containing them)
+    :return: changed attributes (empty if nothing changed), nested like the attributes of :class:`PlayerinfoGeneralStats`
+    """
+    if isinstance(old, PlayerinfoResponse) and isinstance(new, PlayerinfoResponse):
+        if old.asof == new.asof:
+            return dict()
+        old, new = old.data, new.data
+
+    if not isinstance(old, PlayerinfoGeneralStats) or not isinstance(new, PlayerinfoGeneralStats):
+        raise InvalidParameterError('Can only diff general stats (or responses containing them)')
+    if old.pid != new.pid:
+        raise InvalidParameterError(f'Cannot diff stats of different players ({old.pid} and {new.pid})')
+
+    if old.timestamp.last_battle == new.timestamp.last_battle:
+        return diff_instances(old, new, top_level=True)
+
+    return diff_instances(old, new)
+
+
+def diff_instances(old: Any, new: Any, top_level: bool = False) -> Dict[str, Any]:
+    changes: Dict[str, Any] = dict()
+    for name, kind in get_plan(type(old)):
+        if top_level and kind >= AttributeKind.INSTANCE:
+            continue
+
+        a, b = getattr(old, name), getattr(new, name)
+        # Compare entire nested instances/lists first, most of them usually remain unchanged
+        if a == b:
+            continue
+
+        if kind is AttributeKind.NUMBER:
+            changes[name] = b - a
+        elif kind is AttributeKind.VALUE:
+            changes[name] = (a, b)
+        elif kind is AttributeKind.INSTANCE:
+            if any(getattr(a, key) != getattr(b, key) for key in IDENTITY_ATTRIBUTES if hasattr(a, key)):
+                changes[name] = (a, b)
+            else:
+                changes[name] = diff_instances(a, b)
+        else:
+            items = {item.id: item for item in a}
+            item_changes = {
+                item.id: diff_instances(items[item.id], item) for item in b if item.id in items and items[item.id] != item
+            }
+            if len(item_changes) > 0:
+                changes[name] = item_changes
+
+    return changes
+
+
+def get_plan(cls: type) -> List[Tuple[str, AttributeKind]]:
+    plan = _plans.get(cls)
+    if plan is not None:
+        return plan
+
+    plan = list()
+    hints = get_type_hints(cls)
+    for f in fields(cls):
+        annotation = hints[f.name]
+        if f.name in IDENTITY_ATTRIBUTES:
+            # Never changes (or is checked before diffing the instance)
+            continue
+        if is_dataclass(annotation):
+            plan.append((f.name, AttributeKind.INSTANCE))
+        elif get_origin(annotation) is list:
+            plan.append((f.name, AttributeKind.ITEMS))
+        elif annotation in (int, float) and cls not in ID_TYPES:
+            plan.append((f.name, AttributeKind.NUMBER))
+        else:
+            plan.append((f.name, AttributeKind.VALUE))
+
+    _plans[cls] = plan
+    return plan
@@ -1,4 +1,4 @@
-from typing import Union, Optional
+from typing import Union, Optional, Sequence
 
 from .client import AspxClient
 from .types import SearchMatchType, SearchSortOrder, PlayerSearchResponse, StatsProvider, LeaderboardType, \
@@ -81,10 +81,11 @@ def getplayerinfo(
         provider: StatsProvider = StatsProvider.BF2HUB,
         timeout: float = 2.0,
         response_validation_mode: ResponseValidationMode = ResponseValidationMode.LAX,
-        clean_nicks: bool = False
+        clean_nicks: bool = False,
+        fields: Optional[Sequence[str]] = None
 ) -> PlayerinfoResponse:
     with AspxClient(provider, timeout, response_validation_mode, clean_nicks) as client:
-        return client.getplayerinfo(pid, key_set)
+        return client.getplayerinfo(pid, key_set, fields)
 
 
 def getplayerinfo_dict(
@@ -93,10 +94,11 @@ def getplayerinfo_dict(
         provider: StatsProvider = StatsProvider.BF2HUB,
         timeout: float = 2.0,
         response_validation_mode: ResponseValidationMode = ResponseValidationMode.LAX,
-        clean_nicks: bool = False
+        clean_nicks: bool = False,
+        fields: Optional[Sequence[str]] = None
 ) -> dict:
     with AspxClient(provider, timeout, response_validation_mode, clean_nicks) as client:
-        return client.getplayerinfo_dict(pid, key_set)
+        return client.getplayerinfo_dict(pid, key_set, fields)
 
 
 def getrankinfo(
@@ -0,0 +1,136 @@
+"""
+Metrics derived from the stats of many players at once, computed column-wise on a :class:`PlayerStatsTable`.
+
+Uses NumPy if it is installed (columns are wrapped without copying), else falls back to pure Python loops
+producing :class:`array.array` columns. Either way, the n-th value of a metric belongs to the player in the n-th row
+of the table (see :attr:`PlayerStatsTable.index`).
+Ratios follow the same convention as ratio attributes (see :func:`aspxstats.parsing.parse_ratio`): if the divisor is
+zero, the ratio is the dividend (e.g. a K/D of 5.0 for 5 kills and 0 deaths), except that values are not rounded.
+"""
+import heapq
+from array import array
+from typing import Dict, List, Tuple, Union, Any
+
+from .table import PlayerStatsTable
+from ..exceptions import InvalidParameterError
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# array.array (pure Python fallback) or numpy.ndarray of float values
+MetricColumn = Union[array, Any]
+
+# Prefixes of the item families with kill and death attributes
+ITEM_PREFIXES = {'w', 'v', 'k'}
+
+
+def as_vector(column: array) -> Any:
+    # Wrap (int64/float64) array columns without copying them
+    return numpy.frombuffer(column, dtype=numpy.int64 if column.typecode == 'q' else numpy.float64)
+
+
+def ratio(dividend: array, divisor: array) -> MetricColumn:
+    if numpy is not None:
+        dividend, divisor = as_vector(dividend).astype(numpy.float64), as_vector(divisor)
+        # Keep the dividend wherever the divisor is zero
+        return numpy.divide(dividend, divisor, out=dividend, where=divisor != 0)
+
+    return array('d', [a / b if b != 0 else float(a) for (a, b) in zip(dividend, divisor)])
+
+
+def kill_death_ratio(table: PlayerStatsTable) -> MetricColumn:
+    return ratio(table.column('kill'), table.column('deth'))
+
+
+def accuracy_weighted_kills(table: PlayerStatsTable) -> MetricColumn:
+    """
+    Kills weighted by accuracy (in percent), rewarding players who get their kills without spraying
+    """
+    kills, accuracy = table.column('kill'), table.column('osaa')
+    if numpy is not None:
+        return as_vector(kills) * as_vector(accuracy) / 100
+
+    return array('d', [k * a / 100 for (k, a) in zip(kills, accuracy)])
+
+
+def score_per_minute(table: PlayerStatsTable) -> MetricColumn:
+    """
+    Score per minute of total time played (computed from score and time, unlike the "ospm" attribute)
+    """
+    score, time = table.column('scor'), table.column('time')
+    if numpy is not None:
+        score, time = as_vector(score) * 60, as_vector(time)
+        return numpy.divide(score, time, out=numpy.zeros(len(score)), where=time != 0)
+
+    return array('d', [s * 60 / t if t != 0 else 0.0 for (s, t) in zip(score, time)])
+
+
+def win_rate(table: PlayerStatsTable) -> MetricColumn:
+    """
+    Share of rounds won (0.0 to 1.0, zero for players without any rounds)
+    """
+    wins, losses = table.column('wins'), table.column('loss')
+    if numpy is not None:
+        wins = as_vector(wins)
+        total = wins + as_vector(losses)
+        return numpy.divide(wins, total, out=numpy.zeros(len(wins)), where=total != 0)
+
+    return array('d', [w / (w + lo) if w + lo != 0 else 0.0 for (w, lo) in zip(wins, losses)])
+
+
+def item_kill_death_ratios(table: PlayerStatsTable, prefix: str) -> Dict[int, MetricColumn]:
+    """
+    Compute the K/D of each item of a family for all players
+    :param table: table of general stats
+    :param prefix: prefix of the item family, "w" (weapons), "v" (vehicles) or "k" (kits)
+    :return: K/D column by item id
+    """
+    if prefix not in ITEM_PREFIXES:
+        raise InvalidParameterError(f'Unsupported item prefix "{prefix}", must be one of: {", ".join(sorted(ITEM_PREFIXES))}')
+
+    ratios: Dict[int, MetricColumn] = dict()
+    for key in table.columns:
+        target_key, _, item_id = key[len(prefix):].partition('-')
+        if key.startswith(prefix) and target_key == 'kl' and item_id.isnumeric():
+            ratios[int(item_id)] = ratio(table.column(key), table.column(f'{prefix}dt-{item_id}'))
+
+    return ratios
+
+
+def compute_metrics(table: PlayerStatsTable) -> Dict[str, MetricColumn]:
+    """
+    Compute all player-level metrics
+    :param table: table of general stats
+    :return: metric columns by metric name
+    """
+    return {
+        'kill_death_ratio': kill_death_ratio(table),
+        'accuracy_weighted_kills': accuracy_weighted_kills(table),
+        'score_per_minute': score_per_minute(table),
+        'win_rate': win_rate(table)
+    }
+
+
+def rank_players(table: PlayerStatsTable, values: MetricColumn, limit: int = 10) -> List[Tuple[int, float]]:
+    """
+    Rank players by a metric (or any other column of the table)
+    :param table: table the values were computed from
+    :param values: value of each player, in row order
+    :param limit: maximum number of players to return
+    :return: (pid, value) tuples of the players with the highest values, in descending order
+    """
+    if limit < 1:
+        return []
+
+    pids = list(table.index)
+    if numpy is not None:
+        values = numpy.asarray(values)
+        # Select the top values first, which avoids sorting all values
+        top = numpy.argpartition(-values, limit - 1)[:limit] if limit < len(values) else numpy.arange(len(values))
+        rows = top[numpy.argsort(-values[top], kind='stable')]
+        return [(pids[row], float(values[row])) for row in rows]
+
+    rows = heapq.nlargest(limit, range(len(values)), key=values.__getitem__)
+    return [(pids[row], values[row]) for row in rows]
@@ -0,0 +1,402 @@
+import asyncio
+import inspect
+import json
+import sqlite3
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from functools import partial
+from typing import Optional, Dict, Union, Iterable, AsyncIterable, AsyncIterator, Iterator, Callable, Awaitable, \
+    List, Tuple, Set, Deque, TextIO
+
+from .async_client import AsyncAspxClient
+from .types import LeaderboardType, ScoreLeaderboardId, WeaponType, VehicleType, KitType, PlayerinfoKeySet
+from ..exceptions import Error, ClientError, InvalidResponseError, InvalidParameterError
+
+PidSource = Union[Iterable[int], AsyncIterable[int]]
+# Pid, params and raw data (or the error fetching it) of a fetched response
+FetchedItem = Tuple[int, Dict[str, Optional[Union[str, Enum]]], Union[str, Error]]
+
+
+@dataclass
+class PipelineResult:
+    pid: int
+    parsed: Optional[dict] = None
+    error: Optional[Error] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class PipelineStats:
+    fetched: int = 0
+    parsed: int = 0
+    # Players whose response could not be fetched or parsed
+    failed: int = 0
+
+
+PipelineSink = Callable[[PipelineResult], Union[None, Awaitable[None]]]
+
+
+class CrawlPipeline:
+    """
+    Fetches and parses responses for a stream of pids, passing each result to a sink
+    Stages are connected by bounded queues: if the sink (or parsing) cannot keep up, the fetch stage stops sending
+    requests, and if the provider is slow, no more pids are taken from the source. So memory usage only depends on the
+    queue size and concurrency, not on the number of pids (or on how much faster one stage is than the others).
+    Parsing uses the client's parse executor (if any), see :meth:`AsyncAspxClient.run_parse`.
+    """
+    client: AsyncAspxClient
+    source: PidSource
+    sink: PipelineSink
+    endpoint: str
+    params: Dict[str, Optional[Union[str, Enum]]]
+    fetch_concurrency: int
+    parse_concurrency: int
+    queue_size: int
+    stats: PipelineStats
+
+    def __init__(
+            self,
+            client: AsyncAspxClient,
+            source: PidSource,
+            sink: PipelineSink,
+            endpoint: str = 'getplayerinfo.aspx',
+            params: Optional[Dict[str, Optional[Union[str, Enum]]]] = None,
+            fetch_concurrency: int = 10,
+            parse_concurrency: int = 2,
+            queue_size: int = 100
+    ):
+        """
+        :param client: client to fetch and parse responses with
+        :param source: pids to fetch responses for, e.g. from leaderboard_pids, file_pids or relation_pids
+        :param sink: function (or coroutine function) to call with each result (including failures)
+        :param endpoint: endpoint to fetch for each pid (any endpoint taking a "pid" param)
+        :param params: query params to send in addition to the pid (defaults to the general stats key set for
+                       getplayerinfo)
+        :param fetch_concurrency: number of requests to send at the same time
+        :param parse_concurrency: number of responses to parse at the same time (only matters with a parse executor)
+        :param queue_size: maximum number of items waiting between any two stages
+        """
+        if fetch_concurrency < 1 or parse_concurrency < 1 or queue_size < 1:
+            raise InvalidParameterError('Pipeline concurrency and queue size must be positive integers')
+
+        if params is None:
+            params = {'info': PlayerinfoKeySet.GENERAL_STATS} if endpoint == 'getplayerinfo.aspx' else dict()
+
+        self.client = client
+        self.source = source
+        self.sink = sink
+        self.endpoint = endpoint
+        self.params = params
+        self.fetch_concurrency = fetch_concurrency
+        self.parse_concurrency = parse_concurrency
+        self.queue_size = queue_size
+        self.stats = PipelineStats()
+
+    async def run(self) -> PipelineStats:
+        """
+        Run the pipeline until all pids from the source have been passed to the sink
+        Any exception raised by the source or sink stops the pipeline. Exceptions fetching or parsing a single response
+        are passed to the sink as a failed result instead (as an :class:`Error`).
+        :return: number of responses fetched, parsed and failed
+        """
+        pids: 'asyncio.Queue[Optional[int]]' = asyncio.Queue(self.queue_size)
+        raw: 'asyncio.Queue[Optional[FetchedItem]]' = asyncio.Queue(self.queue_size)
+        results: 'asyncio.Queue[Optional[PipelineResult]]' = asyncio.Queue(self.queue_size)
+
+        tasks = [
+            asyncio.create_task(self.produce(pids)),
+            asyncio.create_task(self.run_stage(self.fetch, self.fetch_concurrency, pids, raw, self.parse_concurrency)),
+            asyncio.create_task(self.run_stage(self.parse, self.parse_concurrency, raw, results, 1)),
+            asyncio.create_task(self.consume(results))
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        return self.stats
+
+    async def produce(self, pids: 'asyncio.Queue[Optional[int]]') -> None:
+        async for pid in iterate_pids(self.source):
+            await pids.put(pid)
+        for _ in range(self.fetch_concurrency):
+            await pids.put(None)
+
+    async def run_stage(
+            self,
+            worker: Callable[[asyncio.Queue, asyncio.Queue], Awaitable[None]],
+            concurrency: int,
+            inbox: asyncio.Queue,
+            outbox: asyncio.Queue,
+            next_concurrency: int
+    ) -> None:
+        # Each worker stops once it gets a sentinel (None), the next stage's workers are stopped once all are done
+        await asyncio.gather(*(worker(inbox, outbox) for _ in range(concurrency)))
+        for _ in range(next_concurrency):
+            await outbox.put(None)
+
+    async def fetch(self, pids: asyncio.Queue, raw: asyncio.Queue) -> None:
+        while (pid := await pids.get()) is not None:
+            params = {'pid': str(pid), **self.params}
+            try:
+                raw_data = await self.client.get_aspx_data(self.endpoint, params)
+            except Exception as e:
+                self.stats.failed += 1
+                if not isinstance(e, Error):
+                    # A single failed request must not stop the crawl
+                    e = ClientError(f'Failed to fetch ASPX data: {e!r}')
+                # Failures skip parsing, but are passed on via the parse stage, so the sink gets a result for every pid
+                await raw.put((pid, params, e))
+                continue
+
+            self.stats.fetched += 1
+            await raw.put((pid, params, raw_data))
+
+    async def parse(self, raw: asyncio.Queue, results: asyncio.Queue) -> None:
+        while (item := await raw.get()) is not None:
+            pid, params, raw_data = item
+            if isinstance(raw_data, Error):
+                await results.put(PipelineResult(pid, error=raw_data))
+                continue
+
+            try:
+                parsed = await self.client.run_parse(
+                    partial(
+                        self.client.validate_and_parse_response,
+                        self.endpoint,
+                        params=params,
+                        validation_mode=self.client.select_validation_mode()
+                    ),
+                    raw_data
+                )
+            except Exception as e:
+                self.stats.failed += 1
+                if not isinstance(e, Error):
+                    # Malformed responses can fail parsing with any exception (e.g. an IndexError for missing lines),
+                    # as can the parse executor (e.g. a BrokenProcessPool), neither of which must stop the crawl
+                    e = InvalidResponseError(f'Failed to parse {self.endpoint} response: {e!r}')
+                await results.put(PipelineResult(pid, error=e))
+                continue
+
+            self.stats.parsed += 1
+            await results.put(PipelineResult(pid, parsed=parsed))
+
+    async def consume(self, results: 'asyncio.Queue[Optional[PipelineResult]]') -> None:
+        while (result := await results.get()) is not None:
+            value = self.sink(result)
+            if inspect.isawaitable(value):
+                await value
+
+
+async def iterate_pids(source: PidSource) -> AsyncIterator[int]:
+    if isinstance(source, AsyncIterable):
+        async for pid in source:
+            yield pid
+    else:
+        for pid in source:
+            yield pid
+
+
+async def leaderboard_pids(
+        client: AsyncAspxClient,
+        leaderboard_type: LeaderboardType = LeaderboardType.SCORE,
+        leaderboard_id: Optional[Union[
+            ScoreLeaderboardId,
+            WeaponType,
+            VehicleType,
+            KitType
+        ]] = ScoreLeaderboardId.OVERALL,
+        page_size: int = 50,
+        limit: Optional[int] = None
+) -> AsyncIterator[int]:
+    """
+    Page through a leaderboard, yielding the pid of each entry
+    Pages are only requested once the previous page's pids have been taken, so a pipeline's back-pressure also applies
+    to paging.
+    :param client: client to fetch leaderboard pages with
+    :param leaderboard_type: type of leaderboard
+    :param leaderboard_id: id of the leaderboard
+    :param page_size: number of entries to request per page
+    :param limit: maximum number of pids to yield (defaults to the entire leaderboard)
+    :return: async iterator of pids
+    """
+    if page_size < 1:
+        raise InvalidParameterError('Leaderboard page size must be a positive integer')
+
+    pos, count = 1, 0
+    while limit is None or count < limit:
+        parsed = await client.getleaderboard_dict(leaderboard_type, leaderboard_id, pos, 0, page_size - 1)
+        entries = parsed['entries']
+        for entry in entries:
+            if limit is not None and count >= limit:
+                return
+            yield entry['pid']
+            count += 1
+
+        pos += page_size
+        if len(entries) < page_size or pos > parsed['size']:
+            return
+
+
+def file_pids(path: str) -> Iterator[int]:
+    """
+    Read pids from a text file (one pid per line, ignoring blank lines and lines starting with "#")
+    :param path: path of the file
+    :return: iterator of pids
+    """
+    with open(path, 'r') as f:
+        for number, line in enumerate(f, start=1):
+            line = line.strip()
+            if line == '' or line.startswith('#'):
+                continue
+            if not line.isascii() or not line.isdigit():
+                raise InvalidParameterError(f'Invalid pid "{line}" on line {number} of {path}')
+            yield int(line)
+
+
+async def relation_pids(
+        client: AsyncAspxClient,
+        seeds: Iterable[int],
+        limit: int
+) -> AsyncIterator[int]:
+    """
+    Discover players by following each player's top rival and top victim, starting from the seed players (breadth-first)
+    Only the relations are requested for each player (a projected getplayerinfo request). Players whose relations cannot
+    be fetched are still yielded, but not followed.
+    :param client: client to fetch relations with
+    :param seeds: pids to start from
+    :param limit: maximum number of pids to yield
+    :return: async iterator of (distinct) pids
+    """
+    queue: Deque[int] = deque(seeds)
+    seen: Set[int] = set(queue)
+    count = 0
+    while len(queue) > 0 and count < limit:
+        pid = queue.popleft()
+        yield pid
+        count += 1
+        if count + len(queue) >= limit:
+            # Already know enough players, no need to discover any more
+            continue
+
+        try:
+            parsed = await client.getplayerinfo_dict(pid, PlayerinfoKeySet.GENERAL_STATS, ('topr', 'tvcr'))
+        except Error:
+            continue
+
+        for related in (parsed['data']['topr'], parsed['data']['tvcr']):
+            # Players without any relations have a pid of 0
+            if related != 0 and related not in seen:
+                seen.add(related)
+                queue.append(related)
+
+
+def dump_parsed(parsed: dict) -> str:
+    # Parsed responses are LazyParsedDicts if the client uses lazy values, which json cannot serialize directly
+    return json.dumps(dict(parsed), separators=(',', ':'))
+
+
+class JsonLinesSink:
+    """
+    Writes each parsed response as a line of JSON (failures are skipped)
+    """
+    path: str
+    file: Optional[TextIO]
+    written: int
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = open(path, 'w', encoding='utf-8')
+        self.written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __call__(self, result: PipelineResult) -> None:
+        if not result.ok:
+            return
+
+        self.file.write(dump_parsed(result.parsed))
+        self.file.write('\n')
+        self.written += 1
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class SqliteSink:
+    """
+    Stores each parsed response as JSON in a SQLite table (pid, asof, data), replacing any previous response of the
+    player (failures are skipped)
+    Rows are committed in batches, since committing each row would make the sink the slowest stage of most pipelines.
+    """
+    path: str
+    table: str
+    batch_size: int
+    connection: Optional[sqlite3.Connection]
+    pending: List[Tuple[int, Optional[int], str]]
+    written: int
+
+    def __init__(self, path: str, table: str = 'responses', batch_size: int = 500):
+        """
+        :param path: path of the database file
+        :param table: name of the table to store responses in (created if it does not exist)
+        :param batch_size: number of rows to insert per transaction
+        """
+        if not table.isidentifier():
+            raise InvalidParameterError(f'Invalid SQLite table name "{table}"')
+
+        self.path = path
+        self.table = table
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            f'CREATE TABLE IF NOT EXISTS {table} (pid INTEGER PRIMARY KEY, asof INTEGER, data TEXT NOT NULL)'
+        )
+        self.connection.commit()
+        self.pending = list()
+        self.written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __call__(self, result: PipelineResult) -> None:
+        if not result.ok:
+            return
+
+        self.pending.append((result.pid, result.parsed.get('asof'), dump_parsed(result.parsed)))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if len(self.pending) == 0:
+            return
+
+        with self.connection:
+            self.connection.executemany(
+                f'INSERT OR REPLACE INTO {self.table} (pid, asof, data) VALUES (?, ?, ?)',
+                self.pending
+            )
+        self.written += len(self.pending)
+        self.pending.clear()
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.flush()
+            self.connection.close()
+            self.connection = None
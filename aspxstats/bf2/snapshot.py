@@ -0,0 +1,89 @@
+from array import array
+from typing import Iterable, Dict, Optional
+
+from .table import PlayerStatsTable
+from .types import LeaderboardResponse, PlayerinfoKeySet
+from ..exceptions import Error
+from ..snapshot import write_snapshot, Snapshot, Column
+
+
+def export_player_stats(path: str, table: PlayerStatsTable, metadata: Optional[Dict[str, str]] = None) -> None:
+    """
+    Write a table of player stats to a snapshot file (one column per attribute, plus an "asof" column)
+    :param path: path of the snapshot file
+    :param table: table to export
+    :param metadata: additional information to store with the snapshot (e.g. the provider)
+    """
+    write_snapshot(path, {'asof': table.asof, **table.columns}, {
+        **(metadata or dict()),
+        'key_set': table.key_set.name
+    })
+
+
+def read_player_stats(path: str) -> PlayerStatsTable:
+    """
+    Read a table of player stats from a snapshot file written by :func:`export_player_stats`
+    :param path: path of the snapshot file
+    :return: table containing the same players (in the same rows) as the exported table
+    """
+    with Snapshot(path) as snapshot:
+        key_set = snapshot.metadata.get('key_set')
+        if key_set not in PlayerinfoKeySet.__members__:
+            raise Error(f'Snapshot {path} does not contain player stats')
+
+        table = PlayerStatsTable(PlayerinfoKeySet[key_set])
+        missing = [name for name in ['asof', *table.columns] if name not in snapshot]
+        if len(missing) > 0:
+            raise Error(f'Snapshot {path} is missing player stats columns: {", ".join(missing)}')
+
+        table.asof = snapshot.read_column('asof')
+        for name, column in table.columns.items():
+            table.columns[name] = read_column(snapshot, name, column)
+
+    table.index = {pid: row for (row, pid) in enumerate(table.columns['pid'])}
+    return table
+
+
+def export_leaderboard(path: str, pages: Iterable[LeaderboardResponse], metadata: Optional[Dict[str, str]] = None) -> None:
+    """
+    Write (pages of) a leaderboard to a snapshot file (one column per entry attribute, plus an "asof" column)
+    :param path: path of the snapshot file
+    :param pages: leaderboard responses, e.g. as fetched by paging through the entire leaderboard
+    :param metadata: additional information to store with the snapshot (e.g. the provider and leaderboard type)
+    """
+    write_snapshot(path, get_leaderboard_columns(pages), metadata)
+
+
+def get_leaderboard_columns(pages: Iterable[LeaderboardResponse]) -> Dict[str, Column]:
+    """
+    Turn (pages of) a leaderboard into columns (one per entry attribute, plus an "asof" column)
+    :param pages: leaderboard responses
+    :return: columns by name, as written by :func:`export_leaderboard`
+    """
+    columns: Dict[str, Column] = {
+        'asof': array('q'),
+        'n': array('q'),
+        'pid': array('q'),
+        'nick': list(),
+        'rank': array('q'),
+        'country_code': list()
+    }
+    for page in pages:
+        for entry in page.entries:
+            columns['asof'].append(page.asof)
+            columns['n'].append(entry.n)
+            columns['pid'].append(entry.pid)
+            columns['nick'].append(entry.nick)
+            columns['rank'].append(entry.rank)
+            columns['country_code'].append(entry.country_code)
+
+    return columns
+
+
+def read_column(snapshot: Snapshot, name: str, expected: Column) -> Column:
+    column = snapshot.read_column(name)
+    if isinstance(expected, array) != isinstance(column, array) or \
+            isinstance(column, array) and column.typecode != expected.typecode:
+        raise Error(f'Snapshot {snapshot.path} contains column {name} of unexpected type')
+
+    return column
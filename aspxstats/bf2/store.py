@@ -0,0 +1,500 @@
+"""
+Persistent, memory mapped store of the latest getplayerinfo stats per player.
+
+Each player occupies a fixed-size record, holding their general and map stats (each preceded by its "asof" timestamp,
+the local time it was stored at, zero if the player's stats were never stored for the key set, and whether the stats
+were stored from a typed response, which lacks some attributes). Attributes are packed in schema order, using 8 bytes
+for numeric, floaty and ratio attributes, 1 byte for booly attributes and a fixed number of (UTF-8 encoded,
+zero-padded) bytes for strings. Records are located via an open addressing hash table of pids (linear probing, kept at
+most half full), so any lookup is a few slot reads plus unpacking a single record. Layout of the file (little-endian)::
+
+    magic "AXSTOR", format version (B), layout fingerprint (I), slot count (Q), record count (Q)
+    slots: pid (q), record number + 1 (q, zero for empty slots)
+    records
+"""
+import mmap
+import os
+import struct
+import time
+import zlib
+from typing import Dict, Optional, Iterator, Tuple, Mapping, Any, List, Union, Type
+
+from . import schemas
+from .client import AspxClient
+from .decoding import generate_decoder, Decoder, Placeholder, collect_placeholder_keys
+from .types import PlayerinfoKeySet, PlayerinfoResponse, PlayerinfoGeneralStats, PlayerinfoMapStats
+from ..exceptions import Error, InvalidParameterError
+from ..schema import AttributeSchema
+
+FORMAT_VERSION = 2
+MAGIC = b'AXSTOR'
+
+HEADER = struct.Struct('<6sBIQQ')
+SLOT = struct.Struct('<qq')
+# asof, local time the stats were stored at and whether they were stored from a typed response
+RECORD_HEADER = struct.Struct('<qq?')
+
+# Maximum size of (UTF-8 encoded) string attributes in bytes
+STRING_SIZE = 64
+INITIAL_SLOT_COUNT = 1024
+# Multiplier for Fibonacci hashing of pids
+HASH_MULTIPLIER = 11400714819323198485
+
+
+class RecordLayout:
+    __slots__ = ('key_set', 'cls', 'keys', 'schema', 'struct', 'offset', 'strings', 'untyped', 'decoder')
+
+    key_set: PlayerinfoKeySet
+    # Type of typed responses' data
+    cls: Type[Union[PlayerinfoGeneralStats, PlayerinfoMapStats]]
+    keys: List[str]
+    schema: Dict[str, AttributeSchema]
+    struct: struct.Struct
+    offset: int
+    # Indexes of string attributes' values
+    strings: List[int]
+    # Indexes of attributes typed responses do not contain (unknown if stats were stored from a typed response)
+    untyped: List[int]
+    # Decodes the asof value and a record's (unpacked) values into a typed response
+    decoder: Optional[Decoder]
+
+    def __init__(
+            self,
+            key_set: PlayerinfoKeySet,
+            cls: Type[Union[PlayerinfoGeneralStats, PlayerinfoMapStats]],
+            schema: Dict[str, AttributeSchema],
+            offset: int
+    ):
+        self.key_set = key_set
+        self.cls = cls
+        self.keys = list(schema)
+        self.schema = schema
+        self.struct = struct.Struct('<' + ''.join(RecordLayout.get_format(s) for s in schema.values()))
+        self.offset = offset
+        self.strings = [i for (i, s) in enumerate(schema.values()) if RecordLayout.get_format(s) == f'{STRING_SIZE}s']
+        read = collect_placeholder_keys(cls.from_aspx_response({
+            'asof': Placeholder('asof'),
+            'data': {key: Placeholder(key) for key in schema}
+        }), set())
+        self.untyped = [i for (i, key) in enumerate(self.keys) if key not in read]
+        self.decoder = None
+
+    @property
+    def size(self) -> int:
+        return RECORD_HEADER.size + self.struct.size
+
+    @staticmethod
+    def get_format(schema: AttributeSchema) -> str:
+        if schema.is_numeric:
+            return 'q'
+        if schema.is_booly:
+            return '?'
+        if schema.is_floaty or schema.is_ratio:
+            return 'd'
+        return f'{STRING_SIZE}s'
+
+    @staticmethod
+    def get_default(schema: AttributeSchema) -> Any:
+        # Zero value of the attribute's parsed type
+        return {'q': 0, '?': False, 'd': 0.0}.get(RecordLayout.get_format(schema), '')
+
+
+class PlayerStore:
+    """
+    Persistent store of players' latest general and map stats, keyed by pid
+    The store file is memory mapped, reads and writes access a player's record in place. It grows (by rewriting the
+    file) as players are added. A store must only be opened by a single process at a time.
+    """
+    path: str
+    layouts: Dict[PlayerinfoKeySet, RecordLayout]
+    record_size: int
+    fingerprint: int
+
+    slot_count: int
+    record_count: int
+    file: Optional[mmap.mmap]
+
+    def __init__(self, path: str):
+        self.path = path
+        general = RecordLayout(
+            PlayerinfoKeySet.GENERAL_STATS,
+            PlayerinfoGeneralStats,
+            schemas.GETPLAYERINFO_GENERAL_STATS_RESPONSE_SCHEMA['data'],
+            0
+        )
+        map_stats = RecordLayout(
+            PlayerinfoKeySet.MAP_STATS,
+            PlayerinfoMapStats,
+            schemas.GETPLAYERINFO_MAP_STATS_RESPONSE_SCHEMA['data'],
+            general.size
+        )
+        self.layouts = {general.key_set: general, map_stats.key_set: map_stats}
+        self.record_size = general.size + map_stats.size
+        # Any change to the schemas changes the record layout, making existing files unreadable
+        self.fingerprint = zlib.crc32(';'.join(
+            f'{key}:{RecordLayout.get_format(s)}' for layout in self.layouts.values() for (key, s) in layout.schema.items()
+        ).encode('utf-8'))
+
+        if not os.path.isfile(path):
+            self.create(path, INITIAL_SLOT_COUNT)
+        self.file = None
+        self.open()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.record_count
+
+    def __contains__(self, pid: int) -> bool:
+        return self.find_slot(self.file, self.slot_count, pid)[1] != 0
+
+    def __iter__(self) -> Iterator[int]:
+        for slot in range(self.slot_count):
+            pid, reference = SLOT.unpack_from(self.file, HEADER.size + slot * SLOT.size)
+            if reference != 0:
+                yield pid
+
+    def open(self) -> None:
+        with open(self.path, 'r+b') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER.size:
+                raise Error(f'Failed to open player store {self.path}: invalid header')
+            self.file = mmap.mmap(f.fileno(), 0)
+
+        magic, version, fingerprint, self.slot_count, self.record_count = HEADER.unpack_from(self.file, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise Error(f'Failed to open player store {self.path}: unsupported format (version {version})')
+        if fingerprint != self.fingerprint:
+            self.close()
+            raise Error(f'Failed to open player store {self.path}: written for different getplayerinfo schemas')
+        if size != self.get_file_size(self.slot_count) or self.record_count > self.slot_count // 2:
+            self.close()
+            raise Error(f'Failed to open player store {self.path}: invalid size')
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def put(
+            self,
+            key_set: PlayerinfoKeySet,
+            parsed: Union[Mapping[str, Any], PlayerinfoResponse],
+            stored_at: Optional[int] = None
+    ) -> None:
+        """
+        Store a player's stats, replacing any previously stored stats of the key set
+        :param key_set: key set the stats were requested with
+        :param parsed: parsed getplayerinfo response, as returned by ``getplayerinfo_dict`` for the key set, or typed
+                       response, as returned by ``getplayerinfo`` (attributes not contained in typed responses, e.g.
+                       "vrk", are stored as unknown)
+        :param stored_at: unix timestamp to consider the stats stored at (defaults to now)
+        """
+        layout = self.layouts[key_set]
+        typed = isinstance(parsed, PlayerinfoResponse)
+        if typed:
+            parsed = PlayerStore.to_parsed(layout, parsed)
+
+        data = parsed['data']
+        missing = [key for key in layout.keys if key not in data]
+        if len(missing) > 0:
+            raise InvalidParameterError(f'Parsed getplayerinfo response is missing attributes: {", ".join(missing)}')
+
+        values = [data[key] for key in layout.keys]
+        for i in layout.strings:
+            values[i] = values[i].encode('utf-8')
+            if len(values[i]) > STRING_SIZE:
+                raise InvalidParameterError(
+                    f'Value of getplayerinfo attribute "{layout.keys[i]}" exceeds {STRING_SIZE} bytes'
+                )
+        # Pack before locating/adding the record, so invalid values do not leave an empty record behind
+        try:
+            packed = layout.struct.pack(*values)
+        except struct.error:
+            raise InvalidParameterError(
+                f'Parsed getplayerinfo response of player {data["pid"]} contains unstorable values'
+            ) from None
+
+        pid = data['pid']
+        offset, reference = self.find_slot(self.file, self.slot_count, pid)
+        if reference == 0:
+            if self.record_count + 1 > self.slot_count // 2:
+                self.grow()
+                offset, _ = self.find_slot(self.file, self.slot_count, pid)
+            reference = self.record_count + 1
+            # Write the (empty) record and count it in the header before adding it to the slots, so no slot can ever
+            # reference a record not counted by the header (which would be handed out again to the next new player).
+            # If interrupted in between, the record is merely left unused.
+            self.file[self.get_record_offset(reference):self.get_record_offset(reference) + self.record_size] = \
+                bytes(self.record_size)
+            self.record_count += 1
+            HEADER.pack_into(self.file, 0, MAGIC, FORMAT_VERSION, self.fingerprint, self.slot_count, self.record_count)
+            SLOT.pack_into(self.file, offset, pid, reference)
+
+        record_offset = self.get_record_offset(reference) + layout.offset
+        self.file[record_offset + RECORD_HEADER.size:record_offset + layout.size] = packed
+        RECORD_HEADER.pack_into(
+            self.file, record_offset, parsed['asof'], stored_at if stored_at is not None else int(time.time()), typed
+        )
+
+    def get(self, pid: int, key_set: PlayerinfoKeySet, max_age: Optional[int] = None) -> Optional[dict]:
+        """
+        Get a player's stored stats
+        :param pid: pid of the player
+        :param key_set: key set of the stats
+        :param max_age: maximum time since the stats were stored (in seconds), older stats are considered missing
+        :return: parsed getplayerinfo response (equal to the one stored), None if no (recent enough) stats are stored
+                 (if stored from a typed response, attributes not contained in typed responses are None)
+        """
+        values = self.read(pid, key_set, max_age)
+        if values is None:
+            return None
+
+        asof, typed, values = values
+        if typed:
+            for i in self.layouts[key_set].untyped:
+                values[i] = None
+
+        return {
+            'asof': asof,
+            'data': dict(zip(self.layouts[key_set].keys, values))
+        }
+
+    def read(
+            self,
+            pid: int,
+            key_set: PlayerinfoKeySet,
+            max_age: Optional[int] = None
+    ) -> Optional[Tuple[int, bool, list]]:
+        _, reference = self.find_slot(self.file, self.slot_count, pid)
+        if reference == 0:
+            return None
+
+        layout = self.layouts[key_set]
+        record_offset = self.get_record_offset(reference) + layout.offset
+        asof, stored_at, typed = RECORD_HEADER.unpack_from(self.file, record_offset)
+        if stored_at == 0 or max_age is not None and time.time() - stored_at > max_age:
+            return None
+
+        values = list(layout.struct.unpack_from(self.file, record_offset + RECORD_HEADER.size))
+        for i in layout.strings:
+            values[i] = values[i].rstrip(b'\x00').decode('utf-8')
+
+        return asof, typed, values
+
+    def get_response(
+            self,
+            pid: int,
+            key_set: PlayerinfoKeySet = PlayerinfoKeySet.GENERAL_STATS,
+            max_age: Optional[int] = None
+    ) -> Optional[PlayerinfoResponse]:
+        """
+        Get a player's stored stats as a typed response (see :meth:`get`)
+        """
+        values = self.read(pid, key_set, max_age)
+        if values is None:
+            return None
+
+        asof, _, values = values
+        layout = self.layouts[key_set]
+        if layout.decoder is None:
+            # Decode straight from the record's values, skipping the parsed dict (typed responses do not contain any
+            # of the attributes which may be unknown)
+            layout.decoder = generate_decoder(
+                {'data': layout.schema}, layout.cls.from_aspx_response, layout.keys, convert=False
+            )
+
+        return layout.decoder(asof, values)
+
+    def getplayerinfo(
+            self,
+            client: AspxClient,
+            pid: int,
+            key_set: PlayerinfoKeySet = PlayerinfoKeySet.GENERAL_STATS,
+            max_age: Optional[int] = None
+    ) -> PlayerinfoResponse:
+        """
+        Get a player's stats from the store, only fetching (and storing) them if they are missing or stale
+        :param client: client to fetch the stats with
+        :param pid: pid of the player
+        :param key_set: key set of the stats
+        :param max_age: maximum time since the stats were stored (in seconds)
+        :return: typed response
+        """
+        response = self.get_response(pid, key_set, max_age)
+        if response is None:
+            self.put(key_set, client.getplayerinfo_dict(pid, key_set))
+            response = self.get_response(pid, key_set)
+
+        return response
+
+    @staticmethod
+    def to_parsed(layout: RecordLayout, response: PlayerinfoResponse) -> dict:
+        if not isinstance(response.data, layout.cls):
+            raise InvalidParameterError(
+                f'Typed getplayerinfo response of type {type(response.data).__name__} cannot be stored as '
+                f'{layout.key_set.name} stats'
+            )
+
+        if layout.key_set is PlayerinfoKeySet.GENERAL_STATS:
+            data = flatten_general_stats(response.data)
+        else:
+            data = flatten_map_stats(response.data)
+
+        # Attributes not contained in typed responses still need a value to be packed (read back as None)
+        for key in layout.keys:
+            if key not in data:
+                data[key] = RecordLayout.get_default(layout.schema[key])
+
+        return {'asof': response.asof, 'data': data}
+
+    def grow(self) -> None:
+        # Rewrite the store with twice as many slots, keeping each player's record number
+        slot_count = self.slot_count * 2
+        temporary_path = f'{self.path}.tmp'
+        self.create(temporary_path, slot_count)
+        with open(temporary_path, 'r+b') as f, mmap.mmap(f.fileno(), 0) as target:
+            start, end = self.get_record_offset(1), self.get_record_offset(self.record_count + 1)
+            target_start = self.get_record_offset(1, slot_count)
+            target[target_start:target_start + end - start] = self.file[start:end]
+            for slot in range(self.slot_count):
+                pid, reference = SLOT.unpack_from(self.file, HEADER.size + slot * SLOT.size)
+                if reference != 0:
+                    offset, _ = self.find_slot(target, slot_count, pid)
+                    SLOT.pack_into(target, offset, pid, reference)
+            HEADER.pack_into(target, 0, MAGIC, FORMAT_VERSION, self.fingerprint, slot_count, self.record_count)
+            target.flush()
+
+        self.close()
+        os.replace(temporary_path, self.path)
+        self.open()
+
+    def create(self, path: str, slot_count: int) -> None:
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, self.fingerprint, slot_count, 0))
+            # Extend the file (sparse, where supported) to hold all slots and records
+            f.truncate(self.get_file_size(slot_count))
+
+    def get_file_size(self, slot_count: int) -> int:
+        return self.get_record_offset(slot_count // 2 + 1, slot_count)
+
+    def get_record_offset(self, reference: int, slot_count: Optional[int] = None) -> int:
+        slot_count = slot_count if slot_count is not None else self.slot_count
+        return HEADER.size + slot_count * SLOT.size + (reference - 1) * self.record_size
+
+    @staticmethod
+    def find_slot(file: mmap.mmap, slot_count: int, pid: int) -> Tuple[int, int]:
+        """
+        Find the slot of a pid (linear probing, starting at the pid's hash)
+        :return: offset of the pid's slot (or the empty slot it would be added to) and its record reference (or zero)
+        """
+        slot = (pid * HASH_MULTIPLIER) % 2 ** 64 * slot_count >> 64
+        while True:
+            offset = HEADER.size + slot * SLOT.size
+            slot_pid, reference = SLOT.unpack_from(file, offset)
+            if reference == 0 or slot_pid == pid:
+                return offset, reference
+            slot = (slot + 1) % slot_count
+
+
+def flatten_general_stats(stats: PlayerinfoGeneralStats) -> Dict[str, Any]:
+    """
+    Convert typed general stats back to attributes by their (aspx) key (inverse of ``from_aspx_response``)
+    """
+    data = {
+        'pid': stats.pid,
+        'nick': stats.nick,
+        'rank': stats.rank,
+        'smoc': stats.sgt_major_of_the_corps,
+        'kick': stats.times_kicked,
+        'ban': stats.times_banned,
+        'osaa': stats.accuracy,
+        'jond': stats.timestamp.joined,
+        'lbtl': stats.timestamp.last_battle,
+        'scor': stats.score.total,
+        'twsc': stats.score.teamwork,
+        'cmsc': stats.score.combat,
+        'cdsc': stats.score.commander,
+        'bbrs': stats.score.best_round,
+        'ospm': stats.score.per_minute,
+        'time': stats.time.total,
+        'tcdr': stats.time.commander,
+        'tsql': stats.time.squad_leader,
+        'tsqm': stats.time.squad_member,
+        'tlwf': stats.time.lone_wolf,
+        'mode0': stats.rounds.conquest,
+        'mode1': stats.rounds.supply_lines,
+        'mode2': stats.rounds.coop,
+        'wins': stats.rounds.wins,
+        'loss': stats.rounds.losses,
+        'kill': stats.kills.total,
+        'bksk': stats.kills.streak,
+        'klpm': stats.kills.per_minute,
+        'klpr': stats.kills.per_round,
+        'deth': stats.deaths.total,
+        'suic': stats.deaths.suicides,
+        'wdsk': stats.deaths.streak,
+        'dtpm': stats.deaths.per_minute,
+        'dtpr': stats.deaths.per_round,
+        'cpcp': stats.teamwork.flag_captures,
+        'cacp': stats.teamwork.flag_assists,
+        'dfcp': stats.teamwork.flag_defends,
+        'kila': stats.teamwork.kill_assists,
+        'tgte': stats.teamwork.target_assists,
+        'heal': stats.teamwork.heals,
+        'rviv': stats.teamwork.revives,
+        'rsup': stats.teamwork.resupplies,
+        'rpar': stats.teamwork.repairs,
+        'dkas': stats.teamwork.driver_assists,
+        'dsab': stats.teamwork.driver_specials,
+        'de-6': stats.tactical.teargas_flashbang_deploys,
+        'de-7': stats.tactical.grappling_hook_deploys,
+        'de-8': stats.tactical.zipline_deploys,
+        'fkit': stats.favorite.kit,
+        'fwea': stats.favorite.weapon,
+        'fveh': stats.favorite.vehicle,
+        'fmap': stats.favorite.map,
+        'topr': stats.relations.top_rival.pid,
+        'vmns': stats.relations.top_rival.nick,
+        'vmrs': stats.relations.top_rival.rank,
+        'vmks': stats.relations.top_rival.kills,
+        'tvcr': stats.relations.top_victim.pid,
+        'mvns': stats.relations.top_victim.nick,
+        'mvrs': stats.relations.top_victim.rank,
+        'mvks': stats.relations.top_victim.kills
+    }
+    for w in stats.weapons:
+        data.update({f'wtm-{w.id}': w.time, f'wkl-{w.id}': w.kills, f'wdt-{w.id}': w.deaths,
+                     f'wac-{w.id}': w.accuracy, f'wkd-{w.id}': w.kd})
+    for v in stats.vehicles:
+        data.update({f'vtm-{v.id}': v.time, f'vkl-{v.id}': v.kills, f'vdt-{v.id}': v.deaths,
+                     f'vkd-{v.id}': v.kd, f'vkr-{v.id}': v.road_kills})
+    for a in stats.armies:
+        data.update({f'atm-{a.id}': a.time, f'awn-{a.id}': a.wins, f'alo-{a.id}': a.losses,
+                     f'abr-{a.id}': a.best_round_score})
+    for k in stats.kits:
+        data.update({f'ktm-{k.id}': k.time, f'kkl-{k.id}': k.kills, f'kdt-{k.id}': k.deaths, f'kkd-{k.id}': k.kd})
+
+    return data
+
+
+def flatten_map_stats(stats: PlayerinfoMapStats) -> Dict[str, Any]:
+    """
+    Convert typed map stats back to attributes by their (aspx) key (inverse of ``from_aspx_response``)
+    """
+    data = {
+        'pid': stats.pid,
+        'nick': stats.nick
+    }
+    for m in stats.maps:
+        data.update({f'mtm-{m.id}': m.time, f'mwn-{m.id}': m.wins, f'mls-{m.id}': m.losses})
+
+    return data
@@ -0,0 +1,417 @@
+"""
+Local stand-in for a bf2statistics-compatible stats backend, serving synthetic players (e.g. for load testing).
+Run it via ``python -m aspxstats.bf2.stub --port 8080`` and point a client's ``base_uri`` at it:
+
+    client = AspxClient()
+    client.base_uri = 'http://127.0.0.1:8080/ASP/'
+"""
+import argparse
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Set
+from urllib.parse import urlsplit, parse_qsl
+
+from . import schemas
+from .types import PlayerinfoKeySet
+from .utils import build_aspx_response, find_info_key
+from ..schema import AttributeSchema
+
+COUNTRY_CODES = ['US', 'DE', 'GB', 'FR', 'RU', 'PL', 'NL', 'SE', 'CA', 'AU']
+
+
+@dataclass
+class StubConfig:
+    players: int = 10000
+    first_pid: int = 45000000
+    seed: int = 0
+    # Seconds to wait before sending each response, plus up to latency_jitter seconds of random extra latency
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    # Share of requests answered with an HTTP/500 error
+    error_rate: float = 0.0
+    # Share of requests taking another slow_latency seconds (simulating slow tails)
+    slow_rate: float = 0.0
+    slow_latency: float = 1.0
+
+
+class SyntheticPlayers:
+    """
+    Deterministic generator of synthetic players (the same pid always results in the same stats)
+    """
+    config: StubConfig
+    asof: int
+    leaderboard: List[Tuple[int, int]]
+    pids_by_nick: Dict[str, int]
+
+    def __init__(self, config: StubConfig):
+        self.config = config
+        self.asof = int(time.time())
+        # Rank players by score (descending) for leaderboards
+        self.leaderboard = sorted(
+            ((self.get_score(pid), pid) for pid in self.get_pids()),
+            key=lambda entry: (-entry[0], entry[1])
+        )
+        self.pids_by_nick = {self.get_nick(pid): pid for pid in self.get_pids()}
+
+    def get_pids(self) -> range:
+        return range(self.config.first_pid, self.config.first_pid + self.config.players)
+
+    def exists(self, pid: int) -> bool:
+        return pid in self.get_pids()
+
+    def get_random(self, pid: int, salt: str = '') -> random.Random:
+        return random.Random(f'{self.config.seed}-{pid}-{salt}')
+
+    @staticmethod
+    def get_nick(pid: int) -> str:
+        return f'player{pid}'
+
+    def get_score(self, pid: int) -> int:
+        return self.get_random(pid, 'score').randint(0, 250000)
+
+    def get_rank(self, pid: int) -> int:
+        return min(self.get_score(pid) // 10000, 21)
+
+    def get_country_code(self, pid: int) -> str:
+        return self.get_random(pid, 'country').choice(COUNTRY_CODES)
+
+    def get_playerinfo_values(self, pid: int, key_set: PlayerinfoKeySet) -> Tuple[List[str], List[str]]:
+        if key_set is PlayerinfoKeySet.GENERAL_STATS:
+            schema = schemas.GETPLAYERINFO_GENERAL_STATS_RESPONSE_SCHEMA['data']
+        else:
+            schema = schemas.GETPLAYERINFO_MAP_STATS_RESPONSE_SCHEMA['data']
+
+        rnd = self.get_random(pid, key_set.name)
+        joined = self.asof - rnd.randint(86400, 86400 * 365 * 15)
+        overrides = {
+            'pid': str(pid),
+            'nick': self.get_nick(pid),
+            'scor': str(self.get_score(pid)),
+            'rank': str(self.get_rank(pid)),
+            'jond': str(joined),
+            'lbtl': str(rnd.randint(joined, self.asof)),
+            'mvns': self.get_nick(self.config.first_pid + rnd.randrange(self.config.players)),
+            'vmns': self.get_nick(self.config.first_pid + rnd.randrange(self.config.players)),
+        }
+
+        keys = list(schema.keys())
+        values = [overrides[key] if key in overrides else self.get_value(rnd, schema[key]) for key in keys]
+        return keys, values
+
+    @staticmethod
+    def get_value(rnd: random.Random, schema: AttributeSchema) -> str:
+        if schema.is_numeric:
+            return str(rnd.randint(0, 100000))
+        if schema.is_booly:
+            return str(rnd.randint(0, 1))
+        if schema.is_floaty:
+            return f'{rnd.uniform(0, 100):.2f}'
+        if schema.is_ratio:
+            return f'{rnd.randint(0, 5000)}:{rnd.randint(0, 5000)}'
+        return 'stub'
+
+
+class StubServer:
+    config: StubConfig
+    players: SyntheticPlayers
+    server: Optional[asyncio.AbstractServer]
+    connections: Set[asyncio.Task]
+
+    def __init__(self, config: Optional[StubConfig] = None):
+        self.config = config or StubConfig()
+        self.players = SyntheticPlayers(self.config)
+        self.server = None
+        self.connections = set()
+        # Responses only depend on the request, so cache them to keep serving cheap
+        self.render = lru_cache(maxsize=65536)(self.render)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8080) -> None:
+        self.server = await asyncio.start_server(self.handle_connection, host, port)
+
+    async def close(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            # Closing the server does not close any open (keep-alive) connections
+            for connection in self.connections:
+                connection.cancel()
+            await asyncio.gather(*self.connections, return_exceptions=True)
+            await self.server.wait_closed()
+            self.server = None
+
+    @property
+    def port(self) -> int:
+        return self.server.sockets[0].getsockname()[1]
+
+    @property
+    def base_uri(self) -> str:
+        return f'http://127.0.0.1:{self.port}/ASP/'
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = asyncio.current_task()
+        self.connections.add(connection)
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+
+                request_line, *header_lines = head.decode('latin-1').split('\r\n')
+                method, target, version = (request_line.split(' ') + ['', ''])[:3]
+                headers = {
+                    name.strip().casefold(): value.strip()
+                    for name, _, value in (line.partition(':') for line in header_lines if line)
+                }
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').casefold() != 'close'
+
+                status, body = await self.respond(method, target)
+                writer.write(
+                    f'HTTP/1.1 {status}\r\n'
+                    f'Content-Type: text/plain; charset=utf-8\r\n'
+                    f'Content-Length: {len(body)}\r\n'
+                    f'Connection: {"keep-alive" if keep_alive else "close"}\r\n'
+                    f'\r\n'.encode('latin-1') + body
+                )
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        finally:
+            # Let cancellation (e.g. by close) propagate once the connection is cleaned up
+            self.connections.discard(connection)
+            writer.close()
+
+    async def respond(self, method: str, target: str) -> Tuple[str, bytes]:
+        rnd = random.random
+        delay = self.config.latency + rnd() * self.config.latency_jitter
+        if rnd() < self.config.slow_rate:
+            delay += self.config.slow_latency
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if method != 'GET':
+            return '405 Method Not Allowed', b''
+        if rnd() < self.config.error_rate:
+            return '500 Internal Server Error', b''
+
+        url = urlsplit(target)
+        endpoint = url.path.rsplit('/', 1)[-1].casefold()
+        params = tuple(sorted(parse_qsl(url.query)))
+        body = self.render(endpoint, params)
+        if body is None:
+            return '404 Not Found', b''
+
+        return '200 OK', body.encode('utf-8')
+
+    def render(self, endpoint: str, params: Tuple[Tuple[str, str], ...]) -> Optional[str]:
+        query = dict(params)
+        if endpoint == 'searchforplayers.aspx':
+            return self.render_searchforplayers(query.get('nick', ''), query.get('where', 'x'), query.get('sort', 'a'))
+        if endpoint == 'getleaderboard.aspx':
+            return self.render_getleaderboard(
+                self.get_int(query, 'pos', 1), self.get_int(query, 'before', 0), self.get_int(query, 'after', 19)
+            )
+        if endpoint == 'getbackendinfo.aspx':
+            return self.render_getbackendinfo()
+
+        # All other endpoints are player specific
+        pid = self.get_int(query, 'pid', -1)
+        if not self.players.exists(pid):
+            return build_aspx_response([['E', '998']])
+        if endpoint == 'getplayerinfo.aspx':
+            return self.render_getplayerinfo(pid, query.get('info', ''))
+        if endpoint == 'getrankinfo.aspx':
+            return self.render_getrankinfo(pid)
+        if endpoint == 'getawardsinfo.aspx':
+            return self.render_getawardsinfo(pid)
+        if endpoint == 'getunlocksinfo.aspx':
+            return self.render_getunlocksinfo(pid)
+        if endpoint == 'verifyplayer.aspx':
+            return self.render_verifyplayer(pid, query.get('SoldierNick', ''))
+
+        return None
+
+    def render_searchforplayers(self, nick: str, where: str, sort: str) -> str:
+        if where == 'x':
+            pids = [self.players.pids_by_nick[nick]] if nick in self.players.pids_by_nick else []
+        else:
+            matchers = {
+                'a': lambda candidate: nick in candidate,
+                'b': lambda candidate: candidate.startswith(nick),
+                'e': lambda candidate: candidate.endswith(nick)
+            }
+            matches = matchers.get(where, matchers['a'])
+            pids = [pid for (candidate, pid) in self.players.pids_by_nick.items() if matches(candidate)]
+
+        pids = sorted(pids, reverse=sort == 'r')[:20]
+        return build_aspx_response([
+            ['O'],
+            ['H', 'asof'],
+            ['D', str(self.players.asof)],
+            ['H', 'n', 'pid', 'nick', 'score'],
+            *[
+                ['D', str(n), str(pid), self.players.get_nick(pid), str(self.players.get_score(pid))]
+                for (n, pid) in enumerate(pids, start=1)
+            ]
+        ])
+
+    def render_getleaderboard(self, pos: int, before: int, after: int) -> str:
+        first = max(pos - before, 1)
+        last = min(pos + after, len(self.players.leaderboard))
+        return build_aspx_response([
+            ['O'],
+            ['H', 'size', 'asof'],
+            ['D', str(len(self.players.leaderboard)), str(self.players.asof)],
+            ['H', 'n', 'pid', 'nick', 'score', 'playerrank', 'countrycode'],
+            *[
+                [
+                    'D', str(n), str(pid), self.players.get_nick(pid), str(score),
+                    str(self.players.get_rank(pid)), self.players.get_country_code(pid)
+                ]
+                for (n, (score, pid)) in enumerate(self.players.leaderboard[first - 1:last], start=first)
+            ]
+        ])
+
+    def render_getplayerinfo(self, pid: int, info: str) -> str:
+        info_keys = info.split(',')
+        map_info_keys = PlayerinfoKeySet.MAP_STATS.value.split(',')
+        key_set = PlayerinfoKeySet.MAP_STATS if all(info_key in map_info_keys for info_key in info_keys) \
+            else PlayerinfoKeySet.GENERAL_STATS
+        keys, values = self.players.get_playerinfo_values(pid, key_set)
+        if info != '' and info != key_set.value:
+            # Custom info param, only return requested attributes (plus pid and nick, which are always returned)
+            key_set_info_keys = key_set.value.split(',')
+            group_requested = any(info_key.endswith('*') for info_key in info_keys)
+            requested = [
+                key in ('pid', 'nick') or
+                find_info_key(info_keys, key) is not None or
+                (group_requested and find_info_key(key_set_info_keys, key) is None)
+                for key in keys
+            ]
+            keys = [key for (key, include) in zip(keys, requested) if include]
+            values = [value for (value, include) in zip(values, requested) if include]
+        return build_aspx_response([
+            ['O'],
+            ['H', 'asof'],
+            ['D', str(self.players.asof)],
+            ['H', *keys],
+            ['D', *values]
+        ])
+
+    def render_getrankinfo(self, pid: int) -> str:
+        rnd = self.players.get_random(pid, 'rankinfo')
+        return build_aspx_response([
+            ['O'],
+            ['H', 'rank', 'chng', 'decr'],
+            ['D', str(self.players.get_rank(pid)), str(int(rnd.random() < 0.05)), '0']
+        ])
+
+    def render_getawardsinfo(self, pid: int) -> str:
+        rnd = self.players.get_random(pid, 'awards')
+        awards = sorted(rnd.sample(range(1031105, 1031200), rnd.randint(0, 20)))
+        return build_aspx_response([
+            ['O'],
+            ['H', 'pid', 'asof'],
+            ['D', str(pid), str(self.players.asof)],
+            ['H', 'award', 'level', 'when', 'first'],
+            *[
+                ['D', str(award), str(rnd.randint(1, 3)), str(self.players.asof - rnd.randint(0, 10 ** 8)), '0']
+                for award in awards
+            ]
+        ])
+
+    def render_getunlocksinfo(self, pid: int) -> str:
+        rnd = self.players.get_random(pid, 'unlocks')
+        return build_aspx_response([
+            ['O'],
+            ['H', 'pid', 'nick', 'asof'],
+            ['D', str(pid), self.players.get_nick(pid), str(self.players.asof)],
+            ['H', 'enlisted', 'officer'],
+            ['D', str(rnd.randint(0, 7)), '0'],
+            ['H', 'id', 'state'],
+            *[['D', str(unlock_id), rnd.choice(['n', 's'])] for unlock_id in self.get_unlock_ids()]
+        ])
+
+    def render_getbackendinfo(self) -> str:
+        return build_aspx_response([
+            ['O'],
+            ['H', 'ver', 'now'],
+            ['D', '0.1', str(int(time.time()))],
+            ['H', 'id', 'kit', 'name', 'descr'],
+            *[['D', str(unlock_id), str(kit), f'unlock{unlock_id}', 'stub unlock'] for (kit, unlock_id) in
+              enumerate(self.get_unlock_ids()[:7])]
+        ])
+
+    def render_verifyplayer(self, pid: int, nick: str) -> str:
+        verified = nick == self.players.get_nick(pid)
+        return build_aspx_response([
+            ['O'],
+            ['H', 'pid', 'nick', 'spid', 'asof'],
+            ['D', str(pid), nick if verified else f'INVALID{nick}', str(pid), str(int(time.time()))],
+            ['H', 'result'],
+            ['D', 'Ok' if verified else 'InvalidReportedNick']
+        ])
+
+    @staticmethod
+    def get_unlock_ids() -> List[int]:
+        return [11, 22, 33, 44, 55, 66, 77, 88, 99, 111, 222, 333, 444, 555]
+
+    @staticmethod
+    def get_int(query: Dict[str, str], key: str, default: int) -> int:
+        try:
+            return int(query.get(key, default))
+        except ValueError:
+            return default
+
+
+async def serve(host: str, port: int, config: StubConfig) -> None:
+    async with StubServer(config) as server:
+        await server.start(host, port)
+        print(f'Serving {config.players} synthetic players on {server.base_uri}', flush=True)
+        await server.server.serve_forever()
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Serve synthetic players via a bf2statistics-compatible ASPX API')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--players', type=int, default=StubConfig.players)
+    parser.add_argument('--first-pid', type=int, default=StubConfig.first_pid)
+    parser.add_argument('--seed', type=int, default=StubConfig.seed)
+    parser.add_argument('--latency', type=float, default=StubConfig.latency, help='base latency in seconds')
+    parser.add_argument('--latency-jitter', type=float, default=StubConfig.latency_jitter,
+                        help='maximum random extra latency in seconds')
+    parser.add_argument('--error-rate', type=float, default=StubConfig.error_rate,
+                        help='share of requests to answer with HTTP/500')
+    parser.add_argument('--slow-rate', type=float, default=StubConfig.slow_rate,
+                        help='share of requests to delay by another --slow-latency seconds')
+    parser.add_argument('--slow-latency', type=float, default=StubConfig.slow_latency)
+    parsed = parser.parse_args(args)
+
+    config = StubConfig(
+        players=parsed.players,
+        first_pid=parsed.first_pid,
+        seed=parsed.seed,
+        latency=parsed.latency,
+        latency_jitter=parsed.latency_jitter,
+        error_rate=parsed.error_rate,
+        slow_rate=parsed.slow_rate,
+        slow_latency=parsed.slow_latency
+    )
+    try:
+        asyncio.run(serve(parsed.host, parsed.port, config))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
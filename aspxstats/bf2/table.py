@@ -0,0 +1,153 @@
+from array import array
+from typing import Dict, Union, List, Iterable, Iterator, Optional, Mapping, Any
+
+from . import schemas
+from .types import PlayerinfoKeySet
+from ..exceptions import InvalidParameterError
+from ..schema import AttributeSchema
+
+Column = Union[array, List[str]]
+
+
+class PlayerStatsTable:
+    """
+    Columnar (struct-of-arrays) storage of many players' getplayerinfo stats
+    Each attribute of the key set's schema is stored in a column, using an :class:`array.array` for numeric, booly,
+    floaty and ratio attributes (8, 1, 8 and 8 bytes per player) and a list for any string attributes (nicks).
+    Compared to a list of parsed dicts, this avoids a dict plus a boxed object per player and attribute.
+    Players are indexed by pid, adding a player again replaces their previous row.
+    """
+    key_set: PlayerinfoKeySet
+    schema: Dict[str, AttributeSchema]
+    columns: Dict[str, Column]
+    asof: array
+    index: Dict[int, int]
+
+    def __init__(self, key_set: PlayerinfoKeySet = PlayerinfoKeySet.GENERAL_STATS):
+        self.key_set = key_set
+        if key_set is PlayerinfoKeySet.GENERAL_STATS:
+            self.schema = schemas.GETPLAYERINFO_GENERAL_STATS_RESPONSE_SCHEMA['data']
+        else:
+            self.schema = schemas.GETPLAYERINFO_MAP_STATS_RESPONSE_SCHEMA['data']
+
+        self.columns = {
+            key: PlayerStatsTable.create_column(attribute_schema) for (key, attribute_schema) in self.schema.items()
+        }
+        self.asof = array('q')
+        self.index = dict()
+
+    def __len__(self) -> int:
+        return len(self.asof)
+
+    def __contains__(self, pid: int) -> bool:
+        return pid in self.index
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.index)
+
+    def append(self, parsed: Mapping[str, Any]) -> int:
+        """
+        Add a player's stats
+        :param parsed: parsed getplayerinfo response, as returned by ``getplayerinfo_dict`` for the table's key set
+        :return: row of the player
+        """
+        data = parsed['data']
+        missing = [key for key in self.schema if key not in data]
+        if len(missing) > 0:
+            raise InvalidParameterError(f'Parsed getplayerinfo response is missing attributes: {", ".join(missing)}')
+
+        pid = data['pid']
+        row = self.index.get(pid)
+        if row is None:
+            return self.append_row(pid, parsed['asof'], data)
+
+        # Restore the previous values if any value cannot be stored, so the row is not left partially updated
+        previous_asof, previous = self.asof[row], [column[row] for column in self.columns.values()]
+        try:
+            self.asof[row] = parsed['asof']
+            for key, column in self.columns.items():
+                column[row] = data[key]
+        except (OverflowError, TypeError):
+            self.asof[row] = previous_asof
+            for column, value in zip(self.columns.values(), previous):
+                column[row] = value
+            raise InvalidParameterError(f'Parsed getplayerinfo response of player {pid} contains unstorable values') from None
+
+        return row
+
+    def append_row(self, pid: int, asof: int, data: Mapping[str, Any]) -> int:
+        row = len(self.asof)
+        try:
+            self.asof.append(asof)
+            for key, column in self.columns.items():
+                column.append(data[key])
+        except (OverflowError, TypeError):
+            # Remove any values already appended, so all columns remain of equal length
+            for column in [self.asof, *self.columns.values()]:
+                del column[row:]
+            raise InvalidParameterError(f'Parsed getplayerinfo response of player {pid} contains unstorable values') from None
+
+        self.index[pid] = row
+        return row
+
+    def extend(self, parsed: Iterable[Mapping[str, Any]]) -> None:
+        for p in parsed:
+            self.append(p)
+
+    def get(self, pid: int) -> Optional[dict]:
+        """
+        Get a player's stats
+        :param pid: pid of the player
+        :return: parsed getplayerinfo response (equal to the one added), None if the player is not in the table
+        """
+        row = self.index.get(pid)
+        if row is None:
+            return None
+
+        return self.get_row(row)
+
+    def get_row(self, row: int) -> dict:
+        return {
+            'asof': self.asof[row],
+            'data': {
+                key: self.to_value(column[row], self.schema[key]) for (key, column) in self.columns.items()
+            }
+        }
+
+    def column(self, key: str) -> Column:
+        """
+        Get the values of an attribute for all players, in row order (see :attr:`index` for each pid's row)
+        (booly attributes are stored as 0/1 integers, ratio attributes as floats)
+        :param key: (aspx) key of the attribute, e.g. "kill"
+        :return: column of the attribute (not a copy, do not modify)
+        """
+        column = self.columns.get(key)
+        if column is None:
+            raise InvalidParameterError(f'Unknown getplayerinfo attribute "{key}" for key set {self.key_set.name}')
+
+        return column
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Size of all numeric columns' values in bytes (excluding string columns and the pid index)
+        """
+        return sum(
+            len(column) * column.itemsize for column in [self.asof, *self.columns.values()] if isinstance(column, array)
+        )
+
+    @staticmethod
+    def create_column(schema: AttributeSchema) -> Column:
+        if schema.is_numeric:
+            return array('q')
+        if schema.is_booly:
+            return array('b')
+        if schema.is_floaty or schema.is_ratio:
+            return array('d')
+        return list()
+
+    @staticmethod
+    def to_value(value: Union[int, float, str], schema: AttributeSchema) -> Union[int, float, str, bool]:
+        if schema.is_booly:
+            return value == 1
+        return value
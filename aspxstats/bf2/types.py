@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Union
+from typing import List, Union, Dict
 
 from .utils import group_stats_by_item
+from ..serialization import Serializable
 
 
 class StatsProvider(str, Enum):
@@ -25,7 +26,7 @@ class SearchSortOrder(str, Enum):
 
 
 @dataclass
-class PlayerSearchResult:
+class PlayerSearchResult(Serializable):
     n: int
     pid: int
     nick: str
@@ -39,7 +40,7 @@ class PlayerSearchResult:
 
 
 @dataclass
-class PlayerSearchResponse:
+class PlayerSearchResponse(Serializable):
     asof: int
     results: List[PlayerSearchResult]
 
@@ -118,7 +119,7 @@ class KitType(int, Enum):
 
 
 @dataclass
-class LeaderboardEntry:
+class LeaderboardEntry(Serializable):
     n: int
     pid: int
     nick: str
@@ -134,7 +135,7 @@ class LeaderboardEntry:
 
 
 @dataclass
-class LeaderboardResponse:
+class LeaderboardResponse(Serializable):
     size: int
     asof: int
     entries: List[LeaderboardEntry]
@@ -170,7 +171,7 @@ class PlayerinfoKeySet(str, Enum):
 
 
 @dataclass
-class PlayerinfoTimestamps:
+class PlayerinfoTimestamps(Serializable):
     joined: int
     last_battle: int
 
@@ -180,7 +181,7 @@ class PlayerinfoTimestamps:
 
 
 @dataclass
-class PlayerinfoScores:
+class PlayerinfoScores(Serializable):
     total: int
     teamwork: int
     combat: int
@@ -198,7 +199,7 @@ class PlayerinfoScores:
 
 
 @dataclass
-class PlayerinfoTeamwork:
+class PlayerinfoTeamwork(Serializable):
     flag_captures: int
     flag_assists: int
     flag_defends: int
@@ -226,7 +227,7 @@ class PlayerinfoTeamwork:
 
 
 @dataclass
-class PlayerinfoTimes:
+class PlayerinfoTimes(Serializable):
     total: int
     commander: int
     squad_leader: int
@@ -242,7 +243,7 @@ class PlayerinfoTimes:
 
 
 @dataclass
-class PlayerinfoRounds:
+class PlayerinfoRounds(Serializable):
     conquest: int
     supply_lines: int
     coop: int
@@ -258,7 +259,7 @@ class PlayerinfoRounds:
 
 
 @dataclass
-class PlayerinfoKills:
+class PlayerinfoKills(Serializable):
     total: int
     streak: int
     per_minute: float
@@ -272,7 +273,7 @@ class PlayerinfoKills:
 
 
 @dataclass
-class PlayerinfoDeaths:
+class PlayerinfoDeaths(Serializable):
     total: int
     suicides: int
     streak: int
@@ -288,7 +289,7 @@ class PlayerinfoDeaths:
 
 
 @dataclass
-class PlayerinfoFavorites:
+class PlayerinfoFavorites(Serializable):
     kit: int
     weapon: int
     vehicle: int
@@ -302,7 +303,7 @@ class PlayerinfoFavorites:
 
 
 @dataclass
-class PlayerinfoWeapon:
+class PlayerinfoWeapon(Serializable):
     id: int
     time: int
     kills: int
@@ -320,7 +321,7 @@ class PlayerinfoWeapon:
 
 
 @dataclass
-class PlayerinfoVehicle:
+class PlayerinfoVehicle(Serializable):
     id: int
     time: int
     kills: int
@@ -338,7 +339,7 @@ class PlayerinfoVehicle:
 
 
 @dataclass
-class PlayerinfoArmy:
+class PlayerinfoArmy(Serializable):
     id: int
     time: int
     wins: int
@@ -354,7 +355,7 @@ class PlayerinfoArmy:
 
 
 @dataclass
-class PlayerinfoKit:
+class PlayerinfoKit(Serializable):
     id: int
     time: int
     kills: int
@@ -370,7 +371,7 @@ class PlayerinfoKit:
 
 
 @dataclass
-class PlayerinfoTactical:
+class PlayerinfoTactical(Serializable):
     teargas_flashbang_deploys: int
     grappling_hook_deploys: int
     zipline_deploys: int
@@ -382,7 +383,7 @@ class PlayerinfoTactical:
 
 
 @dataclass
-class PlayerinfoRelation:
+class PlayerinfoRelation(Serializable):
     pid: int
     nick: str
     rank: int
@@ -396,7 +397,7 @@ class PlayerinfoRelation:
 
 
 @dataclass
-class PlayerinfoRelations:
+class PlayerinfoRelations(Serializable):
     top_rival: PlayerinfoRelation
     top_victim: PlayerinfoRelation
 
@@ -406,7 +407,7 @@ class PlayerinfoRelations:
 
 
 @dataclass
-class PlayerinfoGeneralStats:
+class PlayerinfoGeneralStats(Serializable):
     pid: int
     nick: str
     rank: int
@@ -581,7 +582,7 @@ class PlayerinfoGeneralStats:
 
 
 @dataclass
-class PlayerinfoMap:
+class PlayerinfoMap(Serializable):
     id: int
     time: int
     wins: int
@@ -595,7 +596,7 @@ class PlayerinfoMap:
 
 
 @dataclass
-class PlayerinfoMapStats:
+class PlayerinfoMapStats(Serializable):
     pid: int
     nick: str
     maps: List[PlayerinfoMap]
@@ -622,9 +623,33 @@ class PlayerinfoMapStats:
 
 
 @dataclass
-class PlayerinfoResponse:
+class PlayerinfoProjection(Serializable):
+    pid: int
+    nick: str
+    # Converted values of all other requested attributes by their (aspx) key
+    values: Dict[str, Union[int, float, bool, str]]
+
+    def __iter__(self):
+        yield 'pid', self.pid
+        yield 'nick', self.nick
+        yield 'values', dict(self.values)
+
+    @staticmethod
+    def from_aspx_response(parsed: dict) -> 'PlayerinfoProjection':
+        return PlayerinfoProjection(
+            pid=parsed['data']['pid'],
+            nick=parsed['data']['nick'],
+            values={
+                key: value for (key, value) in parsed['data'].items()
+                if key not in ('pid', 'nick')
+            }
+        )
+
+
+@dataclass
+class PlayerinfoResponse(Serializable):
     asof: int
-    data: Union[PlayerinfoGeneralStats, PlayerinfoMapStats]
+    data: Union[PlayerinfoGeneralStats, PlayerinfoMapStats, PlayerinfoProjection]
 
     def __iter__(self):
         yield 'asof', self.asof
@@ -632,7 +657,7 @@ class PlayerinfoResponse:
 
 
 @dataclass
-class RankinfoData:
+class RankinfoData(Serializable):
     rank: int
     promoted: bool
     demoted: bool
@@ -644,7 +669,7 @@ class RankinfoData:
 
 
 @dataclass
-class RankinfoResponse:
+class RankinfoResponse(Serializable):
     data: RankinfoData
 
     def __iter__(self):
@@ -1,4 +1,31 @@
-from typing import List, Dict, Union
+from typing import List, Dict, Union, Optional
+
+from ..validation import is_numeric
+
+"""
+If a player has no kills/deaths, the PlayBF2 backend returns
+a whitespace instead of a zero integer value for:
+tvcr (top victim pid)
+topr (top opponent pid)
+mvrs (top victim rank)
+vmrs (top opponent rank)
+BF2Hub handles it better in most cases, but also has players with an empty string mvrs/vmrs or even more
+interesting values such as "NOT VAILABLE" for tvcr (pid 10226681 asof 1617839795)
+They also frequently return "NOT VAILABLE" for map stats values (pid 7568965 asof 1175020033)
+=> replace any invalid getplayerinfo values with 0 (but don't add it if the key is missing)
+"""
+GETPLAYERINFO_FIXED_KEYS = {'tvcr', 'topr', 'mvrs', 'vmrs'}
+GETPLAYERINFO_FIXED_PREFIXES = {
+    'vtm-', 'vkl-', 'vdt-', 'vkr-',  # vehicle stats prefixes
+    'atm-', 'awn-', 'alo-', 'abr-',  # army stats prefixes
+    'ktm-', 'kkl-', 'kdt-',  # kit stats prefixes
+    'mtm-', 'mwn-', 'mls-'  # map stats prefixes
+}
+"""
+PlayBF2 often returns favorite kit/map/vehicle/weapon values with a "time" prefix
+e.g. fveh as "time1" (pid 92163112 asof 1725108062)
+"""
+GETPLAYERINFO_FAVORITE_KEYS = {'fkit', 'fmap', 'fveh', 'fwea'}
 
 
 def group_stats_by_item(
@@ -57,3 +84,36 @@ def build_aspx_response(lines: List[List[str]]) -> str:
     # Append length indicator line
     return data + '\n$\t' + str(length) + '\t$'
 
+
+def find_info_key(info_keys: List[str], key: str) -> Optional[str]:
+    """
+    Find the getplayerinfo "info" key which requests a given attribute
+    :param info_keys: keys of an "info" param value, e.g. ['per*', 'cmb*', 'twsc', 'wtm-']
+    :param key: attribute key, e.g. "wtm-0"
+    :return: the info key matching the attribute key exactly or by prefix (info keys ending in "-"),
+        None if the attribute can only be requested via a group info key (ending in "*", such as "per*")
+    """
+    for info_key in info_keys:
+        if info_key == key or (info_key.endswith('-') and key.startswith(info_key)):
+            return info_key
+
+    return None
+
+
+def is_fixed_getplayerinfo_key(key: str) -> bool:
+    return key in GETPLAYERINFO_FIXED_KEYS or key[:4] in GETPLAYERINFO_FIXED_PREFIXES or key in GETPLAYERINFO_FAVORITE_KEYS
+
+
+def fix_getplayerinfo_value(key: str, value: str) -> str:
+    """
+    Fix a single getplayerinfo value (same as AspxClient.fix_getplayerinfo_values does for all values)
+    :param key: attribute key
+    :param value: raw attribute value
+    :return: fixed value (or the value as is, if it does not need to be fixed)
+    """
+    if (key in GETPLAYERINFO_FIXED_KEYS or key[:4] in GETPLAYERINFO_FIXED_PREFIXES) and not is_numeric(value):
+        return '0'
+    if key in GETPLAYERINFO_FAVORITE_KEYS and value.startswith('time'):
+        return value[4:]
+
+    return value
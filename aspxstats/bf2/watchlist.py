@@ -0,0 +1,281 @@
+import asyncio
+import heapq
+import inspect
+import random
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional, Dict, Iterable, Callable, Awaitable, Union, List, Tuple, Set
+
+from .async_client import AsyncAspxClient
+from .types import PlayerinfoKeySet
+from ..exceptions import InvalidParameterError
+
+# Attributes requested when polling a player's stats (a projection of the general stats)
+POLL_FIELDS = ('scor', 'rank', 'lbtl')
+
+
+class WatchlistEventType(str, Enum):
+    RANK_UP = 'rank_up'
+    RANK_DOWN = 'rank_down'
+    SCORE_CHANGED = 'score_changed'
+    AWARD_RECEIVED = 'award_received'
+
+
+@dataclass
+class WatchlistEvent:
+    type: WatchlistEventType
+    pid: int
+    nick: str
+    # Previous and current rank/score/award level (previous level is None for first time awards)
+    old: Optional[int]
+    new: int
+    # Id of the received award (AWARD_RECEIVED only)
+    award: Optional[int] = None
+
+
+@dataclass
+class WatchedPlayer:
+    # Values as of the last poll, None until the player was polled successfully
+    score: Optional[int] = None
+    rank: Optional[int] = None
+    last_battle: Optional[int] = None
+    # Level of each award by award id
+    awards: Optional[Dict[int, int]] = None
+    # Time the player's next poll is scheduled at (any other schedule entries of the player are stale)
+    next_due: Optional[float] = None
+
+
+WatchlistCallback = Callable[[WatchlistEvent], Union[None, Awaitable[None]]]
+
+
+class WatchlistPoller:
+    """
+    Periodically polls a set of players, emitting events for any rank ups/downs, score changes and received awards
+    Each poll requests the player's score, rank and last battle timestamp (projected getplayerinfo), awards are only
+    requested again if the player played a battle since the last poll. Players who played recently are polled every
+    active_interval seconds, all others every idle_interval seconds. Intervals are jittered, so players added at the
+    same time do not keep getting polled at the same time.
+    """
+    client: AsyncAspxClient
+    queue: Optional['asyncio.Queue[WatchlistEvent]']
+    callback: Optional[WatchlistCallback]
+    active_interval: float
+    idle_interval: float
+    active_window: float
+    jitter: float
+    max_concurrency: int
+
+    players: Dict[int, WatchedPlayer]
+    # Players by time (event loop clock) they are due to be polled at, as (due, pid) tuples
+    # (entries not matching the player's next_due are stale and skipped)
+    schedule: List[Tuple[float, int]]
+    polls: int
+    errors: int
+    last_error: Optional[Exception]
+
+    rng: random.Random
+    wakeup: Optional[asyncio.Event]
+    stopped: bool
+
+    def __init__(
+            self,
+            client: AsyncAspxClient,
+            pids: Iterable[int] = (),
+            queue: Optional['asyncio.Queue[WatchlistEvent]'] = None,
+            callback: Optional[WatchlistCallback] = None,
+            active_interval: float = 60.0,
+            idle_interval: float = 900.0,
+            active_window: float = 3600.0,
+            jitter: float = 0.1,
+            max_concurrency: int = 10,
+            seed: Optional[int] = None
+    ):
+        """
+        :param client: client to poll with
+        :param pids: players to watch
+        :param queue: queue to put events into
+        :param callback: function (or coroutine function) to call with each event
+        :param active_interval: seconds between polls of players who played within the active window
+        :param idle_interval: seconds between polls of all other players (as well as after failed polls)
+        :param active_window: seconds since a player's last battle for them to be considered active
+        :param jitter: maximum share of the interval to randomly add to/subtract from each interval
+        :param max_concurrency: maximum number of players to poll at the same time
+        :param seed: seed for the random jitter
+        """
+        if queue is None and callback is None:
+            raise InvalidParameterError('Watchlist poller requires a queue and/or callback to emit events to')
+
+        self.client = client
+        self.queue = queue
+        self.callback = callback
+        self.active_interval = active_interval
+        self.idle_interval = idle_interval
+        self.active_window = active_window
+        self.jitter = jitter
+        self.max_concurrency = max_concurrency
+
+        self.players = dict()
+        self.schedule = list()
+        self.polls = 0
+        self.errors = 0
+        self.last_error = None
+
+        self.rng = random.Random(seed)
+        self.wakeup = None
+        self.stopped = False
+
+        for pid in pids:
+            self.add(pid)
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def __contains__(self, pid: int) -> bool:
+        return pid in self.players
+
+    def add(self, pid: int) -> None:
+        """
+        Start watching a player (first poll is spread over the active interval, so a large watchlist is not polled at once)
+        :param pid: pid of the player
+        """
+        if pid in self.players:
+            return
+
+        self.players[pid] = WatchedPlayer()
+        self.reschedule(pid, self.rng.uniform(0, self.active_interval))
+
+    def remove(self, pid: int) -> None:
+        # Any scheduled poll is skipped once it is due (including after the player was added again)
+        self.players.pop(pid, None)
+
+    def stop(self) -> None:
+        self.stopped = True
+        if self.wakeup is not None:
+            self.wakeup.set()
+
+    async def run(self) -> None:
+        """
+        Poll players as they are due, until stopped (waits for any polls in progress before returning)
+        """
+        self.stopped = False
+        self.wakeup = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks: Set[asyncio.Task] = set()
+        try:
+            while not self.stopped:
+                delay = self.schedule[0][0] - loop.time() if len(self.schedule) > 0 else None
+                if delay is None or delay > 0:
+                    # Sleep until the next player is due, unless players are added or the poller is stopped
+                    self.wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self.wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                due, pid = heapq.heappop(self.schedule)
+                player = self.players.get(pid)
+                if player is None or player.next_due != due:
+                    continue
+
+                await semaphore.acquire()
+                task = asyncio.create_task(self.poll_and_reschedule(pid))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                task.add_done_callback(lambda _: semaphore.release())
+        finally:
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.wakeup = None
+
+    async def poll_and_reschedule(self, pid: int) -> None:
+        player = self.players.get(pid)
+        # Failed polls are retried after the idle interval
+        last_battle = None
+        try:
+            await self.poll(pid)
+            last_battle = player.last_battle
+        except Exception as e:
+            # Includes exceptions raised by the callback, none of which must stop the player from being polled again
+            self.errors += 1
+            self.last_error = e
+        finally:
+            self.reschedule(pid, self.get_interval(last_battle))
+
+    async def poll(self, pid: int) -> List[WatchlistEvent]:
+        """
+        Poll a player once, emitting events for any changes since the previous poll
+        (the first poll of a player only records their current state)
+        :param pid: pid of the player
+        :return: events emitted
+        """
+        player = self.players.get(pid)
+        if player is None:
+            raise InvalidParameterError(f'Player {pid} is not on the watchlist')
+
+        parsed = await self.client.getplayerinfo_dict(pid, PlayerinfoKeySet.GENERAL_STATS, POLL_FIELDS)
+        self.polls += 1
+        data = parsed['data']
+        nick, score, rank, last_battle = data['nick'], data['scor'], data['rank'], data['lbtl']
+
+        events: List[WatchlistEvent] = list()
+        if player.rank is not None and rank != player.rank:
+            event_type = WatchlistEventType.RANK_UP if rank > player.rank else WatchlistEventType.RANK_DOWN
+            events.append(WatchlistEvent(event_type, pid, nick, player.rank, rank))
+        if player.score is not None and score != player.score:
+            events.append(WatchlistEvent(WatchlistEventType.SCORE_CHANGED, pid, nick, player.score, score))
+
+        # Awards can only be received by playing, so only request them if the player played since the last poll
+        awards = player.awards
+        if awards is None or last_battle != player.last_battle:
+            parsed_awards = await self.client.getawardsinfo_dict(pid)
+            awards = {award['award']: award['level'] for award in parsed_awards['data']}
+        if player.awards is not None:
+            for award, level in awards.items():
+                previous = player.awards.get(award)
+                if previous is None or level > previous:
+                    events.append(WatchlistEvent(WatchlistEventType.AWARD_RECEIVED, pid, nick, previous, level, award))
+
+        player.score, player.rank, player.last_battle, player.awards = score, rank, last_battle, awards
+
+        for event in events:
+            await self.emit(event)
+
+        return events
+
+    async def emit(self, event: WatchlistEvent) -> None:
+        if self.queue is not None:
+            await self.queue.put(event)
+        if self.callback is not None:
+            result = self.callback(event)
+            if inspect.isawaitable(result):
+                await result
+
+    def get_interval(self, last_battle: Optional[int]) -> float:
+        """
+        Get the (jittered) interval until the next poll of a player
+        :param last_battle: timestamp of the player's last battle (None if unknown)
+        :return: seconds until the player should be polled again
+        """
+        active = last_battle is not None and time.time() - last_battle <= self.active_window
+        interval = self.active_interval if active else self.idle_interval
+        return interval * self.rng.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def reschedule(self, pid: int, delay: float) -> None:
+        player = self.players.get(pid)
+        if player is None:
+            return
+
+        player.next_due = self.get_time() + delay
+        heapq.heappush(self.schedule, (player.next_due, pid))
+        if self.wakeup is not None:
+            self.wakeup.set()
+
+    @staticmethod
+    def get_time() -> float:
+        # Use the event loop's clock if running within a loop (as run() does), else the same (monotonic) clock
+        try:
+            return asyncio.get_running_loop().time()
+        except RuntimeError:
+            return time.monotonic()
@@ -0,0 +1,88 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+# Lines preceding the body of responses starting with an "asof" root dataset
+ASOF_PREFIX = 'O\nH\tasof\nD\t'
+
+
+class UnchangedResponseCache:
+    """
+    Cache of parsed responses which starts with an "asof" root dataset, to skip parsing responses which did not change
+    Providers set "asof" to the time of the request, so a response is considered unchanged if everything following
+    the "asof" dataset is identical to the cached response (checked via a plain string comparison). Least recently
+    used responses are evicted once the cache is full.
+    """
+    max_size: int
+    hits: int
+    misses: int
+
+    # Body (everything after the asof dataset) and parsed response by key
+    entries: 'OrderedDict[Hashable, Tuple[str, Any]]'
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: Hashable, raw_data: str) -> Optional[Tuple[int, Any]]:
+        """
+        Get the cached parsed response for a raw response, if the response did not change
+        :param key: key the response was cached with (e.g. the endpoint and its parameters)
+        :param raw_data: raw aspx data as a string
+        :return: asof of the raw response and parsed (previous) response, None if the response is not cached or changed
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        body, parsed = entry
+        split = UnchangedResponseCache.split_asof(raw_data)
+        # Compare the body without copying it out of the raw data first
+        if split is None or len(raw_data) - split[1] != len(body) or not raw_data.endswith(body):
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return split[0], parsed
+
+    def put(self, key: Hashable, raw_data: str, parsed: Any) -> None:
+        """
+        Cache a parsed response
+        :param key: key to cache the response with
+        :param raw_data: raw aspx data the response was parsed from
+        :param parsed: parsed response
+        """
+        split = UnchangedResponseCache.split_asof(raw_data)
+        if split is None or self.max_size < 1:
+            return
+
+        self.entries[key] = (raw_data[split[1]:], parsed)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    @staticmethod
+    def split_asof(raw_data: str) -> Optional[Tuple[int, int]]:
+        """
+        Extract the asof value from the start of a raw response (without splitting the response into lines)
+        :param raw_data: raw aspx data as a string
+        :return: asof value and offset the body of the response starts at, None if the response does not start with asof
+        """
+        if not raw_data.startswith(ASOF_PREFIX):
+            return None
+
+        end = raw_data.find('\n', len(ASOF_PREFIX))
+        value = raw_data[len(ASOF_PREFIX):end]
+        if end == -1 or not value.isascii() or not value.isdigit():
+            return None
+
+        return int(value), end + 1
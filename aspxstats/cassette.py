@@ -0,0 +1,97 @@
+import json
+from dataclasses import dataclass, asdict
+from enum import Enum
+from typing import Dict, Optional, List, Tuple, TextIO
+
+from .exceptions import ClientError
+
+
+class CassetteMode(str, Enum):
+    RECORD = 'record'
+    REPLAY = 'replay'
+
+
+@dataclass
+class Exchange:
+    url: str
+    params: Optional[Dict[str, str]]
+    status: int
+    body: str
+    latency: float
+
+    @property
+    def ok(self) -> bool:
+        # Same definition as used by requests' Response.ok
+        return self.status < 400
+
+
+class Cassette:
+    """
+    File of recorded HTTP exchanges (one JSON object per line), used to replay responses without any network access
+    Identical requests are replayed in the order they were recorded, starting over once all have been replayed.
+    """
+    path: str
+    mode: CassetteMode
+    replay_latency: bool
+
+    exchanges: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], List[Exchange]]
+    positions: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], int]
+    file: Optional[TextIO]
+
+    def __init__(self, path: str, mode: CassetteMode = CassetteMode.REPLAY, replay_latency: bool = False):
+        self.path = path
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self.exchanges = dict()
+        self.positions = dict()
+        self.file = None
+
+        if mode is CassetteMode.REPLAY:
+            self.load()
+        else:
+            self.file = open(path, 'a', encoding='utf-8')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return sum(len(exchanges) for exchanges in self.exchanges.values())
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def load(self) -> None:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip() == '':
+                    continue
+                exchange = Exchange(**json.loads(line))
+                self.exchanges.setdefault(self.get_key(exchange.url, exchange.params), []).append(exchange)
+
+    def record(self, url: str, params: Optional[Dict[str, str]], status: int, body: str, latency: float) -> None:
+        if self.file is None:
+            raise ClientError('Cassette is not open for recording')
+
+        exchange = Exchange(url, params, status, body, latency)
+        self.exchanges.setdefault(self.get_key(url, params), []).append(exchange)
+        self.file.write(json.dumps(asdict(exchange)) + '\n')
+        self.file.flush()
+
+    def replay(self, url: str, params: Optional[Dict[str, str]]) -> Exchange:
+        key = self.get_key(url, params)
+        exchanges = self.exchanges.get(key)
+        if not exchanges:
+            raise ClientError(f'Failed to fetch ASPX data: no exchange recorded for {url} with params {params}')
+
+        position = self.positions.get(key, 0)
+        self.positions[key] = (position + 1) % len(exchanges)
+        return exchanges[position]
+
+    @staticmethod
+    def get_key(url: str, params: Optional[Dict[str, str]]) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+        return url, tuple(sorted((params or dict()).items()))
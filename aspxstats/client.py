@@ -1,12 +1,14 @@
 import re
+import time
 from enum import Enum
-from typing import Dict, Optional, Tuple, List, Union
+from typing import Dict, Optional, Tuple, List, Union, Callable
 from urllib.parse import urljoin
 
 import requests as requests
 
-from .exceptions import ClientError, InvalidResponseError, Error, TimeoutError
-from .types import LineType, Dataset, ParseTarget, ResponseValidationMode
+from .cassette import Cassette, CassetteMode
+from .exceptions import ClientError, InvalidResponseError, Error, TimeoutError, ValidationError
+from .types import LineType, Dataset, ParseTarget, ResponseValidationMode, ValidationMetrics
 
 
 class AspxClient:
@@ -14,6 +16,10 @@ class AspxClient:
     default_headers: Dict[str, str]
     timeout: float
     response_validation_mode: ResponseValidationMode
+    # Validate one in n responses when using ResponseValidationMode.SAMPLED
+    validation_sample_rate: int
+    validation_metrics: ValidationMetrics
+    cassette: Optional[Cassette]
 
     session: requests.Session
     not_found_regex: re.Pattern
@@ -23,12 +29,17 @@ class AspxClient:
             base_uri: str,
             default_headers: Dict[str, str],
             timeout: float,
-            response_validation_mode: ResponseValidationMode
+            response_validation_mode: ResponseValidationMode,
+            cassette: Optional[Cassette] = None,
+            validation_sample_rate: int = 100
     ):
         self.base_uri = base_uri
         self.default_headers = default_headers
         self.timeout = timeout
         self.response_validation_mode = response_validation_mode
+        self.validation_sample_rate = validation_sample_rate
+        self.validation_metrics = ValidationMetrics()
+        self.cassette = cassette
 
         self.session = requests.session()
         self.session.headers = default_headers
@@ -50,8 +61,23 @@ class AspxClient:
         :return: raw aspx data as a string
         """
         url = urljoin(self.base_uri, endpoint)
+        params = self.stringify_params(params)
+        if self.cassette is not None and self.cassette.mode is CassetteMode.REPLAY:
+            exchange = self.cassette.replay(url, params)
+            if self.cassette.replay_latency:
+                time.sleep(exchange.latency)
+
+            if exchange.ok:
+                return exchange.body
+            else:
+                raise ClientError(f'Failed to fetch ASPX data (HTTP/{exchange.status})')
+
         try:
-            response = self.session.get(url, params=self.stringify_params(params), timeout=self.timeout)
+            started = time.perf_counter()
+            response = self.session.get(url, params=params, timeout=self.timeout)
+
+            if self.cassette is not None:
+                self.cassette.record(url, params, response.status_code, response.text, time.perf_counter() - started)
 
             if response.ok:
                 return response.text
@@ -75,6 +101,59 @@ class AspxClient:
             if value is not None
         }
 
+    def select_validation_mode(self) -> ResponseValidationMode:
+        """
+        Select the validation mode to validate the next response with
+        (resolves ResponseValidationMode.SAMPLED to STRICT for one in n responses and to TRUSTED for all others)
+        :return: validation mode to use for the response
+        """
+        responses = self.validation_metrics.responses
+        self.validation_metrics.responses += 1
+        if self.response_validation_mode is not ResponseValidationMode.SAMPLED:
+            return self.response_validation_mode
+
+        if responses % max(self.validation_sample_rate, 1) == 0:
+            return ResponseValidationMode.STRICT
+
+        return ResponseValidationMode.TRUSTED
+
+    def validate_response_data(
+            self,
+            validation_mode: ResponseValidationMode,
+            validate: Callable[[dict], None],
+            parsed: dict
+    ) -> None:
+        """
+        Validate parsed response data (unless the validation mode trusts the response), recording the result in metrics
+        :param validation_mode: validation mode selected for the response
+        :param validate: function validating the parsed data, raising a ValidationError if it is invalid
+        :param parsed: parsed response data
+        """
+        if validation_mode is ResponseValidationMode.TRUSTED:
+            return
+
+        self.validation_metrics.validated += 1
+        try:
+            validate(parsed)
+        except ValidationError as e:
+            self.validation_metrics.failed += 1
+            self.validation_metrics.last_failure = str(e)
+            raise
+
+    @staticmethod
+    def convert_response_values(convert: Callable[..., dict], *args) -> dict:
+        """
+        Convert parsed response values, turning any conversion errors into an InvalidResponseError
+        (values of trusted responses are converted without being validated first)
+        :param convert: function converting the parsed response values
+        :param args: arguments to call the function with
+        :return: response data with converted values
+        """
+        try:
+            return convert(*args)
+        except (KeyError, IndexError, TypeError, ValueError, AttributeError) as e:
+            raise InvalidResponseError(f'Received response contains unconvertible data: {e!r}') from None
+
     @staticmethod
     def is_valid_aspx_response(
             raw_data: str,
@@ -83,18 +162,16 @@ class AspxClient:
         lines = raw_data.split('\n')
         first_line, last_line = lines[0], lines[-1]
 
-        """
-        Last line contains an indicator for the message length (excluding delimiters and excluding the last line)
-        $	133	$
-        => validate message length matches indicated length
-        """
-        actual_length = AspxClient.determine_actual_response_length(lines)
-        indicated_length = AspxClient.get_indicated_response_length(last_line)
-
-        response_valid = (
-                first_line.strip() == 'O' and
-                (actual_length == indicated_length or validation_mode is ResponseValidationMode.LAX)
-        )
+        response_valid = first_line.strip() == 'O'
+        if response_valid and validation_mode in (ResponseValidationMode.STRICT, ResponseValidationMode.SAMPLED):
+            """
+            Last line contains an indicator for the message length (excluding delimiters and excluding the last line)
+            $	133	$
+            => validate message length matches indicated length (only determined if the mode checks it)
+            """
+            actual_length = AspxClient.determine_actual_response_length(lines)
+            indicated_length = AspxClient.get_indicated_response_length(last_line)
+            response_valid = actual_length == indicated_length
 
         """
         Each project handles player not found errors a little different
@@ -22,6 +22,8 @@ class ValidationError(Error):
     value: Optional[Any]
 
     def __init__(self, path: str, attribute: Optional[Any] = None):
+        # Pass arguments on to ensure errors can be pickled (e.g. when raised in a process pool)
+        super().__init__(path, attribute)
         self.path = path
         self.value = attribute
 
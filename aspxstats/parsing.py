@@ -1,14 +1,21 @@
-from typing import Union, Dict, List, Callable, Optional
+from collections.abc import Mapping
+from functools import partial
+from typing import Union, Dict, List, Callable, Optional, Any, Iterator, Tuple
 
+from .exceptions import InvalidResponseError
 from .schema import AttributeSchema
 from .types import CleanerType
 
+# Converter for each (schema-referenced) key of a dict
+CompiledSchema = Dict[str, Callable[[Any], Any]]
+
 
 def parse_dict_values(
         data: dict,
         schema: Dict[str, Union[dict, AttributeSchema]],
-        cleaners: Optional[Dict[CleanerType, Callable[[str], str]]] = None
-) -> dict:
+        cleaners: Optional[Dict[CleanerType, Callable[[str], str]]] = None,
+        lazy: bool = False
+) -> Union[dict, 'LazyParsedDict']:
     """
     Parses all schema-referenced values in dict to their desired type.
     Assumes that ``is_valid_dict`` successfully validated the ``data`` dict.
@@ -17,8 +24,12 @@ def parse_dict_values(
     :param data: dict containing values to be parsed
     :param schema: :class:`AttributeSchema` defining the structure of the dict and the desired type for its values
     :param cleaners: dict of cleaner functions used to clean the values before parsing
+    :param lazy: return a :class:`LazyParsedDict`, which only parses values once they are accessed
     :return: dict containing correctly types values
     """
+    if lazy:
+        return LazyParsedDict(data, compile_schema(schema, cleaners))
+
     parsed = dict()
     for key, value_schema in schema.items():
         parsed[key] = parse_dict_value(data[key], value_schema, cleaners)
@@ -41,14 +52,154 @@ def parse_dict_value(
     if schema.is_floaty:
         return float(value)
     if schema.is_ratio:
-        if value == '0':
-            return 0.0
-        dividend, divisor = [int(e) for e in value.split(':', 1)]
-        # Cast dividend to float to return a consistent type in both cases
-        return round(dividend / divisor, 2) if divisor > 0 else float(dividend)
+        return parse_ratio(value)
     if schema.is_nick and cleaners is not None and callable(cleaners.get(CleanerType.NICK)):
         return cleaners[CleanerType.NICK](value)
     if schema.type == list:
         return [parse_dict_values(child, schema.children, cleaners) for child in value]
     else:
         return value
+
+
+def parse_booly(value: str) -> bool:
+    return int(value) == 1
+
+
+def parse_ratio(value: str) -> float:
+    if value == '0':
+        return 0.0
+    dividend, divisor = [int(e) for e in value.split(':', 1)]
+    # Cast dividend to float to return a consistent type in both cases
+    return round(dividend / divisor, 2) if divisor > 0 else float(dividend)
+
+
+class LazyParsedDict(Mapping):
+    """
+    Read-only mapping of raw (validated) values, which parses each value on first access and then memoises it.
+    Contains the same keys and (once accessed) values as the dict returned by :func:`parse_dict_values`, so iterating
+    or ``dict()``-ing it gives the same dict. Nested dicts (and lists of dicts) are plain dicts as well, which are
+    parsed in full when the key referencing them is first accessed.
+    """
+    __slots__ = ('_data', '_schema', '_parsed')
+
+    _data: dict
+    _schema: CompiledSchema
+    _parsed: dict
+
+    def __init__(self, data: dict, schema: CompiledSchema):
+        self._data = data
+        self._schema = schema
+        self._parsed = dict()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._parsed[key]
+        except KeyError:
+            pass
+
+        # Raises a KeyError for keys not referenced in the schema, just like those are omitted by parse_dict_values
+        converter = self._schema[key]
+        try:
+            value = converter(self._data[key])
+        except (KeyError, IndexError, TypeError, ValueError, AttributeError) as e:
+            raise InvalidResponseError(f'Received response contains unconvertible data: {e!r}') from None
+
+        self._parsed[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._schema)
+
+    def __len__(self) -> int:
+        return len(self._schema)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.to_dict()!r})'
+
+    def __reduce__(self):
+        # Converters cannot be pickled, so pickle (e.g. when returned from a process pool) as a plain dict instead
+        return dict, (self.to_dict(),)
+
+    def to_dict(self) -> dict:
+        """
+        Parse all values
+        :return: dict equal to the dict returned by :func:`parse_dict_values`
+        """
+        return dict(self.items())
+
+
+# Compiled schemas by schema id and nick cleaner, with each entry retaining the schema (so its id cannot be re-used)
+_compiled_schemas: Dict[Tuple[int, Optional[Callable[[str], str]]], Tuple[dict, CompiledSchema]] = dict()
+
+
+def compile_schema(
+        schema: Dict[str, Union[dict, AttributeSchema]],
+        cleaners: Optional[Dict[CleanerType, Callable[[str], str]]] = None
+) -> CompiledSchema:
+    """
+    Compile a schema into a converter function for each key (cached for each schema and cleaner)
+    :param schema: :class:`AttributeSchema` defining the structure of the dict and the desired type for its values
+    :param cleaners: dict of cleaner functions used to clean the values before parsing
+    :return: dict containing a function converting the raw value of each key referenced in the schema
+    """
+    nick_cleaner = cleaners.get(CleanerType.NICK) if cleaners is not None else None
+    return compile_schema_with_nick_cleaner(schema, nick_cleaner if callable(nick_cleaner) else None)
+
+
+def compile_schema_with_nick_cleaner(
+        schema: Dict[str, Union[dict, AttributeSchema]],
+        nick_cleaner: Optional[Callable[[str], str]]
+) -> CompiledSchema:
+    cache_key = (id(schema), nick_cleaner)
+    cached = _compiled_schemas.get(cache_key)
+    if cached is not None:
+        return cached[1]
+
+    compiled = {
+        key: compile_value_converter(value_schema, nick_cleaner)
+        for (key, value_schema) in schema.items()
+    }
+
+    # Schemas can be derived dynamically (see getplayerinfo field projection), so keep the cache from growing unbounded
+    if len(_compiled_schemas) >= 256:
+        _compiled_schemas.clear()
+    _compiled_schemas[cache_key] = (schema, compiled)
+
+    return compiled
+
+
+def compile_value_converter(
+        schema: Union[AttributeSchema, Dict[str, AttributeSchema]],
+        nick_cleaner: Optional[Callable[[str], str]] = None
+) -> Callable[[Any], Any]:
+    # Follows the same order of checks as parse_dict_value
+    if not isinstance(schema, AttributeSchema):
+        return partial(parse_compiled_dict, compile_schema_with_nick_cleaner(schema, nick_cleaner))
+
+    if schema.is_numeric:
+        return int
+    if schema.is_booly:
+        return parse_booly
+    if schema.is_floaty:
+        return float
+    if schema.is_ratio:
+        return parse_ratio
+    if schema.is_nick and nick_cleaner is not None:
+        return nick_cleaner
+    if schema.type == list:
+        return partial(parse_compiled_list, compile_schema_with_nick_cleaner(schema.children, nick_cleaner))
+    else:
+        return keep_value
+
+
+def parse_compiled_dict(schema: CompiledSchema, value: dict) -> dict:
+    # Nested dicts are parsed eagerly, so copying the parent mapping via dict() gives plain dicts only
+    return {key: converter(value[key]) for (key, converter) in schema.items()}
+
+
+def parse_compiled_list(schema: CompiledSchema, value: List[dict]) -> List[dict]:
+    return [parse_compiled_dict(schema, child) for child in value]
+
+
+def keep_value(value: Any) -> Any:
+    return value
@@ -0,0 +1,148 @@
+import asyncio
+from collections import deque
+from contextlib import contextmanager, asynccontextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Dict, Optional, Deque, Iterator, AsyncIterator
+
+from .exceptions import InvalidParameterError
+
+
+class RequestPriority(int, Enum):
+    # User-facing lookups (e.g. a profile page), never wait for queued requests of any other class
+    INTERACTIVE = 0
+    NORMAL = 1
+    # Crawls and other bulk jobs, only use capacity not needed by any other class
+    BACKGROUND = 2
+
+
+# Priority of requests sent from the current context (task), see request_priority
+_request_priority: ContextVar[RequestPriority] = ContextVar('request_priority', default=RequestPriority.NORMAL)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """
+    Send all requests made within the context with the given priority
+    Tasks inherit the priority of the context they were created in, so this also applies to any tasks created within
+    the context (e.g. all requests of a crawl started within the context).
+    :param priority: priority to send requests with
+    """
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+def get_request_priority() -> RequestPriority:
+    return _request_priority.get()
+
+
+class RequestScheduler:
+    """
+    Limits the number of simultaneous requests, granting free capacity in order of priority
+    Each priority class can be limited to a quota of simultaneous requests. Once the capacity is used up, requests
+    are queued per class and a freed up slot is always granted to the highest priority class with a queued request
+    (within its quota), so queued requests of lower priority classes never delay a request of a higher class.
+    By default, background requests may use at most three quarters of the capacity, leaving the rest for any
+    interactive/normal requests arriving while a crawl is running.
+    """
+    # Maximum number of simultaneous requests (0 for no limit)
+    capacity: int
+    # Maximum number of simultaneous requests by priority (0 for no limit beyond the capacity)
+    quotas: Dict[RequestPriority, int]
+
+    active: Dict[RequestPriority, int]
+    active_total: int
+    waiters: Dict[RequestPriority, Deque[asyncio.Future]]
+
+    def __init__(self, capacity: int = 0, quotas: Optional[Dict[RequestPriority, int]] = None):
+        """
+        :param capacity: maximum number of simultaneous requests, usually the connection limit (0 for no limit)
+        :param quotas: maximum number of simultaneous requests by priority (0 for no limit beyond the capacity),
+        classes not included use the default quota
+        """
+        if capacity < 0 or quotas is not None and any(quota < 0 for quota in quotas.values()):
+            raise InvalidParameterError('Request scheduler capacity and quotas must not be negative')
+
+        self.capacity = capacity
+        self.quotas = RequestScheduler.get_default_quotas(capacity)
+        if quotas is not None:
+            self.quotas.update(quotas)
+
+        self.active = {priority: 0 for priority in RequestPriority}
+        self.active_total = 0
+        self.waiters = {priority: deque() for priority in RequestPriority}
+
+    @property
+    def queued(self) -> int:
+        return sum(len(waiters) for waiters in self.waiters.values())
+
+    @asynccontextmanager
+    async def slot(self, priority: Optional[RequestPriority] = None) -> AsyncIterator[None]:
+        """
+        Hold a request slot for the duration of the context
+        :param priority: priority of the request, defaults to the priority of the current context (see request_priority)
+        """
+        if priority is None:
+            priority = get_request_priority()
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release(priority)
+
+    async def acquire(self, priority: RequestPriority) -> None:
+        """
+        Wait for a request slot (must be released again via release)
+        :param priority: priority of the request
+        """
+        # Any slot a queued request could use is granted as soon as it is freed up, so requests of higher classes
+        # can only still be queued here if they are limited by their quota (requests of the same class are not overtaken)
+        if self.can_grant(priority) and len(self.waiters[priority]) == 0:
+            self.grant(priority)
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters[priority].append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was granted just before the cancellation, so pass it on
+                self.release(priority)
+            elif waiter in self.waiters[priority]:
+                self.waiters[priority].remove(waiter)
+            raise
+
+    def release(self, priority: RequestPriority) -> None:
+        self.active[priority] -= 1
+        self.active_total -= 1
+        self.wake_waiters()
+
+    def can_grant(self, priority: RequestPriority) -> bool:
+        quota = self.quotas[priority]
+        return (self.capacity == 0 or self.active_total < self.capacity) and (quota == 0 or self.active[priority] < quota)
+
+    def grant(self, priority: RequestPriority) -> None:
+        self.active[priority] += 1
+        self.active_total += 1
+
+    def wake_waiters(self) -> None:
+        for priority in RequestPriority:
+            waiters = self.waiters[priority]
+            while len(waiters) > 0 and self.can_grant(priority):
+                waiter = waiters.popleft()
+                if waiter.done():
+                    continue
+                self.grant(priority)
+                waiter.set_result(None)
+
+    @staticmethod
+    def get_default_quotas(capacity: int) -> Dict[RequestPriority, int]:
+        return {
+            RequestPriority.INTERACTIVE: 0,
+            RequestPriority.NORMAL: 0,
+            RequestPriority.BACKGROUND: max(capacity * 3 // 4, 1) if capacity > 0 else 0
+        }
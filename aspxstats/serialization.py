@@ -0,0 +1,184 @@
+"""
+Conversion of typed (dataclass) responses to plain, JSON-ready dicts and JSON bytes.
+
+Instead of walking each response via its ``__iter__`` (one generator per nested instance), a converter function
+is generated once per type, building the entire (nested) dict in a single expression. JSON bytes are produced
+by orjson if it is installed (``pip install aspxstats[orjson]``), else by the standard library's json module.
+Responses are pickled using the (positional) binary format of :mod:`aspxstats.wire`, falling back to regular
+pickling for responses containing values the format cannot encode (e.g. values not matching the annotations).
+"""
+import json
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, Dict, Union, get_args, get_origin, get_type_hints
+
+from . import wire
+from .exceptions import Error
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class Serializable:
+    """
+    Mixin for response dataclasses, adding fast conversion to JSON-ready dicts and JSON bytes
+    """
+    __slots__ = ()
+
+    def to_dict(self) -> dict:
+        """
+        Convert the response to a plain dict (including any nested instances)
+        :return: dict equal to ``dict(response)``
+        """
+        return get_converter(type(self))(self)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the response as (compact, UTF-8 encoded) JSON
+        :return: JSON of the dict returned by :meth:`to_dict` (identical with either backend, except for the notation
+                 of floats needing an exponent, e.g. 1e-07 vs. 1e-7, and non-finite floats, which orjson writes as
+                 null while json writes NaN, Infinity and -Infinity)
+        """
+        if orjson is not None:
+            # Serialize the same dict with either backend (rather than letting orjson serialize the dataclass natively),
+            # so any value is converted the same way regardless of whether orjson is installed
+            return orjson.dumps(self.to_dict())
+
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def __reduce_ex__(self, protocol):
+        # Pickle as the compact wire format instead of a dict of all (nested) fields by name
+        try:
+            return wire.decode, (wire.encode(self),)
+        except Error:
+            return object.__reduce_ex__(self, protocol)
+
+    def __copy__(self):
+        # Keep copy.copy shallow, rather than round-tripping (and thereby deep copying) via the wire format
+        cls = type(self)
+        copied = cls.__new__(cls)
+        copied.__dict__.update(self.__dict__)
+        return copied
+
+
+# Generated converters by type
+_converters: Dict[type, Callable[[Any], dict]] = dict()
+
+
+def get_converter(cls: type) -> Callable[[Any], dict]:
+    converter = _converters.get(cls)
+    if converter is None:
+        converter = _converters[cls] = generate_converter(cls)
+
+    return converter
+
+
+def generate_converter(cls: type) -> Callable[[Any], dict]:
+    """
+    Generate a function converting instances of a dataclass to plain dicts
+    :param cls: dataclass to generate the converter for
+    :return: function returning the same dict as calling ``dict()`` on an instance
+    """
+    namespace = {'convert_value': convert_value}
+    source = f'def convert(value):\n    return {build_expression("value", cls, 0)}\n'
+    exec(compile(source, f'<converter {cls.__qualname__}>', 'exec'), namespace)
+    return namespace['convert']
+
+
+def build_expression(source: str, annotation: Any, depth: int) -> str:
+    if is_dataclass(annotation):
+        hints = get_type_hints(annotation)
+        return '{' + ', '.join(
+            f'{field.name!r}: {build_expression(f"{source}.{field.name}", hints[field.name], depth)}'
+            for field in fields(annotation)
+        ) + '}'
+
+    origin = get_origin(annotation)
+    if origin is list:
+        item_annotation, = get_args(annotation)
+        if not is_dataclass(item_annotation):
+            return f'list({source})'
+        # Use a new name per nesting level, so nested comprehensions do not shadow each other
+        item = f'item{depth}'
+        return f'[{build_expression(item, item_annotation, depth + 1)} for {item} in {source}]'
+    if origin is dict:
+        return f'dict({source})'
+    if origin is Union:
+        # Any of multiple types, so the type can only be determined at runtime
+        return f'convert_value({source})'
+
+    return source
+
+
+# Generated copiers by type
+_copiers: Dict[type, Callable[[Any], Any]] = dict()
+
+
+def copy_instance(value: Any) -> Any:
+    """
+    Copy a typed response, including any nested instances, lists and dicts (only sharing immutable values)
+    :param value: dataclass instance to copy
+    :return: copy equal to ``value``
+    """
+    cls = type(value)
+    copier = _copiers.get(cls)
+    if copier is None:
+        copier = _copiers[cls] = generate_copier(cls)
+
+    return copier(value)
+
+
+def generate_copier(cls: type) -> Callable[[Any], Any]:
+    namespace = {'copy_value': copy_value}
+    source = f'def copy(value):\n    return {build_copy_expression("value", cls, 0, namespace)}\n'
+    exec(compile(source, f'<copier {cls.__qualname__}>', 'exec'), namespace)
+    return namespace['copy']
+
+
+def build_copy_expression(source: str, annotation: Any, depth: int, namespace: Dict[str, Any]) -> str:
+    if is_dataclass(annotation):
+        hints = get_type_hints(annotation)
+        namespace[annotation.__name__] = annotation
+        return f'{annotation.__name__}(' + ', '.join(
+            f'{field.name}={build_copy_expression(f"{source}.{field.name}", hints[field.name], depth, namespace)}'
+            for field in fields(annotation)
+        ) + ')'
+
+    origin = get_origin(annotation)
+    if origin is list:
+        item_annotation, = get_args(annotation)
+        if not is_dataclass(item_annotation):
+            return f'list({source})'
+        item = f'item{depth}'
+        return f'[{build_copy_expression(item, item_annotation, depth + 1, namespace)} for {item} in {source}]'
+    if origin is dict:
+        return f'dict({source})'
+    if origin is Union:
+        return f'copy_value({source})'
+
+    return source
+
+
+def copy_value(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return copy_instance(value)
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return [copy_value(item) for item in value]
+
+    return value
+
+
+def convert_value(value: Any) -> Any:
+    if isinstance(value, Serializable):
+        return value.to_dict()
+    if is_dataclass(value) and not isinstance(value, type):
+        return get_converter(type(value))(value)
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return [convert_value(item) for item in value]
+
+    return value
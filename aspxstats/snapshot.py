@@ -0,0 +1,286 @@
+"""
+Columnar snapshot files, written and read using the standard library only.
+
+A snapshot consists of a header followed by one contiguous region per column. Numeric columns are stored as the raw
+bytes of an :class:`array.array` (typecodes "q", "b" and "d"), string columns as an offsets region ("q", one more
+entry than there are rows) plus a region of concatenated UTF-8 data. Regions are aligned to 8 bytes, so readers can
+memory map the file and access each column via a :class:`memoryview` without parsing or copying any values.
+
+Values are written in the writer's native byte order, which is recorded in the header. Layout of the header
+(little-endian)::
+
+    magic "AXSNAP", format version (B), byte order of values (B), column count (I), row count (Q),
+    metadata length (I), metadata (UTF-8 JSON object)
+    per column: name length (H), typecode (c), offset (Q), length (Q), data offset (Q), data length (Q), name (UTF-8)
+    column regions
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Union, List, Optional, Iterator, Tuple
+
+from .exceptions import Error
+
+FORMAT_VERSION = 1
+MAGIC = b'AXSNAP'
+
+FILE_HEADER = struct.Struct('<6sBBIQI')
+COLUMN_HEADER = struct.Struct('<HcQQQQ')
+ALIGNMENT = 8
+
+# Typecode of string columns (not an array typecode), stored as offsets plus data
+STRING_TYPECODE = 's'
+# Typecodes of numeric columns (64-bit ints, 8-bit ints for booly values, 64-bit floats)
+NUMERIC_TYPECODES = {'q', 'b', 'd'}
+# Size of each value (offset for string columns) in bytes by typecode
+ITEM_SIZES = {'q': 8, 'b': 1, 'd': 8, STRING_TYPECODE: 8}
+
+BYTE_ORDERS = {'little': 0, 'big': 1}
+
+Column = Union[array, List[str]]
+
+
+class ColumnInfo:
+    __slots__ = ('name', 'typecode', 'offset', 'length', 'data_offset', 'data_length')
+
+    name: str
+    typecode: str
+    offset: int
+    length: int
+    data_offset: int
+    data_length: int
+
+    def __init__(self, name: str, typecode: str, offset: int, length: int, data_offset: int = 0, data_length: int = 0):
+        self.name = name
+        self.typecode = typecode
+        self.offset = offset
+        self.length = length
+        self.data_offset = data_offset
+        self.data_length = data_length
+
+
+def write_snapshot(path: str, columns: Dict[str, Column], metadata: Optional[Dict[str, str]] = None) -> None:
+    """
+    Write columns to a snapshot file (atomically, readers never see a partially written file)
+    :param path: path of the snapshot file
+    :param columns: columns by name, either numeric arrays (typecodes "q", "b" or "d") or lists of strings
+    :param metadata: additional information to store with the snapshot (e.g. the provider)
+    """
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) > 1:
+        raise Error('Snapshot columns must all be of the same length')
+    row_count = lengths.pop() if len(lengths) > 0 else 0
+
+    encoded_metadata = json.dumps(metadata or dict()).encode('utf-8')
+    encoded_names = [name.encode('utf-8') for name in columns]
+    header_size = FILE_HEADER.size + len(encoded_metadata) + \
+        sum(COLUMN_HEADER.size + len(encoded_name) for encoded_name in encoded_names)
+
+    # Lay out all regions first, since the header contains their offsets
+    offset = align(header_size)
+    infos: List[ColumnInfo] = []
+    regions: List[Tuple[int, bytes]] = []
+    for name, column in columns.items():
+        if isinstance(column, array):
+            if column.typecode not in NUMERIC_TYPECODES:
+                raise Error(f'Unsupported typecode "{column.typecode}" of snapshot column {name}')
+            region = column.tobytes()
+            infos.append(ColumnInfo(name, column.typecode, offset, len(region)))
+            regions.append((offset, region))
+            offset = align(offset + len(region))
+        else:
+            if not all(isinstance(value, str) for value in column):
+                raise Error(f'Unsupported values in snapshot column {name}, must be an array or a list of strings')
+            encoded = [value.encode('utf-8') for value in column]
+            offsets = array('q', [0])
+            for value in encoded:
+                offsets.append(offsets[-1] + len(value))
+            data_offset = align(offset + len(offsets) * offsets.itemsize)
+            infos.append(ColumnInfo(
+                name, STRING_TYPECODE, offset, len(offsets) * offsets.itemsize, data_offset, offsets[-1]
+            ))
+            regions.append((offset, offsets.tobytes()))
+            regions.append((data_offset, b''.join(encoded)))
+            offset = align(data_offset + offsets[-1])
+
+    header = bytearray(FILE_HEADER.pack(
+        MAGIC, FORMAT_VERSION, BYTE_ORDERS[sys.byteorder], len(infos), row_count, len(encoded_metadata)
+    ))
+    header += encoded_metadata
+    for info, encoded_name in zip(infos, encoded_names):
+        header += COLUMN_HEADER.pack(
+            len(encoded_name), info.typecode.encode('ascii'), info.offset, info.length, info.data_offset, info.data_length
+        )
+        header += encoded_name
+
+    temporary_path = f'{path}.tmp'
+    with open(temporary_path, 'wb') as f:
+        f.write(header)
+        for region_offset, region in regions:
+            # Pad up to the (aligned) start of the region
+            f.write(b'\x00' * (region_offset - f.tell()))
+            f.write(region)
+    os.replace(temporary_path, path)
+
+
+def align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+class StringColumn(Sequence):
+    """
+    Read-only sequence of a string column's values, decoding each value on access
+    """
+    __slots__ = ('offsets', 'data')
+
+    offsets: memoryview
+    data: memoryview
+
+    def __init__(self, offsets: memoryview, data: memoryview):
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('string column index out of range')
+
+        return str(self.data[self.offsets[index]:self.offsets[index + 1]], 'utf-8')
+
+    def __iter__(self) -> Iterator[str]:
+        data = bytes(self.data)
+        offsets = self.offsets.tolist()
+        for start, end in zip(offsets, offsets[1:]):
+            yield data[start:end].decode('utf-8')
+
+
+class Snapshot:
+    """
+    Snapshot file opened for reading
+    The file is memory mapped, columns are memoryviews of the map (no values are read until they are accessed).
+    All memoryviews returned need to be released (or garbage collected) before closing the snapshot.
+    """
+    path: str
+    metadata: Dict[str, str]
+    row_count: int
+    infos: Dict[str, ColumnInfo]
+
+    file: Optional[mmap.mmap]
+    view: Optional[memoryview]
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            # Empty files cannot be mapped
+            if os.fstat(f.fileno()).st_size < FILE_HEADER.size:
+                raise Error(f'Failed to read snapshot {path}: invalid header')
+            self.file = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.file)
+
+        try:
+            self.metadata, self.row_count, self.infos = self.read_header(self.view)
+        except Error:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.infos
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.infos)
+
+    def close(self) -> None:
+        if self.view is not None:
+            self.view.release()
+            self.view = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def column(self, name: str) -> Union[memoryview, StringColumn]:
+        """
+        Get a column's values (without copying them)
+        :param name: name of the column
+        :return: memoryview of a numeric column (cast to its typecode) or sequence of a string column's values
+        """
+        info = self.infos.get(name)
+        if info is None:
+            raise Error(f'Snapshot {self.path} does not contain column {name}')
+
+        if info.typecode == STRING_TYPECODE:
+            return StringColumn(
+                self.view[info.offset:info.offset + info.length].cast('q'),
+                self.view[info.data_offset:info.data_offset + info.data_length]
+            )
+
+        return self.view[info.offset:info.offset + info.length].cast(info.typecode)
+
+    def read_column(self, name: str) -> Column:
+        """
+        Read (copy) a column's values
+        :param name: name of the column
+        :return: numeric array or list of strings
+        """
+        column = self.column(name)
+        if isinstance(column, StringColumn):
+            with column.offsets, column.data:
+                return list(column)
+
+        values = array(column.format)
+        with column, column.cast('B') as raw:
+            values.frombytes(raw)
+        return values
+
+    def read_header(self, view: memoryview) -> Tuple[Dict[str, str], int, Dict[str, ColumnInfo]]:
+        try:
+            magic, version, byte_order, column_count, row_count, metadata_length = FILE_HEADER.unpack_from(view, 0)
+            offset = FILE_HEADER.size
+            metadata = json.loads(bytes(view[offset:offset + metadata_length]).decode('utf-8'))
+            offset += metadata_length
+
+            infos: Dict[str, ColumnInfo] = dict()
+            for _ in range(column_count):
+                name_length, typecode, column_offset, length, data_offset, data_length = \
+                    COLUMN_HEADER.unpack_from(view, offset)
+                offset += COLUMN_HEADER.size
+                name = bytes(view[offset:offset + name_length]).decode('utf-8')
+                offset += name_length
+                infos[name] = ColumnInfo(name, typecode.decode('ascii'), column_offset, length, data_offset, data_length)
+        except (struct.error, UnicodeDecodeError, ValueError):
+            raise Error(f'Failed to read snapshot {self.path}: invalid header') from None
+
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise Error(f'Failed to read snapshot {self.path}: unsupported format (version {version})')
+        if byte_order != BYTE_ORDERS[sys.byteorder]:
+            raise Error(f'Failed to read snapshot {self.path}: written on a platform with a different byte order')
+
+        for info in infos.values():
+            # Make sure each region is within the file and (once cast) contains a value per row
+            itemsize = ITEM_SIZES.get(info.typecode, 0)
+            rows = row_count + 1 if info.typecode == STRING_TYPECODE else row_count
+            end = max(info.offset + info.length, info.data_offset + info.data_length)
+            if itemsize == 0 or info.length != rows * itemsize or end > len(view):
+                raise Error(f'Failed to read snapshot {self.path}: invalid column {info.name}')
+
+        return metadata, row_count, infos
@@ -12,6 +12,21 @@ class ProviderConfig:
 class ResponseValidationMode(IntEnum):
     LAX = 0
     STRICT = 1
+    # Skip any validation, only convert values (for known-good providers)
+    TRUSTED = 2
+    # Strictly validate one in n responses (see validation_sample_rate), treat others as trusted
+    SAMPLED = 3
+
+
+@dataclass
+class ValidationMetrics:
+    # Number of responses a validation mode was selected for
+    responses: int = 0
+    # Number of responses whose data was validated against the schema
+    validated: int = 0
+    # Number of validated responses that failed validation
+    failed: int = 0
+    last_failure: Optional[str] = None
 
 
 class LineType(str, Enum):
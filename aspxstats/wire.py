@@ -0,0 +1,367 @@
+"""
+Compact binary encoding of typed (dataclass) responses, e.g. for passing them between processes or caching them.
+
+Values are written positionally, without any field names: consecutive int/bool/float fields (including those of
+nested instances) are packed with a single :class:`struct.Struct`, strings are length-prefixed UTF-8 and lists are
+prefixed with their length. Encoders and decoders are generated once per type. Each payload starts with a header
+containing the format version, a fingerprint of the type's layout (field names and types, including any nested types)
+and a reference to the type. Decoding a payload written for a different layout raises an :class:`Error`,
+so caches can treat it as a miss instead of returning wrongly decoded values.
+"""
+import importlib
+import struct
+import zlib
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, Dict, List, Tuple, Union, get_args, get_origin, get_type_hints
+
+from .exceptions import Error
+
+FORMAT_VERSION = 1
+MAGIC = b'AW'
+
+HEADER = struct.Struct('<2sBIH')
+UINT8 = struct.Struct('<B')
+UINT32 = struct.Struct('<I')
+
+# Struct format characters of fixed-size values (bool before int, since bool is a subclass of int)
+PRIMITIVE_FORMATS: Dict[type, str] = {bool: '?', int: 'q', float: 'd'}
+
+# Tags of values in dicts, which may contain values of any primitive type
+VALUE_TAGS: Dict[type, int] = {bool: 0, int: 1, float: 2, str: 3}
+
+Encoder = Callable[[Any, bytearray], None]
+Decoder = Callable[[Union[bytes, bytearray, memoryview], int], Tuple[Any, int]]
+
+
+class Codec:
+    """
+    Generated encoder and decoder of a type, plus the fingerprint of the type's layout
+    """
+    __slots__ = ('cls', 'encode', 'decode', 'fingerprint', 'reference')
+
+    cls: type
+    encode: Encoder
+    decode: Decoder
+    fingerprint: int
+    reference: bytes
+
+    def __init__(self, cls: type):
+        self.cls = cls
+        self.fingerprint = zlib.crc32(describe(cls).encode('utf-8'))
+        self.reference = f'{cls.__module__}:{cls.__qualname__}'.encode('utf-8')
+        self.encode = EncoderGenerator(cls).generate()
+        self.decode = DecoderGenerator(cls).generate()
+
+
+# Codecs by type
+_codecs: Dict[type, Codec] = dict()
+
+
+def get_codec(cls: type) -> Codec:
+    codec = _codecs.get(cls)
+    if codec is None:
+        codec = _codecs[cls] = Codec(cls)
+
+    return codec
+
+
+def encode(value: Any) -> bytes:
+    """
+    Encode a typed response
+    :param value: dataclass instance to encode
+    :return: compact binary representation, including a header to decode it (without knowing its type) with
+    """
+    codec = get_codec(type(value))
+    out = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION, codec.fingerprint, len(codec.reference)))
+    out += codec.reference
+    try:
+        codec.encode(value, out)
+    except (struct.error, KeyError, ValueError, TypeError, AttributeError) as e:
+        # Values out of range for their struct format or of types not matching the annotations
+        raise Error(f'Failed to encode {type(value).__name__}: {e}') from None
+
+    return bytes(out)
+
+
+def decode(data: Union[bytes, bytearray, memoryview]) -> Any:
+    """
+    Decode a typed response
+    (like unpickling, only decode trusted data, since the type referenced in the header is imported)
+    :param data: binary representation, as returned by :func:`encode`
+    :return: decoded dataclass instance
+    """
+    try:
+        magic, version, fingerprint, reference_length = HEADER.unpack_from(data, 0)
+        offset = HEADER.size + reference_length
+        reference = bytes(data[HEADER.size:offset]).decode('utf-8')
+    except (struct.error, UnicodeDecodeError):
+        raise Error('Failed to decode data: invalid header') from None
+
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise Error(f'Failed to decode data: unsupported format (version {version})')
+
+    codec = get_codec(resolve_type(reference))
+    if fingerprint != codec.fingerprint:
+        raise Error(f'Failed to decode data: layout of {codec.cls.__name__} changed since it was encoded')
+
+    try:
+        value, offset = codec.decode(data, offset)
+    except (struct.error, UnicodeDecodeError, IndexError, KeyError) as e:
+        raise Error(f'Failed to decode data: {e}') from None
+
+    if offset != len(data):
+        raise Error('Failed to decode data: trailing bytes')
+
+    return value
+
+
+def resolve_type(reference: str) -> type:
+    module_name, _, qualname = reference.partition(':')
+    try:
+        cls = importlib.import_module(module_name)
+        for name in qualname.split('.'):
+            cls = getattr(cls, name)
+    except (ImportError, AttributeError):
+        raise Error(f'Failed to decode data: unknown type {reference}') from None
+
+    if not isinstance(cls, type) or not is_dataclass(cls):
+        raise Error(f'Failed to decode data: {reference} is not a dataclass')
+
+    return cls
+
+
+def describe(annotation: Any) -> str:
+    # Canonical description of a type's layout, used to detect layout changes
+    if is_dataclass(annotation):
+        hints = get_type_hints(annotation)
+        return annotation.__name__ + '(' + ','.join(
+            f'{field.name}:{describe(hints[field.name])}' for field in fields(annotation)
+        ) + ')'
+
+    origin = get_origin(annotation)
+    if origin is not None:
+        return f'{origin.__name__ if isinstance(origin, type) else origin}[' \
+               f'{"|".join(describe(arg) for arg in get_args(annotation))}]'
+
+    return annotation.__name__
+
+
+class Generator:
+    """
+    Generates the source of a function reading/writing a type's values in the same order
+    """
+    cls: type
+    lines: List[str]
+    namespace: Dict[str, Any]
+    # Struct format characters and expressions/variables of fixed-size values not yet read/written
+    pending: List[Tuple[str, str]]
+    counter: int
+
+    def __init__(self, cls: type):
+        self.cls = cls
+        self.lines = []
+        self.namespace = {'UINT8': UINT8, 'UINT32': UINT32}
+        self.pending = []
+        self.counter = 0
+
+    def add_to_namespace(self, prefix: str, value: Any) -> str:
+        name = f'{prefix}{self.counter}'
+        self.counter += 1
+        self.namespace[name] = value
+        return name
+
+    def new_variable(self) -> str:
+        name = f'v{self.counter}'
+        self.counter += 1
+        return name
+
+    def get_struct(self) -> Tuple[str, int]:
+        fmt = '<' + ''.join(char for (char, _) in self.pending)
+        return self.add_to_namespace('S', struct.Struct(fmt)), struct.calcsize(fmt)
+
+    def compile(self, name: str) -> Callable:
+        source = '\n'.join(self.lines) + '\n'
+        exec(compile(source, f'<{name} {self.cls.__qualname__}>', 'exec'), self.namespace)
+        return self.namespace[name]
+
+    @staticmethod
+    def get_list_item_annotation(annotation: Any) -> Any:
+        item_annotation, = get_args(annotation)
+        if not is_dataclass(item_annotation):
+            raise TypeError(f'Cannot encode lists of {item_annotation}')
+        return item_annotation
+
+    @staticmethod
+    def get_union_types(annotation: Any) -> Tuple[type, ...]:
+        types = get_args(annotation)
+        if not all(is_dataclass(t) for t in types) or len(types) > 255:
+            raise TypeError(f'Cannot encode union {annotation}')
+        return types
+
+
+class EncoderGenerator(Generator):
+    def generate(self) -> Encoder:
+        self.lines.append('def encode(value, out):')
+        self.emit('value', self.cls, 1)
+        self.flush(1)
+        self.lines.append('    return None')
+        return self.compile('encode')
+
+    def flush(self, indent: int) -> None:
+        if len(self.pending) == 0:
+            return
+
+        name, _ = self.get_struct()
+        expressions = ', '.join(expression for (_, expression) in self.pending)
+        self.lines.append(f'{"    " * indent}out += {name}.pack({expressions})')
+        self.pending = []
+
+    def emit(self, source: str, annotation: Any, indent: int) -> None:
+        prefix = '    ' * indent
+        if is_dataclass(annotation):
+            hints = get_type_hints(annotation)
+            for field in fields(annotation):
+                self.emit(f'{source}.{field.name}', hints[field.name], indent)
+            return
+        if annotation in PRIMITIVE_FORMATS:
+            self.pending.append((PRIMITIVE_FORMATS[annotation], source))
+            return
+
+        self.flush(indent)
+        origin = get_origin(annotation)
+        if annotation is str:
+            self.lines.append(f'{prefix}write_str(out, {source})')
+            self.namespace['write_str'] = write_str
+        elif origin is list:
+            item_annotation = self.get_list_item_annotation(annotation)
+            item = f'item{indent}'
+            self.lines.append(f'{prefix}out += UINT32.pack(len({source}))')
+            self.lines.append(f'{prefix}for {item} in {source}:')
+            self.emit(item, item_annotation, indent + 1)
+            self.flush(indent + 1)
+        elif origin is dict:
+            self.lines.append(f'{prefix}write_dict(out, {source})')
+            self.namespace['write_dict'] = write_dict
+        elif origin is Union:
+            types = self.add_to_namespace('U', self.get_union_types(annotation))
+            self.lines.append(f'{prefix}write_union(out, {source}, {types})')
+            self.namespace['write_union'] = write_union
+        else:
+            raise TypeError(f'Cannot encode values of type {annotation}')
+
+
+class DecoderGenerator(Generator):
+    def generate(self) -> Decoder:
+        self.lines.append('def decode(buf, offset):')
+        expression = self.emit(self.cls, 1)
+        self.flush(1)
+        self.lines.append(f'    return {expression}, offset')
+        return self.compile('decode')
+
+    def flush(self, indent: int) -> None:
+        if len(self.pending) == 0:
+            return
+
+        prefix = '    ' * indent
+        name, size = self.get_struct()
+        variables = ', '.join(variable for (_, variable) in self.pending)
+        self.lines.append(f'{prefix}{variables}, = {name}.unpack_from(buf, offset)')
+        self.lines.append(f'{prefix}offset += {size}')
+        self.pending = []
+
+    def emit(self, annotation: Any, indent: int) -> str:
+        """
+        Emit the code reading a value
+        :return: expression of the value (only valid once all pending values have been read)
+        """
+        prefix = '    ' * indent
+        if is_dataclass(annotation):
+            hints = get_type_hints(annotation)
+            arguments = ', '.join(f'{field.name}={self.emit(hints[field.name], indent)}' for field in fields(annotation))
+            return f'{self.add_to_namespace("C", annotation)}({arguments})'
+
+        variable = self.new_variable()
+        if annotation in PRIMITIVE_FORMATS:
+            self.pending.append((PRIMITIVE_FORMATS[annotation], variable))
+            return variable
+
+        self.flush(indent)
+        origin = get_origin(annotation)
+        if annotation is str:
+            self.lines.append(f'{prefix}{variable}, offset = read_str(buf, offset)')
+            self.namespace['read_str'] = read_str
+        elif origin is list:
+            item_annotation = self.get_list_item_annotation(annotation)
+            count = self.new_variable()
+            self.lines.append(f'{prefix}{count}, = UINT32.unpack_from(buf, offset)')
+            self.lines.append(f'{prefix}offset += {UINT32.size}')
+            self.lines.append(f'{prefix}{variable} = []')
+            self.lines.append(f'{prefix}for _ in range({count}):')
+            item = self.emit(item_annotation, indent + 1)
+            self.flush(indent + 1)
+            self.lines.append(f'{prefix}    {variable}.append({item})')
+        elif origin is dict:
+            self.lines.append(f'{prefix}{variable}, offset = read_dict(buf, offset)')
+            self.namespace['read_dict'] = read_dict
+        elif origin is Union:
+            types = self.add_to_namespace('U', self.get_union_types(annotation))
+            self.lines.append(f'{prefix}{variable}, offset = read_union(buf, offset, {types})')
+            self.namespace['read_union'] = read_union
+        else:
+            raise TypeError(f'Cannot decode values of type {annotation}')
+
+        return variable
+
+
+def write_str(out: bytearray, value: str) -> None:
+    encoded = value.encode('utf-8')
+    out += UINT32.pack(len(encoded))
+    out += encoded
+
+
+def read_str(buf: Union[bytes, bytearray, memoryview], offset: int) -> Tuple[str, int]:
+    length, = UINT32.unpack_from(buf, offset)
+    offset += UINT32.size
+    end = offset + length
+    if end > len(buf):
+        raise IndexError('string exceeds data')
+    return str(buf[offset:end], 'utf-8'), end
+
+
+def write_dict(out: bytearray, value: Dict[str, Union[bool, int, float, str]]) -> None:
+    out += UINT32.pack(len(value))
+    for key, item in value.items():
+        write_str(out, key)
+        tag = VALUE_TAGS[type(item)]
+        out += UINT8.pack(tag)
+        if tag == 3:
+            write_str(out, item)
+        else:
+            out += struct.pack('<' + PRIMITIVE_FORMATS[type(item)], item)
+
+
+def read_dict(buf: Union[bytes, bytearray, memoryview], offset: int) -> Tuple[Dict[str, Any], int]:
+    count, = UINT32.unpack_from(buf, offset)
+    offset += UINT32.size
+    value = dict()
+    for _ in range(count):
+        key, offset = read_str(buf, offset)
+        tag, = UINT8.unpack_from(buf, offset)
+        offset += UINT8.size
+        if tag == 3:
+            value[key], offset = read_str(buf, offset)
+        else:
+            fmt = '<' + PRIMITIVE_FORMATS[(bool, int, float)[tag]]
+            value[key], = struct.unpack_from(fmt, buf, offset)
+            offset += struct.calcsize(fmt)
+    return value, offset
+
+
+def write_union(out: bytearray, value: Any, types: Tuple[type, ...]) -> None:
+    out += UINT8.pack(types.index(type(value)))
+    get_codec(type(value)).encode(value, out)
+
+
+def read_union(buf: Union[bytes, bytearray, memoryview], offset: int, types: Tuple[type, ...]) -> Tuple[Any, int]:
+    tag, = UINT8.unpack_from(buf, offset)
+    return get_codec(types[tag]).decode(buf, offset + UINT8.size)
@@ -0,0 +1,193 @@
+"""
+Measure AsyncAspxClient throughput, latency percentiles and event loop lag against the local stub server
+
+    python benchmarks/async_throughput.py --concurrency 1,10,100 --connection-limits 10,100 --latency 0.02
+
+With --background, measured requests are sent as interactive requests while a background crawl keeps the given
+number of requests in flight (showing how much a running crawl affects user-facing latency).
+"""
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import List, Dict, Optional, Callable, Awaitable, Tuple
+
+from aspxstats import Error, RequestPriority, request_priority
+from aspxstats.bf2 import AsyncAspxClient, PlayerinfoKeySet
+
+from common import add_output_arguments, finish
+
+FIRST_PID = 45000000
+
+
+def percentile(values: List[float], share: float) -> float:
+    if len(values) == 0:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * share), len(ordered) - 1)]
+
+
+def get_request(client: AsyncAspxClient, endpoint: str, players: int) -> Callable[[int], Awaitable]:
+    if endpoint == 'getplayerinfo':
+        return lambda i: client.getplayerinfo_dict(FIRST_PID + i % players, PlayerinfoKeySet.GENERAL_STATS)
+    if endpoint == 'getrankinfo':
+        return lambda i: client.getrankinfo_dict(FIRST_PID + i % players)
+    if endpoint == 'getleaderboard':
+        return lambda i: client.getleaderboard_dict(pos=1 + i % players)
+    raise ValueError(f'Unsupported endpoint "{endpoint}"')
+
+
+async def monitor_loop_lag(lags: List[float], interval: float, stop: asyncio.Event) -> None:
+    # Any time spent beyond the requested sleep interval is time the loop was busy with other work
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(max(time.perf_counter() - started - interval, 0.0))
+
+
+async def run_level(
+        base_uri: str,
+        endpoint: str,
+        players: int,
+        requests: int,
+        concurrency: int,
+        connection_limit: int,
+        executor: Optional[Executor],
+        background: int
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    lags: List[float] = []
+    errors = 0
+    async with AsyncAspxClient(
+            timeout=30.0,
+            parse_executor=executor,
+            parse_executor_threshold=0 if executor is not None else 1024,
+            connection_limit=connection_limit
+    ) as client:
+        client.base_uri = base_uri
+        request = get_request(client, endpoint, players)
+
+        # Warm up connections (and executor workers) before measuring anything
+        await asyncio.gather(*(request(i) for i in range(min(concurrency, requests))), return_exceptions=True)
+
+        counter = iter(range(requests))
+
+        async def worker() -> None:
+            nonlocal errors
+            for i in counter:
+                started = time.perf_counter()
+                try:
+                    await request(i)
+                    latencies.append(time.perf_counter() - started)
+                except Error:
+                    errors += 1
+
+        async def background_worker(offset: int) -> None:
+            i = offset
+            while not stop.is_set():
+                try:
+                    await request(i)
+                except Error:
+                    pass
+                i += background
+
+        stop = asyncio.Event()
+        monitor = asyncio.create_task(monitor_loop_lag(lags, 0.005, stop))
+        with request_priority(RequestPriority.BACKGROUND):
+            crawlers = [asyncio.create_task(background_worker(offset)) for offset in range(background)]
+        with request_priority(RequestPriority.INTERACTIVE if background > 0 else RequestPriority.NORMAL):
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            elapsed = time.perf_counter() - started
+        stop.set()
+        await asyncio.gather(monitor, *crawlers)
+
+    return {
+        'requests_per_second': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'loop_lag_mean_ms': round(statistics.fmean(lags) * 1000, 3) if lags else 0.0,
+        'loop_lag_p99_ms': round(percentile(lags, 0.99) * 1000, 3),
+        'loop_lag_max_ms': round(max(lags, default=0.0) * 1000, 3),
+        'errors': errors
+    }
+
+
+def start_stub(args) -> Tuple[subprocess.Popen, str]:
+    # Run the stub server in a separate process, so it does not compete with the client for the event loop
+    stub = subprocess.Popen(
+        [
+            sys.executable, '-m', 'aspxstats.bf2.stub',
+            '--port', '0',
+            '--players', str(args.players),
+            '--latency', str(args.latency),
+            '--latency-jitter', str(args.latency_jitter),
+            '--error-rate', str(args.error_rate),
+            '--slow-rate', str(args.slow_rate),
+            '--slow-latency', str(args.slow_latency)
+        ],
+        stdout=subprocess.PIPE,
+        text=True
+    )
+    # Stub reports the (randomly assigned) port once it is listening
+    line = stub.stdout.readline()
+    return stub, line.strip().rsplit(' ', 1)[-1]
+
+
+def parse_ints(value: str) -> List[int]:
+    return [int(element) for element in value.split(',')]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark async client throughput against the local stub server')
+    parser.add_argument('--endpoint', choices=['getplayerinfo', 'getrankinfo', 'getleaderboard'],
+                        default='getplayerinfo')
+    parser.add_argument('--requests', type=int, default=2000, help='requests per concurrency level')
+    parser.add_argument('--concurrency', type=parse_ints, default=[1, 10, 50, 100, 200])
+    parser.add_argument('--connection-limits', type=parse_ints, default=[100],
+                        help='connector limits to test each concurrency level with (0 for no limit)')
+    parser.add_argument('--parse-executor', choices=['none', 'thread', 'process'], default='none')
+    parser.add_argument('--background', type=int, default=0,
+                        help='number of background crawl requests to keep in flight while measuring')
+    parser.add_argument('--players', type=int, default=10000)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--latency-jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--slow-rate', type=float, default=0.0)
+    parser.add_argument('--slow-latency', type=float, default=1.0)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    stub, base_uri = start_stub(args)
+    executor: Optional[Executor] = None
+    if args.parse_executor == 'thread':
+        executor = ThreadPoolExecutor()
+    elif args.parse_executor == 'process':
+        executor = ProcessPoolExecutor()
+
+    results: Dict[str, Dict[str, float]] = dict()
+    try:
+        for connection_limit in args.connection_limits:
+            for concurrency in args.concurrency:
+                name = f'{args.endpoint}/concurrency-{concurrency}/limit-{connection_limit}'
+                if args.background > 0:
+                    name += f'/background-{args.background}'
+                results[name] = asyncio.run(run_level(
+                    base_uri, args.endpoint, args.players, args.requests, concurrency, connection_limit, executor,
+                    args.background
+                ))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        stub.terminate()
+        stub.wait()
+
+    return finish(args, results, 'requests_per_second', higher_is_better=True)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
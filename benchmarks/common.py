@@ -0,0 +1,122 @@
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+from typing import Callable, Dict, Any, List, Optional
+
+import aspxstats
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def load_fixture(name: str) -> str:
+    # Read without newline translation, fixtures need to be byte-identical to the recorded responses
+    with open(os.path.join(FIXTURES_DIR, name), 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def measure(func: Callable[[], Any], min_time: float = 0.2, repeat: int = 5) -> Dict[str, float]:
+    """
+    Time a function, calling it often enough for each run to take at least min_time seconds
+    :return: per-call timings in microseconds (minimum and median over all runs) and the number of calls per run
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time:
+            break
+        number *= 2
+
+    timings = [timing / number * 1e6 for timing in timer.repeat(repeat, number)]
+    return {
+        'min_us': round(min(timings), 3),
+        'median_us': round(statistics.median(timings), 3),
+        'calls': number
+    }
+
+
+def get_meta() -> Dict[str, Any]:
+    return {
+        'aspxstats': aspxstats.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'timestamp': int(time.time())
+    }
+
+
+def write_results(path: str, results: Dict[str, Dict[str, float]]) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'meta': get_meta(), 'results': results}, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def compare_results(
+        baseline: Dict[str, Dict[str, float]],
+        results: Dict[str, Dict[str, float]],
+        metric: str,
+        tolerance: float,
+        higher_is_better: bool = False
+) -> List[str]:
+    """
+    Print a comparison of results against a baseline
+    :return: names of all benchmarks which regressed by more than the given tolerance (relative to the baseline)
+    """
+    regressions = []
+    width = max((len(name) for name in results), default=0)
+    for name, result in sorted(results.items()):
+        if name not in baseline or baseline[name].get(metric) in (None, 0):
+            print(f'{name:<{width}}  {result[metric]:>12.3f}  (no baseline)')
+            continue
+
+        change = result[metric] / baseline[name][metric] - 1
+        regressed = -change > tolerance if higher_is_better else change > tolerance
+        if regressed:
+            regressions.append(name)
+        print(f'{name:<{width}}  {result[metric]:>12.3f}  {change:>+8.1%}{"  REGRESSION" if regressed else ""}')
+
+    return regressions
+
+
+def print_results(results: Dict[str, Dict[str, float]]) -> None:
+    width = max((len(name) for name in results), default=0)
+    for name, result in sorted(results.items()):
+        print(f'{name:<{width}}  ' + '  '.join(f'{key}={value}' for (key, value) in result.items()))
+
+
+def add_output_arguments(parser) -> None:
+    parser.add_argument('--output', help='write results to this (JSON) file')
+    parser.add_argument('--compare', help='compare results against this baseline (JSON) file')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='relative change considered a regression when comparing (default: 0.1)')
+
+
+def finish(
+        args,
+        results: Dict[str, Dict[str, float]],
+        metric: str,
+        higher_is_better: bool = False
+) -> Optional[int]:
+    """
+    Write/compare results as requested via the command line arguments
+    :return: exit code (1 if any benchmark regressed compared to the baseline)
+    """
+    if args.output:
+        write_results(args.output, results)
+
+    if not args.compare:
+        print_results(results)
+        return 0
+
+    with open(args.compare, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)['results']
+
+    regressions = compare_results(baseline, results, metric, args.tolerance, higher_is_better)
+    if len(regressions) > 0:
+        print(f'{len(regressions)} benchmark(s) regressed by more than {args.tolerance:.0%}', file=sys.stderr)
+        return 1
+
+    return 0
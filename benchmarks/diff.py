@@ -0,0 +1,89 @@
+"""
+Benchmark diffing two crawls of a leaderboard (from typed responses and from columns) and two snapshots of a batch of
+players' general stats (compared to checking their dicts for equality)
+
+    python benchmarks/diff.py --output diff.json
+"""
+import argparse
+import copy
+import random
+import sys
+from typing import Callable, Any, Dict, List
+
+from aspxstats.bf2 import AspxClient, PlayerinfoKeySet
+from aspxstats.bf2.diff import diff_leaderboards, diff_general_stats
+from aspxstats.bf2.snapshot import get_leaderboard_columns
+from aspxstats.bf2.stub import StubConfig, StubServer
+from aspxstats.bf2.types import LeaderboardResponse, LeaderboardEntry, PlayerinfoResponse
+
+from common import measure, add_output_arguments, finish
+
+
+def build_leaderboard(pids: List[int], asof: int, page_size: int = 1000) -> List[LeaderboardResponse]:
+    entries = [
+        LeaderboardEntry(n=n, pid=pid, nick=f'player{pid}', rank=n % 22, country_code='DE') for n, pid in enumerate(pids, 1)
+    ]
+    return [
+        LeaderboardResponse(size=len(entries), asof=asof, entries=entries[i:i + page_size])
+        for i in range(0, len(entries), page_size)
+    ]
+
+
+def play_round(response: PlayerinfoResponse) -> PlayerinfoResponse:
+    played = copy.deepcopy(response)
+    played.asof += 600
+    played.data.timestamp.last_battle += 600
+    played.data.score.total += 100
+    played.data.kills.total += 5
+    played.data.weapons[1].kills += 5
+    return played
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark leaderboard diffs')
+    parser.add_argument('--entries', type=int, default=100000, help='number of entries in each leaderboard')
+    parser.add_argument('--players', type=int, default=1000, help='number of players in the general stats batch')
+    parser.add_argument('--min-time', type=float, default=0.1, help='minimum duration of each timing run (seconds)')
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    # A day later, 1% of players dropped off/entered and most others moved by a few positions
+    rng = random.Random(0)
+    old_pids = list(range(45000000, 45000000 + args.entries))
+    new_pids = old_pids[:args.entries - args.entries // 100] + list(range(46000000, 46000000 + args.entries // 100))
+    positions = {pid: i + rng.gauss(0, 5) for (i, pid) in enumerate(new_pids)}
+    new_pids.sort(key=positions.__getitem__)
+    old, new = build_leaderboard(old_pids, 1663441990), build_leaderboard(new_pids, 1663528390)
+    old_columns, new_columns = get_leaderboard_columns(old), get_leaderboard_columns(new)
+
+    server = StubServer(StubConfig(players=args.players))
+    with AspxClient() as client:
+        before = [
+            client.validate_and_decode_getplayerinfo_response(
+                PlayerinfoKeySet.GENERAL_STATS, server.render_getplayerinfo(pid, PlayerinfoKeySet.GENERAL_STATS.value)
+            ) for pid in server.players.get_pids()
+        ]
+    # Most tracked players will not have played a round since the last poll
+    unchanged = [PlayerinfoResponse(asof=r.asof + 600, data=copy.deepcopy(r.data)) for r in before]
+    played = [play_round(r) for r in before]
+
+    scenarios: Dict[str, Callable[[], Any]] = {
+        f'diff-{args.entries}/leaderboard/responses': lambda: diff_leaderboards(old, new),
+        f'diff-{args.entries}/leaderboard/columns': lambda: diff_leaderboards(old_columns, new_columns),
+        f'diff-{args.players}/general_stats/dict_equality': lambda: [
+            a.to_dict() == b.to_dict() for (a, b) in zip(before, played)
+        ],
+        f'diff-{args.players}/general_stats/unchanged': lambda: [
+            diff_general_stats(a, b) for (a, b) in zip(before, unchanged)
+        ],
+        f'diff-{args.players}/general_stats/played': lambda: [
+            diff_general_stats(a, b) for (a, b) in zip(before, played)
+        ],
+    }
+    results = {name: measure(func, args.min_time) for (name, func) in scenarios.items()}
+
+    return finish(args, results, 'median_us')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
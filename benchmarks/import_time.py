@@ -0,0 +1,71 @@
+"""
+Measure cold-start cost: importing the package (sync and async paths) and parsing a first response,
+each in a fresh interpreter
+
+    python benchmarks/import_time.py --output import_time.json
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+from common import FIXTURES_DIR, add_output_arguments, finish
+
+# Code to time, interpreter startup is not included, since timing happens in the child process
+SCENARIOS = {
+    'import aspxstats': 'import aspxstats',
+    'import aspxstats.bf2': 'import aspxstats.bf2',
+    'import AsyncAspxClient': 'from aspxstats.bf2 import AsyncAspxClient',
+    'first getplayerinfo parse': (
+        'import os\n'
+        'from aspxstats.bf2 import AspxClient, PlayerinfoKeySet\n'
+        f'with open(os.path.join({FIXTURES_DIR!r}, "getplayerinfo-general.aspx"), newline="") as f:\n'
+        '    raw_data = f.read()\n'
+        'AspxClient().validate_and_parse_getplayerinfo_response(PlayerinfoKeySet.GENERAL_STATS, raw_data)'
+    ),
+}
+
+# Wraps the scenario code to time it in the child process and report the modules it imported
+TEMPLATE = '''
+import sys, time
+started = time.perf_counter()
+exec(compile({code!r}, '<scenario>', 'exec'))
+elapsed = time.perf_counter() - started
+print(elapsed, int(any(name.split('.')[0] == 'aiohttp' for name in sys.modules)), len(sys.modules))
+'''
+
+
+def run_scenario(code: str, repeat: int) -> Dict[str, float]:
+    timings: List[float] = []
+    aiohttp_imported = modules = 0
+    for _ in range(repeat):
+        # Run without the user site directory, which may otherwise add (varying) imports on startup
+        output = subprocess.run(
+            [sys.executable, '-s', '-c', TEMPLATE.format(code=code)],
+            capture_output=True, text=True, check=True
+        ).stdout.split()
+        timings.append(float(output[0]) * 1e3)
+        aiohttp_imported, modules = int(output[1]), int(output[2])
+
+    return {
+        'min_ms': round(min(timings), 3),
+        'median_ms': round(statistics.median(timings), 3),
+        'aiohttp_imported': aiohttp_imported,
+        'modules': modules
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark import (cold-start) time')
+    parser.add_argument('--repeat', type=int, default=20, help='number of fresh interpreters to start per scenario')
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    results = {name: run_scenario(code, args.repeat) for (name, code) in SCENARIOS.items()}
+
+    return finish(args, results, 'median_ms')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
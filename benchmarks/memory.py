@@ -0,0 +1,104 @@
+"""
+Measure peak and retained memory of parsed responses for the dict and typed representations
+
+    python benchmarks/memory.py --output memory.json
+"""
+import argparse
+import gc
+import sys
+import tracemalloc
+from typing import Callable, Any, Dict, List, Iterable
+
+from aspxstats.bf2 import AspxClient, PlayerinfoKeySet
+from aspxstats.bf2.stub import SyntheticPlayers, StubConfig, StubServer
+from aspxstats.bf2.table import PlayerStatsTable
+from aspxstats.bf2.types import PlayerinfoResponse, LeaderboardResponse
+
+from common import load_fixture, add_output_arguments, finish
+
+
+def measure_memory(func: Callable[[], Any]) -> Dict[str, int]:
+    """
+    Measure memory allocated while running a function
+    :return: peak bytes allocated during the call and bytes still allocated afterwards (held by the result)
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = func()
+        gc.collect()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Keep the result alive until after measuring
+    del result
+    return {
+        'peak_bytes': peak - before,
+        'retained_bytes': after - before
+    }
+
+
+def to_table(parsed: Iterable[dict]) -> PlayerStatsTable:
+    table = PlayerStatsTable()
+    table.extend(parsed)
+    return table
+
+
+def generate_playerinfo_responses(count: int) -> List[str]:
+    config = StubConfig(players=count)
+    server = StubServer(config)
+    return [
+        server.render_getplayerinfo(pid, PlayerinfoKeySet.GENERAL_STATS.value)
+        for pid in SyntheticPlayers(config).get_pids()
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark memory usage of parsed responses')
+    parser.add_argument('--players', type=int, default=10000, help='number of players in the result set scenario')
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    with AspxClient() as client, AspxClient(lazy_values=True) as lazy_client:
+        playerinfo = load_fixture('getplayerinfo-general.aspx')
+        leaderboard = load_fixture('getleaderboard-1000.aspx')
+        result_set = generate_playerinfo_responses(args.players)
+
+        def parse_playerinfo(raw_data: str) -> dict:
+            return client.validate_and_parse_getplayerinfo_response(PlayerinfoKeySet.GENERAL_STATS, raw_data)
+
+        def decode_playerinfo(raw_data: str) -> PlayerinfoResponse:
+            # Typed path of getplayerinfo, decoding the response directly (without building the parsed dict)
+            return client.validate_and_decode_getplayerinfo_response(PlayerinfoKeySet.GENERAL_STATS, raw_data)
+
+        def parse_playerinfo_lazy(raw_data: str) -> dict:
+            return lazy_client.validate_and_parse_getplayerinfo_response(PlayerinfoKeySet.GENERAL_STATS, raw_data)
+
+        scenarios: Dict[str, Callable[[], Any]] = {
+            'getplayerinfo/dict': lambda: parse_playerinfo(playerinfo),
+            'getplayerinfo/typed': lambda: decode_playerinfo(playerinfo),
+            'getplayerinfo/lazy': lambda: parse_playerinfo_lazy(playerinfo),
+            'getleaderboard-1000/dict': lambda: client.validate_and_parse_getleaderboard_response(leaderboard),
+            'getleaderboard-1000/typed': lambda: LeaderboardResponse.from_aspx_response(
+                client.validate_and_parse_getleaderboard_response(leaderboard)
+            ),
+            f'getplayerinfo-{args.players}/dict': lambda: [parse_playerinfo(raw) for raw in result_set],
+            f'getplayerinfo-{args.players}/lazy': lambda: [parse_playerinfo_lazy(raw) for raw in result_set],
+            f'getplayerinfo-{args.players}/typed': lambda: [decode_playerinfo(raw) for raw in result_set],
+            f'getplayerinfo-{args.players}/table': lambda: to_table(parse_playerinfo(raw) for raw in result_set),
+        }
+
+        # Parse once to make sure any (lazily) created module level state is not attributed to the first scenario
+        for func in scenarios.values():
+            func()
+
+        results = {name: measure_memory(func) for (name, func) in scenarios.items()}
+
+    return finish(args, results, 'retained_bytes')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
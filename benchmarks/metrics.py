@@ -0,0 +1,77 @@
+"""
+Benchmark deriving metrics for a batch of players, per player from typed responses and column-wise from a table
+
+    python benchmarks/metrics.py --output metrics.json
+"""
+import argparse
+import sys
+from typing import Callable, Any, Dict, List
+
+from aspxstats.bf2 import AspxClient, PlayerinfoKeySet, PlayerStatsTable
+from aspxstats.bf2 import metrics
+from aspxstats.bf2.stub import SyntheticPlayers, StubConfig, StubServer
+from aspxstats.bf2.types import PlayerinfoGeneralStats
+
+from common import measure, add_output_arguments, finish
+
+
+def ratio(dividend: int, divisor: int) -> float:
+    return dividend / divisor if divisor != 0 else float(dividend)
+
+
+def per_player(players: List[PlayerinfoGeneralStats]) -> List[Dict[str, Any]]:
+    # Metrics as derived one player at a time
+    return [
+        {
+            'kill_death_ratio': ratio(p.kills.total, p.deaths.total),
+            'accuracy_weighted_kills': p.kills.total * p.accuracy / 100,
+            'score_per_minute': p.score.total * 60 / p.time.total if p.time.total != 0 else 0.0,
+            'win_rate': p.rounds.wins / (p.rounds.wins + p.rounds.losses) if p.rounds.wins + p.rounds.losses else 0.0,
+            'weapons': {w.id: ratio(w.kills, w.deaths) for w in p.weapons},
+            'vehicles': {v.id: ratio(v.kills, v.deaths) for v in p.vehicles},
+            'kits': {k.id: ratio(k.kills, k.deaths) for k in p.kits}
+        } for p in players
+    ]
+
+
+def column_wise(table: PlayerStatsTable) -> Dict[str, Any]:
+    return {
+        **metrics.compute_metrics(table),
+        'weapons': metrics.item_kill_death_ratios(table, 'w'),
+        'vehicles': metrics.item_kill_death_ratios(table, 'v'),
+        'kits': metrics.item_kill_death_ratios(table, 'k')
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark derived metrics')
+    parser.add_argument('--players', type=int, default=10000, help='number of players in the batch')
+    parser.add_argument('--min-time', type=float, default=0.1, help='minimum duration of each timing run (seconds)')
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    config = StubConfig(players=args.players)
+    server = StubServer(config)
+    players: List[PlayerinfoGeneralStats] = []
+    table = PlayerStatsTable()
+    with AspxClient() as client:
+        for pid in SyntheticPlayers(config).get_pids():
+            parsed = client.validate_and_parse_getplayerinfo_response(
+                PlayerinfoKeySet.GENERAL_STATS, server.render_getplayerinfo(pid, PlayerinfoKeySet.GENERAL_STATS.value)
+            )
+            players.append(PlayerinfoGeneralStats.from_aspx_response(parsed))
+            table.append(parsed)
+
+    scenarios: Dict[str, Callable[[], Any]] = {
+        f'metrics-{args.players}/per_player': lambda: per_player(players),
+        f'metrics-{args.players}/column_wise': lambda: column_wise(table),
+        f'metrics-{args.players}/rank_players': lambda: metrics.rank_players(table, metrics.kill_death_ratio(table)),
+    }
+    results = {name: measure(func, args.min_time) for (name, func) in scenarios.items()}
+
+    print(f'Backend: {"numpy" if metrics.numpy is not None else "pure Python"}')
+    return finish(args, results, 'median_us')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""
+Benchmark each endpoint's parse pipeline end to end as well as its individual stages
+
+    python benchmarks/parse.py --output baseline.json
+    python benchmarks/parse.py --compare baseline.json
+"""
+import argparse
+import sys
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Dict, Any
+
+from aspxstats.bf2 import AspxClient, PlayerinfoKeySet
+from aspxstats.bf2.schemas import SEARCHFORPLAYERS_RESPONSE_SCHEMA, GETLEADERBOARD_RESPONSE_SCHEMA, \
+    GETPLAYERINFO_GENERAL_STATS_RESPONSE_SCHEMA, GETPLAYERINFO_MAP_STATS_RESPONSE_SCHEMA, GETRANKINFO_RESPONSE_SCHEMA, \
+    GETAWARDSINFO_RESPONSE_SCHEMA, GETUNLOCKSINFO_RESPONSE_SCHEMA, GETBACKENDINFO_RESPONSE_SCHEMA, \
+    VERIFYPLAYER_RESPONSE_SCHEMA
+from aspxstats.bf2.types import PlayerSearchResponse, LeaderboardResponse, PlayerinfoGeneralStats, \
+    PlayerinfoMapStats, RankinfoResponse
+from aspxstats.bf2.utils import group_stats_by_item
+from aspxstats.parsing import parse_dict_values
+from aspxstats.schema import DictSchema
+from aspxstats.types import ParseTarget, ResponseValidationMode
+from aspxstats.validation import validate_dict
+
+from common import load_fixture, measure, add_output_arguments, finish
+
+
+@dataclass
+class Pipeline:
+    name: str
+    fixture: str
+    targets: List[ParseTarget]
+    schema: DictSchema
+    validate_and_parse: Callable[[AspxClient, str], dict]
+    fix: Optional[Callable[[dict], dict]] = None
+    typed: Optional[Callable[[dict], Any]] = None
+    # Validates and decodes straight into the typed response (skipping the intermediate dicts)
+    decode: Optional[Callable[[AspxClient, str], Any]] = None
+    # Prefixes and keys of the stats to group by item (passed to group_stats_by_item)
+    groups: Dict[str, List[str]] = field(default_factory=dict)
+
+
+PIPELINES = [
+    Pipeline(
+        'searchforplayers', 'searchforplayers.aspx',
+        [ParseTarget(to_root=True), ParseTarget('results', as_list=True)],
+        SEARCHFORPLAYERS_RESPONSE_SCHEMA,
+        lambda client, raw_data: client.validate_and_parse_searchforplayers_response(raw_data),
+        typed=PlayerSearchResponse.from_aspx_response
+    ),
+    Pipeline(
+        'getleaderboard', 'getleaderboard.aspx',
+        [ParseTarget(to_root=True), ParseTarget('entries', as_list=True)],
+        GETLEADERBOARD_RESPONSE_SCHEMA,
+        lambda client, raw_data: client.validate_and_parse_getleaderboard_response(raw_data),
+        typed=LeaderboardResponse.from_aspx_response
+    ),
+    Pipeline(
+        'getplayerinfo.general', 'getplayerinfo-general.aspx',
+        [ParseTarget(to_root=True), ParseTarget('data')],
+        GETPLAYERINFO_GENERAL_STATS_RESPONSE_SCHEMA,
+        lambda client, raw_data: client.validate_and_parse_getplayerinfo_response(
+            PlayerinfoKeySet.GENERAL_STATS, raw_data
+        ),
+        fix=AspxClient.fix_getplayerinfo_values,
+        typed=PlayerinfoGeneralStats.from_aspx_response,
+        decode=lambda client, raw_data: client.validate_and_decode_getplayerinfo_response(
+            PlayerinfoKeySet.GENERAL_STATS, raw_data
+        ),
+        groups={
+            'w': ['tm', 'kl', 'dt', 'ac', 'kd'],
+            'v': ['tm', 'kl', 'dt', 'kd', 'kr'],
+            'a': ['tm', 'wn', 'lo', 'br'],
+            'k': ['tm', 'kl', 'dt', 'kd']
+        }
+    ),
+    Pipeline(
+        'getplayerinfo.map', 'getplayerinfo-map.aspx',
+        [ParseTarget(to_root=True), ParseTarget('data')],
+        GETPLAYERINFO_MAP_STATS_RESPONSE_SCHEMA,
+        lambda client, raw_data: client.validate_and_parse_getplayerinfo_response(
+            PlayerinfoKeySet.MAP_STATS, raw_data
+        ),
+        fix=AspxClient.fix_getplayerinfo_values,
+        typed=PlayerinfoMapStats.from_aspx_response,
+        decode=lambda client, raw_data: client.validate_and_decode_getplayerinfo_response(
+            PlayerinfoKeySet.MAP_STATS, raw_data
+        ),
+        groups={
+            'm': ['tm', 'wn', 'ls']
+        }
+    ),
+    Pipeline(
+        'getrankinfo', 'getrankinfo.aspx',
+        [ParseTarget('data')],
+        GETRANKINFO_RESPONSE_SCHEMA,
+        lambda client, raw_data: client.validate_and_parse_getrankinfo_response(raw_data),
+        typed=RankinfoResponse.from_aspx_response
+    ),
+    Pipeline(
+        'getawardsinfo', 'getawardsinfo.aspx',
+        [ParseTarget(to_root=True), ParseTarget('data', as_list=True)],
+        GETAWARDSINFO_RESPONSE_SCHEMA,
+        lambda client, raw_data: client.validate_and_parse_getawardsinfo_response(raw_data, 45000001)
+    ),
+    Pipeline(
+        'getunlocksinfo', 'getunlocksinfo.aspx',
+        [ParseTarget(to_root=True), ParseTarget('status'), ParseTarget('data', as_list=True)],
+        GETUNLOCKSINFO_RESPONSE_SCHEMA,
+        lambda client, raw_data: client.validate_and_parse_getunlocksinfo_response(raw_data)
+    ),
+    Pipeline(
+        'getbackendinfo', 'getbackendinfo.aspx',
+        [ParseTarget(to_root=True), ParseTarget('unlocks', as_list=True)],
+        GETBACKENDINFO_RESPONSE_SCHEMA,
+        lambda client, raw_data: client.validate_and_parse_getbackendinfo_response(raw_data)
+    ),
+    Pipeline(
+        'verifyplayer', 'verifyplayer.aspx',
+        [ParseTarget(to_root=True), ParseTarget(to_root=True)],
+        VERIFYPLAYER_RESPONSE_SCHEMA,
+        lambda client, raw_data: client.validate_and_parse_verifyplayer_response(raw_data)
+    ),
+]
+
+
+def benchmark_pipeline(
+        client: AspxClient,
+        pipeline: Pipeline,
+        min_time: float
+) -> Dict[str, Dict[str, float]]:
+    raw_data = load_fixture(pipeline.fixture)
+
+    # Prepare the input of each stage by running all previous stages once
+    datasets = AspxClient.extract_datasets_from_response(raw_data)
+    built = AspxClient.build_dict_from_datasets(datasets, pipeline.targets)
+    fixed = pipeline.fix(built) if pipeline.fix is not None else built
+    validate_dict(fixed, pipeline.schema)
+    parsed = parse_dict_values(fixed, pipeline.schema, client.cleaners)
+
+    stages: Dict[str, Callable[[], Any]] = {
+        'end_to_end': lambda: pipeline.validate_and_parse(client, raw_data),
+        'is_valid_aspx_response': lambda: AspxClient.is_valid_aspx_response(raw_data, client.response_validation_mode),
+        'extract_datasets_from_response': lambda: AspxClient.extract_datasets_from_response(raw_data),
+        'build_dict_from_datasets': lambda: AspxClient.build_dict_from_datasets(datasets, pipeline.targets),
+        'validate_dict': lambda: validate_dict(fixed, pipeline.schema),
+        'parse_dict_values': lambda: parse_dict_values(fixed, pipeline.schema, client.cleaners),
+    }
+    if pipeline.fix is not None:
+        # Fixes are applied in place, but are idempotent for fixtures without any broken values
+        stages['fix_values'] = lambda: pipeline.fix(fixed)
+    for prefix, keys in pipeline.groups.items():
+        stages[f'group_stats_by_item.{prefix}'] = \
+            lambda prefix=prefix, keys=keys: group_stats_by_item(parsed['data'], prefix, keys)
+    if pipeline.typed is not None:
+        stages['from_aspx_response'] = lambda: pipeline.typed(parsed)
+    if pipeline.decode is not None:
+        stages['validate_and_decode'] = lambda: pipeline.decode(client, raw_data)
+
+    return {f'{pipeline.name}/{stage}': measure(func, min_time) for (stage, func) in stages.items()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark response parsing')
+    parser.add_argument('--filter', default='', help='only run pipelines whose name contains this string')
+    parser.add_argument('--min-time', type=float, default=0.1, help='minimum duration of each timing run (seconds)')
+    parser.add_argument('--validation-mode', choices=[mode.name for mode in ResponseValidationMode], default='LAX',
+                        help='response validation mode to parse with (default: LAX)')
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    results: Dict[str, Dict[str, float]] = dict()
+    with AspxClient(response_validation_mode=ResponseValidationMode[args.validation_mode]) as client:
+        for pipeline in PIPELINES:
+            if args.filter in pipeline.name:
+                results.update(benchmark_pipeline(client, pipeline, args.min_time))
+
+    return finish(args, results, 'median_us')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
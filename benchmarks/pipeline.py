@@ -0,0 +1,115 @@
+"""
+Benchmark crawling a batch of players with the crawl pipeline vs. gathering all requests and writing results afterwards
+(as ad-hoc crawl scripts usually do), reporting time per player and peak memory usage
+
+    python benchmarks/pipeline.py --players 2000 --latency 0.005 --output pipeline.json
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Awaitable, Dict, List, Optional
+
+from aspxstats.bf2 import AsyncAspxClient, PlayerinfoKeySet
+from aspxstats.bf2.pipeline import CrawlPipeline, PipelineResult
+from aspxstats.bf2.stub import StubConfig, StubServer
+
+from common import add_output_arguments, finish
+
+
+def get_stub_client(server: StubServer, latency: float) -> AsyncAspxClient:
+    # Render responses in-process (with simulated latency), so only the client side is measured
+    client = AsyncAspxClient()
+
+    async def get_aspx_data(endpoint: str, params: Optional[Dict[str, str]] = None) -> str:
+        await asyncio.sleep(latency)
+        return server.render(endpoint, tuple(sorted(client.stringify_params(params).items())))
+
+    client.get_aspx_data = get_aspx_data
+    return client
+
+
+async def crawl_gather(client: AsyncAspxClient, pids: List[int], concurrency: int, sink: Callable[[dict], None]) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(pid: int) -> dict:
+        async with semaphore:
+            return await client.getplayerinfo_dict(pid, PlayerinfoKeySet.GENERAL_STATS)
+
+    for parsed in await asyncio.gather(*(fetch(pid) for pid in pids)):
+        sink(parsed)
+
+
+async def crawl_pipeline(client: AsyncAspxClient, pids: List[int], concurrency: int, sink: Callable[[dict], None]) -> None:
+    def pipeline_sink(result: PipelineResult) -> None:
+        sink(result.parsed)
+
+    await CrawlPipeline(client, pids, pipeline_sink, fetch_concurrency=concurrency).run()
+
+
+async def run(
+        crawl: Callable[[AsyncAspxClient, List[int], int, Callable[[dict], None]], Awaitable[None]],
+        server: StubServer,
+        pids: List[int],
+        concurrency: int,
+        latency: float
+) -> float:
+    written = 0
+
+    def sink(_: dict) -> None:
+        nonlocal written
+        written += 1
+
+    client = get_stub_client(server, latency)
+    try:
+        started = time.perf_counter()
+        await crawl(client, pids, concurrency, sink)
+        elapsed = time.perf_counter() - started
+    finally:
+        await client.close()
+
+    assert written == len(pids)
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the crawl pipeline vs. gathering all requests')
+    parser.add_argument('--players', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.005, help='simulated latency per request in seconds')
+    parser.add_argument('--repeat', type=int, default=3)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    server = StubServer(StubConfig(players=args.players))
+    pids = list(server.players.get_pids())
+    crawls = {
+        'gather': crawl_gather,
+        'pipeline': crawl_pipeline
+    }
+
+    results: Dict[str, Dict[str, float]] = dict()
+    for name, crawl in crawls.items():
+        timings = [
+            asyncio.run(run(crawl, server, pids, args.concurrency, args.latency)) / len(pids) * 1e6
+            for _ in range(args.repeat)
+        ]
+
+        tracemalloc.start()
+        asyncio.run(run(crawl, server, pids, args.concurrency, args.latency))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results[f'crawl/{name}/{args.players}'] = {
+            'min_us': round(min(timings), 3),
+            'median_us': round(statistics.median(timings), 3),
+            'peak_kib': round(peak / 1024, 1)
+        }
+
+    return finish(args, results, 'median_us')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+(Re-)record the fixtures used by the benchmarks from a provider or the local stub server
+
+    python benchmarks/record_fixtures.py                                  # local stub server
+    python benchmarks/record_fixtures.py --provider bf2hub --pid 45377286  # live provider
+"""
+import argparse
+import asyncio
+import os
+from typing import Optional, Dict
+
+from aspxstats.bf2 import AspxClient, StatsProvider, PlayerinfoKeySet
+from aspxstats.bf2.stub import StubServer, StubConfig
+
+from common import FIXTURES_DIR
+
+FIXTURES: Dict[str, tuple] = {
+    'searchforplayers.aspx': ('searchforplayers.aspx', {'nick': 'player4500001', 'where': 'b', 'sort': 'a'}),
+    'getleaderboard.aspx': ('getleaderboard.aspx', {'type': 'score', 'id': 'overall', 'pos': '1', 'after': '19'}),
+    'getleaderboard-1000.aspx': ('getleaderboard.aspx', {'type': 'score', 'id': 'overall', 'pos': '1',
+                                                         'after': '999'}),
+    'getplayerinfo-general.aspx': ('getplayerinfo.aspx', {'info': PlayerinfoKeySet.GENERAL_STATS}),
+    'getplayerinfo-map.aspx': ('getplayerinfo.aspx', {'info': PlayerinfoKeySet.MAP_STATS}),
+    'getrankinfo.aspx': ('getrankinfo.aspx', {}),
+    'getawardsinfo.aspx': ('getawardsinfo.aspx', {}),
+    'getunlocksinfo.aspx': ('getunlocksinfo.aspx', {}),
+    'getbackendinfo.aspx': ('getbackendinfo.aspx', {}),
+    'verifyplayer.aspx': ('VerifyPlayer.aspx', {'auth': 'benchmark', 'SoldierNick': 'player45000001'}),
+}
+
+
+def record(client: AspxClient, pid: int) -> None:
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    for name, (endpoint, params) in FIXTURES.items():
+        raw_data = client.get_aspx_data(endpoint, {'pid': str(pid), **params})
+        with open(os.path.join(FIXTURES_DIR, name), 'w', encoding='utf-8', newline='') as f:
+            f.write(raw_data)
+        print(f'Recorded {name} ({len(raw_data)} characters)')
+
+
+async def record_from_stub(pid: int) -> None:
+    async with StubServer(StubConfig(players=2000)) as server:
+        await server.start(port=0)
+        with AspxClient() as client:
+            client.base_uri = server.base_uri
+            # Use a thread to not block the stub server's event loop
+            await asyncio.to_thread(record, client, pid)
+
+
+def main(provider: Optional[str], pid: int) -> None:
+    if provider is None:
+        asyncio.run(record_from_stub(pid))
+        return
+
+    with AspxClient(StatsProvider(provider), timeout=10.0) as client:
+        record(client, pid)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Record benchmark fixtures')
+    parser.add_argument('--provider', choices=[provider.value for provider in StatsProvider])
+    parser.add_argument('--pid', type=int, default=45000001)
+    args = parser.parse_args()
+    main(args.provider, args.pid)
@@ -0,0 +1,55 @@
+"""
+Benchmark converting typed responses to dicts and JSON bytes, via __iter__ (dict()) and the generated converters,
+as well as encoding/decoding them with the binary wire format (used for pickling)
+
+    python benchmarks/serialization.py --output serialization.json
+"""
+import argparse
+import json
+import sys
+from typing import Callable, Any, Dict
+
+from aspxstats import serialization, wire
+from aspxstats.bf2 import AspxClient, PlayerinfoKeySet
+from aspxstats.bf2.types import LeaderboardResponse
+
+from common import load_fixture, measure, add_output_arguments, finish
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark serialization of typed responses')
+    parser.add_argument('--min-time', type=float, default=0.1, help='minimum duration of each timing run (seconds)')
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    with AspxClient() as client:
+        responses = {
+            'getplayerinfo.general': client.validate_and_decode_getplayerinfo_response(
+                PlayerinfoKeySet.GENERAL_STATS, load_fixture('getplayerinfo-general.aspx')
+            ),
+            'getplayerinfo.map': client.validate_and_decode_getplayerinfo_response(
+                PlayerinfoKeySet.MAP_STATS, load_fixture('getplayerinfo-map.aspx')
+            ),
+            'getleaderboard-1000': LeaderboardResponse.from_aspx_response(
+                client.validate_and_parse_getleaderboard_response(load_fixture('getleaderboard-1000.aspx'))
+            )
+        }
+
+    results: Dict[str, Dict[str, float]] = dict()
+    for name, response in responses.items():
+        stages: Dict[str, Callable[[], Any]] = {
+            'dict': lambda response=response: dict(response),
+            'to_dict': lambda response=response: response.to_dict(),
+            'json_dumps_dict': lambda response=response: json.dumps(dict(response)).encode('utf-8'),
+            'to_json_bytes': lambda response=response: response.to_json_bytes(),
+            'wire_encode': lambda response=response: wire.encode(response),
+            'wire_decode': lambda payload=wire.encode(response): wire.decode(payload),
+        }
+        results.update({f'{name}/{stage}': measure(func, args.min_time) for (stage, func) in stages.items()})
+
+    print(f'JSON backend: {"orjson" if serialization.orjson is not None else "json"}')
+    return finish(args, results, 'median_us')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
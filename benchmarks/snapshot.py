@@ -0,0 +1,76 @@
+"""
+Benchmark writing and loading daily snapshots of player stats, as JSON and as columnar snapshot files
+
+    python benchmarks/snapshot.py --output snapshot.json
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+from typing import Callable, Any, Dict, List
+
+from aspxstats.bf2 import AspxClient, PlayerinfoKeySet, PlayerStatsTable
+from aspxstats.bf2.snapshot import export_player_stats, read_player_stats
+from aspxstats.bf2.stub import StubConfig, StubServer
+from aspxstats.snapshot import Snapshot
+
+from common import measure, add_output_arguments, finish
+
+
+def sum_column(path: str, name: str) -> int:
+    # Aggregate a single column straight from the memory mapped file
+    with Snapshot(path) as snapshot:
+        with snapshot.column(name) as column:
+            return sum(column)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark snapshot export and loading')
+    parser.add_argument('--players', type=int, default=10000, help='number of players in the snapshot')
+    parser.add_argument('--min-time', type=float, default=0.1, help='minimum duration of each timing run (seconds)')
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    config = StubConfig(players=args.players)
+    server = StubServer(config)
+    parsed: List[dict] = []
+    table = PlayerStatsTable()
+    with AspxClient() as client:
+        for pid in server.players.get_pids():
+            p = client.validate_and_parse_getplayerinfo_response(
+                PlayerinfoKeySet.GENERAL_STATS, server.render_getplayerinfo(pid, PlayerinfoKeySet.GENERAL_STATS.value)
+            )
+            parsed.append(p)
+            table.append(p)
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, 'snapshot.json')
+        snapshot_path = os.path.join(directory, 'snapshot.dat')
+
+        def write_json() -> None:
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(parsed, f)
+
+        def read_json() -> List[dict]:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        def sum_json() -> int:
+            return sum(p['data']['kill'] for p in read_json())
+
+        scenarios: Dict[str, Callable[[], Any]] = {
+            f'snapshot-{args.players}/json/write': write_json,
+            f'snapshot-{args.players}/json/read': read_json,
+            f'snapshot-{args.players}/json/sum_column': sum_json,
+            f'snapshot-{args.players}/columnar/write': lambda: export_player_stats(snapshot_path, table),
+            f'snapshot-{args.players}/columnar/read': lambda: read_player_stats(snapshot_path),
+            f'snapshot-{args.players}/columnar/sum_column': lambda: sum_column(snapshot_path, 'kill'),
+        }
+        results = {name: measure(func, args.min_time) for (name, func) in scenarios.items()}
+
+    return finish(args, results, 'median_us')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""
+Benchmark serving a player's stats from the local player store, compared to validating and decoding a response
+
+    python benchmarks/store.py --output store.json
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+from typing import Callable, Any, Dict
+
+from aspxstats.bf2 import AspxClient, PlayerinfoKeySet, PlayerStore
+from aspxstats.bf2.stub import StubConfig, StubServer
+
+from common import measure, add_output_arguments, finish
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the player store')
+    parser.add_argument('--players', type=int, default=10000, help='number of players in the store')
+    parser.add_argument('--min-time', type=float, default=0.1, help='minimum duration of each timing run (seconds)')
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    key_set = PlayerinfoKeySet.GENERAL_STATS
+    server = StubServer(StubConfig(players=args.players))
+    pids = list(server.players.get_pids())
+    pid = random.Random(0).choice(pids)
+    raw_data = server.render_getplayerinfo(pid, key_set.value)
+
+    with tempfile.TemporaryDirectory() as directory, AspxClient() as client, \
+            PlayerStore(os.path.join(directory, 'players.dat')) as store:
+        for p in pids:
+            store.put(key_set, client.validate_and_parse_getplayerinfo_response(
+                key_set, server.render_getplayerinfo(p, key_set.value)
+            ))
+        parsed = store.get(pid, key_set)
+
+        scenarios: Dict[str, Callable[[], Any]] = {
+            f'store-{args.players}/put': lambda: store.put(key_set, parsed),
+            f'store-{args.players}/get': lambda: store.get(pid, key_set, max_age=3600),
+            f'store-{args.players}/get_response': lambda: store.get_response(pid, key_set, max_age=3600),
+            f'store-{args.players}/validate_and_decode': lambda: client.validate_and_decode_getplayerinfo_response(
+                key_set, raw_data
+            ),
+        }
+        results = {name: measure(func, args.min_time) for (name, func) in scenarios.items()}
+
+    return finish(args, results, 'median_us')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from aspxstats.archive import ResponseArchive, Compression, ArchiveKey
+from aspxstats.bf2 import StatsProvider
+from aspxstats.exceptions import Error
+
+
+class ResponseArchiveTest(TestCase):
+    def test_append_and_read(self):
+        # GIVEN
+        raw_data = 'O\n' \
+                   'H\tasof\n' \
+                   'D\t1663441990\n' \
+                   'H\tpid\tnick\tmtm-0\tmwn-0\tmls-0\n' \
+                   'D\t500362798\tmister249\t123\t456\t789\n' \
+                   '$\t68\t$'
+        for compression in Compression:
+            with self.subTest(compression=compression), tempfile.TemporaryDirectory() as directory:
+                with ResponseArchive(directory, compression) as archive:
+                    # WHEN
+                    key = archive.append(StatsProvider.BF2HUB, 'getplayerinfo.aspx', 500362798, 1663441990, raw_data)
+
+                    # THEN
+                    self.assertEqual(ArchiveKey('bf2hub', 'getplayerinfo.aspx', 500362798, 1663441990), key)
+                    self.assertEqual(raw_data, archive.read(key))
+                    self.assertEqual(
+                        raw_data,
+                        archive.get(StatsProvider.BF2HUB, 'getplayerinfo.aspx', 500362798, 1663441990)
+                    )
+                    self.assertIsNone(archive.get(StatsProvider.BF2HUB, 'getplayerinfo.aspx', 500362798, 1))
+
+    def test_append_rejects_invalid_key_elements(self):
+        for provider, endpoint in [
+            ('bf2hub', 'getplayerinfo\t.aspx'),
+            ('bf2\nhub', 'getplayerinfo.aspx'),
+            ('bf2hub', 'getplayerinfo.aspx\r'),
+        ]:
+            with self.subTest(provider=provider, endpoint=endpoint), tempfile.TemporaryDirectory() as directory:
+                with ResponseArchive(directory) as archive:
+                    # WHEN/THEN
+                    with self.assertRaises(Error):
+                        archive.append(provider, endpoint, 500362798, 1663441990, 'O\n$\t2\t$')
+                    archive.append('bf2hub', 'getplayerinfo.aspx', 500362798, 1663441990, 'O\n$\t2\t$')
+
+                # Index must still be readable
+                with ResponseArchive(directory) as archive:
+                    self.assertEqual([ArchiveKey('bf2hub', 'getplayerinfo.aspx', 500362798, 1663441990)], list(archive))
+
+    def test_reopen_with_segment_rollover(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # GIVEN
+            with ResponseArchive(directory, max_segment_size=64) as archive:
+                for asof in range(10):
+                    archive.append('bf2hub', 'getrankinfo.aspx', 45377286, asof, f'O\nH\trank\nD\t{asof}\n$\t5\t$')
+                # Replace an existing record
+                archive.append('bf2hub', 'getrankinfo.aspx', 45377286, 0, 'O\nH\trank\nD\t20\n$\t6\t$')
+
+            # WHEN
+            with ResponseArchive(directory, max_segment_size=64) as archive:
+                archive.append('bf2hub', 'getrankinfo.aspx', 45377286, 10, 'O\nH\trank\nD\t10\n$\t6\t$')
+                items = list(archive.items())
+
+            # THEN
+            self.assertGreater(len([name for name in os.listdir(directory) if name.startswith('segment-')]), 1)
+            self.assertEqual(11, len(items))
+            self.assertEqual(list(range(1, 10)) + [0, 10], [key.asof for key, _ in items])
+            self.assertEqual('O\nH\trank\nD\t20\n$\t6\t$', items[-2][1])
+
+    def test_skips_incomplete_records(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # GIVEN
+            with ResponseArchive(directory) as archive:
+                archive.append('bf2hub', 'getrankinfo.aspx', 45377286, 1, 'O\nH\trank\nD\t1\n$\t5\t$')
+            with open(os.path.join(directory, 'index.tsv'), 'a') as f:
+                f.write('bf2hub\tgetrankinfo.aspx\t45377286\t2\t0\t1000\t10\t1\nbf2hub\tgetrank')
+
+            # WHEN
+            with ResponseArchive(directory) as archive:
+                keys = list(archive)
+                # Appending after recovery must not continue the partially written line
+                archive.append('bf2hub', 'getrankinfo.aspx', 45377286, 3, 'O\nH\trank\nD\t2\n$\t5\t$')
+            with ResponseArchive(directory) as archive:
+                reopened = {key: archive.read(key) for key in archive}
+
+            # THEN
+            self.assertEqual([ArchiveKey('bf2hub', 'getrankinfo.aspx', 45377286, 1)], keys)
+            self.assertEqual(
+                {
+                    ArchiveKey('bf2hub', 'getrankinfo.aspx', 45377286, 1): 'O\nH\trank\nD\t1\n$\t5\t$',
+                    ArchiveKey('bf2hub', 'getrankinfo.aspx', 45377286, 3): 'O\nH\trank\nD\t2\n$\t5\t$'
+                },
+                reopened
+            )
@@ -0,0 +1,207 @@
+import asyncio
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import List, Optional, Dict
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch, MagicMock
+
+from aspxstats.async_client import AsyncAspxClient
+from aspxstats.bf2 import AsyncAspxClient as AsyncBf2AspxClient, AspxClient as Bf2AspxClient, PlayerinfoKeySet, \
+    StatsProvider
+from aspxstats.bf2.stub import StubServer, StubConfig
+from aspxstats.cassette import Cassette
+from aspxstats.exceptions import ValidationError
+from aspxstats.scheduler import RequestPriority, request_priority
+from aspxstats.types import ResponseValidationMode
+
+
+class AsyncAspxClientTest(IsolatedAsyncioTestCase):
+    async def test_run_parse_inline_without_executor(self):
+        # GIVEN
+        async with AsyncAspxClient('http://localhost/', {}, 1.0, ResponseValidationMode.STRICT) as client:
+            # WHEN
+            thread_id = await client.run_parse(lambda _: threading.get_ident(), 'O\n$\t0\t$' * 1024)
+
+        # THEN
+        self.assertEqual(threading.get_ident(), thread_id)
+
+    async def test_run_parse_inline_below_threshold(self):
+        # GIVEN
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            async with AsyncAspxClient(
+                    'http://localhost/', {}, 1.0, ResponseValidationMode.STRICT,
+                    parse_executor=executor, parse_executor_threshold=32
+            ) as client:
+                # WHEN
+                thread_id = await client.run_parse(lambda _: threading.get_ident(), 'O\n$\t0\t$')
+
+        # THEN
+        self.assertEqual(threading.get_ident(), thread_id)
+
+    async def test_run_parse_in_executor_above_threshold(self):
+        # GIVEN
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Parse executor options can also be passed positionally (as they could before any later options were added)
+            async with AsyncAspxClient('http://localhost/', {}, 1.0, ResponseValidationMode.STRICT, executor, 32) as client:
+                # WHEN
+                thread_id = await client.run_parse(lambda _: threading.get_ident(), 'O\n$\t0\t$' * 8)
+
+        # THEN
+        self.assertNotEqual(threading.get_ident(), thread_id)
+
+    async def test_pickled_client_parses_responses(self):
+        # GIVEN
+        raw_data = 'O\n' \
+                   'H\trank\tchng\tdecr\n' \
+                   'D\t13\t0\t0\n' \
+                   '$\t19\t$'
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            async with AsyncBf2AspxClient(parse_executor=executor) as client:
+                # WHEN
+                unpickled = pickle.loads(pickle.dumps(client))
+
+        # THEN
+        self.assertFalse(hasattr(unpickled, 'session'))
+        self.assertIsNone(unpickled.parse_executor)
+        self.assertEqual(client.provider, unpickled.provider)
+        self.assertDictEqual(
+            {'data': {'rank': 13, 'chng': False, 'decr': False}},
+            unpickled.validate_and_parse_getrankinfo_response(raw_data)
+        )
+
+    async def test_sampled_validation_with_process_pool_executor(self):
+        # GIVEN
+        valid = 'O\n' \
+                'H\trank\tchng\tdecr\n' \
+                'D\t13\t0\t0\n' \
+                '$\t19\t$'
+        invalid = 'O\n' \
+                  'H\trank\tchng\tdecr\n' \
+                  'D\tnot-a-number\t0\t0\n' \
+                  '$\t29\t$'
+        responses = [invalid, valid, valid, valid] * 2
+        errors = 0
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            async with AsyncBf2AspxClient(
+                    response_validation_mode=ResponseValidationMode.SAMPLED,
+                    validation_sample_rate=4,
+                    parse_executor=executor,
+                    parse_executor_threshold=0
+            ) as client:
+                # Patch the class rather than the client, since the client is pickled to parse in the executor
+                with patch.object(AsyncBf2AspxClient, 'get_aspx_data', side_effect=responses):
+                    # WHEN
+                    for _ in responses:
+                        try:
+                            await client.getrankinfo_dict(1)
+                        except ValidationError:
+                            errors += 1
+
+        # THEN
+        # Modes are selected in this process, so only one in four responses (the invalid ones) is validated
+        self.assertEqual(8, client.validation_metrics.responses)
+        self.assertEqual(2, client.validation_metrics.validated)
+        self.assertEqual(2, client.validation_metrics.failed)
+        self.assertEqual(2, errors)
+        self.assertIsNotNone(client.validation_metrics.last_failure)
+
+    async def test_init_sets_same_options_as_sync_client(self):
+        # GIVEN
+        cassette = MagicMock(spec=Cassette)
+        options = dict(
+            provider=StatsProvider.PLAYBF2,
+            timeout=5.0,
+            response_validation_mode=ResponseValidationMode.SAMPLED,
+            clean_nicks=True,
+            cassette=cassette,
+            validation_sample_rate=7,
+            lazy_values=True,
+            response_cache_size=16
+        )
+
+        # WHEN
+        sync_client = Bf2AspxClient(**options)
+        async with AsyncBf2AspxClient(**options) as client:
+            async_options = vars(client)
+
+        # THEN
+        for name, value in vars(sync_client).items():
+            if name in ['session', 'response_cache', 'validation_metrics']:
+                # Not comparable by value
+                self.assertIn(name, async_options, name)
+                continue
+            self.assertEqual(value, async_options.get(name), name)
+        self.assertIs(cassette, client.cassette)
+        self.assertEqual(16, client.response_cache.max_size)
+        sync_client.close()
+
+    async def test_getplayerinfo_unchanged_response(self):
+        # GIVEN
+        server = StubServer(StubConfig(players=1))
+        pid = next(iter(server.players.get_pids()))
+        raw_data = server.render_getplayerinfo(pid, PlayerinfoKeySet.GENERAL_STATS.value)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            async with AsyncBf2AspxClient(
+                    parse_executor=executor, parse_executor_threshold=0, response_cache_size=16
+            ) as client:
+                with patch.object(client, 'get_aspx_data', return_value=raw_data):
+                    # WHEN
+                    first = await client.getplayerinfo(pid)
+                    second = await client.getplayerinfo(pid)
+
+                unpickled = pickle.loads(pickle.dumps(client))
+
+        # THEN
+        # Cache hits return a copy of the previously returned data
+        self.assertIsNot(first.data, second.data)
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(1, client.response_cache.hits)
+        self.assertIsNone(unpickled.response_cache)
+
+    async def test_get_aspx_data_sends_interactive_requests_first(self):
+        # GIVEN
+        raw_data = 'O\n' \
+                   'H\trank\tchng\tdecr\n' \
+                   'D\t13\t0\t0\n' \
+                   '$\t19\t$'
+        sent: List[str] = []
+        blocked = asyncio.Event()
+
+        async def fetch_aspx_data(url: str, params: Optional[Dict[str, str]]) -> str:
+            sent.append(params['pid'])
+            if params['pid'] == '1':
+                await blocked.wait()
+            return raw_data
+
+        async def crawl(pids: List[int]) -> None:
+            with request_priority(RequestPriority.BACKGROUND):
+                await asyncio.gather(*(client.getrankinfo_dict(pid) for pid in pids))
+
+        async with AsyncBf2AspxClient(connection_limit=1, request_quotas={RequestPriority.BACKGROUND: 0}) as client:
+            with patch.object(client, 'fetch_aspx_data', side_effect=fetch_aspx_data):
+                # Crawl occupies the only connection, with more crawl requests queued behind it
+                background = asyncio.create_task(crawl([1, 2, 3]))
+                await asyncio.sleep(0)
+                with request_priority(RequestPriority.INTERACTIVE):
+                    interactive = asyncio.create_task(client.getrankinfo_dict(4))
+                await asyncio.sleep(0)
+
+                # WHEN
+                blocked.set()
+                await asyncio.gather(background, interactive)
+
+        # THEN
+        self.assertEqual(['1', '4', '2', '3'], sent)
+
+    def test_pickle_validation_error(self):
+        # GIVEN
+        error = ValidationError('data.rank', 'not-a-number')
+
+        # WHEN
+        unpickled = pickle.loads(pickle.dumps(error))
+
+        # THEN
+        self.assertEqual(error.path, unpickled.path)
+        self.assertEqual(error.value, unpickled.value)
+        self.assertEqual(str(error), str(unpickled))
@@ -6,7 +6,7 @@ import requests
 
 from aspxstats.client import AspxClient
 from aspxstats.types import ParseTarget, ResponseValidationMode
-from aspxstats.exceptions import Error, ClientError, InvalidResponseError
+from aspxstats.exceptions import Error, ClientError, InvalidResponseError, ValidationError
 
 
 class MockResponse:
@@ -197,6 +197,63 @@ class AspxClientTest(TestCase):
         self.assertTrue(valid)
         self.assertFalse(not_found)
 
+    def test_is_valid_aspx_response_incorrect_length_ignored_with_trusted_validation(self):
+        # GIVEN
+        raw_data = 'O\n' \
+                   'H\tasof\n' \
+                   'D\t1663441990\n' \
+                   '$\t10000\t$'
+
+        # WHEN
+        valid, not_found = AspxClient.is_valid_aspx_response(raw_data, ResponseValidationMode.TRUSTED)
+
+        # THEN
+        self.assertTrue(valid)
+        self.assertFalse(not_found)
+
+    def test_select_validation_mode_sampled(self):
+        # GIVEN
+        client = AspxClient('http://localhost/', {}, 1.0, ResponseValidationMode.SAMPLED, validation_sample_rate=3)
+
+        # WHEN
+        modes = [client.select_validation_mode() for _ in range(7)]
+
+        # THEN
+        self.assertEqual([
+            ResponseValidationMode.STRICT,
+            ResponseValidationMode.TRUSTED,
+            ResponseValidationMode.TRUSTED,
+            ResponseValidationMode.STRICT,
+            ResponseValidationMode.TRUSTED,
+            ResponseValidationMode.TRUSTED,
+            ResponseValidationMode.STRICT
+        ], modes)
+        self.assertEqual(7, client.validation_metrics.responses)
+
+    def test_validate_response_data_records_metrics(self):
+        # GIVEN
+        client = AspxClient('http://localhost/', {}, 1.0, ResponseValidationMode.STRICT)
+
+        def validate(parsed: dict) -> None:
+            if 'asof' not in parsed:
+                raise ValidationError('asof')
+
+        # WHEN
+        client.validate_response_data(ResponseValidationMode.STRICT, validate, {'asof': '1663441990'})
+        with self.assertRaises(ValidationError):
+            client.validate_response_data(ResponseValidationMode.STRICT, validate, {})
+        client.validate_response_data(ResponseValidationMode.TRUSTED, validate, {})
+
+        # THEN
+        self.assertEqual(2, client.validation_metrics.validated)
+        self.assertEqual(1, client.validation_metrics.failed)
+        self.assertEqual('Received response is missing attribute: asof', client.validation_metrics.last_failure)
+
+    def test_convert_response_values_error(self):
+        # WHEN/THEN
+        with self.assertRaises(InvalidResponseError):
+            AspxClient.convert_response_values(lambda parsed: {'asof': int(parsed['asof'])}, {'asof': 'not-a-number'})
+
     def test_is_valid_aspx_response_bf2hub_incorrect_parameters(self):
         # GIVEN
         raw_data = 'E\t216\n' \
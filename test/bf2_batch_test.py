@@ -0,0 +1,86 @@
+from unittest import TestCase
+
+from aspxstats.bf2 import parse_responses, PlayerinfoKeySet
+from aspxstats.exceptions import NotFoundError, InvalidParameterError, ValidationError, InvalidResponseError
+
+
+class BatchTest(TestCase):
+    def test_parse_responses(self):
+        # GIVEN
+        responses = [
+            (
+                'getrankinfo.aspx',
+                'O\n'
+                'H\trank\tchng\tdecr\n'
+                'D\t13\t0\t0\n'
+                '$\t19\t$'
+            ),
+            (
+                'getplayerinfo.aspx',
+                'E\t998\n'
+                '$\t4\t$',
+                {'pid': '500362798', 'info': PlayerinfoKeySet.MAP_STATS}
+            ),
+            (
+                'getawardsinfo.aspx',
+                'O\n'
+                'H\tpid\tasof\n'
+                'D\t500362798\t1663097863\n'
+                'H\taward\tlevel\twhen\tfirst\n'
+                'D\t1031105\t1\t1601663082\t0\n'
+                '$\t52\t$',
+                {'pid': '500362798'}
+            ),
+            (
+                'getrankinfo.aspx',
+                'O\n'
+                'H\trank\tchng\tdecr\n'
+                'D\tnot-a-rank\t0\t0\n'
+                '$\t26\t$'
+            ),
+            (
+                'getmapinfo.aspx',
+                'O\n'
+                '$\t0\t$'
+            ),
+            (
+                'getrankinfo.aspx',
+                'O\n'
+                'garbage'
+            )
+        ]
+
+        # WHEN
+        results = list(parse_responses(responses, max_workers=2, chunk_size=2))
+
+        # THEN
+        self.assertEqual([0, 1, 2, 3, 4, 5], [result.index for result in results])
+        self.assertEqual([True, False, True, False, False, False], [result.ok for result in results])
+        self.assertDictEqual({'data': {'rank': 13, 'chng': False, 'decr': False}}, results[0].parsed)
+        self.assertIsInstance(results[1].error, NotFoundError)
+        self.assertEqual(1031105, results[2].parsed['data'][0]['award'])
+        self.assertIsInstance(results[3].error, ValidationError)
+        self.assertEqual('data.rank', results[3].error.path)
+        self.assertIsInstance(results[4].error, InvalidParameterError)
+        self.assertIsInstance(results[5].error, InvalidResponseError)
+
+    def test_parse_responses_unordered(self):
+        # GIVEN
+        raw_data = 'O\n' \
+                   'H\trank\tchng\tdecr\n' \
+                   'D\t13\t0\t0\n' \
+                   '$\t19\t$'
+        responses = (('getrankinfo.aspx', raw_data) for _ in range(100))
+
+        # WHEN
+        results = list(parse_responses(responses, max_workers=2, chunk_size=8, ordered=False))
+
+        # THEN
+        self.assertEqual(list(range(100)), sorted(result.index for result in results))
+        self.assertTrue(all(result.ok for result in results))
+
+    def test_parse_responses_invalid_chunk_size(self):
+        # WHEN/THEN
+        with self.assertRaises(InvalidParameterError):
+            # Raised when called, without advancing the iterator
+            parse_responses([], chunk_size=0)
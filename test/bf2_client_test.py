@@ -1,9 +1,12 @@
+import json
 import unittest
 from dataclasses import dataclass
 from typing import List, Tuple, Optional, Any
+from unittest.mock import patch
 
-from aspxstats import InvalidParameterError
+from aspxstats import InvalidParameterError, InvalidResponseError, ResponseValidationMode
 from aspxstats.bf2 import AspxClient, StatsProvider
+from aspxstats.bf2.stub import StubServer, StubConfig
 from aspxstats.bf2.types import PlayerinfoKeySet
 from aspxstats.exceptions import ValidationError
 from aspxstats.types import ProviderConfig
@@ -1002,6 +1005,237 @@ class AspxClientTest(unittest.TestCase):
             else:
                 self.assertIsNone(AspxClient.validate_getrankinfo_response_data(t.parsed))
 
+    def test_validate_and_parse_getrankinfo_response_trusted(self):
+        # GIVEN
+        client = AspxClient(response_validation_mode=ResponseValidationMode.TRUSTED)
+        raw_data = 'O\n' \
+                   'H\trank\tchng\tdecr\n' \
+                   'D\t13\t0\t0\n' \
+                   '$\t0\t$'
+
+        # WHEN
+        parsed = client.validate_and_parse_getrankinfo_response(raw_data)
+
+        # THEN
+        self.assertEqual({'data': {'rank': 13, 'chng': 0, 'decr': 0}}, parsed)
+        self.assertEqual(0, client.validation_metrics.validated)
+
+    def test_validate_and_parse_getrankinfo_response_trusted_unconvertible(self):
+        # GIVEN
+        client = AspxClient(response_validation_mode=ResponseValidationMode.TRUSTED)
+        raw_data = 'O\n' \
+                   'H\trank\tchng\tdecr\n' \
+                   'D\tthirteen\t0\t0\n' \
+                   '$\t0\t$'
+
+        # WHEN/THEN
+        with self.assertRaises(InvalidResponseError):
+            client.validate_and_parse_getrankinfo_response(raw_data)
+
+    def test_validate_and_parse_getrankinfo_response_sampled(self):
+        # GIVEN
+        client = AspxClient(response_validation_mode=ResponseValidationMode.SAMPLED, validation_sample_rate=2)
+        raw_data = 'O\n' \
+                   'H\trank\tchng\tdecr\n' \
+                   'D\tthirteen\t0\t0\n' \
+                   '$\t25\t$'
+
+        # WHEN
+        with self.assertRaises(ValidationError):
+            client.validate_and_parse_getrankinfo_response(raw_data)
+        with self.assertRaises(InvalidResponseError):
+            client.validate_and_parse_getrankinfo_response(raw_data)
+
+        # THEN
+        self.assertEqual(2, client.validation_metrics.responses)
+        self.assertEqual(1, client.validation_metrics.validated)
+        self.assertEqual(1, client.validation_metrics.failed)
+        self.assertEqual(
+            'Received response contains invalid attribute value: data.rank=thirteen',
+            client.validation_metrics.last_failure
+        )
+
+    def test_get_getplayerinfo_projection_schema(self):
+        # WHEN
+        schema = AspxClient.get_getplayerinfo_projection_schema(PlayerinfoKeySet.GENERAL_STATS, ('kill', 'wtm-0'))
+
+        # THEN
+        self.assertEqual(['asof', 'data'], list(schema.keys()))
+        self.assertEqual(['pid', 'nick', 'kill', 'wtm-0'], list(schema['data'].keys()))
+
+    def test_get_getplayerinfo_projection_schema_unknown_field(self):
+        # WHEN/THEN
+        with self.assertRaises(InvalidParameterError):
+            AspxClient.get_getplayerinfo_projection_schema(PlayerinfoKeySet.MAP_STATS, ('kill',))
+
+    def test_build_getplayerinfo_info(self):
+        @dataclass
+        class BuildInfoTestCase:
+            name: str
+            key_set: PlayerinfoKeySet
+            fields: List[str]
+            expected: str
+
+        # GIVEN
+        tests: List[BuildInfoTestCase] = [
+            BuildInfoTestCase(
+                name='requests exact and prefix info keys',
+                key_set=PlayerinfoKeySet.GENERAL_STATS,
+                fields=['pid', 'nick', 'kill', 'wtm-0', 'wtm-1', 'vkl-4'],
+                expected='kill,wtm-,vkl-'
+            ),
+            BuildInfoTestCase(
+                name='requests all group info keys for attributes without a specific info key',
+                key_set=PlayerinfoKeySet.GENERAL_STATS,
+                fields=['scor', 'deth'],
+                expected='per*,cmb*,deth,mvn*,vmr*'
+            ),
+            BuildInfoTestCase(
+                name='requests group info keys if only pid and nick are requested',
+                key_set=PlayerinfoKeySet.GENERAL_STATS,
+                fields=['pid', 'nick'],
+                expected='per*,cmb*,mvn*,vmr*'
+            ),
+            BuildInfoTestCase(
+                name='requests map stats info keys',
+                key_set=PlayerinfoKeySet.MAP_STATS,
+                fields=['mls-2', 'mtm-1'],
+                expected='mtm-,mls-'
+            ),
+        ]
+
+        for t in tests:
+            # WHEN
+            actual = AspxClient.build_getplayerinfo_info(t.key_set, t.fields)
+
+            # THEN
+            self.assertEqual(t.expected, actual, t.name)
+
+    def test_validate_and_parse_getplayerinfo_response_projected(self):
+        # GIVEN
+        client = AspxClient(response_validation_mode=ResponseValidationMode.STRICT)
+        # Provider ignored the info param and returned more attributes than requested
+        raw_data = 'O\n' \
+                   'H\tasof\n' \
+                   'D\t1663441990\n' \
+                   'H\tpid\tnick\tkill\ttvcr\tosaa\n' \
+                   'D\t500362798\tmister249\t123\tNOT VAILABLE\tnot-a-float\n' \
+                   '$\t82\t$'
+
+        # WHEN
+        parsed = client.validate_and_parse_getplayerinfo_response(
+            PlayerinfoKeySet.GENERAL_STATS, raw_data, ['kill', 'tvcr']
+        )
+
+        # THEN
+        self.assertEqual({
+            'asof': 1663441990,
+            'data': {
+                'pid': 500362798,
+                'nick': 'mister249',
+                'kill': 123,
+                'tvcr': 0
+            }
+        }, parsed)
+
+    def test_validate_and_parse_getplayerinfo_response_lazy_values_dict(self):
+        # GIVEN
+        client, lazy_client = AspxClient(), AspxClient(lazy_values=True)
+        server = StubServer(StubConfig(players=1))
+        pid = next(iter(server.players.get_pids()))
+        raw_data = server.render_getplayerinfo(pid, PlayerinfoKeySet.GENERAL_STATS.value)
+        expected = client.validate_and_parse_getplayerinfo_response(PlayerinfoKeySet.GENERAL_STATS, raw_data)
+
+        # WHEN
+        parsed = lazy_client.validate_and_parse_getplayerinfo_response(PlayerinfoKeySet.GENERAL_STATS, raw_data)
+
+        # THEN
+        self.assertEqual(json.dumps(expected), json.dumps(dict(parsed)))
+        self.assertEqual(json.dumps(expected), json.dumps(parsed.to_dict()))
+
+    def test_getplayerinfo_unchanged_response(self):
+        @dataclass
+        class GetplayerinfoUnchangedResponseTestCase:
+            name: str
+            method: str
+            parse_method: str
+
+        tests: List[GetplayerinfoUnchangedResponseTestCase] = [
+            GetplayerinfoUnchangedResponseTestCase(
+                name='returns cached typed response',
+                method='getplayerinfo',
+                parse_method='validate_and_decode_getplayerinfo_response'
+            ),
+            GetplayerinfoUnchangedResponseTestCase(
+                name='returns cached parsed dict',
+                method='getplayerinfo_dict',
+                parse_method='validate_and_parse_getplayerinfo_response'
+            ),
+        ]
+
+        server = StubServer(StubConfig(players=1))
+        pid = next(iter(server.players.get_pids()))
+        raw_data = server.render_getplayerinfo(pid, PlayerinfoKeySet.GENERAL_STATS.value)
+        asof = server.players.asof
+        for t in tests:
+            # GIVEN
+            client = AspxClient(response_cache_size=16)
+            parse = getattr(client, t.parse_method)
+            with patch.object(client, 'get_aspx_data') as get_aspx_data, \
+                    patch.object(client, t.parse_method, wraps=parse) as patched_parse:
+                get_aspx_data.side_effect = [
+                    raw_data,
+                    raw_data.replace(f'D\t{asof}\n', f'D\t{asof + 60}\n'),
+                    raw_data.replace(f'\tplayer{pid}\t', f'\tmister{pid}\t'),
+                ]
+
+                # WHEN
+                first = getattr(client, t.method)(pid)
+                unchanged = getattr(client, t.method)(pid)
+                changed = getattr(client, t.method)(pid)
+
+            # THEN
+            self.assertEqual(2, patched_parse.call_count, t.name)
+            self.assertEqual(1, client.response_cache.hits, t.name)
+            if t.method == 'getplayerinfo':
+                self.assertEqual((asof + 60, first.data), (unchanged.asof, unchanged.data), t.name)
+                self.assertEqual(f'mister{pid}', changed.data.nick, t.name)
+            else:
+                self.assertEqual({**first, 'asof': asof + 60}, unchanged, t.name)
+                self.assertEqual(f'mister{pid}', changed['data']['nick'], t.name)
+
+    def test_getplayerinfo_unchanged_response_modified(self):
+        server = StubServer(StubConfig(players=1))
+        pid = next(iter(server.players.get_pids()))
+        raw_data = server.render_getplayerinfo(pid, PlayerinfoKeySet.GENERAL_STATS.value)
+        for method in ['getplayerinfo', 'getplayerinfo_dict']:
+            # GIVEN
+            client = AspxClient(response_cache_size=16)
+            with patch.object(client, 'get_aspx_data') as get_aspx_data:
+                get_aspx_data.return_value = raw_data
+                first = getattr(client, method)(pid)
+                second = getattr(client, method)(pid)
+
+                # WHEN
+                if method == 'getplayerinfo':
+                    first.data.nick = 'modified'
+                    first.data.weapons[0].kills = -1
+                    second.data.pid = 0
+                    second.data.score.total = -1
+                else:
+                    first['data']['nick'] = 'modified'
+                    second['data'].pop('pid')
+                unchanged = getattr(client, method)(pid)
+
+            # THEN
+            self.assertEqual(2, client.response_cache.hits, method)
+            if method == 'getplayerinfo':
+                self.assertEqual((pid, f'player{pid}'), (unchanged.data.pid, unchanged.data.nick), method)
+                self.assertNotEqual(-1, unchanged.data.weapons[0].kills, method)
+                self.assertNotEqual(-1, unchanged.data.score.total, method)
+            else:
+                self.assertEqual((pid, f'player{pid}'), (unchanged['data']['pid'], unchanged['data']['nick']), method)
+
     def test_get_provider_config(self):
         # GIVEN
         provider = StatsProvider.BF2HUB
@@ -0,0 +1,210 @@
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Callable
+from unittest import TestCase
+
+from aspxstats import InvalidResponseError, ResponseValidationMode
+from aspxstats.bf2 import AspxClient, PlayerinfoKeySet
+from aspxstats.bf2.decoding import decode_getplayerinfo_response
+from aspxstats.bf2.stub import SyntheticPlayers, StubConfig
+from aspxstats.bf2.types import PlayerinfoResponse, PlayerinfoGeneralStats, PlayerinfoMapStats
+from aspxstats.bf2.utils import build_aspx_response, clean_nick
+from aspxstats.exceptions import ValidationError
+
+PLAYERS = SyntheticPlayers(StubConfig(players=10))
+PID = PLAYERS.config.first_pid
+
+
+def render_getplayerinfo(key_set: PlayerinfoKeySet, overrides: Optional[Dict[str, Optional[str]]] = None) -> str:
+    # Render a synthetic player's stats, replacing (or removing, if None) the given values
+    keys, values = PLAYERS.get_playerinfo_values(PID, key_set)
+    data = dict(zip(keys, values))
+    for key, value in (overrides or dict()).items():
+        if value is None:
+            data.pop(key)
+        else:
+            data[key] = value
+
+    return build_aspx_response([
+        ['O'],
+        ['H', 'asof'],
+        ['D', str(PLAYERS.asof)],
+        ['H', *data.keys()],
+        ['D', *data.values()]
+    ])
+
+
+def parse_getplayerinfo(client: AspxClient, key_set: PlayerinfoKeySet, raw_data: str) -> PlayerinfoResponse:
+    parsed = client.validate_and_parse_getplayerinfo_response(key_set, raw_data)
+    if key_set is PlayerinfoKeySet.GENERAL_STATS:
+        data = PlayerinfoGeneralStats.from_aspx_response(parsed)
+    else:
+        data = PlayerinfoMapStats.from_aspx_response(parsed)
+
+    return PlayerinfoResponse(asof=parsed['asof'], data=data)
+
+
+class DecodingTest(TestCase):
+    def test_decode_getplayerinfo_response(self):
+        @dataclass
+        class DecodeGetplayerinfoResponseTestCase:
+            name: str
+            key_set: PlayerinfoKeySet
+            raw_data: str
+            nick_cleaner: Optional[Callable[[str], str]] = None
+
+        tests: List[DecodeGetplayerinfoResponseTestCase] = [
+            DecodeGetplayerinfoResponseTestCase(
+                name='decodes general stats',
+                key_set=PlayerinfoKeySet.GENERAL_STATS,
+                raw_data=render_getplayerinfo(PlayerinfoKeySet.GENERAL_STATS)
+            ),
+            DecodeGetplayerinfoResponseTestCase(
+                name='decodes map stats',
+                key_set=PlayerinfoKeySet.MAP_STATS,
+                raw_data=render_getplayerinfo(PlayerinfoKeySet.MAP_STATS)
+            ),
+            DecodeGetplayerinfoResponseTestCase(
+                name='decodes general stats with nick cleaner',
+                key_set=PlayerinfoKeySet.GENERAL_STATS,
+                raw_data=render_getplayerinfo(PlayerinfoKeySet.GENERAL_STATS, {
+                    'nick': 'mister249 ', 'mvns': '=TAG= some-player', 'vmns': ' other-player'
+                }),
+                nick_cleaner=clean_nick
+            ),
+            DecodeGetplayerinfoResponseTestCase(
+                name='fixes invalid and prefixed values',
+                key_set=PlayerinfoKeySet.GENERAL_STATS,
+                raw_data=render_getplayerinfo(PlayerinfoKeySet.GENERAL_STATS, {
+                    'tvcr': 'NOT VAILABLE', 'mvrs': ' ', 'vtm-3': '', 'fveh': 'time1', 'fmap': 'time101'
+                })
+            ),
+            DecodeGetplayerinfoResponseTestCase(
+                name='fixes invalid map stats values',
+                key_set=PlayerinfoKeySet.MAP_STATS,
+                raw_data=render_getplayerinfo(PlayerinfoKeySet.MAP_STATS, {'mtm-0': 'NOT VAILABLE'})
+            ),
+        ]
+
+        for t in tests:
+            # GIVEN
+            client = AspxClient(response_validation_mode=ResponseValidationMode.STRICT, clean_nicks=t.nick_cleaner is not None)
+            expected = parse_getplayerinfo(client, t.key_set, t.raw_data)
+
+            # WHEN
+            actual = decode_getplayerinfo_response(t.key_set, t.raw_data, t.nick_cleaner)
+
+            # THEN
+            self.assertEqual(expected, actual, t.name)
+
+    def test_decode_getplayerinfo_response_not_decodable(self):
+        @dataclass
+        class DecodeGetplayerinfoResponseNotDecodableTestCase:
+            name: str
+            raw_data: str
+
+        tests: List[DecodeGetplayerinfoResponseNotDecodableTestCase] = [
+            DecodeGetplayerinfoResponseNotDecodableTestCase(
+                name='returns None for missing keys',
+                raw_data=render_getplayerinfo(PlayerinfoKeySet.GENERAL_STATS, {'de-6': None, 'de-7': None, 'de-8': None})
+            ),
+            DecodeGetplayerinfoResponseNotDecodableTestCase(
+                name='returns None for non-numeric value',
+                raw_data=render_getplayerinfo(PlayerinfoKeySet.GENERAL_STATS, {'kill': 'not-a-number'})
+            ),
+            DecodeGetplayerinfoResponseNotDecodableTestCase(
+                name='returns None for invalid booly value',
+                raw_data=render_getplayerinfo(PlayerinfoKeySet.GENERAL_STATS, {'smoc': '2'})
+            ),
+            DecodeGetplayerinfoResponseNotDecodableTestCase(
+                name='returns None for non-floaty value',
+                raw_data=render_getplayerinfo(PlayerinfoKeySet.GENERAL_STATS, {'osaa': 'not-a-float'})
+            ),
+            DecodeGetplayerinfoResponseNotDecodableTestCase(
+                name='returns None for invalid ratio value',
+                raw_data=render_getplayerinfo(PlayerinfoKeySet.GENERAL_STATS, {'wkd-0': '12'})
+            ),
+            DecodeGetplayerinfoResponseNotDecodableTestCase(
+                name='returns None for non-numeric value of key not read by the type',
+                raw_data=render_getplayerinfo(PlayerinfoKeySet.GENERAL_STATS, {'vrk': 'not-a-number'})
+            ),
+            DecodeGetplayerinfoResponseNotDecodableTestCase(
+                name='returns None for not found response',
+                raw_data='E\t998\nH\tasof\terr\nD\t1663441990\tPlayer Not Found!\n$\t37\t$'
+            ),
+            DecodeGetplayerinfoResponseNotDecodableTestCase(
+                name='returns None for missing values',
+                raw_data=render_getplayerinfo(PlayerinfoKeySet.GENERAL_STATS).replace('\tplayer', '', 1)
+            ),
+        ]
+
+        for t in tests:
+            # WHEN
+            actual = decode_getplayerinfo_response(PlayerinfoKeySet.GENERAL_STATS, t.raw_data)
+
+            # THEN
+            self.assertIsNone(actual, t.name)
+
+    def test_validate_and_decode_getplayerinfo_response_falls_back_to_parsing(self):
+        # GIVEN
+        client = AspxClient(response_validation_mode=ResponseValidationMode.STRICT)
+        # Older bf2statistics versions do not return the Special Forces gadget keys, which parsing adds
+        raw_data = render_getplayerinfo(PlayerinfoKeySet.GENERAL_STATS, {'de-6': None, 'de-7': None, 'de-8': None})
+
+        # WHEN
+        actual = client.validate_and_decode_getplayerinfo_response(PlayerinfoKeySet.GENERAL_STATS, raw_data)
+
+        # THEN
+        self.assertEqual(parse_getplayerinfo(client, PlayerinfoKeySet.GENERAL_STATS, raw_data), actual)
+        self.assertEqual(0, actual.data.tactical.zipline_deploys)
+        self.assertEqual(2, client.validation_metrics.validated)
+
+    def test_validate_and_decode_getplayerinfo_response_invalid(self):
+        @dataclass
+        class ValidateAndDecodeInvalidTestCase:
+            name: str
+            response_validation_mode: ResponseValidationMode
+            key: str
+            expected_error: type
+            expected_failed: int
+
+        tests: List[ValidateAndDecodeInvalidTestCase] = [
+            ValidateAndDecodeInvalidTestCase(
+                name='raises validation error in strict mode',
+                response_validation_mode=ResponseValidationMode.STRICT,
+                key='kill',
+                expected_error=ValidationError,
+                expected_failed=1
+            ),
+            ValidateAndDecodeInvalidTestCase(
+                name='raises validation error in strict mode for key not read by the type',
+                response_validation_mode=ResponseValidationMode.STRICT,
+                key='vrk',
+                expected_error=ValidationError,
+                expected_failed=1
+            ),
+            ValidateAndDecodeInvalidTestCase(
+                name='raises validation error in lax mode for key not read by the type',
+                response_validation_mode=ResponseValidationMode.LAX,
+                key='vrk',
+                expected_error=ValidationError,
+                expected_failed=1
+            ),
+            ValidateAndDecodeInvalidTestCase(
+                name='raises invalid response error in trusted mode',
+                response_validation_mode=ResponseValidationMode.TRUSTED,
+                key='kill',
+                expected_error=InvalidResponseError,
+                expected_failed=0
+            ),
+        ]
+
+        for t in tests:
+            # GIVEN
+            client = AspxClient(response_validation_mode=t.response_validation_mode)
+            raw_data = render_getplayerinfo(PlayerinfoKeySet.GENERAL_STATS, {t.key: 'not-a-number'})
+
+            # WHEN/THEN
+            with self.assertRaises(t.expected_error, msg=t.name):
+                client.validate_and_decode_getplayerinfo_response(PlayerinfoKeySet.GENERAL_STATS, raw_data)
+            self.assertEqual(t.expected_failed, client.validation_metrics.failed, t.name)
+            self.assertEqual(1, client.validation_metrics.responses, t.name)
@@ -0,0 +1,261 @@
+import copy
+import os
+import tempfile
+from array import array
+from dataclasses import dataclass
+from typing import List, Tuple, Callable, Dict, Any
+from unittest import TestCase
+
+from aspxstats import InvalidParameterError
+from aspxstats.bf2 import AspxClient, PlayerinfoKeySet
+from aspxstats.bf2.diff import diff_leaderboards, LeaderboardDiff, LeaderboardSource, diff_general_stats
+from aspxstats.bf2.snapshot import export_leaderboard, get_leaderboard_columns
+from aspxstats.bf2.stub import SyntheticPlayers, StubConfig, StubServer
+from aspxstats.bf2.types import LeaderboardResponse, LeaderboardEntry, PlayerinfoResponse, PlayerinfoRelation
+from aspxstats.snapshot import Snapshot
+
+SERVER = StubServer(StubConfig(players=2))
+PIDS = list(SyntheticPlayers(SERVER.players.config).get_pids())
+
+
+def build_leaderboard(asof: int, entries: List[Tuple[int, str]]) -> List[LeaderboardResponse]:
+    # Build a leaderboard of two pages from (pid, nick) tuples, in order of position
+    converted = [
+        LeaderboardEntry(n=n, pid=pid, nick=nick, rank=1, country_code='DE') for n, (pid, nick) in enumerate(entries, 1)
+    ]
+    return [
+        LeaderboardResponse(size=len(converted), asof=asof, entries=converted[:2]),
+        LeaderboardResponse(size=len(converted), asof=asof, entries=converted[2:])
+    ]
+
+
+def decode_playerinfo(pid: int, key_set: PlayerinfoKeySet = PlayerinfoKeySet.GENERAL_STATS) -> PlayerinfoResponse:
+    client = AspxClient()
+    return client.validate_and_decode_getplayerinfo_response(key_set, SERVER.render_getplayerinfo(pid, key_set.value))
+
+
+def play_round(response: PlayerinfoResponse) -> None:
+    response.asof += 600
+    response.data.timestamp.last_battle += 600
+
+
+OLD = build_leaderboard(1663441990, [
+    (45000001, 'mister249'),
+    (45000002, 'mister250'),
+    (45000003, 'mister251'),
+    (45000004, 'mister252'),
+])
+NEW = build_leaderboard(1663528390, [
+    (45000003, 'mister251'),
+    (45000001, 'mïster249'),
+    (45000005, 'mister253'),
+    (45000002, 'mister250'),
+])
+
+
+class LeaderboardDiffTest(TestCase):
+    def test_diff_leaderboards(self):
+        @dataclass
+        class DiffLeaderboardsTestCase:
+            name: str
+            old: LeaderboardSource
+            new: LeaderboardSource
+
+        tests: List[DiffLeaderboardsTestCase] = [
+            DiffLeaderboardsTestCase(
+                name='diffs leaderboard responses',
+                old=OLD,
+                new=NEW
+            ),
+            DiffLeaderboardsTestCase(
+                name='diffs leaderboard columns',
+                old=get_leaderboard_columns(OLD),
+                new=get_leaderboard_columns(NEW)
+            ),
+            DiffLeaderboardsTestCase(
+                name='diffs mix of responses and columns',
+                old=get_leaderboard_columns(OLD),
+                new=NEW
+            ),
+        ]
+
+        for t in tests:
+            # WHEN
+            actual = diff_leaderboards(t.old, t.new)
+
+            # THEN
+            self.assertEqual(LeaderboardDiff(
+                entered=array('q', [45000005]),
+                dropped=array('q', [45000004]),
+                moved_pids=array('q', [45000003, 45000001, 45000002]),
+                moved_from=array('q', [3, 1, 2]),
+                moved_to=array('q', [1, 2, 4]),
+                nick_changes={45000001: ('mister249', 'mïster249')}
+            ), actual, t.name)
+            self.assertEqual([(45000003, 2)], actual.climbers(), t.name)
+            self.assertEqual([(45000002, 2), (45000001, 1)], actual.fallers(), t.name)
+            self.assertEqual([(45000002, 2)], actual.fallers(limit=1), t.name)
+
+    def test_diff_leaderboards_snapshots(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # GIVEN
+            old_path, new_path = os.path.join(directory, 'old.dat'), os.path.join(directory, 'new.dat')
+            export_leaderboard(old_path, OLD)
+            export_leaderboard(new_path, NEW)
+
+            # WHEN
+            with Snapshot(old_path) as old, Snapshot(new_path) as new:
+                actual = diff_leaderboards(old, new)
+
+        # THEN
+        self.assertEqual(diff_leaderboards(OLD, NEW), actual)
+
+    def test_diff_leaderboards_unchanged(self):
+        # WHEN
+        actual = diff_leaderboards(OLD, OLD)
+
+        # THEN
+        self.assertEqual(LeaderboardDiff(), actual)
+        self.assertEqual([], actual.climbers())
+
+    def test_diff_leaderboards_missing_columns(self):
+        # GIVEN
+        columns = get_leaderboard_columns(OLD)
+        del columns['nick']
+
+        # WHEN/THEN
+        with self.assertRaisesRegex(InvalidParameterError, 'nick'):
+            diff_leaderboards(columns, NEW)
+
+
+class GeneralStatsDiffTest(TestCase):
+    def test_diff_general_stats(self):
+        @dataclass
+        class DiffGeneralStatsTestCase:
+            name: str
+            modify: Callable[[PlayerinfoResponse], None]
+            expected: Dict[str, Any]
+
+        def earn_stats(r: PlayerinfoResponse) -> None:
+            play_round(r)
+            r.data.score.total += 100
+            r.data.kills.total += 5
+            r.data.accuracy += 0.5
+            r.data.weapons[1].kills += 3
+            r.data.kits[2].deaths += 1
+
+        def change_favorite_and_rival(r: PlayerinfoResponse) -> None:
+            play_round(r)
+            r.data.favorite.weapon += 1
+            r.data.relations.top_victim.kills += 2
+            r.data.relations.top_rival = PlayerinfoRelation(pid=45001234, nick='rival', rank=5, kills=10)
+
+        def change_all_without_battle(r: PlayerinfoResponse) -> None:
+            r.asof += 600
+            r.data.nick = 'mïster249'
+            r.data.times_kicked += 1
+            r.data.kills.total += 5
+
+        def change_all_in_same_snapshot(r: PlayerinfoResponse) -> None:
+            r.data.nick = 'mïster249'
+            r.data.kills.total += 5
+
+        old = decode_playerinfo(PIDS[0])
+        tests: List[DiffGeneralStatsTestCase] = [
+            DiffGeneralStatsTestCase(
+                name='returns deltas of earned stats',
+                modify=earn_stats,
+                expected={
+                    'accuracy': 0.5,
+                    'timestamp': {'last_battle': 600},
+                    'score': {'total': 100},
+                    'kills': {'total': 5},
+                    'weapons': {old.data.weapons[1].id: {'kills': 3}},
+                    'kits': {old.data.kits[2].id: {'deaths': 1}}
+                }
+            ),
+            DiffGeneralStatsTestCase(
+                name='returns changed ids and relations as tuples',
+                modify=change_favorite_and_rival,
+                expected={
+                    'timestamp': {'last_battle': 600},
+                    'favorite': {'weapon': (old.data.favorite.weapon, old.data.favorite.weapon + 1)},
+                    'relations': {
+                        'top_rival': (
+                            old.data.relations.top_rival,
+                            PlayerinfoRelation(pid=45001234, nick='rival', rank=5, kills=10)
+                        ),
+                        'top_victim': {'kills': 2}
+                    }
+                }
+            ),
+            DiffGeneralStatsTestCase(
+                name='returns only top-level changes if no battle was played',
+                modify=change_all_without_battle,
+                expected={
+                    'nick': (old.data.nick, 'mïster249'),
+                    'times_kicked': 1
+                }
+            ),
+            DiffGeneralStatsTestCase(
+                name='returns no changes for same asof',
+                modify=change_all_in_same_snapshot,
+                expected={}
+            ),
+            DiffGeneralStatsTestCase(
+                name='returns no changes for unchanged stats',
+                modify=lambda r: None,
+                expected={}
+            ),
+        ]
+
+        for t in tests:
+            # GIVEN
+            new = copy.deepcopy(old)
+            t.modify(new)
+
+            # WHEN
+            actual = diff_general_stats(old, new)
+
+            # THEN
+            self.assertEqual(t.expected, actual, t.name)
+
+    def test_diff_general_stats_without_response(self):
+        # GIVEN
+        old = decode_playerinfo(PIDS[0])
+        new = copy.deepcopy(old)
+        play_round(new)
+
+        # WHEN
+        actual = diff_general_stats(old.data, new.data)
+
+        # THEN
+        self.assertEqual({'timestamp': {'last_battle': 600}}, actual)
+
+    def test_diff_general_stats_invalid(self):
+        @dataclass
+        class DiffGeneralStatsInvalidTestCase:
+            name: str
+            old: PlayerinfoResponse
+            new: PlayerinfoResponse
+
+        tests: List[DiffGeneralStatsInvalidTestCase] = [
+            DiffGeneralStatsInvalidTestCase(
+                name='errors for stats of different players',
+                old=decode_playerinfo(PIDS[0]),
+                new=decode_playerinfo(PIDS[1])
+            ),
+            DiffGeneralStatsInvalidTestCase(
+                name='errors for map stats',
+                old=decode_playerinfo(PIDS[0], PlayerinfoKeySet.MAP_STATS),
+                new=decode_playerinfo(PIDS[0], PlayerinfoKeySet.MAP_STATS)
+            ),
+        ]
+
+        for t in tests:
+            # GIVEN
+            t.new.asof += 600
+
+            # WHEN/THEN
+            with self.assertRaises(InvalidParameterError, msg=t.name):
+                diff_general_stats(t.old, t.new)
@@ -0,0 +1,74 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+
+def run_isolated(code: str) -> str:
+    # Modules are only imported once per interpreter, so import behaviour can only be tested in a fresh one
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.strip()
+
+
+class Bf2ImportTest(TestCase):
+    def test_import_does_not_import_async_dependencies(self):
+        # WHEN
+        output = run_isolated(
+            'import sys; import aspxstats.bf2; '
+            'print(any(name.split(".")[0] == "aiohttp" for name in sys.modules))'
+        )
+
+        # THEN
+        self.assertEqual('False', output)
+
+    def test_package_import_does_not_import_asyncio(self):
+        # WHEN
+        output = run_isolated(
+            'import sys; import aspxstats, aspxstats.bf2; before = "asyncio" in sys.modules; '
+            'from aspxstats import RequestPriority; from aspxstats.scheduler import RequestPriority as Priority; '
+            'print(before, "asyncio" in sys.modules, RequestPriority is Priority)'
+        )
+
+        # THEN
+        self.assertEqual('False True True', output)
+
+    def test_lazy_attribute_access_imports_on_first_access(self):
+        # WHEN
+        output = run_isolated(
+            'import sys; from aspxstats.bf2 import AsyncAspxClient, async_getplayerinfo, BatchResult; '
+            'from aspxstats.bf2.async_client import AsyncAspxClient as AsyncClient; '
+            'import aspxstats.bf2 as bf2; '
+            'print("aiohttp" in sys.modules, AsyncAspxClient is AsyncClient, "AsyncAspxClient" in vars(bf2))'
+        )
+
+        # THEN
+        self.assertEqual('True True True', output)
+
+    def test_lazy_attribute_access_unknown_attribute(self):
+        # GIVEN
+        import aspxstats.bf2 as bf2
+
+        # WHEN/THEN
+        with self.assertRaises(AttributeError):
+            getattr(bf2, 'not_an_attribute')
+
+    def test_star_import_includes_lazy_attributes(self):
+        # GIVEN
+        namespace = dict()
+
+        # WHEN
+        exec('from aspxstats.bf2 import *', namespace)
+
+        # THEN
+        for name in ['AsyncAspxClient', 'async_getleaderboard', 'parse_responses']:
+            self.assertIn(name, namespace)
+
+    def test_schemas_are_built_on_first_access(self):
+        # WHEN
+        output = run_isolated(
+            'from aspxstats.bf2 import schemas; '
+            'before = "GETPLAYERINFO_GENERAL_STATS_RESPONSE_SCHEMA" in vars(schemas); '
+            'schema = schemas.GETPLAYERINFO_GENERAL_STATS_RESPONSE_SCHEMA; '
+            'print(before, schema is schemas.GETPLAYERINFO_GENERAL_STATS_RESPONSE_SCHEMA)'
+        )
+
+        # THEN
+        self.assertEqual('False True', output)
@@ -0,0 +1,84 @@
+from array import array
+from typing import List, Dict
+from unittest import TestCase
+
+from aspxstats import InvalidParameterError
+from aspxstats.bf2 import PlayerStatsTable, AspxClient, PlayerinfoKeySet
+from aspxstats.bf2 import metrics
+from aspxstats.bf2.stub import StubServer, StubConfig
+
+
+def build_table(players: List[Dict[str, int]]) -> PlayerStatsTable:
+    # Build a table from synthetic players, overriding the given attributes
+    server = StubServer(StubConfig(players=len(players)))
+    client = AspxClient()
+    table = PlayerStatsTable()
+    for pid, overrides in zip(server.players.get_pids(), players):
+        parsed = client.validate_and_parse_getplayerinfo_response(
+            PlayerinfoKeySet.GENERAL_STATS, server.render_getplayerinfo(pid, PlayerinfoKeySet.GENERAL_STATS.value)
+        )
+        parsed['data'].update(overrides)
+        table.append(parsed)
+    return table
+
+
+class MetricsTest(TestCase):
+    def test_compute_metrics(self):
+        # GIVEN
+        table = build_table([
+            {'kill': 100, 'deth': 50, 'osaa': 25.0, 'scor': 600, 'time': 3600, 'wins': 3, 'loss': 1},
+            {'kill': 5, 'deth': 0, 'osaa': 10.0, 'scor': 0, 'time': 0, 'wins': 0, 'loss': 0}
+        ])
+
+        # WHEN
+        actual = metrics.compute_metrics(table)
+
+        # THEN
+        self.assertEqual({
+            'kill_death_ratio': [2.0, 5.0],
+            'accuracy_weighted_kills': [25.0, 0.5],
+            'score_per_minute': [10.0, 0.0],
+            'win_rate': [0.75, 0.0]
+        }, {name: list(values) for (name, values) in actual.items()})
+
+    def test_item_kill_death_ratios(self):
+        # GIVEN
+        table = build_table([
+            {'wkl-0': 10, 'wdt-0': 4, 'vkl-3': 7, 'vdt-3': 0},
+            {'wkl-0': 0, 'wdt-0': 3, 'vkl-3': 1, 'vdt-3': 2}
+        ])
+
+        # WHEN
+        weapons = metrics.item_kill_death_ratios(table, 'w')
+        vehicles = metrics.item_kill_death_ratios(table, 'v')
+        kits = metrics.item_kill_death_ratios(table, 'k')
+
+        # THEN
+        self.assertEqual(14, len(weapons))
+        self.assertEqual([2.5, 0.0], list(weapons[0]))
+        self.assertEqual([7.0, 0.5], list(vehicles[3]))
+        self.assertEqual(list(range(7)), sorted(kits))
+
+    def test_item_kill_death_ratios_unsupported_prefix(self):
+        # GIVEN
+        table = build_table([])
+
+        # WHEN/THEN
+        with self.assertRaises(InvalidParameterError):
+            metrics.item_kill_death_ratios(table, 'm')
+
+    def test_rank_players(self):
+        # GIVEN
+        table = build_table([dict(), dict(), dict()])
+        pids = list(table.index)
+        values = array('d', [1.5, 3.0, 2.0])
+
+        # WHEN
+        top = metrics.rank_players(table, values, 2)
+        everyone = metrics.rank_players(table, values, 5)
+        nobody = metrics.rank_players(table, values, 0)
+
+        # THEN
+        self.assertEqual([(pids[1], 3.0), (pids[2], 2.0)], top)
+        self.assertEqual([(pids[1], 3.0), (pids[2], 2.0), (pids[0], 1.5)], everyone)
+        self.assertEqual([], nobody)
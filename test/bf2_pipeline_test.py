@@ -0,0 +1,312 @@
+import asyncio
+import json
+import os
+import sqlite3
+import tempfile
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Union, Any, AsyncIterator
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from aspxstats.bf2 import AsyncAspxClient, PlayerinfoKeySet
+from aspxstats.bf2.pipeline import CrawlPipeline, PipelineResult, PipelineStats, leaderboard_pids, file_pids, \
+    relation_pids, JsonLinesSink, SqliteSink
+from aspxstats.bf2.stub import StubServer, StubConfig
+from aspxstats.exceptions import InvalidParameterError, NotFoundError, TimeoutError, InvalidResponseError
+
+SERVER = StubServer(StubConfig(players=50))
+PIDS = list(SERVER.players.get_pids())
+
+
+async def render(endpoint: str, params: Optional[Dict[str, Union[str, PlayerinfoKeySet]]] = None) -> str:
+    await asyncio.sleep(0)
+    if params is not None and params.get('pid') == '1':
+        raise TimeoutError('Timed out trying to fetch ASPX data')
+    if params is not None and params.get('pid') == '3':
+        return 'O\ngarbage'
+    return SERVER.render(endpoint, tuple(sorted(AsyncAspxClient.stringify_params(params).items())))
+
+
+async def async_pids(pids: List[int]) -> AsyncIterator[int]:
+    for pid in pids:
+        await asyncio.sleep(0)
+        yield pid
+
+
+class CrawlPipelineTest(IsolatedAsyncioTestCase):
+    async def test_run(self):
+        @dataclass
+        class RunTestCase:
+            name: str
+            pids: List[int]
+            endpoint: str
+            async_source: bool
+            expected_ok: List[int]
+            expected_errors: Dict[int, type]
+            expected_stats: PipelineStats
+
+        tests: List[RunTestCase] = [
+            RunTestCase(
+                name='fetches and parses getplayerinfo responses',
+                pids=PIDS[:20],
+                endpoint='getplayerinfo.aspx',
+                async_source=False,
+                expected_ok=PIDS[:20],
+                expected_errors={},
+                expected_stats=PipelineStats(fetched=20, parsed=20, failed=0)
+            ),
+            RunTestCase(
+                name='fetches and parses responses for pids from async source',
+                pids=PIDS,
+                endpoint='getrankinfo.aspx',
+                async_source=True,
+                expected_ok=PIDS,
+                expected_errors={},
+                expected_stats=PipelineStats(fetched=50, parsed=50, failed=0)
+            ),
+            RunTestCase(
+                name='passes failures to sink',
+                pids=[PIDS[0], 1, 2, PIDS[1]],
+                endpoint='getplayerinfo.aspx',
+                async_source=False,
+                expected_ok=[PIDS[0], PIDS[1]],
+                expected_errors={1: TimeoutError, 2: NotFoundError},
+                expected_stats=PipelineStats(fetched=3, parsed=2, failed=2)
+            ),
+            RunTestCase(
+                name='passes garbage response to sink as failure',
+                pids=[PIDS[0], 3, PIDS[1]],
+                endpoint='getrankinfo.aspx',
+                async_source=False,
+                expected_ok=[PIDS[0], PIDS[1]],
+                expected_errors={3: InvalidResponseError},
+                expected_stats=PipelineStats(fetched=3, parsed=2, failed=1)
+            ),
+            RunTestCase(
+                name='does nothing for empty source',
+                pids=[],
+                endpoint='getplayerinfo.aspx',
+                async_source=False,
+                expected_ok=[],
+                expected_errors={},
+                expected_stats=PipelineStats()
+            ),
+        ]
+
+        for t in tests:
+            # GIVEN
+            results: List[PipelineResult] = []
+            source = async_pids(t.pids) if t.async_source else t.pids
+            async with AsyncAspxClient() as client:
+                pipeline = CrawlPipeline(
+                    client, source, results.append, t.endpoint, fetch_concurrency=4, queue_size=2
+                )
+                with patch.object(client, 'get_aspx_data', side_effect=render):
+                    # WHEN
+                    stats = await pipeline.run()
+
+            # THEN
+            self.assertEqual(t.expected_stats, stats, t.name)
+            self.assertEqual(sorted(t.expected_ok), sorted(result.pid for result in results if result.ok), t.name)
+            self.assertEqual(
+                t.expected_errors,
+                {result.pid: type(result.error) for result in results if not result.ok},
+                t.name
+            )
+            self.assertTrue(all(result.parsed is not None for result in results if result.ok), t.name)
+
+    async def test_run_applies_back_pressure(self):
+        # GIVEN
+        outstanding = 0
+        max_outstanding = 0
+
+        async def get_aspx_data(endpoint: str, params: Dict[str, Any]) -> str:
+            nonlocal outstanding, max_outstanding
+            outstanding += 1
+            max_outstanding = max(outstanding, max_outstanding)
+            return await render(endpoint, params)
+
+        async def slow_sink(_: PipelineResult) -> None:
+            nonlocal outstanding
+            await asyncio.sleep(0.001)
+            outstanding -= 1
+
+        async with AsyncAspxClient() as client:
+            pipeline = CrawlPipeline(
+                client, PIDS, slow_sink, 'getrankinfo.aspx', fetch_concurrency=2, parse_concurrency=2, queue_size=2
+            )
+            with patch.object(client, 'get_aspx_data', side_effect=get_aspx_data):
+                # WHEN
+                stats = await pipeline.run()
+
+        # THEN
+        self.assertEqual(50, stats.parsed)
+        # Held by fetch workers (2), queued for parsing (2), held by parse workers (2), queued for the sink (2) and sink (1)
+        self.assertLessEqual(max_outstanding, 9)
+
+    async def test_run_stops_on_sink_error(self):
+        # GIVEN
+        def sink(_: PipelineResult) -> None:
+            raise RuntimeError('disk full')
+
+        async with AsyncAspxClient() as client:
+            pipeline = CrawlPipeline(client, PIDS, sink, 'getrankinfo.aspx')
+            with patch.object(client, 'get_aspx_data', side_effect=render):
+                # WHEN/THEN
+                with self.assertRaises(RuntimeError):
+                    await asyncio.wait_for(pipeline.run(), 5.0)
+
+    async def test_init_invalid_concurrency(self):
+        async with AsyncAspxClient() as client:
+            # WHEN/THEN
+            with self.assertRaises(InvalidParameterError):
+                CrawlPipeline(client, PIDS, lambda _: None, fetch_concurrency=0)
+
+
+class PipelineSourceTest(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    async def test_leaderboard_pids(self):
+        @dataclass
+        class LeaderboardPidsTestCase:
+            name: str
+            page_size: int
+            limit: Optional[int]
+            expected: List[int]
+
+        leaderboard = [pid for _, pid in SERVER.players.leaderboard]
+        tests: List[LeaderboardPidsTestCase] = [
+            LeaderboardPidsTestCase(
+                name='pages through entire leaderboard',
+                page_size=7,
+                limit=None,
+                expected=leaderboard
+            ),
+            LeaderboardPidsTestCase(
+                name='stops at limit',
+                page_size=7,
+                limit=10,
+                expected=leaderboard[:10]
+            ),
+            LeaderboardPidsTestCase(
+                name='fetches leaderboard as single page',
+                page_size=100,
+                limit=None,
+                expected=leaderboard
+            ),
+        ]
+
+        for t in tests:
+            async with AsyncAspxClient() as client:
+                with patch.object(client, 'get_aspx_data', side_effect=render):
+                    # WHEN
+                    pids = [pid async for pid in leaderboard_pids(client, page_size=t.page_size, limit=t.limit)]
+
+            # THEN
+            self.assertEqual(t.expected, pids, t.name)
+
+    async def test_relation_pids(self):
+        # GIVEN
+        relations = {1: (2, 3), 2: (1, 4), 3: (0, 0), 4: (5, 6)}
+
+        async def getplayerinfo_dict(pid: int, *_: Any) -> dict:
+            if pid not in relations:
+                raise NotFoundError('Player not found')
+            topr, tvcr = relations[pid]
+            return {'asof': 1792426279, 'data': {'pid': pid, 'nick': f'player{pid}', 'topr': topr, 'tvcr': tvcr}}
+
+        async with AsyncAspxClient() as client:
+            with patch.object(client, 'getplayerinfo_dict', side_effect=getplayerinfo_dict):
+                # WHEN
+                pids = [pid async for pid in relation_pids(client, [1], 5)]
+
+        # THEN
+        self.assertEqual([1, 2, 3, 4, 5], pids)
+
+    async def test_file_pids(self):
+        # GIVEN
+        path = os.path.join(self.directory.name, 'pids.txt')
+        with open(path, 'w') as f:
+            f.write('# players to crawl\n45000000\n\n 45000001 \n')
+
+        # WHEN
+        pids = list(file_pids(path))
+
+        # THEN
+        self.assertEqual([45000000, 45000001], pids)
+
+    async def test_file_pids_invalid_pid(self):
+        # GIVEN
+        path = os.path.join(self.directory.name, 'pids.txt')
+        with open(path, 'w') as f:
+            f.write('45000000\nplayer\n')
+
+        # WHEN/THEN
+        with self.assertRaises(InvalidParameterError):
+            list(file_pids(path))
+
+
+class PipelineSinkTest(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    async def test_sqlite_sink(self):
+        # GIVEN
+        path = os.path.join(self.directory.name, 'stats.db')
+        async with AsyncAspxClient() as client:
+            with patch.object(client, 'get_aspx_data', side_effect=render), SqliteSink(path, batch_size=8) as sink:
+                # WHEN
+                await CrawlPipeline(client, PIDS[:20] + [1], sink).run()
+                # Crawling again replaces the previous rows
+                await CrawlPipeline(client, PIDS[:10], sink).run()
+
+        # THEN
+        connection = sqlite3.connect(path)
+        rows = connection.execute('SELECT pid, asof, data FROM responses ORDER BY pid').fetchall()
+        connection.close()
+        self.assertEqual(PIDS[:20], [pid for pid, _, _ in rows])
+        self.assertTrue(all(asof == SERVER.players.asof for _, asof, _ in rows))
+        self.assertEqual(PIDS[0], json.loads(rows[0][2])['data']['pid'])
+
+    async def test_json_lines_sink(self):
+        # GIVEN
+        path = os.path.join(self.directory.name, 'stats.jsonl')
+        async with AsyncAspxClient() as client:
+            with patch.object(client, 'get_aspx_data', side_effect=render), JsonLinesSink(path) as sink:
+                # WHEN
+                await CrawlPipeline(client, PIDS[:20] + [1], sink, 'getrankinfo.aspx').run()
+
+        # THEN
+        with open(path, 'r') as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(20, len(lines))
+        self.assertEqual(20, sink.written)
+        self.assertTrue(all('rank' in line['data'] for line in lines))
+
+    async def test_sqlite_sink_invalid_table(self):
+        # WHEN/THEN
+        with self.assertRaises(InvalidParameterError):
+            SqliteSink(os.path.join(self.directory.name, 'stats.db'), table='responses; DROP TABLE responses')
+
+    async def test_sinks_with_lazy_values(self):
+        # GIVEN
+        jsonl_path = os.path.join(self.directory.name, 'stats.jsonl')
+        sqlite_path = os.path.join(self.directory.name, 'stats.db')
+        async with AsyncAspxClient(lazy_values=True) as client:
+            with patch.object(client, 'get_aspx_data', side_effect=render), JsonLinesSink(jsonl_path) as jsonl_sink, \
+                    SqliteSink(sqlite_path) as sqlite_sink:
+                # WHEN
+                await CrawlPipeline(client, PIDS[:10], jsonl_sink).run()
+                await CrawlPipeline(client, PIDS[:10], sqlite_sink).run()
+
+        # THEN
+        with open(jsonl_path, 'r') as f:
+            lines = [json.loads(line) for line in f]
+        connection = sqlite3.connect(sqlite_path)
+        rows = connection.execute('SELECT data FROM responses ORDER BY pid').fetchall()
+        connection.close()
+        self.assertEqual(PIDS[:10], sorted(line['data']['pid'] for line in lines))
+        self.assertEqual(PIDS[:10], [json.loads(data)['data']['pid'] for data, in rows])
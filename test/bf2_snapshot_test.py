@@ -0,0 +1,88 @@
+import os
+import tempfile
+from array import array
+from unittest import TestCase
+
+from aspxstats.bf2 import AspxClient, PlayerinfoKeySet, PlayerStatsTable
+from aspxstats.bf2.snapshot import export_player_stats, read_player_stats, export_leaderboard
+from aspxstats.bf2.stub import SyntheticPlayers, StubConfig, StubServer
+from aspxstats.bf2.types import LeaderboardResponse, LeaderboardEntry
+from aspxstats.exceptions import Error
+from aspxstats.snapshot import Snapshot, write_snapshot
+
+SERVER = StubServer(StubConfig(players=10))
+PIDS = list(SyntheticPlayers(SERVER.players.config).get_pids())
+
+
+def parse_playerinfo(pid: int, key_set: PlayerinfoKeySet = PlayerinfoKeySet.GENERAL_STATS) -> dict:
+    client = AspxClient()
+    return client.validate_and_parse_getplayerinfo_response(key_set, SERVER.render_getplayerinfo(pid, key_set.value))
+
+
+class SnapshotTest(TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'snapshot.dat')
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_export_read_player_stats(self):
+        for key_set in PlayerinfoKeySet:
+            # GIVEN
+            table = PlayerStatsTable(key_set)
+            parsed = [parse_playerinfo(pid, key_set) for pid in PIDS]
+            table.extend(parsed)
+
+            # WHEN
+            export_player_stats(self.path, table, {'provider': 'bf2hub'})
+            actual = read_player_stats(self.path)
+
+            # THEN
+            self.assertEqual(key_set, actual.key_set)
+            self.assertEqual(table.index, actual.index)
+            self.assertEqual(table.columns, actual.columns)
+            self.assertEqual(parsed, [actual.get(pid) for pid in PIDS])
+
+    def test_read_player_stats_other_snapshot(self):
+        # GIVEN
+        write_snapshot(self.path, {'pid': array('q', PIDS)})
+
+        # WHEN/THEN
+        with self.assertRaisesRegex(Error, 'does not contain player stats'):
+            read_player_stats(self.path)
+
+    def test_read_player_stats_missing_column(self):
+        # GIVEN
+        table = PlayerStatsTable()
+        table.append(parse_playerinfo(PIDS[0]))
+        write_snapshot(self.path, {'asof': table.asof, 'pid': table.columns['pid']}, {'key_set': 'GENERAL_STATS'})
+
+        # WHEN/THEN
+        with self.assertRaisesRegex(Error, 'missing player stats columns'):
+            read_player_stats(self.path)
+
+    def test_export_leaderboard(self):
+        # GIVEN
+        pages = [
+            LeaderboardResponse(size=3, asof=1663441990, entries=[
+                LeaderboardEntry(n=1, pid=45000001, nick='mister249', rank=21, country_code='DE'),
+                LeaderboardEntry(n=2, pid=45000002, nick='mïster250', rank=20, country_code='')
+            ]),
+            LeaderboardResponse(size=3, asof=1663441991, entries=[
+                LeaderboardEntry(n=3, pid=45000003, nick='mister251', rank=19, country_code='US')
+            ])
+        ]
+
+        # WHEN
+        export_leaderboard(self.path, pages, {'type': 'score'})
+
+        # THEN
+        with Snapshot(self.path) as snapshot:
+            self.assertEqual({'type': 'score'}, snapshot.metadata)
+            self.assertEqual([1663441990, 1663441990, 1663441991], list(snapshot.read_column('asof')))
+            self.assertEqual([1, 2, 3], list(snapshot.read_column('n')))
+            self.assertEqual([45000001, 45000002, 45000003], list(snapshot.read_column('pid')))
+            self.assertEqual(['mister249', 'mïster250', 'mister251'], snapshot.read_column('nick'))
+            self.assertEqual([21, 20, 19], list(snapshot.read_column('rank')))
+            self.assertEqual(['DE', '', 'US'], snapshot.read_column('country_code'))
@@ -0,0 +1,250 @@
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import List, Callable, Optional
+from unittest import TestCase
+from unittest.mock import patch
+
+from aspxstats import InvalidParameterError
+from aspxstats.bf2 import AspxClient, PlayerinfoKeySet, PlayerStore
+from aspxstats.bf2 import store as store_module
+from aspxstats.bf2.store import INITIAL_SLOT_COUNT, STRING_SIZE
+from aspxstats.bf2.stub import SyntheticPlayers, StubConfig, StubServer
+from aspxstats.exceptions import Error
+
+SERVER = StubServer(StubConfig(players=INITIAL_SLOT_COUNT))
+PIDS = list(SyntheticPlayers(SERVER.players.config).get_pids())
+
+
+def parse_playerinfo(pid: int, key_set: PlayerinfoKeySet = PlayerinfoKeySet.GENERAL_STATS) -> dict:
+    client = AspxClient()
+    return client.validate_and_parse_getplayerinfo_response(key_set, SERVER.render_getplayerinfo(pid, key_set.value))
+
+
+class PlayerStoreTest(TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'players.dat')
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_put_get(self):
+        # GIVEN
+        general, map_stats = parse_playerinfo(PIDS[0]), parse_playerinfo(PIDS[0], PlayerinfoKeySet.MAP_STATS)
+        general['data']['nick'] = 'mïster249'
+
+        # WHEN
+        with PlayerStore(self.path) as store:
+            store.put(PlayerinfoKeySet.GENERAL_STATS, general)
+            store.put(PlayerinfoKeySet.MAP_STATS, map_stats)
+
+        # THEN
+        with PlayerStore(self.path) as store:
+            self.assertEqual(1, len(store))
+            self.assertIn(PIDS[0], store)
+            self.assertEqual(general, store.get(PIDS[0], PlayerinfoKeySet.GENERAL_STATS))
+            self.assertEqual(map_stats, store.get(PIDS[0], PlayerinfoKeySet.MAP_STATS))
+
+    def test_get_response(self):
+        client = AspxClient()
+        for key_set in PlayerinfoKeySet:
+            # GIVEN
+            raw_data = SERVER.render_getplayerinfo(PIDS[0], key_set.value)
+            expected = client.validate_and_decode_getplayerinfo_response(key_set, raw_data)
+
+            with PlayerStore(self.path) as store:
+                store.put(key_set, client.validate_and_parse_getplayerinfo_response(key_set, raw_data))
+
+                # WHEN
+                actual = store.get_response(PIDS[0], key_set)
+
+            # THEN
+            self.assertEqual(expected, actual)
+
+    def test_put_typed_response(self):
+        client = AspxClient()
+        for key_set in [PlayerinfoKeySet.GENERAL_STATS, PlayerinfoKeySet.MAP_STATS]:
+            # GIVEN
+            raw_data = SERVER.render_getplayerinfo(PIDS[0], key_set.value)
+            parsed = client.validate_and_parse_getplayerinfo_response(key_set, raw_data)
+            response = client.validate_and_decode_getplayerinfo_response(key_set, raw_data)
+
+            with PlayerStore(self.path) as store:
+                # WHEN
+                store.put(key_set, response)
+
+                # THEN
+                self.assertEqual(response, store.get_response(PIDS[0], key_set), key_set)
+                # Attributes not contained in typed responses are unknown
+                untyped = ('vrk', 'tnv', 'tgm') if key_set is PlayerinfoKeySet.GENERAL_STATS else ()
+                expected = {key: None if key in untyped else value for (key, value) in parsed['data'].items()}
+                self.assertEqual({'asof': parsed['asof'], 'data': expected}, store.get(PIDS[0], key_set), key_set)
+
+                # WHEN
+                store.put(key_set, parsed)
+
+                # THEN
+                # Storing a parsed response makes all attributes known again
+                self.assertEqual(parsed, store.get(PIDS[0], key_set), key_set)
+
+    def test_put_typed_response_of_other_key_set(self):
+        # GIVEN
+        client = AspxClient()
+        raw_data = SERVER.render_getplayerinfo(PIDS[0], PlayerinfoKeySet.MAP_STATS.value)
+        response = client.validate_and_decode_getplayerinfo_response(PlayerinfoKeySet.MAP_STATS, raw_data)
+
+        with PlayerStore(self.path) as store:
+            # WHEN/THEN
+            with self.assertRaises(InvalidParameterError):
+                store.put(PlayerinfoKeySet.GENERAL_STATS, response)
+            self.assertEqual(0, len(store))
+
+    def test_put_counts_record_before_adding_slot(self):
+        # GIVEN
+        written: List[str] = []
+        with PlayerStore(self.path) as store:
+            store.put(PlayerinfoKeySet.GENERAL_STATS, parse_playerinfo(PIDS[0]))
+            # Struct attributes are read-only, so spy on the whole structs (taking the real sizes before patching,
+            # since the store derives all offsets from them)
+            header_pack_into, slot_pack_into = store_module.HEADER.pack_into, store_module.SLOT.pack_into
+            header_size, slot_size = store_module.HEADER.size, store_module.SLOT.size
+            with patch.object(store_module, 'HEADER', wraps=store_module.HEADER) as header, \
+                    patch.object(store_module, 'SLOT', wraps=store_module.SLOT) as slot:
+                header.size, slot.size = header_size, slot_size
+                header.pack_into.side_effect = lambda *args: (written.append('header'), header_pack_into(*args))
+                slot.pack_into.side_effect = lambda *args: (written.append('slot'), slot_pack_into(*args))
+
+                # WHEN
+                store.put(PlayerinfoKeySet.GENERAL_STATS, parse_playerinfo(PIDS[1]))
+
+        # THEN
+        # If interrupted in between, the header must already count the record the slot is about to reference
+        self.assertEqual(['header', 'slot'], written)
+
+    def test_put_replaces_existing_stats(self):
+        # GIVEN
+        with PlayerStore(self.path) as store:
+            store.put(PlayerinfoKeySet.GENERAL_STATS, parse_playerinfo(PIDS[0]))
+            updated = parse_playerinfo(PIDS[0])
+            updated['asof'] += 10
+            updated['data']['kill'] += 5
+
+            # WHEN
+            store.put(PlayerinfoKeySet.GENERAL_STATS, updated)
+
+            # THEN
+            self.assertEqual(1, len(store))
+            self.assertEqual(updated, store.get(PIDS[0], PlayerinfoKeySet.GENERAL_STATS))
+
+    def test_put_grows_store(self):
+        # GIVEN
+        parsed = [parse_playerinfo(pid) for pid in PIDS]
+
+        # WHEN
+        with PlayerStore(self.path) as store:
+            for p in parsed:
+                store.put(PlayerinfoKeySet.GENERAL_STATS, p)
+
+        # THEN
+        with PlayerStore(self.path) as store:
+            self.assertEqual(len(PIDS), len(store))
+            self.assertEqual(INITIAL_SLOT_COUNT * 2, store.slot_count)
+            self.assertEqual(sorted(PIDS), sorted(store))
+            for p in parsed:
+                self.assertEqual(p, store.get(p['data']['pid'], PlayerinfoKeySet.GENERAL_STATS))
+
+    def test_get_missing(self):
+        @dataclass
+        class GetMissingTestCase:
+            name: str
+            pid: int
+            key_set: PlayerinfoKeySet
+            max_age: Optional[int] = None
+
+        tests: List[GetMissingTestCase] = [
+            GetMissingTestCase(
+                name='returns None for unknown player',
+                pid=PIDS[1],
+                key_set=PlayerinfoKeySet.GENERAL_STATS
+            ),
+            GetMissingTestCase(
+                name='returns None for key set not stored for player',
+                pid=PIDS[0],
+                key_set=PlayerinfoKeySet.MAP_STATS
+            ),
+            GetMissingTestCase(
+                name='returns None for stale stats',
+                pid=PIDS[0],
+                key_set=PlayerinfoKeySet.GENERAL_STATS,
+                max_age=3600
+            ),
+        ]
+
+        with PlayerStore(self.path) as store:
+            store.put(PlayerinfoKeySet.GENERAL_STATS, parse_playerinfo(PIDS[0]), int(time.time()) - 7200)
+
+            for t in tests:
+                # WHEN
+                actual = store.get(t.pid, t.key_set, t.max_age)
+
+                # THEN
+                self.assertIsNone(actual, t.name)
+
+    def test_put_invalid(self):
+        @dataclass
+        class PutInvalidTestCase:
+            name: str
+            modify: Callable[[dict], None]
+
+        tests: List[PutInvalidTestCase] = [
+            PutInvalidTestCase(
+                name='errors for missing attribute',
+                modify=lambda data: data.pop('kill')
+            ),
+            PutInvalidTestCase(
+                name='errors for string value exceeding maximum size',
+                modify=lambda data: data.update(nick='x' * (STRING_SIZE + 1))
+            ),
+            PutInvalidTestCase(
+                name='errors for out of range value',
+                modify=lambda data: data.update(kill=2 ** 64)
+            ),
+        ]
+
+        with PlayerStore(self.path) as store:
+            for t in tests:
+                # GIVEN
+                parsed = parse_playerinfo(PIDS[0])
+                t.modify(parsed['data'])
+
+                # WHEN/THEN
+                with self.assertRaises(InvalidParameterError, msg=t.name):
+                    store.put(PlayerinfoKeySet.GENERAL_STATS, parsed)
+                self.assertEqual(0, len(store), t.name)
+
+    def test_getplayerinfo(self):
+        # GIVEN
+        client = AspxClient()
+
+        with PlayerStore(self.path) as store, patch.object(client, 'get_aspx_data') as get_aspx_data:
+            get_aspx_data.return_value = SERVER.render_getplayerinfo(PIDS[0], PlayerinfoKeySet.GENERAL_STATS.value)
+
+            # WHEN
+            fetched = store.getplayerinfo(client, PIDS[0], max_age=3600)
+            stored = store.getplayerinfo(client, PIDS[0], max_age=3600)
+
+        # THEN
+        self.assertEqual(1, get_aspx_data.call_count)
+        self.assertEqual(fetched, stored)
+        self.assertEqual(PIDS[0], stored.data.pid)
+
+    def test_open_invalid_file(self):
+        # GIVEN
+        with open(self.path, 'wb') as f:
+            f.write(b'XXSTOR' + bytes(64))
+
+        # WHEN/THEN
+        with self.assertRaisesRegex(Error, 'unsupported format'):
+            PlayerStore(self.path)
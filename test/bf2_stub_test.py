@@ -0,0 +1,94 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from aspxstats import ResponseValidationMode, NotFoundError, ClientError
+from aspxstats.bf2 import AsyncAspxClient, PlayerinfoKeySet, SearchMatchType
+from aspxstats.bf2.stub import StubServer, StubConfig
+
+
+class StubServerTest(IsolatedAsyncioTestCase):
+    async def test_serves_valid_responses(self):
+        # GIVEN
+        async with StubServer(StubConfig(players=100)) as server:
+            await server.start(port=0)
+            async with AsyncAspxClient(response_validation_mode=ResponseValidationMode.STRICT) as client:
+                client.base_uri = server.base_uri
+                pid = server.players.config.first_pid
+
+                # WHEN
+                general = await client.getplayerinfo(pid)
+                maps = await client.getplayerinfo(pid, PlayerinfoKeySet.MAP_STATS)
+                leaderboard = await client.getleaderboard(pos=11, before=5, after=4)
+                search = await client.searchforplayers('player4500000', SearchMatchType.BEGINS_WITH)
+                rank = await client.getrankinfo(pid)
+                awards = await client.getawardsinfo_dict(pid)
+                unlocks = await client.getunlocksinfo_dict(pid)
+                backend = await client.getbackendinfo_dict()
+                verify = await client.verifyplayer_dict(pid, f'player{pid}', 'auth')
+
+                # THEN
+                self.assertEqual(pid, general.data.pid)
+                self.assertEqual(14, len(general.data.weapons))
+                self.assertEqual(pid, maps.data.pid)
+                self.assertEqual(100, leaderboard.size)
+                self.assertEqual(list(range(6, 16)), [entry.n for entry in leaderboard.entries])
+                self.assertEqual(10, len(search.results))
+                self.assertEqual(server.players.get_rank(pid), rank.data.rank)
+                self.assertEqual(pid, awards['pid'])
+                self.assertEqual(pid, unlocks['pid'])
+                self.assertEqual(7, len(backend['unlocks']))
+                self.assertEqual('Ok', verify['result'])
+                with self.assertRaises(NotFoundError):
+                    await client.getrankinfo(1)
+
+    async def test_serves_projected_playerinfo(self):
+        # GIVEN
+        async with StubServer(StubConfig(players=10)) as server:
+            await server.start(port=0)
+            async with AsyncAspxClient(response_validation_mode=ResponseValidationMode.STRICT) as client:
+                client.base_uri = server.base_uri
+                pid = server.players.config.first_pid
+                fields = ['scor', 'kill', 'wtm-3', 'de-6']
+
+                # WHEN
+                projected = await client.getplayerinfo(pid, fields=fields)
+                general = await client.getplayerinfo_dict(pid)
+
+                # THEN
+                self.assertEqual(pid, projected.data.pid)
+                self.assertEqual(f'player{pid}', projected.data.nick)
+                self.assertEqual({key: general['data'][key] for key in fields}, projected.data.values)
+                info = client.build_getplayerinfo_info(PlayerinfoKeySet.GENERAL_STATS, fields)
+                self.assertLess(
+                    len(server.render_getplayerinfo(pid, info)),
+                    len(server.render_getplayerinfo(pid, PlayerinfoKeySet.GENERAL_STATS.value)) / 2
+                )
+
+    async def test_serves_errors(self):
+        # GIVEN
+        async with StubServer(StubConfig(players=10, error_rate=1.0)) as server:
+            await server.start(port=0)
+            async with AsyncAspxClient() as client:
+                client.base_uri = server.base_uri
+
+                # WHEN/THEN
+                with self.assertRaisesRegex(ClientError, r'^Failed to fetch ASPX data \(HTTP/500\)$'):
+                    await client.getrankinfo(server.players.config.first_pid)
+
+    async def test_close_cancels_open_connections(self):
+        # GIVEN
+        server = StubServer(StubConfig(players=1))
+        await server.start(port=0)
+        reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+        # Wait for the connection to be accepted
+        while len(server.connections) == 0:
+            await asyncio.sleep(0.01)
+        connection = next(iter(server.connections))
+
+        # WHEN
+        await server.close()
+
+        # THEN
+        self.assertTrue(connection.cancelled())
+        self.assertEqual(0, len(server.connections))
+        writer.close()
@@ -0,0 +1,108 @@
+from unittest import TestCase
+
+from aspxstats import InvalidParameterError
+from aspxstats.bf2 import AspxClient, PlayerinfoKeySet, PlayerStatsTable
+from aspxstats.bf2.stub import SyntheticPlayers, StubConfig, StubServer
+
+SERVER = StubServer(StubConfig(players=10))
+PIDS = list(SyntheticPlayers(SERVER.players.config).get_pids())
+
+
+def parse_playerinfo(pid: int, key_set: PlayerinfoKeySet = PlayerinfoKeySet.GENERAL_STATS) -> dict:
+    client = AspxClient()
+    return client.validate_and_parse_getplayerinfo_response(key_set, SERVER.render_getplayerinfo(pid, key_set.value))
+
+
+class PlayerStatsTableTest(TestCase):
+    def test_append(self):
+        # GIVEN
+        table = PlayerStatsTable()
+        parsed = [parse_playerinfo(pid) for pid in PIDS]
+
+        # WHEN
+        table.extend(parsed)
+
+        # THEN
+        self.assertEqual(len(PIDS), len(table))
+        self.assertEqual(PIDS, list(table))
+        for p in parsed:
+            self.assertEqual(p, table.get(p['data']['pid']))
+        self.assertEqual([p['data']['kill'] for p in parsed], list(table.column('kill')))
+        self.assertEqual([int(p['data']['smoc']) for p in parsed], list(table.column('smoc')))
+        self.assertEqual([p['data']['nick'] for p in parsed], table.column('nick'))
+
+    def test_append_map_stats(self):
+        # GIVEN
+        table = PlayerStatsTable(PlayerinfoKeySet.MAP_STATS)
+        parsed = parse_playerinfo(PIDS[0], PlayerinfoKeySet.MAP_STATS)
+
+        # WHEN
+        row = table.append(parsed)
+
+        # THEN
+        self.assertEqual(0, row)
+        self.assertEqual(parsed, table.get(PIDS[0]))
+
+    def test_append_replaces_existing_player(self):
+        # GIVEN
+        table = PlayerStatsTable()
+        table.extend(parse_playerinfo(pid) for pid in PIDS[:2])
+        updated = parse_playerinfo(PIDS[0])
+        updated['asof'] += 10
+        updated['data']['kill'] += 5
+
+        # WHEN
+        row = table.append(updated)
+
+        # THEN
+        self.assertEqual(0, row)
+        self.assertEqual(2, len(table))
+        self.assertEqual(updated, table.get(PIDS[0]))
+
+    def test_append_unstorable_value(self):
+        # GIVEN
+        table = PlayerStatsTable()
+        table.append(parse_playerinfo(PIDS[0]))
+        existing = parse_playerinfo(PIDS[0])
+        existing['data']['wdsk'] = 2 ** 64
+        new = parse_playerinfo(PIDS[1])
+        new['data']['wdsk'] = 2 ** 64
+
+        # WHEN/THEN
+        with self.assertRaises(InvalidParameterError):
+            table.append(existing)
+        with self.assertRaises(InvalidParameterError):
+            table.append(new)
+        self.assertEqual(parse_playerinfo(PIDS[0]), table.get(PIDS[0]))
+        self.assertEqual(1, len(table))
+        self.assertTrue(all(len(column) == 1 for column in table.columns.values()))
+        self.assertNotIn(PIDS[1], table)
+
+    def test_append_missing_attributes(self):
+        # GIVEN
+        table = PlayerStatsTable()
+        parsed = parse_playerinfo(PIDS[0])
+        del parsed['data']['kill']
+
+        # WHEN/THEN
+        with self.assertRaisesRegex(InvalidParameterError, 'missing attributes: kill'):
+            table.append(parsed)
+        self.assertEqual(0, len(table))
+
+    def test_get_unknown_player(self):
+        # GIVEN
+        table = PlayerStatsTable()
+
+        # WHEN
+        actual = table.get(PIDS[0])
+
+        # THEN
+        self.assertIsNone(actual)
+
+    def test_column_unknown_attribute(self):
+        # GIVEN
+        table = PlayerStatsTable()
+
+        # WHEN/THEN
+        with self.assertRaises(InvalidParameterError):
+            table.column('not-an-attribute')
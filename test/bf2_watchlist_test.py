@@ -0,0 +1,270 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from aspxstats.bf2 import AsyncAspxClient
+from aspxstats.bf2.watchlist import WatchlistPoller, WatchlistEvent, WatchlistEventType
+from aspxstats.exceptions import InvalidParameterError, TimeoutError
+
+PID = 45000000
+NICK = 'player45000000'
+
+
+def playerinfo(score: int, rank: int, last_battle: int) -> Dict[str, Any]:
+    return {'asof': 1792426279, 'data': {'pid': PID, 'nick': NICK, 'scor': score, 'rank': rank, 'lbtl': last_battle}}
+
+
+def awardsinfo(awards: Dict[int, int]) -> Dict[str, Any]:
+    return {
+        'pid': PID,
+        'asof': 1792426279,
+        'data': [{'award': award, 'level': level, 'when': 1748735496, 'first': 0} for award, level in awards.items()]
+    }
+
+
+class WatchlistPollerTest(IsolatedAsyncioTestCase):
+    async def test_poll(self):
+        @dataclass
+        class WatchlistPollTestCase:
+            name: str
+            playerinfos: List[Dict[str, Any]]
+            awardsinfos: List[Dict[str, Any]]
+            expected: List[WatchlistEvent]
+            expected_awardsinfo_calls: int
+
+        tests: List[WatchlistPollTestCase] = [
+            WatchlistPollTestCase(
+                name='emits nothing if nothing changed',
+                playerinfos=[playerinfo(1000, 3, 1748735496), playerinfo(1000, 3, 1748735496)],
+                awardsinfos=[awardsinfo({1031105: 1})],
+                expected=[],
+                expected_awardsinfo_calls=1
+            ),
+            WatchlistPollTestCase(
+                name='emits score change',
+                playerinfos=[playerinfo(1000, 3, 1748735496), playerinfo(1250, 3, 1748737296)],
+                awardsinfos=[awardsinfo({1031105: 1}), awardsinfo({1031105: 1})],
+                expected=[WatchlistEvent(WatchlistEventType.SCORE_CHANGED, PID, NICK, 1000, 1250)],
+                expected_awardsinfo_calls=2
+            ),
+            WatchlistPollTestCase(
+                name='emits rank up, score change and awards',
+                playerinfos=[playerinfo(1000, 3, 1748735496), playerinfo(1250, 4, 1748737296)],
+                awardsinfos=[awardsinfo({1031105: 1}), awardsinfo({1031105: 2, 2051907: 1})],
+                expected=[
+                    WatchlistEvent(WatchlistEventType.RANK_UP, PID, NICK, 3, 4),
+                    WatchlistEvent(WatchlistEventType.SCORE_CHANGED, PID, NICK, 1000, 1250),
+                    WatchlistEvent(WatchlistEventType.AWARD_RECEIVED, PID, NICK, 1, 2, 1031105),
+                    WatchlistEvent(WatchlistEventType.AWARD_RECEIVED, PID, NICK, None, 1, 2051907),
+                ],
+                expected_awardsinfo_calls=2
+            ),
+            WatchlistPollTestCase(
+                name='emits rank down',
+                playerinfos=[playerinfo(1000, 3, 1748735496), playerinfo(1000, 0, 1748735496)],
+                awardsinfos=[awardsinfo({})],
+                expected=[WatchlistEvent(WatchlistEventType.RANK_DOWN, PID, NICK, 3, 0)],
+                expected_awardsinfo_calls=1
+            ),
+        ]
+
+        for t in tests:
+            async with AsyncAspxClient() as client:
+                # GIVEN
+                queue: 'asyncio.Queue[WatchlistEvent]' = asyncio.Queue()
+                poller = WatchlistPoller(client, [PID], queue=queue)
+                with patch.object(client, 'getplayerinfo_dict', side_effect=t.playerinfos), \
+                        patch.object(client, 'getawardsinfo_dict', side_effect=t.awardsinfos) as awardsinfo_mock:
+                    # WHEN
+                    first = await poller.poll(PID)
+                    second = await poller.poll(PID)
+
+                # THEN
+                self.assertEqual([], first, t.name)
+                self.assertEqual(t.expected, second, t.name)
+                self.assertEqual(t.expected, [queue.get_nowait() for _ in range(queue.qsize())], t.name)
+                self.assertEqual(t.expected_awardsinfo_calls, awardsinfo_mock.call_count, t.name)
+
+    async def test_poll_awaits_async_callback(self):
+        # GIVEN
+        events: List[WatchlistEvent] = []
+
+        async def callback(event: WatchlistEvent) -> None:
+            await asyncio.sleep(0)
+            events.append(event)
+
+        async with AsyncAspxClient() as client:
+            poller = WatchlistPoller(client, [PID], callback=callback)
+            with patch.object(client, 'getplayerinfo_dict', side_effect=[
+                playerinfo(1000, 3, 1748735496), playerinfo(1250, 3, 1748737296)
+            ]), patch.object(client, 'getawardsinfo_dict', return_value=awardsinfo({})):
+                # WHEN
+                await poller.poll(PID)
+                await poller.poll(PID)
+
+        # THEN
+        self.assertEqual([WatchlistEvent(WatchlistEventType.SCORE_CHANGED, PID, NICK, 1000, 1250)], events)
+
+    async def test_poll_not_watched(self):
+        # GIVEN
+        async with AsyncAspxClient() as client:
+            poller = WatchlistPoller(client, [PID], callback=lambda _: None)
+            poller.remove(PID)
+
+            # WHEN/THEN
+            with self.assertRaises(InvalidParameterError):
+                await poller.poll(PID)
+
+    async def test_run(self):
+        # GIVEN
+        queue: 'asyncio.Queue[WatchlistEvent]' = asyncio.Queue()
+        scores = iter(range(1000, 100000, 10))
+        pids = [PID, PID + 1, PID + 2]
+
+        async def getplayerinfo_dict(pid: int, *_: Any) -> Dict[str, Any]:
+            await asyncio.sleep(0)
+            if pid == PID + 2:
+                raise TimeoutError('Timed out trying to fetch aspx data')
+            return playerinfo(next(scores), 3, int(time.time()))
+
+        async with AsyncAspxClient() as client:
+            poller = WatchlistPoller(client, pids, queue=queue, active_interval=0.01, idle_interval=60.0, seed=1)
+            with patch.object(client, 'getplayerinfo_dict', side_effect=getplayerinfo_dict), \
+                    patch.object(client, 'getawardsinfo_dict', return_value=awardsinfo({})):
+                # WHEN
+                task = asyncio.create_task(poller.run())
+                # First poll only records the state, so the second poll of each active player emits the first events
+                events = [await asyncio.wait_for(queue.get(), 5.0) for _ in range(4)]
+                poller.stop()
+                await asyncio.wait_for(task, 5.0)
+
+        # THEN
+        self.assertTrue(all(event.type is WatchlistEventType.SCORE_CHANGED for event in events))
+        self.assertEqual({PID, PID + 1}, {event.pid for event in events})
+        self.assertEqual(1, poller.errors)
+        self.assertIsInstance(poller.last_error, TimeoutError)
+        # Failed player is only retried after the idle interval
+        self.assertIn(PID + 2, [pid for due, pid in poller.schedule if due - asyncio.get_running_loop().time() > 50.0])
+
+    async def test_run_skips_stale_schedule_of_readded_player(self):
+        # GIVEN
+        queue: 'asyncio.Queue[WatchlistEvent]' = asyncio.Queue()
+        async with AsyncAspxClient() as client:
+            poller = WatchlistPoller(client, [PID], queue=queue, active_interval=0.01, idle_interval=60.0, seed=1)
+            poller.remove(PID)
+            poller.add(PID)
+            # Player did not play recently, so the next poll after the first one is not due for another idle interval
+            with patch.object(client, 'getplayerinfo_dict', return_value=playerinfo(1000, 3, 1748735496)) as mock, \
+                    patch.object(client, 'getawardsinfo_dict', return_value=awardsinfo({})):
+                # WHEN
+                task = asyncio.create_task(poller.run())
+                await asyncio.sleep(0.1)
+                poller.stop()
+                await asyncio.wait_for(task, 5.0)
+
+        # THEN
+        self.assertEqual(1, mock.call_count)
+        self.assertEqual(1, len([due for due, _ in poller.schedule if due == poller.players[PID].next_due]))
+
+    async def test_run_reschedules_after_any_exception(self):
+        # GIVEN
+        scores = iter(range(1000, 100000, 10))
+        calls: List[int] = []
+
+        async def getplayerinfo_dict(pid: int, *_: Any) -> Dict[str, Any]:
+            calls.append(pid)
+            if pid == PID + 1:
+                # E.g. a response missing an attribute
+                raise KeyError('lbtl')
+            return playerinfo(next(scores), 3, int(time.time()))
+
+        def callback(_: WatchlistEvent) -> None:
+            raise RuntimeError('callback failed')
+
+        async with AsyncAspxClient() as client:
+            poller = WatchlistPoller(
+                client, [PID, PID + 1], callback=callback, active_interval=0.01, idle_interval=0.01, seed=1
+            )
+            with patch.object(client, 'getplayerinfo_dict', side_effect=getplayerinfo_dict), \
+                    patch.object(client, 'getawardsinfo_dict', return_value=awardsinfo({})):
+                # WHEN
+                task = asyncio.create_task(poller.run())
+                await asyncio.sleep(0.2)
+                poller.stop()
+                await asyncio.wait_for(task, 5.0)
+
+        # THEN
+        # Both players keep getting polled, even though each poll (but the first of PID) fails
+        self.assertGreater(calls.count(PID), 2)
+        self.assertGreater(calls.count(PID + 1), 2)
+        self.assertEqual(len(calls) - 1, poller.errors)
+        self.assertEqual(2, len({pid for _, pid in poller.schedule}))
+
+
+class WatchlistPollerScheduleTest(IsolatedAsyncioTestCase):
+    async def test_get_interval(self):
+        @dataclass
+        class GetIntervalTestCase:
+            name: str
+            last_battle: Optional[int]
+            expected_min: float
+            expected_max: float
+
+        now = int(time.time())
+        tests: List[GetIntervalTestCase] = [
+            GetIntervalTestCase(
+                name='uses active interval for players who played recently',
+                last_battle=now - 600,
+                expected_min=54.0,
+                expected_max=66.0
+            ),
+            GetIntervalTestCase(
+                name='uses idle interval for players who did not play recently',
+                last_battle=now - 7200,
+                expected_min=810.0,
+                expected_max=990.0
+            ),
+            GetIntervalTestCase(
+                name='uses idle interval for players never polled successfully',
+                last_battle=None,
+                expected_min=810.0,
+                expected_max=990.0
+            ),
+        ]
+
+        for t in tests:
+            async with AsyncAspxClient() as client:
+                # GIVEN
+                poller = WatchlistPoller(client, callback=lambda _: None, seed=1)
+
+                # WHEN
+                intervals = [poller.get_interval(t.last_battle) for _ in range(100)]
+
+            # THEN
+            self.assertTrue(all(t.expected_min <= interval <= t.expected_max for interval in intervals), t.name)
+            # Intervals are jittered
+            self.assertGreater(len(set(intervals)), 1, t.name)
+
+    async def test_add_staggers_first_polls(self):
+        async with AsyncAspxClient() as client:
+            # GIVEN
+            poller = WatchlistPoller(client, callback=lambda _: None, active_interval=60.0, seed=1)
+
+            # WHEN
+            for pid in range(PID, PID + 100):
+                poller.add(pid)
+
+        # THEN
+        self.assertEqual(100, len(poller))
+        dues = [due for due, _ in poller.schedule]
+        self.assertLessEqual(max(dues) - min(dues), 60.0)
+        self.assertGreater(max(dues) - min(dues), 30.0)
+
+    async def test_init_without_queue_or_callback(self):
+        async with AsyncAspxClient() as client:
+            # WHEN/THEN
+            with self.assertRaises(InvalidParameterError):
+                WatchlistPoller(client)
@@ -0,0 +1,105 @@
+from dataclasses import dataclass
+from typing import List, Optional, Tuple, Any
+from unittest import TestCase
+
+from aspxstats.cache import UnchangedResponseCache
+
+RAW_DATA = 'O\n' \
+           'H\tasof\n' \
+           'D\t1663441990\n' \
+           'H\trank\tchng\tdecr\n' \
+           'D\t13\t0\t0\n' \
+           '$\t29\t$'
+
+
+class UnchangedResponseCacheTest(TestCase):
+    def test_get(self):
+        @dataclass
+        class GetTestCase:
+            name: str
+            key: str
+            raw_data: str
+            expected: Optional[Tuple[int, Any]]
+
+        tests: List[GetTestCase] = [
+            GetTestCase(
+                name='returns cached response for identical response',
+                key='a',
+                raw_data=RAW_DATA,
+                expected=(1663441990, 'parsed')
+            ),
+            GetTestCase(
+                name='returns cached response with new asof for otherwise identical response',
+                key='a',
+                raw_data=RAW_DATA.replace('1663441990', '1663442990'),
+                expected=(1663442990, 'parsed')
+            ),
+            GetTestCase(
+                name='returns None for changed response',
+                key='a',
+                raw_data=RAW_DATA.replace('D\t13', 'D\t14'),
+                expected=None
+            ),
+            GetTestCase(
+                name='returns None for response with trailing data',
+                key='a',
+                raw_data='O\nH\tasof\nD\t1663441990\nH\tpid\n' + RAW_DATA[RAW_DATA.index('H\trank'):],
+                expected=None
+            ),
+            GetTestCase(
+                name='returns None for response without asof',
+                key='a',
+                raw_data=RAW_DATA.replace('H\tasof\nD\t1663441990\n', ''),
+                expected=None
+            ),
+            GetTestCase(
+                name='returns None for response with invalid asof',
+                key='a',
+                raw_data=RAW_DATA.replace('1663441990', '166344199x'),
+                expected=None
+            ),
+            GetTestCase(
+                name='returns None for other key',
+                key='b',
+                raw_data=RAW_DATA,
+                expected=None
+            ),
+        ]
+
+        cache = UnchangedResponseCache()
+        cache.put('a', RAW_DATA, 'parsed')
+        for t in tests:
+            # WHEN
+            actual = cache.get(t.key, t.raw_data)
+
+            # THEN
+            self.assertEqual(t.expected, actual, t.name)
+
+        self.assertEqual(2, cache.hits)
+        self.assertEqual(5, cache.misses)
+
+    def test_put_evicts_least_recently_used(self):
+        # GIVEN
+        cache = UnchangedResponseCache(max_size=2)
+        cache.put('a', RAW_DATA, 'a')
+        cache.put('b', RAW_DATA, 'b')
+        cache.get('a', RAW_DATA)
+
+        # WHEN
+        cache.put('c', RAW_DATA, 'c')
+
+        # THEN
+        self.assertEqual(2, len(cache))
+        self.assertIsNotNone(cache.get('a', RAW_DATA))
+        self.assertIsNone(cache.get('b', RAW_DATA))
+        self.assertIsNotNone(cache.get('c', RAW_DATA))
+
+    def test_put_ignores_response_without_asof(self):
+        # GIVEN
+        cache = UnchangedResponseCache()
+
+        # WHEN
+        cache.put('a', 'O\nH\trank\tchng\tdecr\nD\t13\t0\t0\n$\t19\t$', 'parsed')
+
+        # THEN
+        self.assertEqual(0, len(cache))
@@ -0,0 +1,81 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+import requests
+
+from aspxstats.cassette import Cassette, CassetteMode
+from aspxstats.client import AspxClient
+from aspxstats.exceptions import ClientError
+from aspxstats.types import ResponseValidationMode
+from base_client_test import MockSession, MockResponse
+
+
+class CassetteTest(TestCase):
+    def test_record_and_replay(self):
+        with tempfile.TemporaryDirectory() as directory, patch('requests.session') as patched_session:
+            # GIVEN
+            path = os.path.join(directory, 'cassette.jsonl')
+            response_text = 'O\n' \
+                            'H\trank\tchng\tdecr\n' \
+                            'D\t13\t0\t0\n' \
+                            '$\t19\t$'
+            patched_session.return_value = MockSession(MockResponse(response_text, 200, True))
+            with Cassette(path, CassetteMode.RECORD) as cassette:
+                client = AspxClient('http://localhost/ASP/', {}, 1.0, ResponseValidationMode.STRICT, cassette)
+                client.get_aspx_data('getrankinfo.aspx', {'pid': '45377286'})
+
+            # WHEN
+            patched_session.return_value = MockSession(
+                MockResponse('', 500, False),
+                requests.RequestException('network access during replay')
+            )
+            with Cassette(path, CassetteMode.REPLAY) as cassette:
+                client = AspxClient('http://localhost/ASP/', {}, 1.0, ResponseValidationMode.STRICT, cassette)
+                response = client.get_aspx_data('getrankinfo.aspx', {'pid': '45377286'})
+
+            # THEN
+            self.assertEqual(1, len(cassette))
+            self.assertEqual(response_text, response)
+            self.assertRaisesRegex(
+                ClientError,
+                r'^Failed to fetch ASPX data: no exchange recorded for http://localhost/ASP/getrankinfo\.aspx',
+                client.get_aspx_data,
+                'getrankinfo.aspx',
+                {'pid': '500362798'}
+            )
+
+    def test_replay_error_status(self):
+        with tempfile.TemporaryDirectory() as directory, patch('requests.session') as patched_session:
+            # GIVEN
+            path = os.path.join(directory, 'cassette.jsonl')
+            patched_session.return_value = MockSession(MockResponse('', 500, False))
+            with Cassette(path, CassetteMode.RECORD) as cassette:
+                client = AspxClient('http://localhost/ASP/', {}, 1.0, ResponseValidationMode.STRICT, cassette)
+                self.assertRaises(ClientError, client.get_aspx_data, 'getbackendinfo.aspx')
+
+            # WHEN/THEN
+            with Cassette(path, CassetteMode.REPLAY) as cassette:
+                client = AspxClient('http://localhost/ASP/', {}, 1.0, ResponseValidationMode.STRICT, cassette)
+                self.assertRaisesRegex(
+                    ClientError,
+                    r'^Failed to fetch ASPX data \(HTTP/500\)$',
+                    client.get_aspx_data,
+                    'getbackendinfo.aspx'
+                )
+
+    def test_replay_in_recorded_order(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # GIVEN
+            path = os.path.join(directory, 'cassette.jsonl')
+            with Cassette(path, CassetteMode.RECORD) as cassette:
+                cassette.record('http://localhost/ASP/getrankinfo.aspx', {'pid': '1'}, 200, 'first', 0.1)
+                cassette.record('http://localhost/ASP/getrankinfo.aspx', {'pid': '1'}, 200, 'second', 0.2)
+
+            # WHEN
+            cassette = Cassette(path)
+            bodies = [cassette.replay('http://localhost/ASP/getrankinfo.aspx', {'pid': '1'}).body for _ in range(3)]
+
+            # THEN
+            self.assertEqual(['first', 'second', 'first'], bodies)
@@ -1,8 +1,11 @@
+import json
+import pickle
 from dataclasses import dataclass
 from typing import Dict, Any, Union, List, Optional, Callable
 from unittest import TestCase
 
-from aspxstats.parsing import parse_dict_values
+from aspxstats.exceptions import InvalidResponseError
+from aspxstats.parsing import parse_dict_values, LazyParsedDict
 from aspxstats.schema import AttributeSchema
 from aspxstats.types import CleanerType
 
@@ -217,6 +220,58 @@ class ParsingTest(TestCase):
         for t in tests:
             # WHEN
             parsed = parse_dict_values(t.data, t.schema, t.cleaners)
+            lazily_parsed = parse_dict_values(t.data, t.schema, t.cleaners, lazy=True)
 
             # THEN
             self.assertDictEqual(t.expected, parsed)
+            self.assertDictEqual(t.expected, lazily_parsed.to_dict())
+            self.assertEqual(t.expected, lazily_parsed)
+
+    def test_parse_lazy_converts_on_access(self):
+        # GIVEN
+        data = {'numeric-str': '123456', 'invalid-numeric-str': 'not-a-number', 'unreferenced': 'value'}
+        schema = {
+            'numeric-str': AttributeSchema(type=str, is_numeric=True),
+            'invalid-numeric-str': AttributeSchema(type=str, is_numeric=True)
+        }
+
+        # WHEN
+        parsed = parse_dict_values(data, schema, lazy=True)
+
+        # THEN
+        self.assertIsInstance(parsed, LazyParsedDict)
+        self.assertEqual(['numeric-str', 'invalid-numeric-str'], list(parsed))
+        self.assertEqual(123456, parsed['numeric-str'])
+        self.assertIs(parsed['numeric-str'], parsed['numeric-str'])
+        self.assertNotIn('unreferenced', parsed)
+        with self.assertRaises(InvalidResponseError):
+            parsed['invalid-numeric-str']
+
+    def test_parse_lazy_nested_values_are_plain(self):
+        # GIVEN
+        data = {'sub-dict': {'numeric-str': '123456'}, 'sub-list': [{'numeric-str': '654321'}]}
+        schema = {
+            'sub-dict': {'numeric-str': AttributeSchema(type=str, is_numeric=True)},
+            'sub-list': AttributeSchema(type=list, children={'numeric-str': AttributeSchema(type=str, is_numeric=True)})
+        }
+
+        # WHEN
+        copied = dict(parse_dict_values(data, schema, lazy=True))
+
+        # THEN
+        self.assertIs(dict, type(copied['sub-dict']))
+        self.assertIs(dict, type(copied['sub-list'][0]))
+        self.assertEqual(json.dumps(parse_dict_values(data, schema)), json.dumps(copied))
+
+    def test_parse_lazy_pickles_as_dict(self):
+        # GIVEN
+        data = {'sub-dict': {'numeric-str': '123456'}}
+        schema = {'sub-dict': {'numeric-str': AttributeSchema(type=str, is_numeric=True)}}
+
+        # WHEN
+        unpickled = pickle.loads(pickle.dumps(parse_dict_values(data, schema, lazy=True)))
+
+        # THEN
+        self.assertIs(dict, type(unpickled))
+        self.assertIs(dict, type(unpickled['sub-dict']))
+        self.assertEqual({'sub-dict': {'numeric-str': 123456}}, unpickled)
@@ -0,0 +1,152 @@
+import asyncio
+from dataclasses import dataclass
+from typing import List, Dict, Optional
+from unittest import IsolatedAsyncioTestCase
+
+from aspxstats.exceptions import InvalidParameterError
+from aspxstats.scheduler import RequestScheduler, RequestPriority, request_priority, get_request_priority
+
+
+class RequestSchedulerTest(IsolatedAsyncioTestCase):
+    async def test_acquire(self):
+        @dataclass
+        class AcquireTestCase:
+            name: str
+            capacity: int
+            quotas: Optional[Dict[RequestPriority, int]]
+            active: List[RequestPriority]
+            priority: RequestPriority
+            expected_granted: bool
+
+        tests: List[AcquireTestCase] = [
+            AcquireTestCase(
+                name='grants any request without capacity limit',
+                capacity=0,
+                quotas=None,
+                active=[RequestPriority.BACKGROUND] * 100,
+                priority=RequestPriority.BACKGROUND,
+                expected_granted=True
+            ),
+            AcquireTestCase(
+                name='grants request within capacity',
+                capacity=2,
+                quotas=None,
+                active=[RequestPriority.NORMAL],
+                priority=RequestPriority.NORMAL,
+                expected_granted=True
+            ),
+            AcquireTestCase(
+                name='queues request exceeding capacity',
+                capacity=2,
+                quotas=None,
+                active=[RequestPriority.NORMAL, RequestPriority.NORMAL],
+                priority=RequestPriority.INTERACTIVE,
+                expected_granted=False
+            ),
+            AcquireTestCase(
+                name='queues background request exceeding default quota',
+                capacity=4,
+                quotas=None,
+                active=[RequestPriority.BACKGROUND] * 3,
+                priority=RequestPriority.BACKGROUND,
+                expected_granted=False
+            ),
+            AcquireTestCase(
+                name='grants interactive request while background requests are at their quota',
+                capacity=4,
+                quotas=None,
+                active=[RequestPriority.BACKGROUND] * 3,
+                priority=RequestPriority.INTERACTIVE,
+                expected_granted=True
+            ),
+            AcquireTestCase(
+                name='queues request exceeding custom quota',
+                capacity=0,
+                quotas={RequestPriority.NORMAL: 1},
+                active=[RequestPriority.NORMAL],
+                priority=RequestPriority.NORMAL,
+                expected_granted=False
+            ),
+        ]
+
+        for t in tests:
+            # GIVEN
+            scheduler = RequestScheduler(t.capacity, t.quotas)
+            for priority in t.active:
+                await scheduler.acquire(priority)
+
+            # WHEN
+            task = asyncio.create_task(scheduler.acquire(t.priority))
+            await asyncio.sleep(0)
+
+            # THEN
+            self.assertEqual(t.expected_granted, task.done(), t.name)
+            self.assertEqual(0 if t.expected_granted else 1, scheduler.queued, t.name)
+            task.cancel()
+
+    async def test_release_grants_in_order_of_priority(self):
+        # GIVEN
+        scheduler = RequestScheduler(1, {RequestPriority.BACKGROUND: 0})
+        await scheduler.acquire(RequestPriority.BACKGROUND)
+        granted: List[str] = []
+
+        async def request(name: str, priority: RequestPriority) -> None:
+            async with scheduler.slot(priority):
+                granted.append(name)
+
+        tasks = [
+            asyncio.create_task(request('background-1', RequestPriority.BACKGROUND)),
+            asyncio.create_task(request('background-2', RequestPriority.BACKGROUND)),
+            asyncio.create_task(request('normal', RequestPriority.NORMAL)),
+            asyncio.create_task(request('interactive', RequestPriority.INTERACTIVE)),
+        ]
+        await asyncio.sleep(0)
+
+        # WHEN
+        scheduler.release(RequestPriority.BACKGROUND)
+        await asyncio.gather(*tasks)
+
+        # THEN
+        self.assertEqual(['interactive', 'normal', 'background-1', 'background-2'], granted)
+        self.assertEqual(0, scheduler.active_total)
+        self.assertEqual(0, scheduler.queued)
+
+    async def test_cancelled_waiter_does_not_hold_slot(self):
+        # GIVEN
+        scheduler = RequestScheduler(1)
+        await scheduler.acquire(RequestPriority.NORMAL)
+        cancelled = asyncio.create_task(scheduler.acquire(RequestPriority.NORMAL))
+        waiting = asyncio.create_task(scheduler.acquire(RequestPriority.NORMAL))
+        await asyncio.sleep(0)
+
+        # WHEN
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        scheduler.release(RequestPriority.NORMAL)
+        await asyncio.wait_for(waiting, 1.0)
+
+        # THEN
+        self.assertTrue(cancelled.cancelled())
+        self.assertEqual(1, scheduler.active_total)
+        self.assertEqual(0, scheduler.queued)
+
+    async def test_slot_uses_context_priority(self):
+        # GIVEN
+        scheduler = RequestScheduler(4)
+
+        # WHEN
+        with request_priority(RequestPriority.BACKGROUND):
+            async with scheduler.slot():
+                active = dict(scheduler.active)
+                context_priority = get_request_priority()
+
+        # THEN
+        self.assertEqual(RequestPriority.BACKGROUND, context_priority)
+        self.assertEqual(1, active[RequestPriority.BACKGROUND])
+        self.assertEqual(RequestPriority.NORMAL, get_request_priority())
+        self.assertEqual(0, scheduler.active_total)
+
+    async def test_init_negative_capacity(self):
+        # WHEN/THEN
+        with self.assertRaises(InvalidParameterError):
+            RequestScheduler(-1)
@@ -0,0 +1,160 @@
+import json
+from dataclasses import dataclass
+from typing import List, Any
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+from aspxstats import serialization
+from aspxstats.bf2.types import PlayerinfoResponse, PlayerinfoMapStats, PlayerinfoMap, PlayerinfoProjection, \
+    LeaderboardResponse, LeaderboardEntry, RankinfoResponse, RankinfoData, PlayerSearchResponse
+
+
+class SerializationTest(TestCase):
+    def test_to_dict(self):
+        @dataclass
+        class ToDictTestCase:
+            name: str
+            response: Any
+
+        tests: List[ToDictTestCase] = [
+            ToDictTestCase(
+                name='converts nested list of instances',
+                response=LeaderboardResponse(size=2, asof=1663441990, entries=[
+                    LeaderboardEntry(n=1, pid=45000001, nick='mister249', rank=21, country_code='DE'),
+                    LeaderboardEntry(n=2, pid=45000002, nick='mister250', rank=20, country_code='US')
+                ])
+            ),
+            ToDictTestCase(
+                name='converts nested instance',
+                response=RankinfoResponse(data=RankinfoData(rank=21, promoted=False, demoted=True))
+            ),
+            ToDictTestCase(
+                name='converts empty list',
+                response=PlayerSearchResponse(asof=1663441990, results=[])
+            ),
+            ToDictTestCase(
+                name='converts union of map stats',
+                response=PlayerinfoResponse(asof=1663441990, data=PlayerinfoMapStats(pid=45000001, nick='mister249', maps=[
+                    PlayerinfoMap(id=0, time=123, wins=4, losses=5),
+                    PlayerinfoMap(id=100, time=456, wins=7, losses=8)
+                ]))
+            ),
+            ToDictTestCase(
+                name='converts union of projection',
+                response=PlayerinfoResponse(asof=1663441990, data=PlayerinfoProjection(pid=45000001, nick='mister249', values={
+                    'kill': 123,
+                    'osaa': 45.6,
+                    'smoc': False
+                }))
+            ),
+        ]
+
+        for t in tests:
+            # WHEN
+            actual = t.response.to_dict()
+
+            # THEN
+            self.assertEqual(dict(t.response), actual, t.name)
+
+    def test_to_dict_copies_values(self):
+        # GIVEN
+        response = PlayerinfoResponse(asof=1663441990, data=PlayerinfoProjection(pid=45000001, nick='mister249', values={
+            'kill': 123
+        }))
+
+        # WHEN
+        actual = response.to_dict()
+        actual['data']['values']['kill'] = 0
+
+        # THEN
+        self.assertEqual(123, response.data.values['kill'])
+
+    def test_copy_instance(self):
+        # GIVEN
+        response = PlayerinfoResponse(asof=1663441990, data=PlayerinfoMapStats(pid=45000001, nick='mister249', maps=[
+            PlayerinfoMap(id=0, time=123, wins=4, losses=5)
+        ]))
+
+        # WHEN
+        copied = serialization.copy_instance(response)
+        copied.data.maps[0].wins = 0
+
+        # THEN
+        self.assertEqual(4, response.data.maps[0].wins)
+        self.assertIsNot(response.data.maps, copied.data.maps)
+        self.assertEqual(response.data.nick, copied.data.nick)
+
+    def test_to_json_bytes(self):
+        # GIVEN
+        response = PlayerinfoResponse(asof=1663441990, data=PlayerinfoMapStats(pid=45000001, nick='mïster249', maps=[
+            PlayerinfoMap(id=0, time=123, wins=4, losses=5)
+        ]))
+        expected = b'{"asof":1663441990,"data":{"pid":45000001,"nick":"m\xc3\xafster249","maps":' \
+                   b'[{"id":0,"time":123,"wins":4,"losses":5}]}}'
+
+        for backend in [serialization.orjson, None]:
+            with patch.object(serialization, 'orjson', backend):
+                # WHEN
+                actual = response.to_json_bytes()
+
+                # THEN
+                self.assertEqual(expected, actual)
+                self.assertEqual(dict(response), json.loads(actual))
+
+    @skipIf(serialization.orjson is None, 'orjson is not installed')
+    def test_to_json_bytes_backends_are_identical(self):
+        @dataclass
+        class BackendsTestCase:
+            name: str
+            response: Any
+            expected_identical: bool
+
+        tests: List[BackendsTestCase] = [
+            BackendsTestCase(
+                name='serializes floats, bools and non-ascii strings identically',
+                response=PlayerinfoResponse(asof=1663441990, data=PlayerinfoProjection(pid=45000001, nick='mïster249', values={
+                    'kill': 123,
+                    'osaa': 45.6,
+                    'tvcr': 0.30000000000000004,
+                    'kdr': 1.0,
+                    'smoc': False
+                })),
+                expected_identical=True
+            ),
+            BackendsTestCase(
+                name='serializes floats needing an exponent to equal values',
+                response=PlayerinfoResponse(asof=1663441990, data=PlayerinfoProjection(pid=45000001, nick='mister249', values={
+                    'osaa': 2.5e-05,
+                    'tvcr': 1e16
+                })),
+                expected_identical=False
+            ),
+        ]
+
+        for t in tests:
+            # WHEN
+            with patch.object(serialization, 'orjson', None):
+                fallback = t.response.to_json_bytes()
+            actual = t.response.to_json_bytes()
+
+            # THEN
+            self.assertEqual(json.loads(fallback), json.loads(actual), t.name)
+            if t.expected_identical:
+                self.assertEqual(fallback, actual, t.name)
+
+    @skipIf(serialization.orjson is None, 'orjson is not installed')
+    def test_to_json_bytes_non_finite_floats(self):
+        # GIVEN
+        response = PlayerinfoResponse(asof=1663441990, data=PlayerinfoProjection(pid=45000001, nick='mister249', values={
+            'osaa': float('nan'),
+            'tvcr': float('inf')
+        }))
+
+        # WHEN
+        with patch.object(serialization, 'orjson', None):
+            fallback = response.to_json_bytes()
+        actual = response.to_json_bytes()
+
+        # THEN
+        self.assertIn(b'"values":{"osaa":NaN,"tvcr":Infinity}', fallback)
+        self.assertIn(b'"values":{"osaa":null,"tvcr":null}', actual)
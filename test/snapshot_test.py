@@ -0,0 +1,164 @@
+import os
+import tempfile
+from array import array
+from dataclasses import dataclass
+from typing import List, Dict, Callable
+from unittest import TestCase
+
+from aspxstats.exceptions import Error
+from aspxstats.snapshot import write_snapshot, Snapshot, Column, FILE_HEADER
+
+COLUMNS: Dict[str, Column] = {
+    'pid': array('q', [45000001, 45000002, 45000003]),
+    'smoc': array('b', [1, 0, 1]),
+    'osaa': array('d', [12.5, 0.0, 99.75]),
+    'nick': ['mister249', 'mïster250', '']
+}
+
+
+class SnapshotTest(TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'snapshot.dat')
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_write_read(self):
+        # GIVEN
+        write_snapshot(self.path, COLUMNS, {'provider': 'bf2hub'})
+
+        # WHEN
+        with Snapshot(self.path) as snapshot:
+            metadata = snapshot.metadata
+            length = len(snapshot)
+            columns = snapshot.columns
+            actual = {name: snapshot.read_column(name) for name in columns}
+
+        # THEN
+        self.assertEqual({'provider': 'bf2hub'}, metadata)
+        self.assertEqual(3, length)
+        self.assertEqual(list(COLUMNS), columns)
+        self.assertEqual(COLUMNS, actual)
+        self.assertFalse(os.path.exists(f'{self.path}.tmp'))
+
+    def test_write_read_empty(self):
+        # GIVEN
+        write_snapshot(self.path, {'pid': array('q'), 'nick': list()})
+
+        # WHEN
+        with Snapshot(self.path) as snapshot:
+            actual = {name: snapshot.read_column(name) for name in snapshot.columns}
+
+        # THEN
+        self.assertEqual({'pid': array('q'), 'nick': list()}, actual)
+
+    def test_column(self):
+        # GIVEN
+        write_snapshot(self.path, COLUMNS)
+
+        # WHEN
+        with Snapshot(self.path) as snapshot:
+            with snapshot.column('pid') as pids:
+                total = sum(pids)
+                aligned = pids.obj is not None and snapshot.infos['pid'].offset % 8 == 0
+            nicks = snapshot.column('nick')
+            nick, last, sliced = nicks[1], nicks[-1], nicks[0:2]
+            nicks.offsets.release()
+            nicks.data.release()
+
+        # THEN
+        self.assertEqual(sum(COLUMNS['pid']), total)
+        self.assertTrue(aligned)
+        self.assertEqual('mïster250', nick)
+        self.assertEqual('', last)
+        self.assertEqual(['mister249', 'mïster250'], sliced)
+
+    def test_column_not_found(self):
+        # GIVEN
+        write_snapshot(self.path, COLUMNS)
+
+        # WHEN/THEN
+        with Snapshot(self.path) as snapshot:
+            self.assertNotIn('kill', snapshot)
+            with self.assertRaisesRegex(Error, 'does not contain column kill'):
+                snapshot.column('kill')
+
+    def test_write_invalid_columns(self):
+        @dataclass
+        class WriteInvalidColumnsTestCase:
+            name: str
+            columns: Dict[str, Column]
+
+        tests: List[WriteInvalidColumnsTestCase] = [
+            WriteInvalidColumnsTestCase(
+                name='errors for columns of different lengths',
+                columns={'pid': array('q', [1, 2]), 'nick': ['mister249']}
+            ),
+            WriteInvalidColumnsTestCase(
+                name='errors for list of non-string values',
+                columns={'pid': [1, 2]}
+            ),
+            WriteInvalidColumnsTestCase(
+                name='errors for unsupported typecode',
+                columns={'pid': array('i', [1, 2])}
+            ),
+        ]
+
+        for t in tests:
+            # WHEN/THEN
+            with self.assertRaises(Error, msg=t.name):
+                write_snapshot(self.path, t.columns)
+            self.assertFalse(os.path.exists(self.path), t.name)
+
+    def test_read_invalid_file(self):
+        @dataclass
+        class ReadInvalidFileTestCase:
+            name: str
+            modify: Callable[[bytes], bytes]
+
+        tests: List[ReadInvalidFileTestCase] = [
+            ReadInvalidFileTestCase(
+                name='errors for empty file',
+                modify=lambda data: b''
+            ),
+            ReadInvalidFileTestCase(
+                name='errors for other format',
+                modify=lambda data: b'XXSNAP' + data[6:]
+            ),
+            ReadInvalidFileTestCase(
+                name='errors for unsupported version',
+                modify=lambda data: data[:6] + b'\x02' + data[7:]
+            ),
+            ReadInvalidFileTestCase(
+                name='errors for truncated header',
+                modify=lambda data: data[:FILE_HEADER.size + 4]
+            ),
+            ReadInvalidFileTestCase(
+                name='errors for truncated column region',
+                modify=lambda data: data[:-8]
+            ),
+            ReadInvalidFileTestCase(
+                name='errors for column not matching row count',
+                modify=lambda data: modify_row_count(data, 4)
+            ),
+        ]
+
+        write_snapshot(self.path, COLUMNS)
+        with open(self.path, 'rb') as f:
+            data = f.read()
+
+        for t in tests:
+            # GIVEN
+            with open(self.path, 'wb') as f:
+                f.write(t.modify(data))
+
+            # WHEN/THEN
+            with self.assertRaises(Error, msg=t.name):
+                Snapshot(self.path)
+
+
+def modify_row_count(data: bytes, row_count: int) -> bytes:
+    magic, version, byte_order, column_count, _, metadata_length = FILE_HEADER.unpack_from(data, 0)
+    return FILE_HEADER.pack(magic, version, byte_order, column_count, row_count, metadata_length) + \
+        data[FILE_HEADER.size:]
@@ -0,0 +1,191 @@
+import copy
+import pickle
+import struct
+from dataclasses import dataclass
+from typing import List, Any
+from unittest import TestCase
+
+from aspxstats import wire
+from aspxstats.bf2.types import PlayerinfoResponse, PlayerinfoMapStats, PlayerinfoMap, PlayerinfoProjection, \
+    LeaderboardResponse, LeaderboardEntry, RankinfoResponse, RankinfoData, PlayerSearchResponse
+from aspxstats.exceptions import Error
+
+LEADERBOARD = LeaderboardResponse(size=2, asof=1663441990, entries=[
+    LeaderboardEntry(n=1, pid=45000001, nick='mister249', rank=21, country_code='DE'),
+    LeaderboardEntry(n=2, pid=45000002, nick='mïster250', rank=20, country_code='')
+])
+
+
+class WireTest(TestCase):
+    def test_encode_decode(self):
+        @dataclass
+        class EncodeDecodeTestCase:
+            name: str
+            value: Any
+
+        tests: List[EncodeDecodeTestCase] = [
+            EncodeDecodeTestCase(
+                name='round-trips list of instances with (non-ascii/empty) strings',
+                value=LEADERBOARD
+            ),
+            EncodeDecodeTestCase(
+                name='round-trips nested instance with bools',
+                value=RankinfoResponse(data=RankinfoData(rank=21, promoted=False, demoted=True))
+            ),
+            EncodeDecodeTestCase(
+                name='round-trips empty list',
+                value=PlayerSearchResponse(asof=1663441990, results=[])
+            ),
+            EncodeDecodeTestCase(
+                name='round-trips union of map stats',
+                value=PlayerinfoResponse(asof=1663441990, data=PlayerinfoMapStats(pid=45000001, nick='mister249', maps=[
+                    PlayerinfoMap(id=0, time=123, wins=4, losses=5),
+                    PlayerinfoMap(id=100, time=456, wins=7, losses=-8)
+                ]))
+            ),
+            EncodeDecodeTestCase(
+                name='round-trips union of projection with values of any type',
+                value=PlayerinfoResponse(asof=1663441990, data=PlayerinfoProjection(pid=45000001, nick='mister249', values={
+                    'kill': 123,
+                    'osaa': 45.6,
+                    'smoc': False,
+                    'mvns': 'some-player'
+                }))
+            ),
+        ]
+
+        for t in tests:
+            # WHEN
+            actual = wire.decode(wire.encode(t.value))
+
+            # THEN
+            self.assertEqual(t.value, actual, t.name)
+
+    def test_pickle(self):
+        # GIVEN
+        value = LEADERBOARD
+
+        # WHEN
+        pickled = pickle.dumps(value)
+        actual = pickle.loads(pickled)
+
+        # THEN
+        self.assertEqual(value, actual)
+        # Field names are not written for every entry
+        self.assertNotIn(b'country_code', pickled)
+
+    def test_pickle_copy_out_of_schema_values(self):
+        @dataclass
+        class OutOfSchemaTestCase:
+            name: str
+            value: Any
+
+        tests: List[OutOfSchemaTestCase] = [
+            OutOfSchemaTestCase(
+                name='falls back for value out of range',
+                value=RankinfoResponse(data=RankinfoData(rank=2 ** 70, promoted=False, demoted=False))
+            ),
+            OutOfSchemaTestCase(
+                name='falls back for str instead of int',
+                value=LeaderboardEntry(n=1, pid='7', nick='mister249', rank=21, country_code='DE')
+            ),
+            OutOfSchemaTestCase(
+                name='falls back for None instead of str',
+                value=LeaderboardEntry(n=1, pid=45000001, nick=None, rank=21, country_code='DE')
+            ),
+        ]
+
+        for t in tests:
+            # WHEN
+            unpickled = pickle.loads(pickle.dumps(t.value))
+            copied = copy.copy(t.value)
+            deep_copied = copy.deepcopy(t.value)
+
+            # THEN
+            self.assertEqual(t.value, unpickled, t.name)
+            self.assertEqual(t.value, copied, t.name)
+            self.assertEqual(t.value, deep_copied, t.name)
+
+    def test_copy_is_shallow(self):
+        # GIVEN
+        value = LEADERBOARD
+
+        # WHEN
+        copied = copy.copy(value)
+
+        # THEN
+        self.assertEqual(value, copied)
+        self.assertIsNot(value, copied)
+        self.assertIs(value.entries, copied.entries)
+
+    def test_encode_invalid_value_type(self):
+        # GIVEN
+        value = LeaderboardEntry(n=1, pid=45000001, nick=None, rank=21, country_code='DE')
+
+        # WHEN/THEN
+        with self.assertRaises(Error):
+            wire.encode(value)
+
+    def test_decode_changed_layout(self):
+        # GIVEN
+        data = bytearray(wire.encode(LEADERBOARD))
+        magic, version, fingerprint, reference_length = wire.HEADER.unpack_from(data, 0)
+        wire.HEADER.pack_into(data, 0, magic, version, fingerprint ^ 1, reference_length)
+
+        # WHEN/THEN
+        with self.assertRaisesRegex(Error, 'layout of LeaderboardResponse changed'):
+            wire.decode(bytes(data))
+
+    def test_decode_invalid_data(self):
+        @dataclass
+        class DecodeInvalidDataTestCase:
+            name: str
+            data: bytes
+
+        encoded = wire.encode(LEADERBOARD)
+        tests: List[DecodeInvalidDataTestCase] = [
+            DecodeInvalidDataTestCase(
+                name='errors for empty data',
+                data=b''
+            ),
+            DecodeInvalidDataTestCase(
+                name='errors for other format',
+                data=b'XX' + encoded[2:]
+            ),
+            DecodeInvalidDataTestCase(
+                name='errors for truncated data',
+                data=encoded[:-4]
+            ),
+            DecodeInvalidDataTestCase(
+                name='errors for trailing data',
+                data=encoded + b'\x00'
+            ),
+            DecodeInvalidDataTestCase(
+                name='errors for unknown type',
+                data=wire.HEADER.pack(wire.MAGIC, wire.FORMAT_VERSION, 0, 14) + b'aspxstats:Nope'
+            ),
+        ]
+
+        for t in tests:
+            # WHEN/THEN
+            with self.assertRaises(Error, msg=t.name):
+                wire.decode(t.data)
+
+    def test_encode_out_of_range_value(self):
+        # GIVEN
+        value = RankinfoResponse(data=RankinfoData(rank=2 ** 64, promoted=False, demoted=True))
+
+        # WHEN/THEN
+        with self.assertRaises(Error):
+            wire.encode(value)
+
+    def test_encode_packs_fixed_size_values(self):
+        # GIVEN
+        value = RankinfoResponse(data=RankinfoData(rank=21, promoted=False, demoted=True))
+
+        # WHEN
+        actual = wire.encode(value)
+
+        # THEN
+        reference = b'aspxstats.bf2.types:RankinfoResponse'
+        self.assertEqual(wire.HEADER.size + len(reference) + struct.calcsize('<q??'), len(actual))